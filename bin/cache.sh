@@ -5,4 +5,7 @@ appdir=${cwd}/..
 
 if [ "$1" == "-d" ]; then
 	rm -fr ${appdir}/.cache/tranp
+else
+	source ${cwd}/.env.sh
+	python ${appdir}/rogw/tranp/bin/cache.py $*
 fi
@@ -0,0 +1,9790 @@
+"""このファイルは自動生成。直接編集しないこと @see rogw.tranp.bin.parser_gen"""
+import re
+
+from rogw.tranp.implements.syntax.tranp.ast import ASTEntry, ASTToken, ASTTree
+from rogw.tranp.implements.syntax.tranp.compiled import CompiledParser
+
+_R0 = re.compile('metaclass').fullmatch
+_R1 = re.compile('Annotated').fullmatch
+_R2 = re.compile("'[^'\\\\]*'").fullmatch
+_R3 = re.compile('Literal').fullmatch
+_R4 = re.compile('ClassVar').fullmatch
+_R5 = re.compile('bound').fullmatch
+_R6 = re.compile('covariant').fullmatch
+_R7 = re.compile('#.*').fullmatch
+_R8 = re.compile('[^\\W\\d]\\w*').fullmatch
+_R9 = re.compile('[a-zA-Z]*("""|\'\'\')[\\s\\S]*').fullmatch
+_R10 = re.compile('[a-zA-Z]*["\'][\\s\\S]*').fullmatch
+_R11 = re.compile('0(_?0)*|[1-9](_?\\d)*').fullmatch
+_R12 = re.compile('0[xX](_?[\\da-fA-F])+').fullmatch
+_R13 = re.compile('0[oO](_?[0-7])+').fullmatch
+_R14 = re.compile('0[bB](_?[01])+').fullmatch
+_R15 = re.compile('\\d(_?\\d)*[eE][-+]?\\d(_?\\d)*|(\\d(_?\\d)*\\.(\\d(_?\\d)*)?|\\.\\d(_?\\d)*)([eE][-+]?\\d(_?\\d)*)?').fullmatch
+_R16 = re.compile('[\\d_.eE+-]+[jJ]').fullmatch
+_R17 = re.compile('TypeVar').fullmatch
+_R18 = re.compile('TypeVarTuple').fullmatch
+_R19 = re.compile('ParamSpec').fullmatch
+_R20 = re.compile('(?!)').fullmatch
+_R21 = re.compile('TypeAlias').fullmatch
+_R22 = re.compile('TypedDict').fullmatch
+_F0 = frozenset(['\n', '\\DEDENT'])
+_F1 = frozenset([')', '...', 'False', 'None', 'True', ']', '}'])
+_F2 = frozenset([')', '...', 'None', ']'])
+_F3 = frozenset([')', ',', '...', 'False', 'None', 'True', ']', '}'])
+_F4 = frozenset([')', ',', '...', 'False', 'None', 'True', ']', 'return', '}'])
+_F5 = frozenset([')', ','])
+_F6 = frozenset(['...', 'None', ']'])
+_F7 = frozenset([')', '...', ':', 'False', 'None', 'True', ']', '}'])
+_F8 = frozenset(['!=', '<', '<=', '<>', '==', '>', '>='])
+
+
+class GrammarParser(CompiledParser):
+	"""シンタックスパーサー(コード生成版)"""
+
+	Signature = 'f43eeff2fe4b8996f2108b0ccb160c9c'
+	Keywords = frozenset(['\n', '!=', '%', '%=', '&', '&=', '(', ')', '*', '**', '**=', '*=', '+', '+=', ',', '-', '-=', '->', '.', '...', '/', '//=', '/=', ':', '<', '<<', '<<=', '<=', '<>', '=', '==', '>', '>=', '>>', '>>=', '@', '@=', 'False', 'None', 'True', '[', '\\DEDENT', '\\INDENT', '\\LAMBDA_COLON', '\\OP_UNARY_MINUS', '\\OP_UNARY_PLUS', ']', '^', '^=', 'and', 'as', 'assert', 'break', 'class', 'continue', 'def', 'del', 'elif', 'else', 'except', 'for', 'from', 'if', 'import', 'in', 'is', 'lambda', 'not', 'or', 'pass', 'raise', 'return', 'try', 'while', 'with', 'yield', '{', '|', '|=', '}', '~'])
+	Memos = 177
+
+	def _r_file_input(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[0]
+		if c in m:
+			return m[c]
+		r = self._m_file_input(c)
+		m[c] = r
+		return r
+
+	def _m_file_input(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g0(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g1(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('file_input', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_forward_input(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[1]
+		if c in m:
+			return m[c]
+		r = self._m_typed_forward_input(c)
+		m[c] = r
+		return r
+
+	def _m_typed_forward_input(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_forward_input', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_statement(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[2]
+		if c in m:
+			return m[c]
+		r = self._m_statement(c)
+		m[c] = r
+		return r
+
+	def _m_statement(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g2(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('statement', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_simple_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[3]
+		if c in m:
+			return m[c]
+		r = self._m_simple_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_simple_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_small_stmt(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('simple_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_small_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[4]
+		if c in m:
+			return m[c]
+		r = self._m_small_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_small_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g3(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('small_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_compound_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[5]
+		if c in m:
+			return m[c]
+		r = self._m_compound_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_compound_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g4(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('compound_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_import_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[6]
+		if c in m:
+			return m[c]
+		r = self._m_import_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_import_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g5(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'import'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_dotted_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'from'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('import_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_dotted_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[7]
+		if c in m:
+			return m[c]
+		r = self._m_dotted_name(c)
+		m[c] = r
+		return r
+
+	def _m_dotted_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g6(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('dotted_name', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_import_as_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[8]
+		if c in m:
+			return m[c]
+		r = self._m_import_as_name(c)
+		m[c] = r
+		return r
+
+	def _m_import_as_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g7(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('import_as_name', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_import_as_names(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[9]
+		if c in m:
+			return m[c]
+		r = self._m_import_as_names(c)
+		m[c] = r
+		return r
+
+	def _m_import_as_names(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g8(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_import_as_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g9(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('import_as_names', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__suite(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[10]
+		if c in m:
+			return m[c]
+		r = self._m__suite(c)
+		m[c] = r
+		return r
+
+	def _m__suite(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g10(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_suite', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_block(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[11]
+		if c in m:
+			return m[c]
+		r = self._m_block(c)
+		m[c] = r
+		return r
+
+	def _m_block(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g11(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('block', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_block__anno(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[12]
+		if c in m:
+			return m[c]
+		r = self._m_block__anno(c)
+		m[c] = r
+		return r
+
+	def _m_block__anno(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r__anno_stmt(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('block__anno', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__anno_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[13]
+		if c in m:
+			return m[c]
+		r = self._m__anno_stmt(c)
+		m[c] = r
+		return r
+
+	def _m__anno_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g12(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_anno_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__inline_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[14]
+		if c in m:
+			return m[c]
+		r = self._m__inline_stmt(c)
+		m[c] = r
+		return r
+
+	def _m__inline_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g13(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_inline_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_decorators(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[15]
+		if c in m:
+			return m[c]
+		r = self._m_decorators(c)
+		m[c] = r
+		return r
+
+	def _m_decorators(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g14(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('decorators', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_decorator(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[16]
+		if c in m:
+			return m[c]
+		r = self._m_decorator(c)
+		m[c] = r
+		return r
+
+	def _m_decorator(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g15(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_dotted_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '@'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('decorator', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_class_def(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[17]
+		if c in m:
+			return m[c]
+		r = self._m_class_def(c)
+		m[c] = r
+		return r
+
+	def _m_class_def(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_class_def_raw(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g16(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('class_def', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_class_def_raw(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[18]
+		if c in m:
+			return m[c]
+		r = self._m_class_def_raw(c)
+		m[c] = r
+		return r
+
+	def _m_class_def_raw(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r__inherit(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g17(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'class'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('class_def_raw', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__inherit(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[19]
+		if c in m:
+			return m[c]
+		r = self._m__inherit(c)
+		m[c] = r
+		return r
+
+	def _m__inherit(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g18(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_inherit', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_inherit_arguments(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[20]
+		if c in m:
+			return m[c]
+		r = self._m_inherit_arguments(c)
+		m[c] = r
+		return r
+
+	def _m_inherit_arguments(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g19(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_argvalue(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g20(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('inherit_arguments', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_metaclass_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[21]
+		if c in m:
+			return m[c]
+		r = self._m_metaclass_argvalue(c)
+		m[c] = r
+		return r
+
+	def _m_metaclass_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('metaclass_argvalue', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_params(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[22]
+		if c in m:
+			return m[c]
+		r = self._m_template_params(c)
+		m[c] = r
+		return r
+
+	def _m_template_params(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g21(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_template_assign__param(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g22(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('template_params', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[23]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign__param(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g23(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist__param(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('template_assign__param', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_assign_namelist__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[24]
+		if c in m:
+			return m[c]
+		r = self._m_assign_namelist__param(c)
+		m[c] = r
+		return r
+
+	def _m_assign_namelist__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_var(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('assign_namelist__param', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_param_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[25]
+		if c in m:
+			return m[c]
+		r = self._m_template_param_expression(c)
+		m[c] = r
+		return r
+
+	def _m_template_param_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g24(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('template_param_expression', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign_bound__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[26]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign_bound__param(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign_bound__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_atom(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('template_assign_bound__param', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign_constraint__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[27]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign_constraint__param(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign_constraint__param(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_slices(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('template_assign_constraint__param', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_function_def(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[28]
+		if c in m:
+			return m[c]
+		r = self._m_function_def(c)
+		m[c] = r
+		return r
+
+	def _m_function_def(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_function_def_raw(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g25(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('function_def', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_function_def_raw(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[29]
+		if c in m:
+			return m[c]
+		r = self._m_function_def_raw(c)
+		m[c] = r
+		return r
+
+	def _m_function_def_raw(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '->'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r__params(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g26(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'def'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('function_def_raw', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_lambdaparams(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[30]
+		if c in m:
+			return m[c]
+		r = self._m_lambdaparams(c)
+		m[c] = r
+		return r
+
+	def _m_lambdaparams(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g27(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('lambdaparams', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__params(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[31]
+		if c in m:
+			return m[c]
+		r = self._m__params(c)
+		m[c] = r
+		return r
+
+	def _m__params(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g28(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_params', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_parameters__values(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[32]
+		if c in m:
+			return m[c]
+		r = self._m_parameters__values(c)
+		m[c] = r
+		return r
+
+	def _m_parameters__values(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g29(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g30(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_paramvalue(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g31(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('parameters__values', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_parameters__star(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[33]
+		if c in m:
+			return m[c]
+		r = self._m_parameters__star(c)
+		m[c] = r
+		return r
+
+	def _m_parameters__star(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g32(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_starparam(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('parameters__star', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_parameters__kw(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[34]
+		if c in m:
+			return m[c]
+		r = self._m_parameters__kw(c)
+		m[c] = r
+		return r
+
+	def _m_parameters__kw(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_kwparams(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('parameters__kw', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_paramvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[35]
+		if c in m:
+			return m[c]
+		r = self._m_paramvalue(c)
+		m[c] = r
+		return r
+
+	def _m_paramvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g33(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typedparam(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('paramvalue', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typedparam(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[36]
+		if c in m:
+			return m[c]
+		r = self._m_typedparam(c)
+		m[c] = r
+		return r
+
+	def _m_typedparam(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g34(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typedparam', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_starparam(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[37]
+		if c in m:
+			return m[c]
+		r = self._m_starparam(c)
+		m[c] = r
+		return r
+
+	def _m_starparam(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typedparam(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '*'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('starparam', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_kwparams(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[38]
+		if c in m:
+			return m[c]
+		r = self._m_kwparams(c)
+		m[c] = r
+		return r
+
+	def _m_kwparams(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typedparam(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '**'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('kwparams', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[39]
+		if c in m:
+			return m[c]
+		r = self._m_typed_argvalue(c)
+		m[c] = r
+		return r
+
+	def _m_typed_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_argvalue', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[40]
+		if c in m:
+			return m[c]
+		r = self._m_typed_expression(c)
+		m[c] = r
+		return r
+
+	def _m_typed_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_or_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_expression', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_or_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[41]
+		if c in m:
+			return m[c]
+		r = self._m_typed_or_expr(c)
+		m[c] = r
+		return r
+
+	def _m_typed_or_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g35(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('typed_or_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_primary(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[42]
+		if c in m:
+			return m[c]
+		r = self._m_typed_primary(c)
+		m[c] = r
+		return r
+
+	def _m_typed_primary(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g36(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('typed_primary', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_getattr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[43]
+		if c in m:
+			return m[c]
+		r = self._m_typed_getattr(c)
+		m[c] = r
+		return r
+
+	def _m_typed_getattr(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '.'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_getattr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_getitem(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[44]
+		if c in m:
+			return m[c]
+		r = self._m_typed_getitem(c)
+		m[c] = r
+		return r
+
+	def _m_typed_getitem(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_slices(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_getitem', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_getattr__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[45]
+		if c in m:
+			return m[c]
+		r = self._m_typed_getattr__annotated(c)
+		m[c] = r
+		return r
+
+	def _m_typed_getattr__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g37(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '.'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R1(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_getattr__annotated', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_getitem__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[46]
+		if c in m:
+			return m[c]
+		r = self._m_typed_getitem__annotated(c)
+		m[c] = r
+		return r
+
+	def _m_typed_getitem__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g38(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_slices(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R1(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_getitem__annotated', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_starable_typed_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[47]
+		if c in m:
+			return m[c]
+		r = self._m_starable_typed_expression(c)
+		m[c] = r
+		return r
+
+	def _m_starable_typed_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g39(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('starable_typed_expression', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_slices(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[48]
+		if c in m:
+			return m[c]
+		r = self._m_typed_slices(c)
+		m[c] = r
+		return r
+
+	def _m_typed_slices(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g40(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_starable_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g41(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('typed_slices', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_atom(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[49]
+		if c in m:
+			return m[c]
+		r = self._m_typed_atom(c)
+		m[c] = r
+		return r
+
+	def _m_typed_atom(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g42(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('typed_atom', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_var(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[50]
+		if c in m:
+			return m[c]
+		r = self._m_typed_var(c)
+		m[c] = r
+		return r
+
+	def _m_typed_var(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_var', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_var__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[51]
+		if c in m:
+			return m[c]
+		r = self._m_typed_var__annotated(c)
+		m[c] = r
+		return r
+
+	def _m_typed_var__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g43(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R1(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_var__annotated', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_forward__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[52]
+		if c in m:
+			return m[c]
+		r = self._m_typed_forward__annotated(c)
+		m[c] = r
+		return r
+
+	def _m_typed_forward__annotated(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g44(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R2(S[p])):
+			return None
+		out.append(ASTToken('typed_forward', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R1(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_forward__annotated', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_literal(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[53]
+		if c in m:
+			return m[c]
+		r = self._m_typed_literal(c)
+		m[c] = r
+		return r
+
+	def _m_typed_literal(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g45(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g46(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g47(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R3(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_literal', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_none(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[54]
+		if c in m:
+			return m[c]
+		r = self._m_typed_none(c)
+		m[c] = r
+		return r
+
+	def _m_typed_none(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'None'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_none', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_elipsis(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[55]
+		if c in m:
+			return m[c]
+		r = self._m_typed_elipsis(c)
+		m[c] = r
+		return r
+
+	def _m_typed_elipsis(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '...'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_elipsis', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_list(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[56]
+		if c in m:
+			return m[c]
+		r = self._m_typed_list(c)
+		m[c] = r
+		return r
+
+	def _m_typed_list(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g48(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('typed_list', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_forward(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R2(S[c]):
+			return 1, ASTToken('typed_forward', T[c])
+		return None
+
+	def _r_anno_meta(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[57]
+		if c in m:
+			return m[c]
+		r = self._m_anno_meta(c)
+		m[c] = r
+		return r
+
+	def _m_anno_meta(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('anno_meta', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__typed_exprlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[58]
+		if c in m:
+			return m[c]
+		r = self._m__typed_exprlist(c)
+		m[c] = r
+		return r
+
+	def _m__typed_exprlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g49(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_starable_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g50(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_typed_exprlist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[59]
+		if c in m:
+			return m[c]
+		r = self._m_typed_dict(c)
+		m[c] = r
+		return r
+
+	def _m_typed_dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '}'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_dict_slices(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '{'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ','):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_string(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_dict', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_dict_slices(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[60]
+		if c in m:
+			return m[c]
+		r = self._m_typed_dict_slices(c)
+		m[c] = r
+		return r
+
+	def _m_typed_dict_slices(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g51(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r__typed_dict_slice(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g52(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('typed_dict_slices', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__typed_dict_slice(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[61]
+		if c in m:
+			return m[c]
+		r = self._m__typed_dict_slice(c)
+		m[c] = r
+		return r
+
+	def _m__typed_dict_slice(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_literal__key(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('_typed_dict_slice', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_literal__key(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[62]
+		if c in m:
+			return m[c]
+		r = self._m_typed_literal__key(c)
+		m[c] = r
+		return r
+
+	def _m_typed_literal__key(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_string(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('typed_literal__key', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__call_args(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[63]
+		if c in m:
+			return m[c]
+		r = self._m__call_args(c)
+		m[c] = r
+		return r
+
+	def _m__call_args(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g53(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_call_args', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_arguments__values(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[64]
+		if c in m:
+			return m[c]
+		r = self._m_arguments__values(c)
+		m[c] = r
+		return r
+
+	def _m_arguments__values(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g54(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g55(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_argvalue(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g56(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('arguments__values', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_arguments__star(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[65]
+		if c in m:
+			return m[c]
+		r = self._m_arguments__star(c)
+		m[c] = r
+		return r
+
+	def _m_arguments__star(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g57(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_starargs(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('arguments__star', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_arguments__kw(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[66]
+		if c in m:
+			return m[c]
+		r = self._m_arguments__kw(c)
+		m[c] = r
+		return r
+
+	def _m_arguments__kw(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_kwargs(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('arguments__kw', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[67]
+		if c in m:
+			return m[c]
+		r = self._m_argvalue(c)
+		m[c] = r
+		return r
+
+	def _m_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g58(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('argvalue', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_starargs(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[68]
+		if c in m:
+			return m[c]
+		r = self._m_starargs(c)
+		m[c] = r
+		return r
+
+	def _m_starargs(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '*'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('starargs', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_kwargs(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[69]
+		if c in m:
+			return m[c]
+		r = self._m_kwargs(c)
+		m[c] = r
+		return r
+
+	def _m_kwargs(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '**'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('kwargs', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_if_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[70]
+		if c in m:
+			return m[c]
+		r = self._m_if_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_if_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g59(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_elif_clauses(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_if_clause(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('if_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_if_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[71]
+		if c in m:
+			return m[c]
+		r = self._m_if_clause(c)
+		m[c] = r
+		return r
+
+	def _m_if_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'if'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('if_clause', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_elif_clauses(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[72]
+		if c in m:
+			return m[c]
+		r = self._m_elif_clauses(c)
+		m[c] = r
+		return r
+
+	def _m_elif_clauses(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g60(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('elif_clauses', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_elif_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[73]
+		if c in m:
+			return m[c]
+		r = self._m_elif_clause(c)
+		m[c] = r
+		return r
+
+	def _m_elif_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'elif'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('elif_clause', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_else_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[74]
+		if c in m:
+			return m[c]
+		r = self._m_else_clause(c)
+		m[c] = r
+		return r
+
+	def _m_else_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'else'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('else_clause', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_while_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[75]
+		if c in m:
+			return m[c]
+		r = self._m_while_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_while_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'while'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('while_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_for_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[76]
+		if c in m:
+			return m[c]
+		r = self._m_for_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_for_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_for_in(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_for_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'for'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('for_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_for_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[77]
+		if c in m:
+			return m[c]
+		r = self._m_for_in(c)
+		m[c] = r
+		return r
+
+	def _m_for_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_testlist__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'in'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('for_in', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_testlist__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[78]
+		if c in m:
+			return m[c]
+		r = self._m_testlist__for(c)
+		m[c] = r
+		return r
+
+	def _m_testlist__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g61(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('testlist__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_tuple__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[79]
+		if c in m:
+			return m[c]
+		r = self._m_tuple__for(c)
+		m[c] = r
+		return r
+
+	def _m_tuple__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g62(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('tuple__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_ternary_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[80]
+		if c in m:
+			return m[c]
+		r = self._m_ternary_test__for(c)
+		m[c] = r
+		return r
+
+	def _m_ternary_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_or_test__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g63(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('ternary_test__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_ternary_test__for__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[81]
+		if c in m:
+			return m[c]
+		r = self._m_ternary_test__for__head(c)
+		m[c] = r
+		return r
+
+	def _m_ternary_test__for__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'else'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_or_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'if'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_or_test__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('ternary_test__for__head', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_try_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[82]
+		if c in m:
+			return m[c]
+		r = self._m_try_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_try_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_except_clauses(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_try_clause(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('try_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_try_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[83]
+		if c in m:
+			return m[c]
+		r = self._m_try_clause(c)
+		m[c] = r
+		return r
+
+	def _m_try_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'try'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('try_clause', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_except_clauses(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[84]
+		if c in m:
+			return m[c]
+		r = self._m_except_clauses(c)
+		m[c] = r
+		return r
+
+	def _m_except_clauses(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g64(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('except_clauses', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_except_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[85]
+		if c in m:
+			return m[c]
+		r = self._m_except_clause(c)
+		m[c] = r
+		return r
+
+	def _m_except_clause(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g65(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'except'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('except_clause', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_with_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[86]
+		if c in m:
+			return m[c]
+		r = self._m_with_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_with_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__suite(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_with_items(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'with'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('with_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_with_items(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[87]
+		if c in m:
+			return m[c]
+		r = self._m_with_items(c)
+		m[c] = r
+		return r
+
+	def _m_with_items(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_with_item(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g66(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('with_items', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_with_item(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[88]
+		if c in m:
+			return m[c]
+		r = self._m_with_item(c)
+		m[c] = r
+		return r
+
+	def _m_with_item(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g67(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('with_item', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[89]
+		if c in m:
+			return m[c]
+		r = self._m_assign(c)
+		m[c] = r
+		return r
+
+	def _m_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g68(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_anno_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[90]
+		if c in m:
+			return m[c]
+		r = self._m_anno_assign(c)
+		m[c] = r
+		return r
+
+	def _m_anno_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g69(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('anno_assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_aug_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[91]
+		if c in m:
+			return m[c]
+		r = self._m_aug_assign(c)
+		m[c] = r
+		return r
+
+	def _m_aug_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_aug_assign_op(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('aug_assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_aug_assign_op(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[92]
+		if c in m:
+			return m[c]
+		r = self._m_aug_assign_op(c)
+		m[c] = r
+		return r
+
+	def _m_aug_assign_op(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g70(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('aug_assign_op', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_class_var_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[93]
+		if c in m:
+			return m[c]
+		r = self._m_class_var_assign(c)
+		m[c] = r
+		return r
+
+	def _m_class_var_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R4(S[p])):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('class_var_assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_class_var_anno_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[94]
+		if c in m:
+			return m[c]
+		r = self._m_class_var_anno_assign(c)
+		m[c] = r
+		return r
+
+	def _m_class_var_anno_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R4(S[p])):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('class_var_anno_assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_class_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[95]
+		if c in m:
+			return m[c]
+		r = self._m_class_assign(c)
+		m[c] = r
+		return r
+
+	def _m_class_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g71(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('class_assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[96]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g72(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g73(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_string(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_var__template(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_assign_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('template_assign', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_typed_var__template(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[97]
+		if c in m:
+			return m[c]
+		r = self._m_typed_var__template(c)
+		m[c] = r
+		return r
+
+	def _m_typed_var__template(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g74(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('typed_var__template', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[98]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign_argvalue(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign_argvalue(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g75(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('template_assign_argvalue', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign_bound__arg(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[99]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign_bound__arg(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign_bound__arg(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R5(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('template_assign_bound__arg', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign_covariant(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[100]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign_covariant(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign_covariant(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_atom(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R6(S[p])):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('template_assign_covariant', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_template_assign_constraint__arg(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[101]
+		if c in m:
+			return m[c]
+		r = self._m_template_assign_constraint__arg(c)
+		m[c] = r
+		return r
+
+	def _m_template_assign_constraint__arg(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_typed_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('template_assign_constraint__arg', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_assign_namelist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[102]
+		if c in m:
+			return m[c]
+		r = self._m_assign_namelist(c)
+		m[c] = r
+		return r
+
+	def _m_assign_namelist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g76(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g77(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('assign_namelist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_for_namelist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[103]
+		if c in m:
+			return m[c]
+		r = self._m_for_namelist(c)
+		m[c] = r
+		return r
+
+	def _m_for_namelist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g78(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g79(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('for_namelist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_del_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[104]
+		if c in m:
+			return m[c]
+		r = self._m_del_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_del_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__exprlist(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'del'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('del_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_return_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[105]
+		if c in m:
+			return m[c]
+		r = self._m_return_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_return_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g80(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'return'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('return_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_yield_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[106]
+		if c in m:
+			return m[c]
+		r = self._m_yield_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_yield_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_testlist(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'yield'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('yield_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_assert_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[107]
+		if c in m:
+			return m[c]
+		r = self._m_assert_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_assert_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g81(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'assert'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('assert_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_raise_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[108]
+		if c in m:
+			return m[c]
+		r = self._m_raise_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_raise_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g82(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'raise'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('raise_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_break_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[109]
+		if c in m:
+			return m[c]
+		r = self._m_break_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_break_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'break'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('break_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_pass_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[110]
+		if c in m:
+			return m[c]
+		r = self._m_pass_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_pass_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'pass'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('pass_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_continue_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[111]
+		if c in m:
+			return m[c]
+		r = self._m_continue_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_continue_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'continue'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('continue_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comment_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[112]
+		if c in m:
+			return m[c]
+		r = self._m_comment_stmt(c)
+		m[c] = r
+		return r
+
+	def _m_comment_stmt(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R7(S[p])):
+			return None
+		out.append(ASTToken('COMMENT', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comment_stmt', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[113]
+		if c in m:
+			return m[c]
+		r = self._m_expression(c)
+		m[c] = r
+		return r
+
+	def _m_expression(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_lambdadef(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('expression', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_lambdadef(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[114]
+		if c in m:
+			return m[c]
+		r = self._m_lambdadef(c)
+		m[c] = r
+		return r
+
+	def _m_lambdadef(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_ternary_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g83(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('lambdadef', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_lambdadef__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[115]
+		if c in m:
+			return m[c]
+		r = self._m_lambdadef__head(c)
+		m[c] = r
+		return r
+
+	def _m_lambdadef__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '\\LAMBDA_COLON'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g84(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'lambda'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('lambdadef__head', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_ternary_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[116]
+		if c in m:
+			return m[c]
+		r = self._m_ternary_test(c)
+		m[c] = r
+		return r
+
+	def _m_ternary_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_or_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g85(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('ternary_test', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_ternary_test__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[117]
+		if c in m:
+			return m[c]
+		r = self._m_ternary_test__head(c)
+		m[c] = r
+		return r
+
+	def _m_ternary_test__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'else'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_or_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'if'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_or_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('ternary_test__head', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_or_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[118]
+		if c in m:
+			return m[c]
+		r = self._m_or_test(c)
+		m[c] = r
+		return r
+
+	def _m_or_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_and_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g86(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('or_test', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_and_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[119]
+		if c in m:
+			return m[c]
+		r = self._m_and_test(c)
+		m[c] = r
+		return r
+
+	def _m_and_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_not_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g87(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('and_test', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_not_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[120]
+		if c in m:
+			return m[c]
+		r = self._m_not_test(c)
+		m[c] = r
+		return r
+
+	def _m_not_test(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comparison(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g88(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('not_test', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_not_test__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[121]
+		if c in m:
+			return m[c]
+		r = self._m_not_test__head(c)
+		m[c] = r
+		return r
+
+	def _m_not_test__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'not'):
+			return None
+		out.append(ASTToken('NOT', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('not_test__head', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comparison(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[122]
+		if c in m:
+			return m[c]
+		r = self._m_comparison(c)
+		m[c] = r
+		return r
+
+	def _m_comparison(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g89(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comparison', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[123]
+		if c in m:
+			return m[c]
+		r = self._m_expr(c)
+		m[c] = r
+		return r
+
+	def _m_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_or_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_op(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[124]
+		if c in m:
+			return m[c]
+		r = self._m_comp_op(c)
+		m[c] = r
+		return r
+
+	def _m_comp_op(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g90(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comp_op', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[125]
+		if c in m:
+			return m[c]
+		r = self._m_comp_in(c)
+		m[c] = r
+		return r
+
+	def _m_comp_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'in'):
+			return None
+		out.append(ASTToken('IN', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_in', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_not_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[126]
+		if c in m:
+			return m[c]
+		r = self._m_comp_not_in(c)
+		m[c] = r
+		return r
+
+	def _m_comp_not_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'in'):
+			return None
+		out.append(ASTToken('IN', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'not'):
+			return None
+		out.append(ASTToken('NOT', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_not_in', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_is(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[127]
+		if c in m:
+			return m[c]
+		r = self._m_comp_is(c)
+		m[c] = r
+		return r
+
+	def _m_comp_is(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'is'):
+			return None
+		out.append(ASTToken('IS', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_is', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_is_not(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[128]
+		if c in m:
+			return m[c]
+		r = self._m_comp_is_not(c)
+		m[c] = r
+		return r
+
+	def _m_comp_is_not(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'not'):
+			return None
+		out.append(ASTToken('NOT', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'is'):
+			return None
+		out.append(ASTToken('IS', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_is_not', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_or_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[129]
+		if c in m:
+			return m[c]
+		r = self._m_or_test__for(c)
+		m[c] = r
+		return r
+
+	def _m_or_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_and_test__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g91(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('or_test__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_and_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[130]
+		if c in m:
+			return m[c]
+		r = self._m_and_test__for(c)
+		m[c] = r
+		return r
+
+	def _m_and_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_not_test__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g92(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('and_test__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_not_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[131]
+		if c in m:
+			return m[c]
+		r = self._m_not_test__for(c)
+		m[c] = r
+		return r
+
+	def _m_not_test__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comparison__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g93(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('not_test__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_not_test__for__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[132]
+		if c in m:
+			return m[c]
+		r = self._m_not_test__for__head(c)
+		m[c] = r
+		return r
+
+	def _m_not_test__for__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'not'):
+			return None
+		out.append(ASTToken('NOT', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('not_test__for__head', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comparison__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[133]
+		if c in m:
+			return m[c]
+		r = self._m_comparison__for(c)
+		m[c] = r
+		return r
+
+	def _m_comparison__for(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g94(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comparison__for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_or_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[134]
+		if c in m:
+			return m[c]
+		r = self._m_or_expr(c)
+		m[c] = r
+		return r
+
+	def _m_or_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_xor_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g95(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('or_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_xor_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[135]
+		if c in m:
+			return m[c]
+		r = self._m_xor_expr(c)
+		m[c] = r
+		return r
+
+	def _m_xor_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_and_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g96(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('xor_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_and_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[136]
+		if c in m:
+			return m[c]
+		r = self._m_and_expr(c)
+		m[c] = r
+		return r
+
+	def _m_and_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_shift_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g97(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('and_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_shift_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[137]
+		if c in m:
+			return m[c]
+		r = self._m_shift_expr(c)
+		m[c] = r
+		return r
+
+	def _m_shift_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_sum(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g98(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('shift_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_sum(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[138]
+		if c in m:
+			return m[c]
+		r = self._m_sum(c)
+		m[c] = r
+		return r
+
+	def _m_sum(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_term(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g99(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('sum', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_term(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[139]
+		if c in m:
+			return m[c]
+		r = self._m_term(c)
+		m[c] = r
+		return r
+
+	def _m_term(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_factor(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g100(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('term', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_factor(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[140]
+		if c in m:
+			return m[c]
+		r = self._m_factor(c)
+		m[c] = r
+		return r
+
+	def _m_factor(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g101(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('factor', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_factor__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[141]
+		if c in m:
+			return m[c]
+		r = self._m_factor__head(c)
+		m[c] = r
+		return r
+
+	def _m_factor__head(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g102(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('factor__head', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_primary(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[142]
+		if c in m:
+			return m[c]
+		r = self._m_primary(c)
+		m[c] = r
+		return r
+
+	def _m_primary(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g103(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('primary', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_getattr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[143]
+		if c in m:
+			return m[c]
+		r = self._m_getattr(c)
+		m[c] = r
+		return r
+
+	def _m_getattr(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '.'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('getattr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_funccall(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[144]
+		if c in m:
+			return m[c]
+		r = self._m_funccall(c)
+		m[c] = r
+		return r
+
+	def _m_funccall(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r__call_args(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('funccall', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_getitem(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[145]
+		if c in m:
+			return m[c]
+		r = self._m_getitem(c)
+		m[c] = r
+		return r
+
+	def _m_getitem(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g104(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('getitem', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_slices(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[146]
+		if c in m:
+			return m[c]
+		r = self._m_slices(c)
+		m[c] = r
+		return r
+
+	def _m_slices(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g105(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r__slice_item(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g106(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('slices', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_slice(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[147]
+		if c in m:
+			return m[c]
+		r = self._m_slice(c)
+		m[c] = r
+		return r
+
+	def _m_slice(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g107(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('slice', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__slice_item(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[148]
+		if c in m:
+			return m[c]
+		r = self._m__slice_item(c)
+		m[c] = r
+		return r
+
+	def _m__slice_item(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g108(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_slice_item', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_atom(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[149]
+		if c in m:
+			return m[c]
+		r = self._m_atom(c)
+		m[c] = r
+		return r
+
+	def _m_atom(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g109(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('atom', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_var(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[150]
+		if c in m:
+			return m[c]
+		r = self._m_var(c)
+		m[c] = r
+		return r
+
+	def _m_var(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_name(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('var', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_const_true(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[151]
+		if c in m:
+			return m[c]
+		r = self._m_const_true(c)
+		m[c] = r
+		return r
+
+	def _m_const_true(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'True'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('const_true', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_const_false(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[152]
+		if c in m:
+			return m[c]
+		r = self._m_const_false(c)
+		m[c] = r
+		return r
+
+	def _m_const_false(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'False'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('const_false', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_const_none(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[153]
+		if c in m:
+			return m[c]
+		r = self._m_const_none(c)
+		m[c] = r
+		return r
+
+	def _m_const_none(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'None'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('const_none', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_group_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[154]
+		if c in m:
+			return m[c]
+		r = self._m_group_expr(c)
+		m[c] = r
+		return r
+
+	def _m_group_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('group_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_tuple(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[155]
+		if c in m:
+			return m[c]
+		r = self._m_tuple(c)
+		m[c] = r
+		return r
+
+	def _m_tuple(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g110(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('tuple', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_list(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[156]
+		if c in m:
+			return m[c]
+		r = self._m_list(c)
+		m[c] = r
+		return r
+
+	def _m_list(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g111(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('list', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_list_comp(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[157]
+		if c in m:
+			return m[c]
+		r = self._m_list_comp(c)
+		m[c] = r
+		return r
+
+	def _m_list_comp(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_comprehension__list(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('list_comp', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[158]
+		if c in m:
+			return m[c]
+		r = self._m_dict(c)
+		m[c] = r
+		return r
+
+	def _m_dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '}'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g112(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '{'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('dict', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_dict_comp(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[159]
+		if c in m:
+			return m[c]
+		r = self._m_dict_comp(c)
+		m[c] = r
+		return r
+
+	def _m_dict_comp(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '}'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_comprehension__dict(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '{'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('dict_comp', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_elipsis(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[160]
+		if c in m:
+			return m[c]
+		r = self._m_elipsis(c)
+		m[c] = r
+		return r
+
+	def _m_elipsis(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '...'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('elipsis', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__tuple_inner(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[161]
+		if c in m:
+			return m[c]
+		r = self._m__tuple_inner(c)
+		m[c] = r
+		return r
+
+	def _m__tuple_inner(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g113(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g114(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_tuple_inner', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_testlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[162]
+		if c in m:
+			return m[c]
+		r = self._m_testlist(c)
+		m[c] = r
+		return r
+
+	def _m_testlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g115(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('testlist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_tuple__testlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[163]
+		if c in m:
+			return m[c]
+		r = self._m_tuple__testlist(c)
+		m[c] = r
+		return r
+
+	def _m_tuple__testlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g116(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('tuple__testlist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__exprlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[164]
+		if c in m:
+			return m[c]
+		r = self._m__exprlist(c)
+		m[c] = r
+		return r
+
+	def _m__exprlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g117(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g118(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g119(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_exprlist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_star_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[165]
+		if c in m:
+			return m[c]
+		r = self._m_star_expr(c)
+		m[c] = r
+		return r
+
+	def _m_star_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '*'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('star_expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r__dict_exprlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[166]
+		if c in m:
+			return m[c]
+		r = self._m__dict_exprlist(c)
+		m[c] = r
+		return r
+
+	def _m__dict_exprlist(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g120(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g121(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g122(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('_dict_exprlist', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_key_value(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[167]
+		if c in m:
+			return m[c]
+		r = self._m_key_value(c)
+		m[c] = r
+		return r
+
+	def _m_key_value(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('key_value', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comprehension__list(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[168]
+		if c in m:
+			return m[c]
+		r = self._m_comprehension__list(c)
+		m[c] = r
+		return r
+
+	def _m_comprehension__list(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g123(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_comp_fors(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('comprehension__list', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comprehension__dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[169]
+		if c in m:
+			return m[c]
+		r = self._m_comprehension__dict(c)
+		m[c] = r
+		return r
+
+	def _m_comprehension__dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g124(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_comp_fors(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_key_value(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('comprehension__dict', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_fors(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[170]
+		if c in m:
+			return m[c]
+		r = self._m_comp_fors(c)
+		m[c] = r
+		return r
+
+	def _m_comp_fors(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g125(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comp_fors', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_for(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[171]
+		if c in m:
+			return m[c]
+		r = self._m_comp_for(c)
+		m[c] = r
+		return r
+
+	def _m_comp_for(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comp_for_in(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		r = self._r_for_namelist(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'for'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_if(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[172]
+		if c in m:
+			return m[c]
+		r = self._m_comp_if(c)
+		m[c] = r
+		return r
+
+	def _m_comp_if(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_or_test(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'if'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_if', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_for_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[173]
+		if c in m:
+			return m[c]
+		r = self._m_comp_for_in(c)
+		m[c] = r
+		return r
+
+	def _m_comp_for_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_or_test__for(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'in'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('comp_for_in', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[174]
+		if c in m:
+			return m[c]
+		r = self._m_name(c)
+		m[c] = r
+		return r
+
+	def _m_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R8(S[p])):
+			return None
+		out.append(ASTToken('NAME', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('name', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_string(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[175]
+		if c in m:
+			return m[c]
+		r = self._m_string(c)
+		m[c] = r
+		return r
+
+	def _m_string(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g126(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('string', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_number(self, c: int) -> tuple[int, ASTEntry] | None:
+		m = self._memos[176]
+		if c in m:
+			return m[c]
+		r = self._m_number(c)
+		m[c] = r
+		return r
+
+	def _m_number(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g127(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('number', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_NAME(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R8(S[c]):
+			return 1, ASTToken('NAME', T[c])
+		return None
+
+	def _r_LONG_STRING(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R9(S[c]):
+			return 1, ASTToken('LONG_STRING', T[c])
+		return None
+
+	def _r_STRING(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R10(S[c]):
+			return 1, ASTToken('STRING', T[c])
+		return None
+
+	def _r_DEC_NUMBER(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R11(S[c]):
+			return 1, ASTToken('DEC_NUMBER', T[c])
+		return None
+
+	def _r_HEX_NUMBER(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R12(S[c]):
+			return 1, ASTToken('HEX_NUMBER', T[c])
+		return None
+
+	def _r_OCT_NUMBER(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R13(S[c]):
+			return 1, ASTToken('OCT_NUMBER', T[c])
+		return None
+
+	def _r_BIN_NUMBER(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R14(S[c]):
+			return 1, ASTToken('BIN_NUMBER', T[c])
+		return None
+
+	def _r_FLOAT_NUMBER(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R15(S[c]):
+			return 1, ASTToken('FLOAT_NUMBER', T[c])
+		return None
+
+	def _r_IMAG_NUMBER(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R16(S[c]):
+			return 1, ASTToken('IMAG_NUMBER', T[c])
+		return None
+
+	def _r_COMMENT(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R7(S[c]):
+			return 1, ASTToken('COMMENT', T[c])
+		return None
+
+	def _r_PLUS(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '+':
+			return 1, ASTToken('PLUS', T[c])
+		return None
+
+	def _r_MINUS(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '-':
+			return 1, ASTToken('MINUS', T[c])
+		return None
+
+	def _r_PLUS__unary(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '\\OP_UNARY_PLUS':
+			return 1, ASTToken('PLUS__unary', T[c])
+		return None
+
+	def _r_MINUS__unary(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '\\OP_UNARY_MINUS':
+			return 1, ASTToken('MINUS__unary', T[c])
+		return None
+
+	def _r_TILDE(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '~':
+			return 1, ASTToken('TILDE', T[c])
+		return None
+
+	def _r_STAR(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '*':
+			return 1, ASTToken('STAR', T[c])
+		return None
+
+	def _r_SLASH(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '/':
+			return 1, ASTToken('SLASH', T[c])
+		return None
+
+	def _r_PERCENT(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '%':
+			return 1, ASTToken('PERCENT', T[c])
+		return None
+
+	def _r_AMPERSAND(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '&':
+			return 1, ASTToken('AMPERSAND', T[c])
+		return None
+
+	def _r_VBAR(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '|':
+			return 1, ASTToken('VBAR', T[c])
+		return None
+
+	def _r_CIRCUMFLEX(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '^':
+			return 1, ASTToken('CIRCUMFLEX', T[c])
+		return None
+
+	def _r_LESSTHAN(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<':
+			return 1, ASTToken('LESSTHAN', T[c])
+		return None
+
+	def _r_MORETHAN(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '>':
+			return 1, ASTToken('MORETHAN', T[c])
+		return None
+
+	def _r_OR(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'or':
+			return 1, ASTToken('OR', T[c])
+		return None
+
+	def _r_AND(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'and':
+			return 1, ASTToken('AND', T[c])
+		return None
+
+	def _r_NOT(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'not':
+			return 1, ASTToken('NOT', T[c])
+		return None
+
+	def _r_IN(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'in':
+			return 1, ASTToken('IN', T[c])
+		return None
+
+	def _r_IS(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'is':
+			return 1, ASTToken('IS', T[c])
+		return None
+
+	def _r___ANON_3(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '+=':
+			return 1, ASTToken('__ANON_3', T[c])
+		return None
+
+	def _r___ANON_4(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '-=':
+			return 1, ASTToken('__ANON_4', T[c])
+		return None
+
+	def _r___ANON_5(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '*=':
+			return 1, ASTToken('__ANON_5', T[c])
+		return None
+
+	def _r___ANON_6(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '@=':
+			return 1, ASTToken('__ANON_6', T[c])
+		return None
+
+	def _r___ANON_7(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '/=':
+			return 1, ASTToken('__ANON_7', T[c])
+		return None
+
+	def _r___ANON_8(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '%=':
+			return 1, ASTToken('__ANON_8', T[c])
+		return None
+
+	def _r___ANON_9(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '&=':
+			return 1, ASTToken('__ANON_9', T[c])
+		return None
+
+	def _r___ANON_10(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '|=':
+			return 1, ASTToken('__ANON_10', T[c])
+		return None
+
+	def _r___ANON_11(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '^=':
+			return 1, ASTToken('__ANON_11', T[c])
+		return None
+
+	def _r___ANON_12(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<<=':
+			return 1, ASTToken('__ANON_12', T[c])
+		return None
+
+	def _r___ANON_13(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '>>=':
+			return 1, ASTToken('__ANON_13', T[c])
+		return None
+
+	def _r___ANON_14(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '**=':
+			return 1, ASTToken('__ANON_14', T[c])
+		return None
+
+	def _r___ANON_15(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '//=':
+			return 1, ASTToken('__ANON_15', T[c])
+		return None
+
+	def _r___ANON_16(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '==':
+			return 1, ASTToken('__ANON_16', T[c])
+		return None
+
+	def _r___ANON_17(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '>=':
+			return 1, ASTToken('__ANON_17', T[c])
+		return None
+
+	def _r___ANON_18(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<=':
+			return 1, ASTToken('__ANON_18', T[c])
+		return None
+
+	def _r___ANON_19(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<>':
+			return 1, ASTToken('__ANON_19', T[c])
+		return None
+
+	def _r___ANON_20(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '!=':
+			return 1, ASTToken('__ANON_20', T[c])
+		return None
+
+	def _r___ANON_21(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<<':
+			return 1, ASTToken('__ANON_21', T[c])
+		return None
+
+	def _r___ANON_22(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '>>':
+			return 1, ASTToken('__ANON_22', T[c])
+		return None
+
+	def _r_TYPEVAR(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R17(S[c]):
+			return 1, ASTToken('TYPEVAR', T[c])
+		return None
+
+	def _r_TYPEVARTUPLE(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R18(S[c]):
+			return 1, ASTToken('TYPEVARTUPLE', T[c])
+		return None
+
+	def _r_PARAMSPEC(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R19(S[c]):
+			return 1, ASTToken('PARAMSPEC', T[c])
+		return None
+
+	def _r__void(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R20(S[c]):
+			return 1, ASTToken('_void', T[c])
+		return None
+
+	def _g0(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_statement(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g1(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == '\n'):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g2(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] in _F0):
+			r = self._r_compound_stmt(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		if c < n and (S[c] == '\n'):
+			r = self._r_simple_stmt(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g3(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_class_var_anno_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_class_var_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F2 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			r = self._r_class_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			r = self._r_template_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R2(S[c]) or _R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_anno_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_aug_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F4 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_return_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F5 or (not K[c] and (_R8(S[c])))):
+			r = self._r_import_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_raise_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'pass'):
+			r = self._r_pass_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_del_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_yield_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_assert_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'break'):
+			r = self._r_break_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'continue'):
+			r = self._r_continue_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R7(S[c])))):
+			r = self._r_comment_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g4(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] in _F0):
+			r = self._r_function_def(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F0):
+			r = self._r_if_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F0):
+			r = self._r_class_def(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F0):
+			r = self._r_with_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F0):
+			r = self._r_for_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F0):
+			r = self._r_try_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F0):
+			r = self._r_while_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g5(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] == ')'):
+			s = self._g128(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ',' or (not K[c] and (_R8(S[c])))):
+			r = self._r_import_as_names(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g6(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '.'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g7(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == 'as'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g8(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g9(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_import_as_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g10(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] == '\n'):
+			s = self._g129(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] in _F0):
+			s = self._g130(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g11(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] == '\\DEDENT'):
+			s = self._g131(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == '\n'):
+			s = self._g132(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g12(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_class_var_anno_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_class_var_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F2 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			r = self._r_class_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R2(S[c]) or _R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_anno_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g13(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] == ')'):
+			r = self._r_template_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_aug_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_assign(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F4 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_return_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F5 or (not K[c] and (_R8(S[c])))):
+			r = self._r_import_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_raise_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'pass'):
+			r = self._r_pass_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_del_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_yield_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_assert_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'break'):
+			r = self._r_break_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'continue'):
+			r = self._r_continue_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R7(S[c])))):
+			r = self._r_comment_stmt(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g14(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_decorator(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g15(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__call_args(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g16(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_decorators(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g17(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ']'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_template_params(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == '['):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g18(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] == ')'):
+			s = self._g133(c, out)
+			if s >= 0:
+				return s
+		s = self._g134(c, out)
+		if s >= 0:
+			return s
+		return -1
+
+	def _g19(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g20(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_typed_argvalue(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g21(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g22(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_template_assign__param(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g23(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_template_param_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ':'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g24(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] == ')'):
+			r = self._r_template_assign_constraint__param(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F6 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			r = self._r_template_assign_bound__param(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g25(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_decorators(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g26(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ']'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_template_params(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == '['):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g27(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g28(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] == ')'):
+			s = self._g135(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g136(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g137(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g138(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g29(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_kwparams(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g30(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_starparam(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g31(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_paramvalue(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g32(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_kwparams(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g33(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == '='):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g34(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_starable_typed_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ':'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g35(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] == ']'):
+			s = self._g139(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] in _F6 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			s = self._g140(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g36(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_forward__annotated(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_var__annotated(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_getattr__annotated(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_getitem__annotated(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_literal(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R8(S[c])))):
+			r = self._r_typed_getattr(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_getitem(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F6 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			r = self._r_typed_atom(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g37(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_anno_meta(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g38(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_anno_meta(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g39(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == '*'):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g40(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g41(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_starable_typed_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g42(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and ((not K[c] and (_R8(S[c])))):
+			r = self._r_typed_var(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_literal(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'None'):
+			r = self._r_typed_none(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '...'):
+			r = self._r_typed_elipsis(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_typed_list(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and not K[c] and _R2(S[c]):
+			out.append(ASTToken('typed_forward', T[c]))
+			return 1
+		return -1
+
+	def _g43(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_anno_meta(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g44(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_anno_meta(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g45(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g46(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and ((not K[c] and (_R9(S[c]) or _R10(S[c])))):
+			r = self._r_string(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R15(S[c])))):
+			r = self._r_number(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g47(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			s = self._g141(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			p = q
+		return p - c
+
+	def _g48(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__typed_exprlist(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g49(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g50(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_starable_typed_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g51(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g52(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r__typed_dict_slice(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g53(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] == ')'):
+			s = self._g142(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g143(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g144(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g145(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g54(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_kwargs(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g55(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_starargs(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g56(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_argvalue(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g57(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_kwargs(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g58(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g146(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g59(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_else_clause(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g60(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_elif_clause(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g61(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_tuple__for(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_ternary_test__for(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g62(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g147(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ','):
+			s = self._g148(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g63(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_ternary_test__for__head(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g64(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_except_clause(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g65(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == 'as'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g66(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_with_item(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g67(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == 'as'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g68(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_testlist(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == '='):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g69(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == '='):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g70(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '+=':
+			out.append(ASTToken('__ANON_3', T[c]))
+			return 1
+		if c < n and S[c] == '-=':
+			out.append(ASTToken('__ANON_4', T[c]))
+			return 1
+		if c < n and S[c] == '*=':
+			out.append(ASTToken('__ANON_5', T[c]))
+			return 1
+		if c < n and S[c] == '@=':
+			out.append(ASTToken('__ANON_6', T[c]))
+			return 1
+		if c < n and S[c] == '/=':
+			out.append(ASTToken('__ANON_7', T[c]))
+			return 1
+		if c < n and S[c] == '%=':
+			out.append(ASTToken('__ANON_8', T[c]))
+			return 1
+		if c < n and S[c] == '&=':
+			out.append(ASTToken('__ANON_9', T[c]))
+			return 1
+		if c < n and S[c] == '|=':
+			out.append(ASTToken('__ANON_10', T[c]))
+			return 1
+		if c < n and S[c] == '^=':
+			out.append(ASTToken('__ANON_11', T[c]))
+			return 1
+		if c < n and S[c] == '<<=':
+			out.append(ASTToken('__ANON_12', T[c]))
+			return 1
+		if c < n and S[c] == '>>=':
+			out.append(ASTToken('__ANON_13', T[c]))
+			return 1
+		if c < n and S[c] == '**=':
+			out.append(ASTToken('__ANON_14', T[c]))
+			return 1
+		if c < n and S[c] == '//=':
+			out.append(ASTToken('__ANON_15', T[c]))
+			return 1
+		return -1
+
+	def _g71(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F6 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			s = self._g149(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ')'):
+			s = self._g150(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g72(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g73(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R2(S[c]) or _R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g151(c, out)
+			if s >= 0:
+				return s
+		s = self._g152(c, out)
+		if s >= 0:
+			return s
+		return -1
+
+	def _g74(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R17(S[c]):
+			out.append(ASTToken('TYPEVAR', T[c]))
+			return 1
+		if c < n and not K[c] and _R18(S[c]):
+			out.append(ASTToken('TYPEVARTUPLE', T[c]))
+			return 1
+		if c < n and not K[c] and _R19(S[c]):
+			out.append(ASTToken('PARAMSPEC', T[c]))
+			return 1
+		return -1
+
+	def _g75(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F6 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			r = self._r_template_assign_bound__arg(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_template_assign_covariant(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F6 or (not K[c] and (_R2(S[c]) or _R8(S[c])))):
+			r = self._r_template_assign_constraint__arg(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g76(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g77(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			s = self._g153(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g78(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g79(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g80(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_testlist(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g81(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g82(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_name(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == 'from'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g83(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_lambdadef__head(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g84(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_lambdaparams(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g85(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_ternary_test__head(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g86(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'or'):
+				del out[mark:]
+				break
+			out.append(ASTToken('OR', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_and_test(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g87(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'and'):
+				del out[mark:]
+				break
+			out.append(ASTToken('AND', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_not_test(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g88(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_not_test__head(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g89(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			s = self._g154(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g90(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<':
+			out.append(ASTToken('LESSTHAN', T[c]))
+			return 1
+		if c < n and S[c] == '>':
+			out.append(ASTToken('MORETHAN', T[c]))
+			return 1
+		if c < n and S[c] == '==':
+			out.append(ASTToken('__ANON_16', T[c]))
+			return 1
+		if c < n and S[c] == '>=':
+			out.append(ASTToken('__ANON_17', T[c]))
+			return 1
+		if c < n and S[c] == '<=':
+			out.append(ASTToken('__ANON_18', T[c]))
+			return 1
+		if c < n and S[c] == '<>':
+			out.append(ASTToken('__ANON_19', T[c]))
+			return 1
+		if c < n and S[c] == '!=':
+			out.append(ASTToken('__ANON_20', T[c]))
+			return 1
+		return -1
+
+	def _g91(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'or'):
+				del out[mark:]
+				break
+			out.append(ASTToken('OR', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_and_test__for(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g92(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'and'):
+				del out[mark:]
+				break
+			out.append(ASTToken('AND', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_not_test__for(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g93(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_not_test__for__head(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g94(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			s = self._g155(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g95(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '|'):
+				del out[mark:]
+				break
+			out.append(ASTToken('VBAR', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_xor_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g96(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '^'):
+				del out[mark:]
+				break
+			out.append(ASTToken('CIRCUMFLEX', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_and_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g97(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '&'):
+				del out[mark:]
+				break
+			out.append(ASTToken('AMPERSAND', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_shift_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g98(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			s = self._g156(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			r = self._r_sum(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g99(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			s = self._g157(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			r = self._r_term(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g100(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			s = self._g158(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			r = self._r_factor(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g101(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_factor__head(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g102(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '\\OP_UNARY_PLUS':
+			out.append(ASTToken('PLUS__unary', T[c]))
+			return 1
+		if c < n and S[c] == '\\OP_UNARY_MINUS':
+			out.append(ASTToken('MINUS__unary', T[c]))
+			return 1
+		if c < n and S[c] == '~':
+			out.append(ASTToken('TILDE', T[c]))
+			return 1
+		return -1
+
+	def _g103(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and ((not K[c] and (_R8(S[c])))):
+			r = self._r_getattr(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			r = self._r_funccall(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_getitem(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_atom(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g104(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F7 or (not K[c] and (_R20(S[c]) or _R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_slice(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_slices(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g105(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g106(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r__slice_item(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g107(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g159(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] in _F7 or (not K[c] and (_R20(S[c]) or _R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g160(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g108(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_star_expr(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g109(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and ((not K[c] and (_R8(S[c])))):
+			r = self._r_var(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'True'):
+			r = self._r_const_true(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'False'):
+			r = self._r_const_false(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'None'):
+			r = self._r_const_none(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R9(S[c]) or _R10(S[c])))):
+			r = self._r_string(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R15(S[c])))):
+			r = self._r_number(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			r = self._r_group_expr(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			r = self._r_tuple(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_list_comp(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_list(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '}'):
+			r = self._r_dict_comp(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '}'):
+			r = self._r_dict(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '...'):
+			r = self._r_elipsis(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g110(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__tuple_inner(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g111(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__exprlist(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g112(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__dict_exprlist(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g113(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g114(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g115(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_tuple__testlist(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g116(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F3 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g161(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == ','):
+			s = self._g162(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g117(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g118(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_star_expr(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g119(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			s = self._g163(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			p = q
+		return p - c
+
+	def _g120(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g121(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_key_value(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g164(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g122(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			s = self._g165(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			p = q
+		return p - c
+
+	def _g123(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_comp_if(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g124(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_comp_if(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g125(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_comp_for(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g126(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R9(S[c]):
+			out.append(ASTToken('LONG_STRING', T[c]))
+			return 1
+		if c < n and not K[c] and _R10(S[c]):
+			out.append(ASTToken('STRING', T[c]))
+			return 1
+		return -1
+
+	def _g127(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R11(S[c]):
+			out.append(ASTToken('DEC_NUMBER', T[c]))
+			return 1
+		if c < n and not K[c] and _R12(S[c]):
+			out.append(ASTToken('HEX_NUMBER', T[c]))
+			return 1
+		if c < n and not K[c] and _R13(S[c]):
+			out.append(ASTToken('OCT_NUMBER', T[c]))
+			return 1
+		if c < n and not K[c] and _R14(S[c]):
+			out.append(ASTToken('BIN_NUMBER', T[c]))
+			return 1
+		if c < n and not K[c] and _R15(S[c]):
+			out.append(ASTToken('FLOAT_NUMBER', T[c]))
+			return 1
+		if c < n and not K[c] and _R16(S[c]):
+			out.append(ASTToken('IMAG_NUMBER', T[c]))
+			return 1
+		return -1
+
+	def _g128(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_import_as_names(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g129(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		r = self._r_block__anno(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g130(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		r = self._r_block(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g131(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == '\\DEDENT'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g166(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\\INDENT'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g132(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == '\n'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r__inline_stmt(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		return p - c
+
+	def _g133(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g167(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g168(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g134(self, c: int, out: list[ASTEntry]) -> int:
+		p = c
+		mark = len(out)
+		s = self._g169(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g170(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g135(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_parameters__values(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g136(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_parameters__star(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g137(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_parameters__kw(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g138(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g171(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g139(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ']'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g172(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_primary(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g173(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R1(S[p])):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g140(self, c: int, out: list[ASTEntry]) -> int:
+		p = c
+		mark = len(out)
+		r = self._r_typed_primary(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g174(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g141(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and ((not K[c] and (_R9(S[c]) or _R10(S[c])))):
+			r = self._r_string(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R15(S[c])))):
+			r = self._r_number(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g142(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_arguments__values(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g143(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_arguments__star(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g144(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_arguments__kw(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g145(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g175(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g146(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		r = self._r_expression(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_name(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		return p - c
+
+	def _g147(self, c: int, out: list[ASTEntry]) -> int:
+		p = c
+		mark = len(out)
+		s = self._g176(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_ternary_test__for(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g177(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g148(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ','):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_ternary_test__for(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		return p - c
+
+	def _g149(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		p = c
+		mark = len(out)
+		r = self._r_typed_expression(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R21(S[p])):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g150(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_typed_dict(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R22(S[p])):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '='):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g151(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_template_assign_argvalue(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g152(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and not K[q] and _R20(S[q])):
+				break
+			out.append(ASTToken('_void', T[q]))
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g153(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == '*'):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g154(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] in _F8):
+			r = self._r_comp_op(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'in'):
+			r = self._r_comp_not_in(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'in'):
+			r = self._r_comp_in(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'not'):
+			r = self._r_comp_is_not(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'is'):
+			r = self._r_comp_is(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g155(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] in _F8):
+			r = self._r_comp_op(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'not'):
+			r = self._r_comp_is_not(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == 'is'):
+			r = self._r_comp_is(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g156(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '<<':
+			out.append(ASTToken('__ANON_21', T[c]))
+			return 1
+		if c < n and S[c] == '>>':
+			out.append(ASTToken('__ANON_22', T[c]))
+			return 1
+		return -1
+
+	def _g157(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '+':
+			out.append(ASTToken('PLUS', T[c]))
+			return 1
+		if c < n and S[c] == '-':
+			out.append(ASTToken('MINUS', T[c]))
+			return 1
+		return -1
+
+	def _g158(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '*':
+			out.append(ASTToken('STAR', T[c]))
+			return 1
+		if c < n and S[c] == '/':
+			out.append(ASTToken('SLASH', T[c]))
+			return 1
+		if c < n and S[c] == '%':
+			out.append(ASTToken('PERCENT', T[c]))
+			return 1
+		return -1
+
+	def _g159(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		r = self._r__slice_item(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g178(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g179(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g160(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		s = self._g180(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g181(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g182(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g161(self, c: int, out: list[ASTEntry]) -> int:
+		p = c
+		mark = len(out)
+		s = self._g183(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g184(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g162(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ','):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expression(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		return p - c
+
+	def _g163(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_star_expr(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_expression(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g164(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		r = self._r_expression(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '**'):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g165(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			r = self._r_key_value(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R11(S[c]) or _R14(S[c]) or _R13(S[c]) or _R12(S[c]) or _R16(S[c]) or _R8(S[c]) or _R9(S[c]) or _R10(S[c]) or _R15(S[c])))):
+			s = self._g185(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g166(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_statement(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g167(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_metaclass_argvalue(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g168(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_inherit_arguments(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g169(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and not K[q] and _R20(S[q])):
+				break
+			out.append(ASTToken('_void', T[q]))
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g170(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and not K[q] and _R20(S[q])):
+				break
+			out.append(ASTToken('_void', T[q]))
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g171(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and not K[q] and _R20(S[q])):
+				break
+			out.append(ASTToken('_void', T[q]))
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g172(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_anno_meta(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g173(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '|'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_typed_primary(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g174(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '|'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_typed_primary(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g175(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and not K[q] and _R20(S[q])):
+				break
+			out.append(ASTToken('_void', T[q]))
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g176(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g177(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_ternary_test__for(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g178(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__slice_item(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g179(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__slice_item(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g180(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and not K[q] and _R20(S[q])):
+				break
+			out.append(ASTToken('_void', T[q]))
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g181(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__slice_item(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g182(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r__slice_item(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g183(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == ','):
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g184(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expression(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g185(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		r = self._r_expression(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '**'):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
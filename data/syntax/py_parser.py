@@ -0,0 +1,2375 @@
+"""このファイルは自動生成。直接編集しないこと @see rogw.tranp.bin.parser_gen"""
+import re
+
+from rogw.tranp.implements.syntax.tranp.ast import ASTEntry, ASTToken, ASTTree
+from rogw.tranp.implements.syntax.tranp.compiled import CompiledParser
+
+_R0 = re.compile('[a-zA-Z_]\\w*').fullmatch
+_R1 = re.compile('<|>|==|<=|>=|!=').fullmatch
+_R2 = re.compile('[-+]').fullmatch
+_R3 = re.compile('[*\\/%]').fullmatch
+_R4 = re.compile('\'([^\'\\\\]*(\\\\\')?)*\'|"([^"\\\\]*(\\\\")?)*"').fullmatch
+_R5 = re.compile('\\*{1,2}').fullmatch
+_R6 = re.compile('False|True').fullmatch
+_R7 = re.compile('0|[1-9]\\d*').fullmatch
+_R8 = re.compile('(0|[1-9]\\d*)[.]\\d+').fullmatch
+_F0 = frozenset([')', 'None', ']', 'return', '}'])
+_F1 = frozenset([')', 'None', ']', '}'])
+_F2 = frozenset(['is', 'not'])
+
+
+class PyParser(CompiledParser):
+	"""シンタックスパーサー(コード生成版)"""
+
+	Signature = 'f1c49f8b4f8ba513f049e061568cfe29'
+	Keywords = frozenset(['\n', '(', ')', ',', '->', '.', '...', ':', ':=', '=', 'None', '[', '\\DEDENT', '\\INDENT', '\\OP_UNARY_MINUS', ']', 'and', 'break', 'continue', 'def', 'elif', 'else', 'for', 'if', 'in', 'is', 'lambda', 'not', 'or', 'raise', 'return', 'while', '{', '}'])
+
+	def _r_entry(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g0(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('entry', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_statement(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g1(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('statement', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_line(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g2(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('line', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_break(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'break':
+			return 1, ASTToken('break', T[c])
+		return None
+
+	def _r_continue(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'continue':
+			return 1, ASTToken('continue', T[c])
+		return None
+
+	def _r_pass(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '...':
+			return 1, ASTToken('pass', T[c])
+		return None
+
+	def _r_return(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g3(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'return'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('return', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_raise(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'raise'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('raise', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_move(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g4(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('move', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_move_target(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g5(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('move_target', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_move_relay(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '.'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('move_relay', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_move_indexer(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_slice(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('move_indexer', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_function(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_block(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g6(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '->'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g7(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'def'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('function', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_params(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_param(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g8(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('params', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_param(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g9(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_type(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('param', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_if(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g10(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		s = self._g11(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		r = self._r_then(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('if', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_then(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_block(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'if'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('then', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_elif(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_block(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'elif'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('elif', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_else(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_block(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'else'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('else', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_for(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_block(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'in'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_var_names(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'for'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('for', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_while(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_block(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\n'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'while'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('while', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_var_names(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g12(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('var_names', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_block(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '\\DEDENT'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g13(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '\\INDENT'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('block', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_expr(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_lambda(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('expr', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_lambda(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_ternary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g14(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('lambda', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_ternary(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr_move(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g15(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('ternary', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_expr_move(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comp_or(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g16(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('expr_move', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_or(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comp_and(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g17(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comp_or', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_and(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comp_not(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g18(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comp_and', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp_not(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_comp(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g19(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comp_not', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_comp(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_calc_sum(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g20(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('comp', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_calc_sum(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_calc_mul(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g21(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('calc_sum', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_calc_mul(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_unary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g22(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('calc_mul', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_unary(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g23(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('unary', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_op_or(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'or':
+			return 1, ASTToken('op_or', T[c])
+		return None
+
+	def _r_op_and(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'and':
+			return 1, ASTToken('op_and', T[c])
+		return None
+
+	def _r_op_comp(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g24(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('op_comp', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_op_comp_s(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R1(S[c]):
+			return 1, ASTToken('op_comp_s', T[c])
+		return None
+
+	def _r_op_in(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'in':
+			return 1, ASTToken('op_in', T[c])
+		return None
+
+	def _r_op_is(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'is':
+			return 1, ASTToken('op_is', T[c])
+		return None
+
+	def _r_op_not(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'not':
+			return 1, ASTToken('op_not', T[c])
+		return None
+
+	def _r_op_add(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R2(S[c]):
+			return 1, ASTToken('op_add', T[c])
+		return None
+
+	def _r_op_mul(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R3(S[c]):
+			return 1, ASTToken('op_mul', T[c])
+		return None
+
+	def _r_op_unary(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == '\\OP_UNARY_MINUS':
+			return 1, ASTToken('op_unary', T[c])
+		return None
+
+	def _r_primary(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g25(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('primary', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_relay(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '.'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('relay', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_invoke(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g26(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('invoke', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_indexer(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_slice(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_primary(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		out.reverse()
+		return p - c, ASTTree('indexer', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_atom(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g27(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('atom', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_var(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('var', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_type(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		s = self._g28(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('type', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_type_none(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == 'None'):
+			return None
+		out.append(ASTToken('none', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('type_none', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_type_var(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and not K[p] and _R0(S[p])):
+			return None
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('type_var', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_args(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_arg(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g29(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('args', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_arg(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g30(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('arg', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_slice(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g31(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('slice', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_values(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g32(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('values', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_tuple_values(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g33(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('tuple_values', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_key_values(self, c: int) -> tuple[int, ASTEntry] | None:
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_key_value(p)
+		if r is None:
+			return None
+		out.append(r[1])
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		s = self._g34(p, out)
+		if s < 0:
+			return None
+		p += s
+		out.reverse()
+		return p - c, ASTTree('key_values', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_key_value(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		r = self._r_expr(p)
+		if r is None:
+			return None
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == ':'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R4(S[p])):
+			return None
+		out.append(ASTToken('string', T[p]))
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('key_value', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_packing(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R5(S[c]):
+			return 1, ASTToken('packing', T[c])
+		return None
+
+	def _r_list(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ']'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g35(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '['):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('list', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_tuple(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == ')'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_tuple_values(p)
+		if r is None:
+			return None
+		out.extend(reversed(r[1].children))
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('tuple', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_dict(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		out: list[ASTEntry] = []
+		p = c
+		if not (p < n and S[p] == '}'):
+			return None
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g36(p, out)
+		if s < 0:
+			return None
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '{'):
+			return None
+		p += 1
+		out.reverse()
+		return p - c, ASTTree('dict', out, (T[p - 1], T[c]) if p > c else None)
+
+	def _r_boolean(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R6(S[c]):
+			return 1, ASTToken('boolean', T[c])
+		return None
+
+	def _r_none(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		if c < n and S[c] == 'None':
+			return 1, ASTToken('none', T[c])
+		return None
+
+	def _r_name(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R0(S[c]):
+			return 1, ASTToken('name', T[c])
+		return None
+
+	def _r_string(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R4(S[c]):
+			return 1, ASTToken('string', T[c])
+		return None
+
+	def _r_digit(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R7(S[c]):
+			return 1, ASTToken('digit', T[c])
+		return None
+
+	def _r_decimal(self, c: int) -> tuple[int, ASTEntry] | None:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R8(S[c]):
+			return 1, ASTToken('decimal', T[c])
+		return None
+
+	def _g0(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_statement(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g1(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		if c < n and (S[c] == '\n'):
+			s = self._g37(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] == '\\DEDENT'):
+			r = self._r_if(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '\\DEDENT'):
+			r = self._r_for(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '\\DEDENT'):
+			r = self._r_while(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '\\DEDENT'):
+			r = self._r_function(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g2(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and S[c] == 'break':
+			out.append(ASTToken('break', T[c]))
+			return 1
+		if c < n and S[c] == 'continue':
+			out.append(ASTToken('continue', T[c]))
+			return 1
+		if c < n and S[c] == '...':
+			out.append(ASTToken('pass', T[c]))
+			return 1
+		if c < n and (S[c] in _F0 or (not K[c] and (_R4(S[c]) or _R8(S[c]) or _R7(S[c]) or _R6(S[c]) or _R0(S[c])))):
+			r = self._r_return(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R4(S[c]) or _R8(S[c]) or _R7(S[c]) or _R6(S[c]) or _R0(S[c])))):
+			r = self._r_raise(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R4(S[c]) or _R8(S[c]) or _R7(S[c]) or _R6(S[c]) or _R0(S[c])))):
+			r = self._r_move(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g3(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_expr(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g4(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == '='):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_move_target(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g5(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and ((not K[c] and (_R0(S[c])))):
+			r = self._r_move_relay(c)
+			if r is not None:
+				out.extend(reversed(r[1].children))
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_move_indexer(c)
+			if r is not None:
+				out.extend(reversed(r[1].children))
+				return r[0]
+		if c < n and not K[c] and _R0(S[c]):
+			out.append(ASTToken('name', T[c]))
+			return 1
+		return -1
+
+	def _g6(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_type(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g7(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_params(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g8(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_param(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g9(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == '='):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g10(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_else(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g11(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_elif(q)
+			if r is None:
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g12(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and not K[q] and _R0(S[q])):
+				del out[mark:]
+				break
+			out.append(ASTToken('name', T[q]))
+			q += 1
+			p = q
+		return p - c
+
+	def _g13(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_statement(q)
+			if r is None:
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g14(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ':'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			s = self._g38(q, out)
+			if s < 0:
+				del out[mark:]
+				break
+			q += s
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == 'lambda'):
+				del out[mark:]
+				break
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g15(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'else'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr_move(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			if not (q < n and S[q] == 'if'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr_move(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g16(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ':='):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_comp_or(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			break
+		return p - c
+
+	def _g17(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'or'):
+				del out[mark:]
+				break
+			out.append(ASTToken('op_or', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_comp_and(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g18(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == 'and'):
+				del out[mark:]
+				break
+			out.append(ASTToken('op_and', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_comp_not(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g19(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == 'not'):
+				break
+			out.append(ASTToken('op_not', T[q]))
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g20(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			r = self._r_op_comp(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			if q > self._peek:
+				self._peek = q
+			r = self._r_calc_sum(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g21(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and not K[q] and _R2(S[q])):
+				del out[mark:]
+				break
+			out.append(ASTToken('op_add', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_calc_mul(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g22(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and not K[q] and _R3(S[q])):
+				del out[mark:]
+				break
+			out.append(ASTToken('op_mul', T[q]))
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_unary(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g23(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == '\\OP_UNARY_MINUS'):
+				break
+			out.append(ASTToken('op_unary', T[q]))
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g24(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R1(S[c]):
+			out.append(ASTToken('op_comp_s', T[c]))
+			return 1
+		if c < n and (S[c] == 'in'):
+			s = self._g39(c, out)
+			if s >= 0:
+				return s
+		if c < n and (S[c] in _F2):
+			s = self._g40(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g25(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and ((not K[c] and (_R0(S[c])))):
+			r = self._r_relay(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			r = self._r_invoke(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ']'):
+			r = self._r_indexer(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] in _F1 or (not K[c] and (_R4(S[c]) or _R8(S[c]) or _R7(S[c]) or _R6(S[c]) or _R0(S[c])))):
+			r = self._r_atom(c)
+			if r is not None:
+				e = r[1]
+				out.append(e.children[0] if len(e.children) == 1 else e)
+				return r[0]
+		return -1
+
+	def _g26(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_args(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g27(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and not K[c] and _R6(S[c]):
+			out.append(ASTToken('boolean', T[c]))
+			return 1
+		if c < n and S[c] == 'None':
+			out.append(ASTToken('none', T[c]))
+			return 1
+		if c < n and ((not K[c] and (_R0(S[c])))):
+			r = self._r_var(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and not K[c] and _R4(S[c]):
+			out.append(ASTToken('string', T[c]))
+			return 1
+		if c < n and not K[c] and _R7(S[c]):
+			out.append(ASTToken('digit', T[c]))
+			return 1
+		if c < n and not K[c] and _R8(S[c]):
+			out.append(ASTToken('decimal', T[c]))
+			return 1
+		if c < n and (S[c] == ']'):
+			r = self._r_list(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			r = self._r_tuple(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == '}'):
+			r = self._r_dict(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and (S[c] == ')'):
+			s = self._g41(c, out)
+			if s >= 0:
+				return s
+		return -1
+
+	def _g28(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		if c < n and (S[c] == 'None'):
+			r = self._r_type_none(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		if c < n and ((not K[c] and (_R0(S[c])))):
+			r = self._r_type_var(c)
+			if r is not None:
+				out.append(r[1])
+				return r[0]
+		return -1
+
+	def _g29(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_arg(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g30(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			s = self._g42(q, out)
+			if s < 0:
+				break
+			q += s
+			p = q
+			break
+		return p - c
+
+	def _g31(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ':'):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g32(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g33(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_expr(q)
+			if r is None:
+				del out[mark:]
+				break
+			e = r[1]
+			out.append(e.children[0] if len(e.children) == 1 else e)
+			q += r[0]
+			p = q
+			found += 1
+		if found == 0:
+			return -1
+		return p - c
+
+	def _g34(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			mark = len(out)
+			if not (q < n and S[q] == ','):
+				del out[mark:]
+				break
+			q += 1
+			if q > self._peek:
+				self._peek = q
+			r = self._r_key_value(q)
+			if r is None:
+				del out[mark:]
+				break
+			out.append(r[1])
+			q += r[0]
+			p = q
+		return p - c
+
+	def _g35(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_values(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g36(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_key_values(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g37(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == '\n'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_line(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		return p - c
+
+	def _g38(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		p = c
+		found = 0
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			r = self._r_var_names(q)
+			if r is None:
+				break
+			out.extend(reversed(r[1].children))
+			q += r[0]
+			p = q
+			found += 1
+			break
+		if found == 0:
+			out.append(ASTToken.empty())
+		return p - c
+
+	def _g39(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == 'in'):
+			del out[mark:]
+			return -1
+		out.append(ASTToken('op_in', T[p]))
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		s = self._g43(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		return p - c
+
+	def _g40(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		mark = len(out)
+		s = self._g44(p, out)
+		if s < 0:
+			del out[mark:]
+			return -1
+		p += s
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == 'is'):
+			del out[mark:]
+			return -1
+		out.append(ASTToken('op_is', T[p]))
+		p += 1
+		return p - c
+
+	def _g41(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == ')'):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		r = self._r_expr(p)
+		if r is None:
+			del out[mark:]
+			return -1
+		e = r[1]
+		out.append(e.children[0] if len(e.children) == 1 else e)
+		p += r[0]
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and S[p] == '('):
+			del out[mark:]
+			return -1
+		p += 1
+		return p - c
+
+	def _g42(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		if c < n and (S[c] == '='):
+			s = self._g45(c, out)
+			if s >= 0:
+				return s
+		if c < n and not K[c] and _R5(S[c]):
+			out.append(ASTToken('packing', T[c]))
+			return 1
+		return -1
+
+	def _g43(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == 'not'):
+				break
+			out.append(ASTToken('op_not', T[q]))
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g44(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		T = self._tokens
+		p = c
+		while p < n:
+			if p > self._peek:
+				self._peek = p
+			q = p
+			if not (q < n and S[q] == 'not'):
+				break
+			out.append(ASTToken('op_not', T[q]))
+			q += 1
+			p = q
+			break
+		return p - c
+
+	def _g45(self, c: int, out: list[ASTEntry]) -> int:
+		n = self._length
+		S = self._strings
+		K = self._keywords
+		T = self._tokens
+		p = c
+		mark = len(out)
+		if not (p < n and S[p] == '='):
+			del out[mark:]
+			return -1
+		p += 1
+		if p > self._peek:
+			self._peek = p
+		if not (p < n and not K[p] and _R0(S[p])):
+			del out[mark:]
+			return -1
+		out.append(ASTToken('name', T[p]))
+		p += 1
+		return p - c
@@ -11,6 +11,7 @@ def default_definitions() -> ModuleDefinitions:
 	return {
 		'rogw.tranp.app.env.DataEnvPath': 'rogw.tranp.providers.app.data_env_path',
 		'rogw.tranp.app.env.SourceEnvPath': 'rogw.tranp.providers.app.source_env_path',
+		'rogw.tranp.cache.backend.CacheBackend': 'rogw.tranp.providers.cache.cache_backend',
 		'rogw.tranp.cache.cache.CacheProvider': 'rogw.tranp.cache.cache.CacheProvider',
 		'rogw.tranp.cache.cache.CacheSetting': 'rogw.tranp.providers.cache.cache_setting',
 		'rogw.tranp.data.meta.types.ModuleMetaFactory': 'rogw.tranp.providers.module.module_meta_factory',
@@ -23,6 +24,7 @@ def default_definitions() -> ModuleDefinitions:
 		'rogw.tranp.module.loader.IModuleLoader': 'rogw.tranp.providers.module.ModuleLoader',
 		'rogw.tranp.module.loader.ModuleDependencyProvider': 'rogw.tranp.app.config.module_dependency_provider',
 		'rogw.tranp.module.modules.Modules': 'rogw.tranp.module.modules.Modules',
+		'rogw.tranp.module.pack.LibraryPack': 'rogw.tranp.providers.module.library_pack',
 		'rogw.tranp.module.types.LibraryPaths': 'rogw.tranp.providers.module.library_paths',
 		'rogw.tranp.module.types.ModulePaths': 'rogw.tranp.providers.module.module_paths',
 		'rogw.tranp.semantics.reflection.db.SymbolDB': 'rogw.tranp.semantics.reflection.db.SymbolDB',
@@ -36,7 +38,7 @@ def default_definitions() -> ModuleDefinitions:
 		'rogw.tranp.syntax.ast.resolver.SymbolMapping': 'rogw.tranp.providers.syntax.resolver.symbol_mapping',
 		'rogw.tranp.syntax.ast.parser.ParserSetting': 'rogw.tranp.providers.syntax.ast.parser_setting',
 		'rogw.tranp.syntax.ast.parser.SourceProvider': 'rogw.tranp.providers.syntax.ast.source_provider',
-		'rogw.tranp.syntax.ast.parser.SyntaxParser': 'rogw.tranp.implements.syntax.lark.parser.SyntaxParserOfLark',
+		'rogw.tranp.syntax.ast.parser.SyntaxParser': 'rogw.tranp.providers.syntax.ast.syntax_parser',
 		'rogw.tranp.transpiler.middleware.RenderMiddleware': 'rogw.tranp.transpiler.middleware.RenderMiddleware',
 		'rogw.tranp.transpiler.types.Evaluator': 'rogw.tranp.implements.transpiler.evaluator.LiteralEvaluator',
 	}
@@ -90,6 +90,23 @@ class FileLoader(IFileLoader):
 
 		return self.__hashs[found_filepath]
 
+	@implements
+	def invalidate(self, filepath: str) -> None:
+		"""ファイルのキャッシュ情報(最終更新日時・ハッシュ値)を破棄
+
+		Args:
+			filepath: 実行ディレクトリーからの相対パス。または絶対パス
+		"""
+		found_filepath = self.__resolve_filepath(filepath)
+		if found_filepath is None:
+			return
+
+		if found_filepath in self.__hashs:
+			del self.__hashs[found_filepath]
+
+		if found_filepath in self.__mtimes:
+			del self.__mtimes[found_filepath]
+
 	def __resolve_filepath(self, filepath: str) -> str | None:
 		"""ファイルパスを解決。未検出の場合はNoneを返却
 
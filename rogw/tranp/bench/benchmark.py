@@ -0,0 +1,244 @@
+import sys
+import time
+from collections.abc import Callable
+from typing import NamedTuple, TypedDict
+
+import rogw.tranp.syntax.node.definition as defs
+from rogw.tranp.errors import Errors
+from rogw.tranp.file.loader import ISourceLoader
+from rogw.tranp.lang.annotation import injectable
+from rogw.tranp.lang.module import module_path_to_filepath
+from rogw.tranp.lang.profile import peak_rss_mb
+from rogw.tranp.module.modules import Modules
+from rogw.tranp.module.types import ModulePaths
+from rogw.tranp.semantics.reflections import Reflections
+from rogw.tranp.syntax.ast.entrypoints import Entrypoints
+from rogw.tranp.syntax.ast.parser import SyntaxParser
+from rogw.tranp.transpiler.types import ITranspiler
+
+
+class PhaseResult(TypedDict):
+	"""フェーズ毎の計測結果
+
+	Attributes:
+		elapsed: 所要時間(秒)
+		modules_per_sec: 秒間の処理モジュール数
+		lines_per_sec: 秒間の処理行数
+		peak_rss_mb: フェーズ終了時点のピークRSS(MB)
+	"""
+
+	elapsed: float
+	modules_per_sec: float
+	lines_per_sec: float
+	peak_rss_mb: float
+
+
+class BenchResult(TypedDict):
+	"""ベンチマークの計測結果
+
+	Attributes:
+		version: アプリケーションのバージョン
+		shape: 合成モジュールの形状
+		modules: モジュール数
+		lines: 総行数
+		errors: 型解決に失敗したノード数
+		phases: フェーズ名と計測結果の一覧
+		syntax: シンタックスパーサーのバックエンド名と構文解析の計測結果の一覧 @see SyntaxBenchmark
+	"""
+
+	version: str
+	shape: dict[str, int | bool]
+	modules: int
+	lines: int
+	errors: int
+	phases: dict[str, PhaseResult]
+	syntax: dict[str, PhaseResult]
+
+
+class Comparison(NamedTuple):
+	"""ベースラインとの比較結果
+
+	Attributes:
+		phase: フェーズ名
+		metric: 指標名
+		baseline: ベースラインの値
+		current: 今回の値
+		ratio: ベースラインに対する比率
+		regressed: True = 劣化
+	"""
+
+	phase: str
+	metric: str
+	baseline: float
+	current: float
+	ratio: float
+	regressed: bool
+
+
+class Benchmark:
+	"""ベンチマーク。パース・シンボル展開・型解決・レンダリングをフェーズ毎に計測
+
+	Note:
+		```
+		* 各フェーズは全モジュールに対して順に実施するため、前のフェーズの結果は後のフェーズから再利用される
+		* ピークRSSはプロセス全体の値のため、前のフェーズまでの使用量を含む
+		* 事前に標準ライブラリーをロードし、その所要時間は'setup'として計測
+		```
+	"""
+
+	Phases = ['setup', 'parse', 'expand', 'resolve', 'render']
+
+	@injectable
+	def __init__(self, sources: ISourceLoader, module_paths: ModulePaths, modules: Modules, entrypoints: Entrypoints, reflections: Reflections, transpiler: ITranspiler) -> None:
+		"""インスタンスを生成
+
+		Args:
+			sources: ソースコードローダー @inject
+			module_paths: モジュールパスリスト @inject
+			modules: モジュールリスト @inject
+			entrypoints: エントリーポイントマネージャー @inject
+			reflections: シンボルリゾルバー @inject
+			transpiler: トランスパイラー @inject
+		"""
+		self.sources = sources
+		self.module_paths = module_paths
+		self.modules = modules
+		self.entrypoints = entrypoints
+		self.reflections = reflections
+		self.transpiler = transpiler
+		self.errors = 0
+
+	def lines(self) -> int:
+		"""Returns: 対象モジュールの総行数"""
+		return sum([self.sources.load(module_path_to_filepath(module_path.path, '.py')).count('\n') for module_path in self.module_paths])
+
+	def run(self) -> dict[str, PhaseResult]:
+		"""全てのフェーズを計測
+
+		Returns:
+			フェーズ名と計測結果の一覧
+		"""
+		lines = self.lines()
+		actions: dict[str, Callable[[], None]] = {
+			'setup': self.setup,
+			'parse': self.parse,
+			'expand': self.expand,
+			'resolve': self.resolve,
+			'render': self.render,
+		}
+		results: dict[str, PhaseResult] = {}
+		for phase in self.Phases:
+			start = time.perf_counter()
+			actions[phase]()
+			elapsed = max(time.perf_counter() - start, sys.float_info.epsilon)
+			results[phase] = {
+				'elapsed': elapsed,
+				'modules_per_sec': len(self.module_paths) / elapsed,
+				'lines_per_sec': lines / elapsed,
+				'peak_rss_mb': peak_rss_mb(),
+			}
+
+		return results
+
+	def setup(self) -> None:
+		"""標準ライブラリーをロード"""
+		self.modules.libralies()
+
+	def parse(self) -> None:
+		"""パース(ソースの読み込み・ASTの生成・ノードの索引付け)"""
+		for module_path in self.module_paths:
+			self.entrypoints.load(module_path.path, module_path.language)
+
+	def expand(self) -> None:
+		"""シンボル展開(プリプロセス)"""
+		for module_path in self.module_paths:
+			self.modules.load(module_path.path, module_path.language)
+
+	def resolve(self) -> None:
+		"""型解決(全てのシンボル宣言・参照ノード)"""
+		for module_path in self.module_paths:
+			entrypoint = self.modules.load(module_path.path, module_path.language).entrypoint
+			for node in entrypoint.procedural():
+				if not isinstance(node, (defs.Declable, defs.Reference)):
+					continue
+
+				try:
+					self.reflections.type_of(node)
+				except Errors.Error:
+					self.errors += 1
+
+	def render(self) -> None:
+		"""レンダリング(トランスパイル)"""
+		for module_path in self.module_paths:
+			self.transpiler.transpile(self.modules.load(module_path.path, module_path.language).entrypoint)
+
+
+class SyntaxBenchmark:
+	"""ベンチマーク(構文解析)。シンタックスパーサー単体の所要時間を計測
+
+	Note:
+		```
+		* シンタックスパーサーのバックエンドを比較するため、ノードの索引付けは含まない
+		* パーサーのロード(Larkはグラマーの解析)を含む
+		```
+	"""
+
+	Backends = ['lark', 'tranp']
+
+	@injectable
+	def __init__(self, sources: ISourceLoader, module_paths: ModulePaths, parser: SyntaxParser) -> None:
+		"""インスタンスを生成
+
+		Args:
+			sources: ソースコードローダー @inject
+			module_paths: モジュールパスリスト @inject
+			parser: シンタックスパーサー @inject
+		"""
+		self.sources = sources
+		self.module_paths = module_paths
+		self.parser = parser
+
+	def run(self) -> PhaseResult:
+		"""構文解析を計測
+
+		Returns:
+			計測結果
+		"""
+		lines = sum([self.sources.load(module_path_to_filepath(module_path.path, '.py')).count('\n') for module_path in self.module_paths])
+		start = time.perf_counter()
+		for module_path in self.module_paths:
+			self.parser(module_path.path)
+
+		elapsed = max(time.perf_counter() - start, sys.float_info.epsilon)
+		return {
+			'elapsed': elapsed,
+			'modules_per_sec': len(self.module_paths) / elapsed,
+			'lines_per_sec': lines / elapsed,
+			'peak_rss_mb': peak_rss_mb(),
+		}
+
+
+def compare(current: BenchResult, baseline: BenchResult, threshold: float) -> list[Comparison]:
+	"""計測結果をベースラインと比較
+
+	Args:
+		current: 今回の計測結果
+		baseline: ベースラインの計測結果
+		threshold: 劣化と見做す比率の閾値
+	Returns:
+		比較結果リスト
+	Note:
+		所要時間とピークRSSを比較。ベースラインに存在しないフェーズは対象外
+	"""
+	comparisons: list[Comparison] = []
+	for phase, result in current['phases'].items():
+		if phase not in baseline['phases']:
+			continue
+
+		for metric in ['elapsed', 'peak_rss_mb']:
+			baseline_value = baseline['phases'][phase][metric]
+			current_value = result[metric]
+			ratio = current_value / baseline_value if baseline_value > 0 else 1.0
+			comparisons.append(Comparison(phase, metric, baseline_value, current_value, ratio, ratio > threshold))
+
+	return comparisons
@@ -0,0 +1,195 @@
+import os
+from dataclasses import dataclass
+
+from rogw.tranp.module.types import ModulePath, ModulePaths
+
+
+@dataclass
+class Shape:
+	"""合成モジュールの形状
+
+	Attributes:
+		modules: モジュール数
+		classes: モジュール毎のクラス数
+		methods: クラス毎のメソッド数
+		depth: メソッド内の制御構文のネスト数
+		fanout: モジュール毎のインポート数
+		generics: True = ジェネリッククラスを使用
+	"""
+
+	modules: int = 10
+	classes: int = 4
+	methods: int = 4
+	depth: int = 2
+	fanout: int = 2
+	generics: bool = True
+
+
+class SourceGenerator:
+	"""合成モジュールのソースコードジェネレーター
+
+	Note:
+		```
+		* 形状に応じてトランスパイル可能なソースコードを生成
+		* モジュールは番号順に先行するモジュールをインポートするため、依存関係は非循環
+		```
+	"""
+
+	def __init__(self, shape: Shape, package: str = 'bench') -> None:
+		"""インスタンスを生成
+
+		Args:
+			shape: 形状
+			package: 生成するモジュールのパッケージ名 (default = 'bench')
+		"""
+		self.shape = shape
+		self.package = package
+
+	def module_path(self, index: int) -> str:
+		"""モジュールパスを生成
+
+		Args:
+			index: モジュールの番号
+		Returns:
+			モジュールパス
+		"""
+		return f'{self.package}.m{index:04d}'
+
+	def class_name(self, module_index: int, class_index: int) -> str:
+		"""クラス名を生成
+
+		Args:
+			module_index: モジュールの番号
+			class_index: クラスの番号
+		Returns:
+			クラス名
+		"""
+		return f'C{module_index:04d}_{class_index}'
+
+	def imports_of(self, index: int) -> list[int]:
+		"""インポート先のモジュールの番号リストを取得
+
+		Args:
+			index: モジュールの番号
+		Returns:
+			モジュールの番号リスト
+		"""
+		return [index - offset for offset in range(1, self.shape.fanout + 1) if index - offset >= 0]
+
+	def generate(self, dirpath: str) -> ModulePaths:
+		"""全てのモジュールを生成し、ファイルに出力
+
+		Args:
+			dirpath: 出力ディレクトリー。環境パスに含まれるディレクトリーを指定
+		Returns:
+			モジュールパスリスト
+		"""
+		module_paths = ModulePaths()
+		for index in range(self.shape.modules):
+			module_path = self.module_path(index)
+			filepath = os.path.join(dirpath, f'{module_path.replace(".", os.path.sep)}.py')
+			os.makedirs(os.path.dirname(filepath), exist_ok=True)
+			with open(filepath, mode='wb') as f:
+				f.write(self.source(index).encode('utf-8'))
+
+			module_paths.append(ModulePath(module_path, language='py'))
+
+		return module_paths
+
+	def source(self, index: int) -> str:
+		"""モジュールのソースコードを生成
+
+		Args:
+			index: モジュールの番号
+		Returns:
+			ソースコード
+		"""
+		lines: list[str] = []
+		if self.shape.generics:
+			lines.append('from typing import Generic, TypeVar')
+			lines.append('')
+
+		for import_index in self.imports_of(index):
+			lines.append(f'from {self.module_path(import_index)} import {self.class_name(import_index, 0)}')
+
+		if self.shape.generics:
+			lines.extend(['', "T = TypeVar('T')", '', ''])
+			lines.extend(self.generic_class())
+
+		for class_index in range(self.shape.classes):
+			lines.extend(['', ''])
+			lines.extend(self.class_def(index, class_index))
+
+		return '\n'.join(lines) + '\n'
+
+	def generic_class(self) -> list[str]:
+		"""ジェネリッククラスのソースコードを生成
+
+		Returns:
+			ソースコードの行リスト
+		"""
+		return [
+			'class Box(Generic[T]):',
+			'\tvalue: T',
+			'',
+			'\tdef __init__(self, value: T) -> None:',
+			'\t\tself.value = value',
+			'',
+			'\tdef get(self) -> T:',
+			'\t\treturn self.value',
+		]
+
+	def class_def(self, index: int, class_index: int) -> list[str]:
+		"""クラスのソースコードを生成
+
+		Args:
+			index: モジュールの番号
+			class_index: クラスの番号
+		Returns:
+			ソースコードの行リスト
+		"""
+		lines = [
+			f'class {self.class_name(index, class_index)}:',
+			'\tcount: int',
+			'',
+			'\tdef __init__(self) -> None:',
+			f'\t\tself.count = {class_index}',
+		]
+		for method_index in range(self.shape.methods):
+			lines.append('')
+			lines.extend(self.method_def(index, method_index))
+
+		return lines
+
+	def method_def(self, index: int, method_index: int) -> list[str]:
+		"""メソッドのソースコードを生成
+
+		Args:
+			index: モジュールの番号
+			method_index: メソッドの番号
+		Returns:
+			ソースコードの行リスト
+		"""
+		lines = [
+			f'\tdef method_{method_index}(self, a: int) -> int:',
+			'\t\ttotal = a + self.count',
+		]
+		indent = '\t\t'
+		for depth in range(self.shape.depth):
+			if depth % 2 == 0:
+				lines.append(f'{indent}if total > {depth}:')
+			else:
+				lines.append(f'{indent}for i{depth} in range(a):')
+
+			indent = f'{indent}\t'
+			lines.append(f'{indent}total = total + {depth + 1}')
+
+		for import_index in self.imports_of(index):
+			lines.append(f'\t\ttotal = total + {self.class_name(import_index, 0)}().method_0(a)')
+
+		if self.shape.generics:
+			lines.append('\t\tbox = Box[int](total)')
+			lines.append('\t\ttotal = box.get()')
+
+		lines.append('\t\treturn total')
+		return lines
@@ -11,11 +11,14 @@ from data.syntax.gram_rules import gram_rules
 from data.syntax.gram_tokenizer import gram_tokenizer
 from rogw.tranp.app.dir import tranp_dir
 from rogw.tranp.bin.io import tty
+from rogw.tranp.cache.cache import CacheProvider
 from rogw.tranp.implements.syntax.tranp.ast import ASTNormalizer
+from rogw.tranp.implements.syntax.tranp.loader import RulesLoader
 from rogw.tranp.implements.syntax.tranp.rule import Rules
 from rogw.tranp.implements.syntax.tranp.syntax import SyntaxParser
 from rogw.tranp.lang.error import stacktrace
 from rogw.tranp.lang.module import filepath_to_module_path, load_module, load_module_path
+from rogw.tranp.providers.cache import cache_backend, cache_setting
 
 DictArgs = TypedDict('DictArgs', {'input': str, 'parser': str, 'grammar': str, 'normalizer': str, 'help': bool})
 Parser: TypeAlias = Callable[[str], str]
@@ -175,9 +178,7 @@ $ bin/ast.sh -i path/to/source.py -g path/to/grammar.lark -p other -n path/to/no
 	def build_for_other(self) -> Parser:
 		"""Returns: パーサー(Other)"""
 		grammar = self.load_file(self.args.grammar)
-		gram_parser = SyntaxParser(gram_rules(), gram_tokenizer())
-		gram_ast = gram_parser.parse(grammar, 'entry')
-		rules = Rules.from_ast(gram_ast.simplify())
+		rules = self.load_rules(grammar)
 		parser = SyntaxParser(rules)
 		normalizer_type = self.resolve_normalizer(self.args.normalizer)
 
@@ -196,7 +197,24 @@ $ bin/ast.sh -i path/to/source.py -g path/to/grammar.lark -p other -n path/to/no
 			])
 
 		return callback
-	
+
+	def load_rules(self, grammar: str) -> Rules:
+		"""ルールリストをロード
+
+		Args:
+			grammar: グラマー
+		Returns:
+			ルールリスト
+		Note:
+			コンパイル済みのルールリストをキャッシュから復元 @see rogw.tranp.implements.syntax.tranp.loader.RulesLoader
+		"""
+		def factory() -> Rules:
+			gram_parser = SyntaxParser(gram_rules(), gram_tokenizer())
+			return Rules.from_ast(gram_parser.parse(grammar, 'entry').simplify())
+
+		setting = cache_setting()
+		return RulesLoader(CacheProvider(setting, cache_backend(setting))).load(grammar, factory)
+
 	def resolve_normalizer(self, filepath: str) -> type[ASTNormalizer] | None:
 		"""AST正規化ミドルウェアを解決
 
@@ -0,0 +1,282 @@
+import json
+import os
+import sys
+import tempfile
+from dataclasses import asdict, replace
+from typing import TypedDict, cast
+
+from rogw.tranp.app.app import App
+from rogw.tranp.app.env import SourceEnvPath
+from rogw.tranp.bench.benchmark import Benchmark, BenchResult, SyntaxBenchmark, compare
+from rogw.tranp.bench.generator import Shape, SourceGenerator
+from rogw.tranp.bin.transpile import Args as TranspileArgs
+from rogw.tranp.bin.transpile import Config, TranspileApp
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.data.version import Versions
+from rogw.tranp.lang.annotation import injectable
+from rogw.tranp.lang.di import ModuleDefinitions
+from rogw.tranp.lang.module import to_fullyname
+from rogw.tranp.module.types import ModulePaths
+from rogw.tranp.syntax.ast.parser import ParserSetting
+from rogw.tranp.view.error_render import ErrorRender
+
+ArgsDict = TypedDict('ArgsDict', {
+	'config': str,
+	'modules': int,
+	'classes': int,
+	'methods': int,
+	'depth': int,
+	'fanout': int,
+	'generics': bool,
+	'output': str,
+	'baseline': str,
+	'threshold': float,
+	'syntax_backend': str,
+	'help': bool,
+})
+
+
+class Args:
+	"""引数"""
+
+	def __init__(self, argv: list[str]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			argv: コマンド引数リスト
+		"""
+		args = self.__parse_argv(argv)
+		self.config = args['config']
+		self.shape = Shape(
+			modules=args['modules'],
+			classes=args['classes'],
+			methods=args['methods'],
+			depth=args['depth'],
+			fanout=args['fanout'],
+			generics=args['generics'],
+		)
+		self.output = args['output']
+		self.baseline = args['baseline']
+		self.threshold = args['threshold']
+		self.syntax_backend = args['syntax_backend']
+		self.help = args['help']
+
+	def __parse_argv(self, argv: list[str]) -> ArgsDict:
+		"""コマンド引数をパース
+
+		Args:
+			argv: コマンド引数リスト
+		Returns:
+			パースしたコマンド引数
+		"""
+		shape = Shape()
+		args: ArgsDict = {
+			'config': 'example/config.yml',
+			'modules': shape.modules,
+			'classes': shape.classes,
+			'methods': shape.methods,
+			'depth': shape.depth,
+			'fanout': shape.fanout,
+			'generics': shape.generics,
+			'output': '',
+			'baseline': '',
+			'threshold': 1.2,
+			'syntax_backend': '',
+			'help': False,
+		}
+		while argv:
+			arg = argv.pop(0)
+			if arg == '-c':
+				args['config'] = argv.pop(0)
+			elif arg == '-n':
+				args['modules'] = int(argv.pop(0))
+			elif arg == '-k':
+				args['classes'] = int(argv.pop(0))
+			elif arg == '-m':
+				args['methods'] = int(argv.pop(0))
+			elif arg == '-d':
+				args['depth'] = int(argv.pop(0))
+			elif arg == '-f':
+				args['fanout'] = int(argv.pop(0))
+			elif arg == '-G':
+				args['generics'] = False
+			elif arg == '-o':
+				args['output'] = argv.pop(0)
+			elif arg == '-b':
+				args['baseline'] = argv.pop(0)
+			elif arg == '-t':
+				args['threshold'] = float(argv.pop(0))
+			elif arg == '-s':
+				args['syntax_backend'] = argv.pop(0)
+			elif arg == '-h':
+				args['help'] = True
+
+		return args
+
+
+class BenchApp:
+	"""ベンチマークアプリケーション"""
+
+	def __init__(self, args: Args) -> None:
+		"""インスタンスを生成
+
+		Args:
+			args: 引数
+		"""
+		self.args = args
+
+	def run(self) -> int:
+		"""実行処理
+
+		Returns:
+			終了コード。ベースラインに対して劣化した場合は1
+		"""
+		if self.args.help:
+			self.run_help()
+			return 0
+
+		result = self.measure()
+		self.print_result(result)
+		if self.args.output:
+			self.save(result, self.args.output)
+
+		if self.args.baseline:
+			return self.run_compare(result)
+
+		return 0
+
+	def measure(self) -> BenchResult:
+		"""合成モジュールを生成して計測
+
+		Returns:
+			計測結果
+		Note:
+			```
+			* 計測はキャッシュを無効にした状態で実施。合成モジュールと永続化されたシンボルテーブルは一時ディレクトリーに出力し、計測後に削除
+			* 構文解析はシンタックスパーサーのバックエンド毎に別のアプリケーションで計測 @see SyntaxBenchmark
+			```
+		"""
+		with tempfile.TemporaryDirectory() as workdir:
+			generator = SourceGenerator(self.args.shape)
+			module_paths = generator.generate(workdir)
+			benchmark = App(self.definitions(workdir, module_paths, self.args.syntax_backend)).run(Benchmark)
+			phases = benchmark.run()
+			syntax = {backend: App(self.definitions(workdir, module_paths, backend)).run(SyntaxBenchmark).run() for backend in SyntaxBenchmark.Backends}
+			return {
+				'version': Versions.app,
+				'shape': asdict(self.args.shape),
+				'modules': len(module_paths),
+				'lines': benchmark.lines(),
+				'errors': benchmark.errors,
+				'phases': phases,
+				'syntax': syntax,
+			}
+
+	def definitions(self, workdir: str, module_paths: ModulePaths, syntax_backend: str) -> ModuleDefinitions:
+		"""計測用のモジュール定義を生成
+
+		Args:
+			workdir: 作業ディレクトリー
+			module_paths: モジュールパスリスト
+			syntax_backend: シンタックスパーサーのバックエンド。空の場合はコンフィグの設定を使用
+		Returns:
+			モジュール定義
+		"""
+		@injectable
+		def make_parser_setting(config: Config) -> ParserSetting:
+			setting = TranspileApp.make_parser_setting(config)
+			return replace(setting, backend=syntax_backend) if syntax_backend else setting
+
+		return {
+			**TranspileApp.definitions(TranspileArgs(['-c', self.args.config])),
+			to_fullyname(CacheSetting): lambda: CacheSetting(basedir=os.path.join(workdir, '.cache'), enabled=False),
+			to_fullyname(ModulePaths): lambda: module_paths,
+			to_fullyname(ParserSetting): make_parser_setting,
+			to_fullyname(SourceEnvPath): lambda: SourceEnvPath.instantiate([workdir]),
+		}
+
+	def print_result(self, result: BenchResult) -> None:
+		"""計測結果を出力
+
+		Args:
+			result: 計測結果
+		"""
+		print(f'# Shape: {json.dumps(result["shape"])}')
+		print(f'# Modules: {result["modules"]}, Lines: {result["lines"]}, Errors: {result["errors"]}')
+		print(f'{"phase":<10}{"elapsed(s)":>12}{"modules/s":>12}{"lines/s":>12}{"rss(MB)":>10}')
+		for phase, phase_result in result['phases'].items():
+			print(f'{phase:<10}{phase_result["elapsed"]:>12.3f}{phase_result["modules_per_sec"]:>12.1f}{phase_result["lines_per_sec"]:>12.1f}{phase_result["peak_rss_mb"]:>10.1f}')
+
+		print('# Syntax backends (parse only)')
+		print(f'{"backend":<10}{"elapsed(s)":>12}{"modules/s":>12}{"lines/s":>12}')
+		for backend, backend_result in result['syntax'].items():
+			print(f'{backend:<10}{backend_result["elapsed"]:>12.3f}{backend_result["modules_per_sec"]:>12.1f}{backend_result["lines_per_sec"]:>12.1f}')
+
+	def save(self, result: BenchResult, filepath: str) -> None:
+		"""計測結果をJSONファイルに保存
+
+		Args:
+			result: 計測結果
+			filepath: ファイルパス
+		"""
+		dirpath = os.path.dirname(os.path.abspath(filepath))
+		if not os.path.exists(dirpath):
+			os.makedirs(dirpath)
+
+		with open(filepath, mode='w', encoding='utf-8') as f:
+			json.dump(result, f, indent=2)
+
+	def run_compare(self, result: BenchResult) -> int:
+		"""ベースラインと比較
+
+		Args:
+			result: 計測結果
+		Returns:
+			終了コード。劣化した場合は1
+		"""
+		with open(self.args.baseline, encoding='utf-8') as f:
+			baseline = cast(BenchResult, json.load(f))
+
+		if baseline['shape'] != result['shape']:
+			print(f'Warning: Shape mismatch. baseline: {json.dumps(baseline["shape"])}')
+
+		comparisons = compare(result, baseline, self.args.threshold)
+		print(f'# Compare with baseline: {self.args.baseline} (threshold: x{self.args.threshold})')
+		for comparison in comparisons:
+			mark = 'NG' if comparison.regressed else 'OK'
+			print(f'{mark} {comparison.phase:<10}{comparison.metric:<14}{comparison.baseline:>12.3f} -> {comparison.current:>12.3f} (x{comparison.ratio:.2f})')
+
+		return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+	def run_help(self) -> None:
+		"""実行処理(ヘルプ)"""
+		print("""# Usage
+$ bin/bench.sh [-c config_path] [-n modules] [-k classes] [-m methods] [-d depth] [-f fanout] [-G] [-o output_path] [-b baseline_path] [-t threshold] [-s backend] [-h]
+# Options
+-c: Config YAML filepath. default to './example/config.yml'
+-n: Number of modules. default to 10
+-k: Number of classes per module. default to 4
+-m: Number of methods per class. default to 4
+-d: Nesting depth of control flow per method. default to 2
+-f: Number of imports per module. default to 2
+-G: Disable generic class usage
+-o: Output result JSON filepath
+-b: Baseline result JSON filepath to compare
+-t: Regression threshold ratio against baseline. default to 1.2
+-s: Syntax parser backend for the phases. 'lark' or 'tranp'. default to the config. Both backends are always measured side by side for parsing
+-h: Show help
+# Examples
+$ bin/bench.sh
+$ bin/bench.sh -n 100 -k 8 -m 8
+$ bin/bench.sh -o ./bench/baseline.json
+$ bin/bench.sh -b ./bench/baseline.json -t 1.5
+$ bin/bench.sh -s tranp
+""")
+
+
+if __name__ == '__main__':
+	try:
+		sys.exit(BenchApp(Args(sys.argv[1:])).run())
+	except Exception as e:
+		print(ErrorRender(e))
+		sys.exit(1)
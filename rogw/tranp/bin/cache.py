@@ -0,0 +1,379 @@
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import ClassVar, TypedDict
+
+from rogw.tranp.app.app import App
+from rogw.tranp.bin.transpile import Args as TranspileArgs
+from rogw.tranp.bin.transpile import TranspileApp
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.cache.remote import CacheServer
+from rogw.tranp.cache.stats import CacheCounter, CacheStats
+from rogw.tranp.cache.storage import CacheFile, CacheStorage
+from rogw.tranp.errors import Errors
+from rogw.tranp.lang.di import ModuleDefinitions
+from rogw.tranp.lang.module import to_fullyname
+from rogw.tranp.module.modules import Modules
+from rogw.tranp.module.types import LibraryPaths, ModulePath, ModulePaths
+from rogw.tranp.providers.cache import cache_setting, local_cache_backend
+from rogw.tranp.syntax.ast.parser import SyntaxParser
+from rogw.tranp.view.error_render import ErrorRender
+
+ArgsDict = TypedDict('ArgsDict', {
+	'command': str,
+	'max_size': float,
+	'max_age': float,
+	'backend': str,
+	'host': str,
+	'port': int,
+	'dir': str,
+	'config': str,
+	'input_globs': list[str],
+	'jobs': int,
+	'help': bool,
+})
+
+
+class Args:
+	"""引数"""
+
+	def __init__(self, argv: list[str]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			argv: コマンド引数リスト
+		"""
+		args = self.__parse_argv(argv)
+		self.command = args['command']
+		self.max_size = args['max_size']
+		self.max_age = args['max_age']
+		self.backend = args['backend']
+		self.host = args['host']
+		self.port = args['port']
+		self.dir = args['dir']
+		self.config = args['config']
+		self.input_globs = args['input_globs']
+		self.jobs = args['jobs']
+		self.help = args['help']
+
+	def __parse_argv(self, argv: list[str]) -> ArgsDict:
+		"""コマンド引数をパース
+
+		Args:
+			argv: コマンド引数リスト
+		Returns:
+			パースしたコマンド引数
+		"""
+		args: ArgsDict = {
+			'command': '',
+			'max_size': -1,
+			'max_age': -1,
+			'backend': '',
+			'host': '127.0.0.1',
+			'port': 8765,
+			'dir': '',
+			'config': 'example/config.yml',
+			'input_globs': [],
+			'jobs': 1,
+			'help': False,
+		}
+		while argv:
+			arg = argv.pop(0)
+			if arg == '-s':
+				args['max_size'] = float(argv.pop(0))
+			elif arg == '-a':
+				args['max_age'] = float(argv.pop(0))
+			elif arg == '-b':
+				args['backend'] = argv.pop(0)
+			elif arg == '-p':
+				args['port'] = int(argv.pop(0))
+			elif arg == '--host':
+				args['host'] = argv.pop(0)
+			elif arg == '--dir':
+				args['dir'] = argv.pop(0)
+			elif arg == '-c':
+				args['config'] = argv.pop(0)
+			elif arg == '-i':
+				args['input_globs'].append(argv.pop(0))
+			elif arg == '-j':
+				args['jobs'] = int(argv.pop(0))
+			elif arg == '-h':
+				args['help'] = True
+			elif not arg.startswith('-'):
+				args['command'] = arg
+
+		return args
+
+
+class CacheApp:
+	"""キャッシュ管理アプリケーション"""
+
+	def __init__(self, args: Args, setting: CacheSetting) -> None:
+		"""インスタンスを生成
+
+		Args:
+			args: 引数
+			setting: キャッシュ設定データ
+		Note:
+			```
+			* バックエンド・保存ディレクトリーの指定がある場合はキャッシュ設定データより優先
+			* リモートキャッシュは対象外。ローカルのバックエンドのみを扱う
+			```
+		"""
+		self.args = args
+		self.setting = setting
+		if args.backend:
+			self.setting = replace(self.setting, backend=args.backend)
+
+		if args.dir:
+			self.setting = replace(self.setting, basedir=args.dir)
+
+		self.storage = CacheStorage(self.setting.basedir)
+		self.backend = local_cache_backend(self.setting)
+
+	def run(self) -> int:
+		"""実行処理
+
+		Returns:
+			終了コード
+		"""
+		if self.args.help:
+			self.run_help()
+		elif self.args.command == 'stats':
+			self.run_stats()
+		elif self.args.command == 'gc':
+			self.run_gc()
+		elif self.args.command == 'serve':
+			self.run_serve()
+		elif self.args.command == 'warm':
+			self.run_warm()
+		else:
+			self.run_help()
+
+		return 0
+
+	def run_stats(self) -> None:
+		"""実行処理(統計)"""
+		files = self.backend.files()
+		print(f'# Cache: {self.storage.basedir} ({self.setting.backend})')
+		print(f'# Files: {len(files)}, Size: {self.to_mb(self.total_size(files)):.1f}MB')
+		print(f'{"prefix":<16}{"hits":>10}{"misses":>10}{"hit rate":>10}{"read(MB)":>10}{"write(MB)":>10}{"load(ms)":>10}')
+		for prefix, counter in sorted(CacheStats.load(self.storage.stats_filepath).items()):
+			total = counter['hits'] + counter['misses']
+			hit_rate = counter['hits'] / total * 100 if total > 0 else 0.0
+			print(f'{prefix:<16}{counter["hits"]:>10}{counter["misses"]:>10}{hit_rate:>9.1f}%{self.to_mb(counter["bytes_read"]):>10.1f}{self.to_mb(counter["bytes_written"]):>10.1f}{counter["load_time"] * 1000:>10.1f}')
+
+	def run_gc(self) -> None:
+		"""実行処理(エビクション)
+
+		Note:
+			上限の指定がない場合はキャッシュ設定データの上限を使用
+		"""
+		max_size = int(self.args.max_size * 1024 * 1024) if self.args.max_size >= 0 else self.setting.max_size
+		max_age = self.args.max_age * 24 * 60 * 60 if self.args.max_age >= 0 else self.setting.max_age
+		removed = self.backend.gc(max_size, max_age)
+		self.storage.stamp_gc()
+		remains = self.backend.files()
+		print(f'# Removed: {len(removed)} files ({self.to_mb(self.total_size(removed)):.1f}MB)')
+		print(f'# Remains: {len(remains)} files ({self.to_mb(self.total_size(remains)):.1f}MB)')
+
+	def run_serve(self) -> None:
+		"""実行処理(リモートキャッシュサーバー)
+
+		Note:
+			停止するまで処理を継続 @see rogw.tranp.cache.remote.CacheServer
+		"""
+		server = CacheServer(self.backend, self.args.host, self.args.port)
+		print(f'# Serving: {self.storage.basedir} ({self.setting.backend}) on {server.url}')
+		try:
+			server.serve_forever()
+		except KeyboardInterrupt:
+			pass
+		finally:
+			server.server_close()
+
+	def run_warm(self) -> None:
+		"""実行処理(ウォームアップ)
+
+		Note:
+			```
+			* 1. 対象のモジュールをプロセスプールに分配してパースし、ASTのキャッシュを生成
+			* 2. 対象のモジュールを依存関係の順にロードし、プリプロセス(RestoreSymbols〜StoreSymbols)によってシンボルテーブルのキャッシュを生成
+			* シンボルテーブルは依存モジュールのシンボルを参照するため、2は直列で実行
+			* 対象のモジュールはトランスパイルと同様にコンフィグの入力パターン、または-iの指定から抽出 @see rogw.tranp.module.includer.include_module_paths
+			@see WarmWorker
+			```
+		"""
+		if not self.setting.enabled:
+			print('# Cache is disabled')
+			return
+
+		start = time.perf_counter()
+		transpile_args = TranspileArgs(['-c', self.args.config, *[arg for input_glob in self.args.input_globs for arg in ['-i', input_glob]]])
+		app = App(WarmWorker.definitions(transpile_args, self.setting))
+		module_paths = self.unique_module_paths([*app.resolve(LibraryPaths), *app.resolve(ModulePaths)])
+		if self.args.jobs > 1 and len(module_paths) > 1:
+			max_workers = min(self.args.jobs, len(module_paths))
+			with ProcessPoolExecutor(max_workers=max_workers, initializer=WarmWorker.setup, initargs=(transpile_args, self.setting)) as executor:
+				for counters in executor.map(WarmWorker.parse, [module_path.path for module_path in module_paths]):
+					CacheStats.instance().merge(counters)
+		else:
+			parser = app.resolve(SyntaxParser)
+			for module_path in module_paths:
+				parser(module_path.path)
+
+		loaded = app.run(self.preprocess)
+		counters = CacheStats.instance().counters
+		hits = sum(counter['hits'] for counter in counters.values())
+		misses = sum(counter['misses'] for counter in counters.values())
+		CacheStats.instance().save(self.storage.stats_filepath)
+		print(f'# Warmed: {self.storage.basedir} ({self.setting.backend})')
+		print(f'# Modules: parsed {len(module_paths)}, loaded {loaded}, Caches: hits {hits}, misses {misses}, Elapsed: {time.perf_counter() - start:.1f}s')
+
+	def preprocess(self, modules: Modules, module_paths: ModulePaths) -> int:
+		"""全てのモジュールをロードし、シンボルテーブルを永続化
+
+		Args:
+			modules: モジュールマネージャー @inject
+			module_paths: モジュールパスリスト @inject
+		Returns:
+			ロードしたモジュールの数
+		Note:
+			依存モジュールはロード時に再帰的に先行してロードされる @see rogw.tranp.module.modules.Modules.load
+		"""
+		modules.libralies()
+		for module_path in module_paths:
+			modules.load(module_path.path)
+
+		return len(modules.loaded())
+
+	def unique_module_paths(self, module_paths: list[ModulePath]) -> list[ModulePath]:
+		"""重複を除いたモジュールパスリストを生成
+
+		Args:
+			module_paths: モジュールパスリスト
+		Returns:
+			モジュールパスリスト(出現順)
+		"""
+		return list({module_path.path: module_path for module_path in module_paths}.values())
+
+	def total_size(self, files: list[CacheFile]) -> int:
+		"""合計サイズを算出
+
+		Args:
+			files: キャッシュファイルリスト
+		Returns:
+			合計サイズ(バイト)
+		"""
+		return sum(found.size for found in files)
+
+	def to_mb(self, size: int) -> float:
+		"""バイトをMBに変換
+
+		Args:
+			size: サイズ(バイト)
+		Returns:
+			サイズ(MB)
+		"""
+		return size / 1024 / 1024
+
+	def run_help(self) -> None:
+		"""実行処理(ヘルプ)"""
+		print("""# Usage
+$ bin/cache.sh stats [-b backend]
+$ bin/cache.sh gc [-s max_size] [-a max_age] [-b backend]
+$ bin/cache.sh serve [-p port] [--host host] [--dir dir] [-b backend]
+$ bin/cache.sh warm [-j jobs] [-i input_glob] [-c config_path] [-b backend] [--dir dir]
+$ bin/cache.sh -d
+# Commands
+stats: Show hit/miss statistics per cache key prefix and disk usage
+gc: Remove caches unused for longer than max_age, then least recently used caches until the total fits max_size
+serve: Run a remote cache server sharing the caches over HTTP. Use with 'bin/transpile.sh --cache-remote url'
+warm: Pre-populate the parse and symbol caches of the target modules. e.g. Bake caches into CI images
+# Options
+-s: Max total size in MB. default to the cache setting (1024MB)
+-a: Max age in days since last use. default to the cache setting (30 days)
+-b: Cache backend. 'files' or 'packed'. default to the cache setting ('files')
+-p: Port number of the server. default to 8765
+--host: Host name of the server. default to '127.0.0.1'
+--dir: Cache directory. default to the cache setting ('.cache/tranp')
+-j: Number of parallel parsing processes. default to 1
+-i: Input glob of the target modules. Repeatable. default to 'input_globs' in the config
+-c: Config YAML filepath. default to './example/config.yml'
+-d: Delete all caches
+-h: Show help
+# Examples
+$ bin/cache.sh stats
+$ bin/cache.sh gc -s 256 -a 7
+$ bin/cache.sh gc -b packed
+$ bin/cache.sh serve -p 8765 --dir .cache/remote -b packed
+$ bin/cache.sh warm -j 4 -i 'example/**/*.py'
+""")
+
+
+class WarmWorker:
+	"""ワーカー(ウォームアップ)
+
+	Note:
+		```
+		* ワーカープロセス毎にアプリケーション(DIコンテナー)を生成し、プロセスの生存期間中は使い回す
+		* パースの結果はディスク上のキャッシュに保存されるため、親プロセスとも共有される
+		@see CacheApp.run_warm
+		```
+	"""
+
+	parser: ClassVar[SyntaxParser | None] = None
+
+	@classmethod
+	def definitions(cls, args: TranspileArgs, setting: CacheSetting) -> ModuleDefinitions:
+		"""モジュール定義を生成
+
+		Args:
+			args: トランスパイルの引数
+			setting: キャッシュ設定データ
+		Returns:
+			モジュール定義
+		"""
+		return {
+			**TranspileApp.definitions(args),
+			to_fullyname(CacheSetting): lambda: setting,
+		}
+
+	@classmethod
+	def setup(cls, args: TranspileArgs, setting: CacheSetting) -> None:
+		"""ワーカープロセスを初期化
+
+		Args:
+			args: トランスパイルの引数
+			setting: キャッシュ設定データ
+		"""
+		cls.parser = App(cls.definitions(args, setting)).resolve(SyntaxParser)
+
+	@classmethod
+	def parse(cls, module_path: str) -> dict[str, CacheCounter]:
+		"""モジュールをパース
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			キャッシュの統計
+		Raises:
+			Errors.Fatal: パースに失敗
+		Note:
+			例外はシリアライズ出来ない値を含む場合があるため、レンダリング済みのメッセージに変換して親プロセスに送出
+		"""
+		assert cls.parser is not None, 'Must be called after setup'
+		try:
+			cls.parser(module_path)
+			return CacheStats.instance().drain()
+		except Exception as e:
+			raise Errors.Fatal(str(ErrorRender(e))) from None
+
+
+if __name__ == '__main__':
+	try:
+		sys.exit(CacheApp(Args(sys.argv[1:]), cache_setting()).run())
+	except Exception as e:
+		print(ErrorRender(e))
+		sys.exit(1)
@@ -0,0 +1,165 @@
+import os
+import sys
+import tempfile
+from typing import TypedDict
+
+from rogw.tranp.app.app import App
+from rogw.tranp.bin.transpile import Args as TranspileArgs
+from rogw.tranp.bin.transpile import TranspileApp
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.implements.syntax.lark.entry import Serialization
+from rogw.tranp.implements.syntax.lark.parser import SyntaxParserOfLark
+from rogw.tranp.lang.module import to_fullyname
+from rogw.tranp.module.modules import Modules
+from rogw.tranp.module.pack import LibraryPack
+from rogw.tranp.providers.module import library_pack_filepath
+from rogw.tranp.semantics.reflection.db import SymbolDB
+from rogw.tranp.semantics.reflection.serialization import IReflectionSerializer
+from rogw.tranp.syntax.ast.parser import SyntaxParser
+from rogw.tranp.view.error_render import ErrorRender
+
+ArgsDict = TypedDict('ArgsDict', {
+	'config': str,
+	'output': str,
+	'help': bool,
+})
+
+
+class Args:
+	"""引数"""
+
+	def __init__(self, argv: list[str]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			argv: コマンド引数リスト
+		"""
+		args = self.__parse_argv(argv)
+		self.config = args['config']
+		self.output = args['output']
+		self.help = args['help']
+
+	def __parse_argv(self, argv: list[str]) -> ArgsDict:
+		"""コマンド引数をパース
+
+		Args:
+			argv: コマンド引数リスト
+		Returns:
+			パースしたコマンド引数
+		"""
+		args: ArgsDict = {
+			'config': 'example/config.yml',
+			'output': library_pack_filepath(),
+			'help': False,
+		}
+		while argv:
+			arg = argv.pop(0)
+			if arg == '-c':
+				args['config'] = argv.pop(0)
+			elif arg == '-o':
+				args['output'] = argv.pop(0)
+			elif arg == '-h':
+				args['help'] = True
+
+		return args
+
+
+class PackApp:
+	"""ライブラリーパック生成アプリケーション"""
+
+	def __init__(self, args: Args) -> None:
+		"""インスタンスを生成
+
+		Args:
+			args: 引数
+		"""
+		self.args = args
+
+	def run(self) -> int:
+		"""実行処理
+
+		Returns:
+			終了コード
+		"""
+		if self.args.help:
+			self.run_help()
+			return 0
+
+		pack = self.build()
+		pack.save(self.args.output)
+		self.print_result(pack)
+		return 0
+
+	def build(self) -> LibraryPack:
+		"""標準ライブラリーを解析してパックを生成
+
+		Returns:
+			ライブラリーパック
+		Note:
+			```
+			* 既存のパックとキャッシュの影響を受けない様に、いずれも無効にした状態で解析
+			* 依存モジュールとしてロードされたモジュールも含め、全てのモジュールを完全に展開した上で格納
+			```
+		"""
+		with tempfile.TemporaryDirectory() as workdir:
+			definitions = {
+				**TranspileApp.definitions(TranspileArgs(['-c', self.args.config])),
+				to_fullyname(CacheSetting): lambda: CacheSetting(basedir=os.path.join(workdir, '.cache'), enabled=False),
+				to_fullyname(LibraryPack): lambda: LibraryPack(),
+			}
+			return App(definitions).run(self.pack)
+
+	def pack(self, modules: Modules, parser: SyntaxParser, db: SymbolDB, serializer: IReflectionSerializer) -> LibraryPack:
+		"""モジュールのシンタックスツリーとシンボルテーブルをパックに格納
+
+		Args:
+			modules: モジュールマネージャー
+			parser: シンタックスパーサー
+			db: シンボルテーブル
+			serializer: シンボルシリアライザー
+		Returns:
+			ライブラリーパック
+		"""
+		modules.libralies()
+		for module in modules.loaded():
+			modules.load(module.path, module.module_path.language)
+
+		assert isinstance(parser, SyntaxParserOfLark), f'Unsupported parser. parser: {parser}'
+
+		pack = LibraryPack()
+		for module in modules.loaded():
+			pack.put(module.path, 'entry', parser.packed_identity(module.path), Serialization.dumps(parser(module.path).source))
+			pack.put(module.path, 'symbols', module.identity(), db.to_json(serializer, for_module_path=module.path))
+
+		return pack
+
+	def print_result(self, pack: LibraryPack) -> None:
+		"""生成結果を出力
+
+		Args:
+			pack: ライブラリーパック
+		"""
+		print(f'# Output: {self.args.output} ({os.path.getsize(self.args.output)} bytes)')
+		for module_path in pack.module_paths:
+			print(f'- {module_path}')
+
+	def run_help(self) -> None:
+		"""実行処理(ヘルプ)"""
+		print("""# Usage
+$ bin/pack.sh [-c config_path] [-o output_path] [-h]
+# Options
+-c: Config YAML filepath. default to './example/config.yml'
+-o: Output pack filepath. default to './data/libralies.pack'
+-h: Show help
+# Examples
+$ bin/pack.sh
+$ bin/pack.sh -o ./libralies.pack
+""")
+
+
+if __name__ == '__main__':
+	try:
+		sys.exit(PackApp(Args(sys.argv[1:])).run())
+	except Exception as e:
+		print(ErrorRender(e))
+		sys.exit(1)
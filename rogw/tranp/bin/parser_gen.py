@@ -0,0 +1,158 @@
+import os
+import sys
+from importlib import import_module
+from typing import TypedDict
+
+from data.syntax.gram_rules import gram_rules
+from data.syntax.gram_tokenizer import gram_tokenizer
+from rogw.tranp.implements.syntax.tranp.codegen import ParserGenerator
+from rogw.tranp.implements.syntax.tranp.rule import Rules
+from rogw.tranp.implements.syntax.tranp.syntax import SyntaxParser
+from rogw.tranp.lang.error import stacktrace
+from rogw.tranp.lang.module import filepath_to_module_path
+
+DictArgs = TypedDict('DictArgs', {'input': str, 'output': str, 'class_name': str, 'memoize': bool, 'help': bool})
+
+
+class Args:
+	"""アプリケーション引数"""
+
+	def __init__(self, argv: list[str]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			argv: コマンドライン引数
+		"""
+		args = self.parse(argv)
+		self.input = args['input']
+		self.output = args['output']
+		self.class_name = args['class_name']
+		self.memoize = args['memoize']
+		self.help = args['help']
+
+	def parse(self, argv: list[str]) -> DictArgs:
+		"""コマンドライン引数を解析
+
+		Args:
+			argv: コマンドライン引数
+		Returns:
+			引数一覧
+		"""
+		args: DictArgs = {
+			'input': '',
+			'output': '',
+			'class_name': '',
+			'memoize': False,
+			'help': False,
+		}
+		while(len(argv)):
+			value = argv.pop(0)
+			if value == '-i':
+				args['input'] = argv.pop(0)
+			elif value == '-o':
+				args['output'] = argv.pop(0)
+			elif value == '-c':
+				args['class_name'] = argv.pop(0)
+			elif value == '-m':
+				args['memoize'] = True
+			elif value == '-h':
+				args['help'] = True
+
+		return args
+
+
+class App:
+	"""アプリケーション"""
+
+	def __init__(self, args: Args) -> None:
+		"""インスタンスを生成
+
+		Args:
+			args: 引数
+		"""
+		self.args = args
+
+	def run(self) -> None:
+		"""実行処理"""
+		if self.args.help or not self.args.input:
+			self.run_help()
+		elif self.args.output:
+			self.run_output()
+		else:
+			self.run_echo()
+
+	def run_help(self) -> None:
+		"""実行処理(ヘルプ)"""
+		print("""# Usage
+$ bin/parser.sh -i input_path [-o output_path] [-c class_name] [-m] [-h]
+# Options
+-i: Input rules file(*.py) or grammar file(*.lark)
+-o: Output parser file
+-c: Parser class name. Default is the CamelCase of the output file name
+-m: Memoize the matching results (packrat parsing)
+-h: Show help
+# Examples
+$ bin/parser.sh -i data/syntax/py_rules.py
+$ bin/parser.sh -i data/syntax/py_rules.py -o data/syntax/py_parser.py
+$ bin/parser.sh -i data/syntax/py_gram.lark -o path/to/output_parser.py
+$ bin/parser.sh -i data/syntax/grammar.lark -o data/syntax/grammar_parser.py -m
+""")
+
+	def run_echo(self) -> None:
+		"""実行処理(生成結果を標準出力)"""
+		print(self.generate())
+
+	def run_output(self) -> None:
+		"""実行処理(生成結果をファイル出力)"""
+		with open(self.args.output, mode='w', encoding='utf-8', newline='') as f:
+			f.write(self.generate())
+
+	def generate(self) -> str:
+		"""パーサーモジュールのソースコードを生成
+
+		Returns:
+			ソースコード
+		"""
+		return ParserGenerator(self.load_rules(self.args.input), memoize=self.args.memoize).generate(self.class_name())
+
+	def class_name(self) -> str:
+		"""Returns: パーサーのクラス名"""
+		if self.args.class_name:
+			return self.args.class_name
+
+		if not self.args.output:
+			return 'Parser'
+
+		filename, _ = os.path.splitext(os.path.basename(self.args.output))
+		return ''.join([elem.capitalize() for elem in filename.split('_')])
+
+	def load_rules(self, filepath: str) -> Rules:
+		"""ルールリストをロード
+
+		Args:
+			filepath: ルールリスト(*.py)、またはグラマー(*.lark)のファイルパス
+		Returns:
+			ルールリスト
+		Note:
+			ルールリストのモジュールはファイル名と同名の関数でルールリストを提供 @see rogw.tranp.bin.gram_check.App.render_rules
+		"""
+		abs_filepath = os.path.abspath(filepath)
+		basepath, extention = os.path.splitext(abs_filepath)
+		if extention == '.py':
+			module = import_module(filepath_to_module_path(abs_filepath, os.getcwd()))
+			return getattr(module, os.path.basename(basepath))()
+
+		with open(abs_filepath, mode='rb') as f:
+			grammar = f.read().decode('utf-8')
+
+		gram_parser = SyntaxParser(gram_rules(), gram_tokenizer())
+		return Rules.from_ast(gram_parser.parse(grammar, 'entry').simplify())
+
+
+if __name__ == '__main__':
+	try:
+		App(Args(sys.argv[1:])).run()
+	except KeyboardInterrupt:
+		pass
+	except Exception as e:
+		print(''.join(stacktrace(e)))
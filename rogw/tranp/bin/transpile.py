@@ -1,19 +1,27 @@
+import hashlib
 import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from enum import Enum
-from typing import Any, TypedDict, cast
+from typing import Any, ClassVar, TypedDict, cast, override
 
 import yaml
 
 from rogw.tranp.app.app import App
 from rogw.tranp.app.dummy import WrapSourceProvider, make_dummy_module_meta_factory
 from rogw.tranp.bin.io import tty
-from rogw.tranp.data.meta.header import MetaHeader
+from rogw.tranp.cache.backend import CacheBackend
+from rogw.tranp.cache.cache import CacheProvider, CacheSetting
+from rogw.tranp.cache.stats import CacheCounter, CacheStats
+from rogw.tranp.cache.storage import CacheStorage
+from rogw.tranp.data.meta.manifest import BuildManifest, ManifestEntry, ManifestOutput
 from rogw.tranp.data.meta.types import ModuleMetaFactory
 from rogw.tranp.errors import Errors
 from rogw.tranp.file.loader import IDataLoader, ISourceLoader
-from rogw.tranp.file.writer import Writer
+from rogw.tranp.file.writer import Writer, WriterPool
 from rogw.tranp.i18n.i18n import I18n, TranslationMapping
 from rogw.tranp.implements.cpp.providers.view import renderer_helper_provider_cpp
 from rogw.tranp.implements.cpp.transpiler.py2cpp import Py2Cpp
@@ -23,11 +31,13 @@ from rogw.tranp.lang.di import DI, ModuleDefinitions
 from rogw.tranp.lang.locator import Invoker, Locator
 from rogw.tranp.lang.middleware import Middleware
 from rogw.tranp.lang.module import module_path_to_filepath, to_fullyname
-from rogw.tranp.lang.profile import profiler
+from rogw.tranp.lang.profile import TraceEvent, Tracer, profiler, rss_mb
+from rogw.tranp.module.graph import DependencyGraph
 from rogw.tranp.module.includer import include_module_paths
 from rogw.tranp.module.module import Module
 from rogw.tranp.module.modules import Modules
-from rogw.tranp.module.types import ModulePath, ModulePaths
+from rogw.tranp.module.types import LibraryPaths, ModulePath, ModulePaths
+from rogw.tranp.providers.cache import cache_setting
 from rogw.tranp.syntax.ast.parser import ParserSetting, SourceProvider
 from rogw.tranp.syntax.node.node import Node
 from rogw.tranp.transpiler.types import ITranspiler, TranspilerOptions
@@ -42,6 +52,13 @@ ArgsDict = TypedDict('ArgsDict', {
 	'help': bool,
 	'profile': bool,
 	'verbose': bool,
+	'jobs': int,
+	'watch': bool,
+	'trace_out': str,
+	'memory_budget': int,
+	'cache_backend': str,
+	'cache_remote': str,
+	'syntax_backend': str,
 })
 EnvDict = TypedDict('EnvDict', {
 	'transpiler': dict[str, Any],
@@ -60,6 +77,13 @@ ConfigDict = TypedDict('ConfigDict', {
 	'force': bool,
 	'profile': bool,
 	'verbose': bool,
+	'jobs': int,
+	'watch': bool,
+	'trace_out': str,
+	'memory_budget': int,
+	'cache_backend': str,
+	'cache_remote': str,
+	'syntax_backend': str,
 })
 
 
@@ -80,6 +104,13 @@ class Args:
 		self.help = args['help']
 		self.profile = args['profile']
 		self.verbose = args['verbose']
+		self.jobs = args['jobs']
+		self.watch = args['watch']
+		self.trace_out = args['trace_out']
+		self.memory_budget = args['memory_budget']
+		self.cache_backend = args['cache_backend']
+		self.cache_remote = args['cache_remote']
+		self.syntax_backend = args['syntax_backend']
 
 	def __parse_argv(self, argv: list[str]) -> ArgsDict:
 		"""コマンド引数をパース
@@ -97,6 +128,13 @@ class Args:
 			'help': False,
 			'profile': False,
 			'verbose': False,
+			'jobs': 1,
+			'watch': False,
+			'trace_out': '',
+			'memory_budget': 0,
+			'cache_backend': '',
+			'cache_remote': '',
+			'syntax_backend': '',
 		}
 		while argv:
 			arg = argv.pop(0)
@@ -114,6 +152,20 @@ class Args:
 				args['profile'] = True
 			elif arg == '-v':
 				args['verbose'] = True
+			elif arg == '-j':
+				args['jobs'] = int(argv.pop(0))
+			elif arg in ['-w', '--watch']:
+				args['watch'] = True
+			elif arg == '--trace-out':
+				args['trace_out'] = argv.pop(0)
+			elif arg == '--memory-budget':
+				args['memory_budget'] = int(argv.pop(0))
+			elif arg == '--cache-backend':
+				args['cache_backend'] = argv.pop(0)
+			elif arg == '--cache-remote':
+				args['cache_remote'] = argv.pop(0)
+			elif arg == '--syntax-backend':
+				args['syntax_backend'] = argv.pop(0)
 
 		return args
 
@@ -126,6 +178,7 @@ class Config:
 		Interactive = 0
 		Run = 1
 		Help = 2
+		Watch = 3
 
 	def __init__(self, args: Args) -> None:
 		"""インスタンスを生成
@@ -146,7 +199,31 @@ class Config:
 		self.force = config.get('force', args.force)
 		self.profile = config.get('profile', args.profile)
 		self.verbose = config.get('verbose', args.verbose)
-		self.mode = Config.Modes.Help if args.help else (Config.Modes.Interactive if args.interactive else Config.Modes.Run)
+		self.jobs = max(1, config.get('jobs', args.jobs))
+		self.watch = config.get('watch', args.watch)
+		self.trace_out = config.get('trace_out', args.trace_out)
+		self.memory_budget = max(0, config.get('memory_budget', args.memory_budget))
+		self.cache_backend = config.get('cache_backend', args.cache_backend)
+		self.cache_remote = config.get('cache_remote', args.cache_remote)
+		self.syntax_backend = config.get('syntax_backend', args.syntax_backend)
+		self.mode = self.__select_mode(args)
+
+	def __select_mode(self, args: Args) -> 'Config.Modes':
+		"""実行モードを選択
+
+		Args:
+			args: 引数
+		Returns:
+			モード種別
+		"""
+		if args.help:
+			return Config.Modes.Help
+		elif args.interactive:
+			return Config.Modes.Interactive
+		elif self.watch:
+			return Config.Modes.Watch
+		else:
+			return Config.Modes.Run
 
 	def __load_config(self, filepath: str) -> ConfigDict:
 		"""コマンド引数をパース
@@ -198,8 +275,35 @@ class TranspileApp:
 			config: コンフィグ @inject
 		Returns:
 			シンタックスパーサー設定データ
+		Note:
+			バックエンドの指定がない場合はデフォルトの設定を使用 @see rogw.tranp.syntax.ast.parser.ParserSetting
 		"""
-		return ParserSetting(grammar=config.grammar)
+		setting = ParserSetting(grammar=config.grammar)
+		if config.syntax_backend:
+			setting = replace(setting, backend=config.syntax_backend)
+
+		return setting
+
+	@classmethod
+	@injectable
+	def make_cache_setting(cls, config: Config) -> CacheSetting:
+		"""キャッシュ設定データを生成
+
+		Args:
+			config: コンフィグ @inject
+		Returns:
+			キャッシュ設定データ
+		Note:
+			バックエンド・リモートキャッシュの指定がない場合はデフォルトの設定を使用 @see rogw.tranp.providers.cache.cache_setting
+		"""
+		setting = cache_setting()
+		if config.cache_backend:
+			setting = replace(setting, backend=config.cache_backend)
+
+		if config.cache_remote:
+			setting = replace(setting, remote=config.cache_remote)
+
+		return setting
 
 	@classmethod
 	@injectable
@@ -242,6 +346,8 @@ class TranspileApp:
 		"""
 		config = Config(args)
 		definitions = {
+			to_fullyname(Args): lambda: args,
+			to_fullyname(CacheSetting): cls.make_cache_setting,
 			to_fullyname(Config): lambda: config,
 			to_fullyname(ITranspiler): Py2Cpp,
 			to_fullyname(ModulePaths): cls.make_module_paths,
@@ -268,6 +374,7 @@ class TranspileApp:
 			Config.Modes.Run: Runner,
 			Config.Modes.Interactive: Interactive,
 			Config.Modes.Help: Help,
+			Config.Modes.Watch: Watcher,
 		}
 		invoker(modes[config.mode]).run()
 
@@ -275,54 +382,311 @@ class TranspileApp:
 class Runner:
 	"""ランナー(非対話モード)"""
 
-	def __init__(self, sources: ISourceLoader, config: Config, module_paths: ModulePaths, modules: Modules, module_meta_factory: ModuleMetaFactory, transpiler: ITranspiler) -> None:
+	def __init__(self, sources: ISourceLoader, args: Args, config: Config, caches: CacheProvider, cache_setting: CacheSetting, cache_backend: CacheBackend, library_paths: LibraryPaths, module_paths: ModulePaths, modules: Modules, transpiler: ITranspiler) -> None:
 		"""インスタンスを生成
 
 		Args:
 			sources: ソースコードローダー @inject
+			args: 引数 @inject
 			config: コンフィグ @inject
+			caches: キャッシュプロバイダー @inject
+			cache_setting: キャッシュ設定データ @inject
+			cache_backend: キャッシュバックエンド @inject
+			library_paths: 標準ライブラリーパスリスト @inject
 			module_paths: モジュールパスリスト @inject
 			modules: モジュールリスト @inject
-			module_meta_factory: モジュールのメタ情報ファクトリー @inject
 			transpiler: トランスパイラー @inject
 		"""
 		self.sources = sources
+		self.args = args
+		self.library_paths = library_paths
 		self.module_paths = module_paths
 		self.modules = modules
 		self.config = config
-		self.module_meta_factory = module_meta_factory
+		self.caches = caches
+		self.cache_setting = cache_setting
+		self.cache_backend = cache_backend
 		self.transpiler = transpiler
+		self.writers = WriterPool()
 
 	def run(self) -> None:
 		"""トランスパイルの実行"""
+		self.trace_begin()
 		if self.config.profile:
 			profiler('tottime')(self._run_impl)()
 		else:
 			self._run_impl()
 
-	def _run_impl(self) -> None:
-		"""トランスパイルの実行"""
-		target_paths = self.module_paths if self.config.force else [module_path for module_path in self.module_paths if self.can_transpile(module_path)]
-		for module_path in target_paths:
-			content = self.transpiler.transpile(self.by_entrypoint(module_path))
-			writer = Writer(self.output_filepath(module_path))
-			writer.put(content)
-			writer.flush()
-
-	def can_transpile(self, module_path: ModulePath) -> bool:
+		self.trace_end()
+		self.cache_end()
+
+	def _run_impl(self) -> BuildManifest:
+		"""トランスパイルの実行
+
+		Returns:
+			ビルドマニフェスト
+		"""
+		manifest = BuildManifest.load(self.manifest_filepath())
+		target_paths = self.module_paths if self.config.force else self.dirty_module_paths(manifest)
+		if self.config.jobs > 1 and len(target_paths) > 1:
+			self._run_parallel(target_paths, manifest)
+		else:
+			self._run_serial(target_paths, manifest)
+
+		if len(target_paths) > 0:
+			manifest.save(self.manifest_filepath())
+
+		return manifest
+
+	def _run_serial(self, target_paths: list[ModulePath], manifest: BuildManifest) -> None:
+		"""トランスパイルの実行(直列)
+
+		Args:
+			target_paths: 対象のモジュールパスリスト
+			manifest: ビルドマニフェスト
+		Note:
+			```
+			* メモリー使用量が上限を超えた場合は、マニフェストのエントリーを収集した上でモジュールを解放
+			* ファイル出力はバックグラウンドで実行し、全ての出力の完了を待機して終了
+			```
+		"""
+		outputs: dict[str, ManifestOutput] = {}
+		for index, module_path in enumerate(target_paths):
+			content = self.transpile(module_path)
+			self.write(module_path, content)
+			outputs[module_path.path] = self.make_manifest_output(module_path, content)
+			if self.over_memory_budget():
+				manifest.update(self.collect_manifest_entries(outputs))
+				outputs = {}
+				self.release_modules([in_path.path for in_path in target_paths[index + 1:]], manifest.graph())
+
+		manifest.update(self.collect_manifest_entries(outputs))
+		self.writers.wait()
+
+	def _run_parallel(self, target_paths: list[ModulePath], manifest: BuildManifest) -> None:
+		"""トランスパイルの実行(並列)
+
+		Args:
+			target_paths: 対象のモジュールパスリスト
+			manifest: ビルドマニフェスト
+		Note:
+			```
+			* 対象のモジュールをプロセスプールに分配し、結果は親プロセスで対象の順序通りに出力
+			* 出力結果は直列実行と同一
+			* ファイル出力はバックグラウンドで実行し、全ての出力の完了を待機して終了
+			@see Worker
+			```
+		"""
+		max_workers = min(self.config.jobs, len(target_paths))
+		with ProcessPoolExecutor(max_workers=max_workers, initializer=Worker.setup, initargs=(self.args,)) as executor:
+			for module_path, (content, entries, events, counters) in zip(target_paths, executor.map(Worker.transpile, target_paths)):
+				self.write(module_path, content)
+				manifest.update(entries)
+				Tracer.instance().merge(events)
+				CacheStats.instance().merge(counters)
+
+		self.writers.wait()
+
+	def dirty_module_paths(self, manifest: BuildManifest) -> list[ModulePath]:
+		"""トランスパイルが必要なモジュールパスリストを抽出
+
+		Args:
+			manifest: ビルドマニフェスト
+		Returns:
+			モジュールパスリスト
+		Note:
+			```
+			* 前回のビルドから変更されたモジュールと、それに推移的に依存する全てのモジュールが対象
+			* 変更の有無はマニフェストとの比較で判定するため、対象外のモジュールはロードしない
+			```
+		"""
+		changed = [module_path for module_path, entry in manifest.entries.items() if self.changed(entry)]
+		dirty = {module_path: True for module_path in manifest.graph().dependents_of(changed)}
+		return [module_path for module_path in self.module_paths if module_path.path in dirty or self.can_transpile(module_path, manifest)]
+
+	def changed(self, entry: ManifestEntry) -> bool:
+		"""マニフェストのエントリーに対してファイルが変更されたか判定
+
+		Args:
+			entry: マニフェストのエントリー
+		Returns:
+			True = 変更あり(削除を含む)
+		Note:
+			最終更新日時が一致する場合はファイルを読み込まずに変更なしと見做す
+		"""
+		filepath = entry['filepath']
+		if not self.sources.exists(filepath):
+			return True
+
+		if self.sources.mtime(filepath) == entry['mtime']:
+			return False
+
+		return self.sources.hash(filepath) != entry['hash']
+
+	def collect_manifest_entries(self, outputs: dict[str, ManifestOutput]) -> dict[str, ManifestEntry]:
+		"""出力対象のモジュールと、その推移的な依存モジュールのマニフェストのエントリーを収集
+
+		Args:
+			outputs: 出力対象のモジュールパスと出力情報の一覧
+		Returns:
+			エントリー一覧
+		Note:
+			ロード済みのモジュールのみが対象
+		"""
+		loaded = {module.path: module for module in self.modules.loaded()}
+		graph = DependencyGraph.from_modules(list(loaded.values()))
+		entries: dict[str, ManifestEntry] = {}
+		for module_path in graph.closure_of(list(outputs.keys())):
+			module = loaded[module_path]
+			if not module.in_storage():
+				continue
+
+			entries[module_path] = {
+				'filepath': module.filepath,
+				'hash': self.sources.hash(module.filepath),
+				'mtime': self.sources.mtime(module.filepath),
+				'imports': graph.imports_of(module_path),
+				'output': outputs.get(module_path),
+			}
+
+		return entries
+
+	def over_memory_budget(self) -> bool:
+		"""メモリー使用量が上限を超えたか判定
+
+		Returns:
+			True = 超過。上限が未指定の場合は常にFalse
+		"""
+		return self.config.memory_budget > 0 and rss_mb() > self.config.memory_budget
+
+	def release_modules(self, pending_paths: list[str], graph: DependencyGraph) -> None:
+		"""未処理のモジュールから依存されていないモジュールを解放
+
+		Args:
+			pending_paths: 未処理のモジュールパスリスト
+			graph: 未処理のモジュールの依存関係を推定するための依存グラフ
+		Note:
+			```
+			* 解放対象はAST・ノード・エントリーのキャッシュと、シンボルテーブル上のシンボル
+			* 永続化されたシンボルテーブルは保持されるため、再度必要になった場合はキャッシュから復元される
+			* 標準ライブラリーは解放しない
+			* ASTのキャッシュキーはモジュールのファイルパス(拡張子を除く) @see SyntaxParserOfLark
+			```
+		"""
+		for module in self.modules.loaded():
+			graph.add(module.path, [import_node.import_path.tokens for import_node in module.entrypoint.imports])
+
+		needs = {module_path: True for module_path in graph.closure_of(pending_paths)}
+		libraries = {module_path.path: True for module_path in self.library_paths}
+		for module in self.modules.loaded():
+			if module.path not in needs and module.path not in libraries:
+				self.modules.unload(module.path)
+				self.caches.release(module_path_to_filepath(module.path))
+
+	def make_manifest_output(self, module_path: ModulePath, content: str) -> ManifestOutput:
+		"""マニフェストの出力情報を生成
+
+		Args:
+			module_path: モジュールパス
+			content: トランスパイル後のコンテンツ
+		Returns:
+			出力情報
+		"""
+		return {
+			'filepath': self.output_filepath(module_path),
+			'hash': hashlib.md5(content.encode('utf-8')).hexdigest(),
+			'transpiler': self.transpiler.meta,
+		}
+
+	def transpile(self, module_path: ModulePath) -> str:
+		"""モジュールをトランスパイル
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			トランスパイル後のコンテンツ
+		"""
+		entrypoint = self.by_entrypoint(module_path)
+		with Tracer.instance().span('transpile', module=module_path.path):
+			return self.transpiler.transpile(entrypoint)
+
+	def write(self, module_path: ModulePath, content: str) -> None:
+		"""トランスパイル後のコンテンツをファイルに出力
+
+		Args:
+			module_path: モジュールパス
+			content: トランスパイル後のコンテンツ
+		Note:
+			```
+			* 出力はスレッドプールに登録し、バックグラウンドで実行。内容が一致する場合は出力しない
+			@see WriterPool.wait
+			```
+		"""
+		writer = Writer(self.output_filepath(module_path))
+		writer.put(content)
+		self.writers.submit(lambda: self.flush(module_path, writer))
+
+	def flush(self, module_path: ModulePath, writer: Writer) -> bool:
+		"""ライターの出力バッファをファイルに反映
+
+		Args:
+			module_path: モジュールパス
+			writer: ライター
+		Returns:
+			True = 出力, False = 内容が一致するため出力をスキップ
+		"""
+		with Tracer.instance().span('write', module=module_path.path):
+			return writer.flush()
+
+	def trace_begin(self) -> None:
+		"""トレース出力が指定された場合にタイミングの記録を開始"""
+		if self.config.trace_out:
+			Tracer.instance().enable()
+
+	def trace_end(self) -> None:
+		"""トレース出力が指定された場合に記録したタイミングをファイルに出力"""
+		if self.config.trace_out:
+			Tracer.instance().save(self.config.trace_out)
+
+	def cache_end(self) -> None:
+		"""キャッシュの統計を保存し、容量・期間の上限を超えたキャッシュを削除
+
+		Note:
+			```
+			* エビクションは全てのキャッシュファイルを走査するため、実行間隔が経過した場合のみ実施 @see rogw.tranp.cache.storage.CacheStorage.gc_due
+			@see rogw.tranp.cache.backend.CacheBackend.gc
+			```
+		"""
+		if not self.cache_setting.enabled:
+			return
+
+		storage = CacheStorage(self.cache_setting.basedir)
+		CacheStats.instance().save(storage.stats_filepath)
+		if storage.gc_due(self.cache_setting.gc_interval):
+			self.cache_backend.gc(self.cache_setting.max_size, self.cache_setting.max_age)
+			storage.stamp_gc()
+
+	def can_transpile(self, module_path: ModulePath, manifest: BuildManifest) -> bool:
 		"""トランスパイルを実行するか判定
 
 		Args:
 			module_path: モジュールパス
+			manifest: ビルドマニフェスト
 		Returns:
 			True = 実行
+		Note:
+			```
+			* マニフェストに出力情報がない場合は常に実行
+			* 出力情報がある場合は、出力先・トランスパイラーのメタ情報・出力ファイルの有無を比較
+			* 出力済みのファイルは読み込まない
+			```
 		"""
-		old_meta = self.try_load_meta_header(module_path)
-		if not old_meta:
+		entry = manifest.entries.get(module_path.path)
+		output = entry['output'] if entry is not None else None
+		if output is None:
 			return True
 
-		new_meta = MetaHeader(self.module_meta_factory(module_path.path), self.transpiler.meta)
-		return new_meta != old_meta
+		return output['filepath'] != self.output_filepath(module_path) or output['transpiler'] != self.transpiler.meta or not os.path.exists(output['filepath'])
 
 	def by_entrypoint(self, module_path: ModulePath) -> Node:
 		"""エントリーポイントのノードを取得
@@ -334,19 +698,16 @@ class Runner:
 		"""
 		return self.modules.load(module_path.path).entrypoint
 
-	def try_load_meta_header(self, module_path: ModulePath) -> MetaHeader | None:
-		"""トランスパイル済みのファイルからメタヘッダーの読み込みを試行
+	def manifest_filepath(self) -> str:
+		"""ビルドマニフェストのファイルパスを生成
 
-		Args:
-			module_path: モジュールパス
 		Returns:
-			メタヘッダー。ファイル・メタヘッダーが存在しない場合はNone
+			ファイルパス
+		Note:
+			コンフィグ毎に個別のマニフェストをキャッシュディレクトリーに保存
 		"""
-		filepath = self.output_filepath(module_path)
-		if not self.sources.exists(filepath):
-			return None
-
-		return MetaHeader.try_from_content(self.sources.load(filepath))
+		identity = hashlib.md5(os.path.abspath(self.args.config).encode('utf-8')).hexdigest()
+		return os.path.abspath(os.path.join(self.cache_setting.basedir, f'manifest-{identity}.json'))
 
 	def output_filepath(self, module_path: ModulePath) -> str:
 		"""トランスパイル後のファイルパスを生成
@@ -387,6 +748,151 @@ class Runner:
 		return os.path.join(fallback, filepath)
 
 
+class Worker:
+	"""ワーカー(並列モード)
+
+	Note:
+		```
+		* ワーカープロセス毎にアプリケーション(DIコンテナー)を生成し、プロセスの生存期間中は使い回す
+		* パース・シンボルのキャッシュは通常通りディスク上に保存されるため、各プロセス間で共有される
+		@see Runner._run_parallel
+		```
+	"""
+
+	runner: ClassVar[Runner | None] = None
+
+	@classmethod
+	def setup(cls, args: Args) -> None:
+		"""ワーカープロセスを初期化
+
+		Args:
+			args: 引数
+		"""
+		cls.runner = App(TranspileApp.definitions(args)).run(cls.make_runner)
+		cls.runner.trace_begin()
+
+	@classmethod
+	@injectable
+	def make_runner(cls, invoker: Invoker) -> Runner:
+		"""ランナーを生成
+
+		Args:
+			invoker: ファクトリー関数 @inject
+		Returns:
+			ランナー
+		"""
+		return invoker(Runner)
+
+	@classmethod
+	def transpile(cls, module_path: ModulePath) -> tuple[str, dict[str, ManifestEntry], list[TraceEvent], dict[str, CacheCounter]]:
+		"""モジュールをトランスパイル
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			(トランスパイル後のコンテンツ, マニフェストのエントリー一覧, トレースイベントリスト, キャッシュの統計)
+		Raises:
+			Errors.Fatal: トランスパイルに失敗
+		Note:
+			例外はノード等のシリアライズ出来ない値を含むため、レンダリング済みのメッセージに変換して親プロセスに送出
+		"""
+		assert cls.runner is not None, 'Must be called after setup'
+		try:
+			content = cls.runner.transpile(module_path)
+			outputs = {module_path.path: cls.runner.make_manifest_output(module_path, content)}
+			entries = cls.runner.collect_manifest_entries(outputs)
+			if cls.runner.over_memory_budget():
+				cls.runner.release_modules([], DependencyGraph())
+
+			return content, entries, Tracer.instance().drain(), CacheStats.instance().drain()
+		except Exception as e:
+			raise Errors.Fatal(str(ErrorRender(e))) from None
+
+
+class Watcher(Runner):
+	"""ランナー(監視モード)
+
+	Note:
+		```
+		* 初回は通常通りトランスパイルを実行し、以降はソースの変更を監視
+		* モジュール・エントリーポイント・シンボルテーブルを常駐させ、変更されたモジュールとその依存元のみアンロードして再出力
+		* 監視対象はビルドマニフェストに記録されたモジュール。起動後に追加されたファイルは対象外
+		* 常駐させた状態を再利用するため、並列モードは初回のトランスパイルのみ有効
+		```
+	"""
+
+	Interval: ClassVar = 0.5
+
+	@override
+	def run(self) -> None:
+		"""監視モードの実行"""
+		self.trace_begin()
+		manifest = self._run_impl()
+		mtimes = {module_path: entry['mtime'] for module_path, entry in manifest.entries.items()}
+		print(f'Watching {len(mtimes)} modules. Press Ctrl+C to quit')
+		try:
+			while True:
+				time.sleep(self.Interval)
+				changed = self.poll(manifest, mtimes)
+				if len(changed) > 0:
+					self.rebuild(manifest, changed)
+		except KeyboardInterrupt:
+			pass
+		finally:
+			self.trace_end()
+			print('Quit')
+
+	def poll(self, manifest: BuildManifest, mtimes: dict[str, float]) -> list[str]:
+		"""変更されたモジュールを検出
+
+		Args:
+			manifest: ビルドマニフェスト
+			mtimes: 前回検出時のモジュールパスと最終更新日時の一覧
+		Returns:
+			変更されたモジュールパスリスト
+		Note:
+			```
+			* 最終更新日時が前回検出時から変わったモジュールのみハッシュ値を比較
+			* 削除されたモジュールは変更ありと見做す
+			```
+		"""
+		changed: list[str] = []
+		for module_path, entry in manifest.entries.items():
+			filepath = entry['filepath']
+			self.sources.invalidate(filepath)
+			mtime = self.sources.mtime(filepath) if self.sources.exists(filepath) else -1.0
+			if mtimes.get(module_path) != mtime and self.changed(entry):
+				changed.append(module_path)
+
+			mtimes[module_path] = mtime
+
+		return changed
+
+	def rebuild(self, manifest: BuildManifest, changed: list[str]) -> None:
+		"""変更されたモジュールとその依存元をアンロードして再出力
+
+		Args:
+			manifest: ビルドマニフェスト
+			changed: 変更されたモジュールパスリスト
+		"""
+		dirty = {module_path: True for module_path in manifest.graph().dependents_of(changed)}
+		for module_path in dirty.keys():
+			self.modules.unload(module_path)
+
+		target_paths = [module_path for module_path in self.module_paths if module_path.path in dirty and self.sources.exists(module_path_to_filepath(module_path.path, '.py'))]
+		try:
+			start = time.perf_counter()
+			self._run_serial(target_paths, manifest)
+			manifest.save(self.manifest_filepath())
+			print(f'Rebuilt {len(target_paths)} modules in {time.perf_counter() - start:.3f}s. changed: {", ".join(changed)}')
+		except Exception as e:
+			# 次回の変更時に再度ロードするため、失敗したモジュールは全てアンロード
+			for module_path in dirty.keys():
+				self.modules.unload(module_path)
+
+			print(ErrorRender(e))
+
+
 class Interactive:
 	"""ランナー(対話モード)"""
 
@@ -449,7 +955,7 @@ class Help:
 	def run(self) -> None:
 		print(
 """# Usage
-$ bin/transpile.sh [-c config_path] [-i source_path] [-f] [-it] [-h] [-p] [-v]
+$ bin/transpile.sh [-c config_path] [-i source_path] [-f] [-it] [-h] [-p] [-v] [-j jobs] [-w] [--trace-out trace_path] [--memory-budget mb] [--cache-backend backend] [--cache-remote url] [--syntax-backend backend]
 # Options
 -c: Config YAML filepath. default to './example/config.yml'
 -i: Input source filepath
@@ -458,6 +964,13 @@ $ bin/transpile.sh [-c config_path] [-i source_path] [-f] [-it] [-h] [-p] [-v]
 -h: Show help
 -p: Show profiling
 -v: Output Detailed logs
+-j: Number of parallel jobs. default to 1
+-w, --watch: Watch mode. Re-output only the changed modules and their dependents
+--trace-out: Output timing spans per phase and module as Chrome trace JSON and summary CSV
+--memory-budget: Memory budget in MB. Release finished modules when RSS exceeds it. default to 0 (unlimited)
+--cache-backend: Cache backend. 'files' (one file per entry) or 'packed' (single pack file). default to 'files'
+--cache-remote: Remote cache server URL. Checked after the local cache misses. e.g. 'http://127.0.0.1:8765'
+--syntax-backend: Syntax parser backend. 'lark' or 'tranp' (in-house parser). default to 'lark'
 # Examples
 $ bin/transpile.sh
 $ bin/transpile.sh -c ./path/to/config.yml
@@ -467,6 +980,13 @@ $ bin/transpile.sh -it
 $ bin/transpile.sh -h
 $ bin/transpile.sh -p
 $ bin/transpile.sh -v
+$ bin/transpile.sh -j 4
+$ bin/transpile.sh -w
+$ bin/transpile.sh --trace-out ./trace.json
+$ bin/transpile.sh --memory-budget 512
+$ bin/transpile.sh --cache-backend packed
+$ bin/transpile.sh --cache-remote http://127.0.0.1:8765
+$ bin/transpile.sh --syntax-backend tranp
 """
 		)
 
@@ -0,0 +1,617 @@
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+from abc import ABCMeta, abstractmethod
+from typing import NamedTuple
+
+from rogw.tranp.cache.storage import CacheFile, CacheStorage
+from rogw.tranp.errors import Errors
+from rogw.tranp.file.lock import FileLock
+from rogw.tranp.lang.annotation import implements
+
+Trailer = struct.Struct('<QI4s')
+TrailerMagic = b'TRCK'
+
+
+def content_addressed_path(basedir: str, identifier: str, extention: str = '') -> str:
+	"""コンテンツアドレス形式のキャッシュファイルの絶対パスを生成
+
+	Args:
+		basedir: キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
+		identifier: 一意な識別子
+		extention: 拡張子 (default = '')
+	Returns:
+		キャッシュファイルの絶対パス
+	Note:
+		```
+		* 識別子の先頭2文字でディレクトリーを分割
+		* 保存先がファイルの内容のみで決まるため、チェックアウト先・ブランチ・CIのワークスペース間で共有が可能
+		### 例
+		'${basedir}/objects/12/12345678901234567890123456789012.json'
+		```
+	"""
+	return os.path.abspath(os.path.join(os.getcwd(), basedir, 'objects', identifier[:2], f'{identifier}{extention}'))
+
+
+def touch(filepath: str) -> None:
+	"""キャッシュファイルの最終更新日時を現在日時に更新
+
+	Args:
+		filepath: キャッシュファイルパス
+	Note:
+		読み取り専用のキャッシュを共有する場合を考慮し、更新の失敗は無視
+	"""
+	try:
+		os.utime(filepath)
+	except OSError:
+		pass
+
+
+def write_atomic(filepath: str, payload: bytes) -> None:
+	"""ペイロードにトレーラーを付与し、一時ファイルを経由してアトミックに書き込み
+
+	Args:
+		filepath: キャッシュファイルパス
+		payload: ペイロード
+	Note:
+		```
+		* トレーラー(16byte): ペイロード長(8byte), CRC32(4byte), マジックナンバー(4byte) @see read_verified
+		* 一時ファイルは同じディレクトリーに生成した上でリネームするため、書き込み途中のファイルが参照されることはない
+		```
+	"""
+	dirpath = os.path.dirname(filepath)
+	if not os.path.exists(dirpath):
+		os.makedirs(dirpath, exist_ok=True)
+
+	tmp_filepath = os.path.join(dirpath, f'.{os.path.basename(filepath)}.{os.getpid()}.{threading.get_ident()}.tmp')
+	try:
+		with open(tmp_filepath, mode='wb') as f:
+			f.write(payload)
+			f.write(Trailer.pack(len(payload), zlib.crc32(payload), TrailerMagic))
+
+		os.replace(tmp_filepath, filepath)
+	except BaseException:
+		if os.path.exists(tmp_filepath):
+			os.remove(tmp_filepath)
+
+		raise
+
+
+def read_verified(filepath: str) -> bytes:
+	"""トレーラーを検証してペイロードを読み込み
+
+	Args:
+		filepath: キャッシュファイルパス
+	Returns:
+		ペイロード
+	Raises:
+		Errors.InvalidSchema: トレーラーが不正、またはペイロードが破損
+		OSError: ファイルの読み込みに失敗
+	"""
+	with open(filepath, mode='rb') as f:
+		content = f.read()
+
+	if len(content) < Trailer.size:
+		raise Errors.InvalidSchema(f'Cache is too short. filepath: {filepath}')
+
+	size, checksum, magic = Trailer.unpack_from(content, len(content) - Trailer.size)
+	payload = content[:-Trailer.size]
+	if magic != TrailerMagic or size != len(payload) or checksum != zlib.crc32(payload):
+		raise Errors.InvalidSchema(f'Cache is corrupted. filepath: {filepath}')
+
+	return payload
+
+
+class CacheBackend(metaclass=ABCMeta):
+	"""キャッシュバックエンド。コンテンツアドレス形式のキャッシュの保存先を抽象化
+
+	Note:
+		```
+		* キャッシュは識別子と拡張子の組み合わせで一意に特定
+		* 読み込み時にペイロードを検証し、破損している場合はErrors.InvalidSchemaを出力
+		```
+	"""
+
+	@abstractmethod
+	def exists(self, identifier: str, extention: str) -> bool:
+		"""キャッシュが存在するか判定
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			True = 存在
+		"""
+		...
+
+	@abstractmethod
+	def read(self, identifier: str, extention: str) -> bytes:
+		"""キャッシュを読み込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			ペイロード
+		Raises:
+			Errors.InvalidSchema: キャッシュが破損
+			OSError: キャッシュの読み込みに失敗
+		"""
+		...
+
+	@abstractmethod
+	def write(self, identifier: str, extention: str, payload: bytes) -> None:
+		"""キャッシュを書き込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+			payload: ペイロード
+		"""
+		...
+
+	@abstractmethod
+	def touch(self, identifier: str, extention: str) -> None:
+		"""キャッシュの最終使用日時を更新
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		"""
+		...
+
+	@abstractmethod
+	def discard(self, identifier: str, extention: str) -> None:
+		"""キャッシュを破棄。存在しない場合は無視
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		"""
+		...
+
+	@abstractmethod
+	def files(self) -> list[CacheFile]:
+		"""全てのキャッシュを取得
+
+		Returns:
+			キャッシュファイルリスト(最終使用日時の昇順)
+		"""
+		...
+
+	@abstractmethod
+	def remove(self, files: list[CacheFile]) -> list[CacheFile]:
+		"""キャッシュを削除
+
+		Args:
+			files: キャッシュファイルリスト
+		Returns:
+			削除したキャッシュファイルリスト
+		"""
+		...
+
+	def gc(self, max_size: int, max_age: float) -> list[CacheFile]:
+		"""容量・期間の上限を超えたキャッシュを削除
+
+		Args:
+			max_size: 容量の上限(バイト)。0以下は無制限
+			max_age: 未使用期間の上限(秒)。0以下は無制限
+		Returns:
+			削除したキャッシュファイルリスト
+		Note:
+			@see rogw.tranp.cache.storage.CacheStorage.select
+		"""
+		return self.remove(CacheStorage.select(self.files(), max_size, max_age))
+
+
+class FileBackend(CacheBackend):
+	"""キャッシュバックエンド(ファイル)。キャッシュ毎に1ファイルを保存
+
+	Note:
+		保存先は識別子から生成 @see content_addressed_path
+	"""
+
+	def __init__(self, basedir: str) -> None:
+		"""インスタンスを生成
+
+		Args:
+			basedir: キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
+		"""
+		self.__basedir = basedir
+		self.__storage = CacheStorage(basedir)
+
+	def filepath(self, identifier: str, extention: str) -> str:
+		"""キャッシュファイルの絶対パスを生成
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			キャッシュファイルの絶対パス
+		"""
+		return content_addressed_path(self.__basedir, identifier, extention)
+
+	@implements
+	def exists(self, identifier: str, extention: str) -> bool:
+		"""キャッシュが存在するか判定
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			True = 存在
+		"""
+		return os.path.exists(self.filepath(identifier, extention))
+
+	@implements
+	def read(self, identifier: str, extention: str) -> bytes:
+		"""キャッシュを読み込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			ペイロード
+		Raises:
+			Errors.InvalidSchema: キャッシュが破損
+			OSError: キャッシュの読み込みに失敗
+		"""
+		return read_verified(self.filepath(identifier, extention))
+
+	@implements
+	def write(self, identifier: str, extention: str, payload: bytes) -> None:
+		"""キャッシュを書き込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+			payload: ペイロード
+		Note:
+			書き込みはアトミックに実施 @see write_atomic
+		"""
+		write_atomic(self.filepath(identifier, extention), payload)
+
+	@implements
+	def touch(self, identifier: str, extention: str) -> None:
+		"""キャッシュの最終使用日時を更新
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		"""
+		touch(self.filepath(identifier, extention))
+
+	@implements
+	def discard(self, identifier: str, extention: str) -> None:
+		"""キャッシュを破棄。存在しない場合は無視
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		"""
+		try:
+			os.remove(self.filepath(identifier, extention))
+		except FileNotFoundError:
+			pass
+
+	@implements
+	def files(self) -> list[CacheFile]:
+		"""全てのキャッシュを取得
+
+		Returns:
+			キャッシュファイルリスト(最終使用日時の昇順)
+		"""
+		return self.__storage.files()
+
+	@implements
+	def remove(self, files: list[CacheFile]) -> list[CacheFile]:
+		"""キャッシュを削除
+
+		Args:
+			files: キャッシュファイルリスト
+		Returns:
+			削除したキャッシュファイルリスト
+		"""
+		return self.__storage.remove(files)
+
+
+class PackEntry(NamedTuple):
+	"""パック内のレコード情報
+
+	Attributes:
+		offset: ペイロードの開始位置
+		size: ペイロード長
+		checksum: ペイロードのCRC32
+		mtime: 書き込み日時
+	"""
+
+	offset: int
+	size: int
+	checksum: int
+	mtime: float
+
+
+class PackedBackend(CacheBackend):
+	"""キャッシュバックエンド(パック)。全てのキャッシュを1つの追記専用ファイルに保存
+
+	Note:
+		```
+		### ファイルフォーマット
+		* マジックナンバー(8byte)
+		* レコードの連結
+		  * レコードヘッダー(24byte): キー長(4byte), ペイロード長(8byte), CRC32(4byte), 書き込み日時(8byte)
+		  * キー(UTF-8): 識別子 + 拡張子
+		  * ペイロード
+		### 読み込み
+		* ファイルはメモリーマップで開き、レコードヘッダーのみを走査してインデックスを構築
+		* 他のプロセスが追記したレコードは、インデックスに存在しないキーの参照時に差分のみ走査
+		* 同じキーのレコードが複数存在する場合は後勝ち
+		### 書き込み
+		* 追記はロックを取得して実施。不完全な末尾のレコード(異常終了時の残骸)は追記前にコンパクションで除去
+		* コンパクションは一時ファイルを経由して置き換えるため、他のプロセスが開いているメモリーマップには影響しない
+		### エビクション
+		* 最終使用日時はレコードの書き込み日時。ヒット時には更新しない
+		* 削除対象のレコードを除外してコンパクション
+		```
+	"""
+
+	Magic = b'TRANPCA1'
+	Record = struct.Struct('<IQId')
+
+	def __init__(self, basedir: str) -> None:
+		"""インスタンスを生成
+
+		Args:
+			basedir: キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
+		"""
+		self.__storage = CacheStorage(basedir)
+		self.__filepath = self.__storage.pack_filepath
+		self.__entries: dict[str, PackEntry] = {}
+		self.__buffer: mmap.mmap | None = None
+		self.__scanned = 0
+		self.__inode = -1
+
+	@implements
+	def exists(self, identifier: str, extention: str) -> bool:
+		"""キャッシュが存在するか判定
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			True = 存在
+		"""
+		key = f'{identifier}{extention}'
+		if key not in self.__entries:
+			self.__refresh()
+
+		return key in self.__entries
+
+	@implements
+	def read(self, identifier: str, extention: str) -> bytes:
+		"""キャッシュを読み込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			ペイロード
+		Raises:
+			Errors.InvalidSchema: キャッシュが破損
+			OSError: キャッシュの読み込みに失敗
+		"""
+		key = f'{identifier}{extention}'
+		if key not in self.__entries:
+			self.__refresh()
+
+		entry = self.__entries.get(key)
+		if entry is None or self.__buffer is None:
+			raise FileNotFoundError(f'Cache not found. key: {key}')
+
+		payload = self.__buffer[entry.offset:entry.offset + entry.size]
+		if zlib.crc32(payload) != entry.checksum:
+			raise Errors.InvalidSchema(f'Cache is corrupted. key: {key}')
+
+		return payload
+
+	@implements
+	def write(self, identifier: str, extention: str, payload: bytes) -> None:
+		"""キャッシュを書き込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+			payload: ペイロード
+		Note:
+			他のプロセスが既に書き込み済みの場合は何もしない
+		"""
+		key = f'{identifier}{extention}'
+		with FileLock(self.__storage.lock_filepath):
+			self.__refresh()
+			if key in self.__entries:
+				return
+
+			if os.path.exists(self.__filepath) and os.path.getsize(self.__filepath) != self.__scanned:
+				self.__compact(set())
+
+			encoded = key.encode('utf-8')
+			record = self.Record.pack(len(encoded), len(payload), zlib.crc32(payload), time.time())
+			with open(self.__filepath, mode='ab') as f:
+				if f.tell() == 0:
+					f.write(self.Magic)
+
+				f.write(record + encoded + payload)
+
+			self.__refresh()
+
+	@implements
+	def touch(self, identifier: str, extention: str) -> None:
+		"""キャッシュの最終使用日時を更新
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Note:
+			レコードの書き込み日時を最終使用日時とするため、何もしない
+		"""
+		pass
+
+	@implements
+	def discard(self, identifier: str, extention: str) -> None:
+		"""キャッシュを破棄。存在しない場合は無視
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Note:
+			インデックスからのみ削除し、次回の書き込みで新しいレコードを追記させる
+		"""
+		self.__refresh()
+		self.__entries.pop(f'{identifier}{extention}', None)
+
+	@implements
+	def files(self) -> list[CacheFile]:
+		"""全てのキャッシュを取得
+
+		Returns:
+			キャッシュファイルリスト(最終使用日時の昇順)
+		Note:
+			パック内のレコードは'${pack_filepath}/${key}'の形式のパスで表現。パック以外のファイルも含む
+		"""
+		self.__refresh()
+		founds = [CacheFile(os.path.join(self.__filepath, key), entry.size, entry.mtime) for key, entry in self.__entries.items()]
+		return sorted([*founds, *self.__storage.files()], key=lambda found: found.mtime)
+
+	@implements
+	def remove(self, files: list[CacheFile]) -> list[CacheFile]:
+		"""キャッシュを削除
+
+		Args:
+			files: キャッシュファイルリスト
+		Returns:
+			削除したキャッシュファイルリスト
+		"""
+		prefix = os.path.join(self.__filepath, '')
+		packed = [found for found in files if found.path.startswith(prefix)]
+		removed = self.__storage.remove([found for found in files if not found.path.startswith(prefix)])
+		if len(packed) == 0:
+			return removed
+
+		with FileLock(self.__storage.lock_filepath):
+			if self.__compact(set(found.path[len(prefix):] for found in packed)):
+				removed.extend(packed)
+
+		return removed
+
+	def __refresh(self) -> None:
+		"""ファイルの追記分を走査してインデックスを更新
+
+		Note:
+			コンパクションによってファイルが置き換えられた場合はインデックスを再構築
+		"""
+		try:
+			stat = os.stat(self.__filepath)
+		except FileNotFoundError:
+			self.__reset()
+			return
+
+		if stat.st_ino != self.__inode:
+			self.__reset()
+			self.__inode = stat.st_ino
+
+		if stat.st_size <= self.__scanned or stat.st_size == 0:
+			return
+
+		with open(self.__filepath, mode='rb') as f:
+			buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+		if self.__buffer is not None:
+			self.__buffer.close()
+
+		self.__buffer = buffer
+		self.__scanned = self.__scan(buffer, self.__scanned)
+
+	def __scan(self, buffer: mmap.mmap, begin: int) -> int:
+		"""レコードヘッダーを走査してインデックスに追加
+
+		Args:
+			buffer: メモリーマップ
+			begin: 走査の開始位置
+		Returns:
+			走査済みの終了位置。不完全なレコードの手前で終了
+		"""
+		offset = begin
+		if offset == 0:
+			if buffer[:len(self.Magic)] != self.Magic:
+				return 0
+
+			offset = len(self.Magic)
+
+		end = len(buffer)
+		while offset + self.Record.size <= end:
+			key_size, size, checksum, mtime = self.Record.unpack_from(buffer, offset)
+			key_begin = offset + self.Record.size
+			payload_begin = key_begin + key_size
+			if payload_begin + size > end:
+				break
+
+			try:
+				key = buffer[key_begin:payload_begin].decode('utf-8')
+			except UnicodeDecodeError:
+				break
+
+			self.__entries[key] = PackEntry(payload_begin, size, checksum, mtime)
+			offset = payload_begin + size
+
+		return offset
+
+	def __compact(self, excludes: set[str]) -> bool:
+		"""除外対象と破損したレコードを除いてファイルを再構築
+
+		Args:
+			excludes: 除外対象のキー
+		Returns:
+			True = 成功, False = 置き換えに失敗
+		Note:
+			```
+			* 呼び出し元でロックを取得すること
+			* 他のプロセスがファイルを開いている場合、置き換えに失敗する環境(Windows)では何もしない
+			```
+		"""
+		self.__refresh()
+		tmp_filepath = f'{self.__filepath}.{os.getpid()}.tmp'
+		with open(tmp_filepath, mode='wb') as f:
+			f.write(self.Magic)
+			for key, entry in self.__entries.items():
+				if key in excludes or self.__buffer is None:
+					continue
+
+				payload = self.__buffer[entry.offset:entry.offset + entry.size]
+				if zlib.crc32(payload) != entry.checksum:
+					continue
+
+				encoded = key.encode('utf-8')
+				f.write(self.Record.pack(len(encoded), len(payload), entry.checksum, entry.mtime) + encoded + payload)
+
+		self.__reset()
+		try:
+			os.replace(tmp_filepath, self.__filepath)
+			return True
+		except OSError:
+			os.remove(tmp_filepath)
+			return False
+		finally:
+			self.__refresh()
+
+	def __reset(self) -> None:
+		"""インデックスとメモリーマップを破棄"""
+		if self.__buffer is not None:
+			self.__buffer.close()
+
+		self.__buffer = None
+		self.__entries = {}
+		self.__scanned = 0
+		self.__inode = -1
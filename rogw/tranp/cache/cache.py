@@ -1,10 +1,19 @@
 import glob
 import hashlib
+import io
 import os
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from typing import IO, Any, Generic, Protocol, Self, TypeVar
 
+from rogw.tranp.cache.backend import CacheBackend, read_verified, touch, write_atomic
+from rogw.tranp.cache.lru import LRUCache, LRUMetrics
+from rogw.tranp.cache.stats import CacheStats
+from rogw.tranp.cache.storage import CacheStorage
+from rogw.tranp.data.version import Versions
+from rogw.tranp.errors import Errors
+from rogw.tranp.file.lock import FileLock
 from rogw.tranp.lang.annotation import implements
 
 
@@ -48,7 +57,7 @@ class Cached(Generic[T_Stored]):
 		"""
 		return hashlib.md5(str(identity).encode('utf-8')).hexdigest()
 
-	def __init__(self, stored: T_Stored, factory: Callable[[], T_Stored], identity: dict[str, str], basedir: str, **options: Any) -> None:
+	def __init__(self, stored: T_Stored, factory: Callable[[], T_Stored], identity: dict[str, str], basedir: str, backend: CacheBackend, **options: Any) -> None:
 		"""インスタンスを生成
 
 		Args:
@@ -56,13 +65,16 @@ class Cached(Generic[T_Stored]):
 			factory: ファクトリー
 			identity: 一意性担保用のコンテキスト
 			basedir: キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
+			backend: キャッシュバックエンド。コンテンツアドレス形式のキャッシュの保存先
 			**options: オプション
 		"""
 		self._stored = stored
 		self._factory = factory
 		self._identity = identity
 		self._basedir = basedir
+		self._backend = backend
 		self._options = options
+		self.size = 0
 
 	def get(self, cache_key: str) -> T_Stored:
 		"""インスタンスの取得プロクシー
@@ -85,6 +97,11 @@ class CachedProxy(Cached[T_Stored]):
 		cache_key: 'path/to/cache'
 		identity: {'mtime': str(os.path.getmtime('path/to/actual'))}
 		'${cache_key}-${md5(json.dumps(identity))}' -> 'path/to/cache-12345678901234567890123456789012'
+		### コンテンツアドレス形式
+		* オプションにcontent_addressed=Trueを指定した場合、保存先はidentityのみから決定
+		* identityにはファイルのハッシュ値など、内容のみに依存する値を指定
+		* 同じキャッシュキーの旧キャッシュファイルは削除しない
+		* 保存先はキャッシュバックエンドに委譲 @see rogw.tranp.cache.backend.CacheBackend
 		```
 	"""
 
@@ -96,13 +113,30 @@ class CachedProxy(Cached[T_Stored]):
 			cache_key: キャッシュキー
 		Returns:
 			インスタンス
+		Note:
+			```
+			* ヒット・ミスは統計に記録。ヒット時はLRUのためにキャッシュファイルの最終更新日時を更新 @see CacheStats, CacheStorage
+			* 破損したキャッシュはミスとして扱い、再生成したインスタンスで上書き
+			* 読み書きしたバイト数をインスタンスの概算サイズとして保持 @see CacheProvider
+			```
 		"""
 		cache_path = self.gen_cache_path(cache_key)
 		if self.cache_exists(cache_path):
-			return self.load_cache(cache_path)
+			try:
+				start = time.perf_counter()
+				instance, size = self.load_cache(cache_path)
+				CacheStats.instance().hit(cache_key, size, time.perf_counter() - start)
+				self.size = size
+				self.touch_cache(cache_path)
+				return instance
+			except (OSError, ValueError, Errors.InvalidSchema):
+				# 破損したキャッシュ、または読み込み中に削除されたキャッシュはミスとして扱う
+				self.discard_cache(cache_path)
 
 		instance = self.instantiate()
-		self.save_cache(instance, cache_path)
+		size = self.save_cache(instance, cache_path)
+		CacheStats.instance().miss(cache_key, size)
+		self.size = size
 		return instance
 
 	def gen_cache_path(self, cache_key: str) -> str:
@@ -111,15 +145,27 @@ class CachedProxy(Cached[T_Stored]):
 		Args:
 			cache_key: キャッシュキー
 		Returns:
-			キャッシュファイルの絶対パス
+			キャッシュファイルの絶対パス。コンテンツアドレス形式の場合は一意な識別子
 		Note:
 			ファイルパスに一意性を担保する文字列を付与する
 		"""
-		file_format = self._options.get('format', '')
-		extention = f'.{file_format}' if file_format else ''
-		filename = f'{cache_key}-{self.identifier(self._identity)}{extention}'
+		if self.content_addressed:
+			return self.identifier(self._identity)
+
+		filename = f'{cache_key}-{self.identifier(self._identity)}{self.extention}'
 		return os.path.abspath(os.path.join(os.getcwd(), self._basedir, filename))
 
+	@property
+	def content_addressed(self) -> bool:
+		"""Returns: True = コンテンツアドレス形式"""
+		return self._options.get('content_addressed', False)
+
+	@property
+	def extention(self) -> str:
+		"""Returns: キャッシュファイルの拡張子"""
+		file_format = self._options.get('format', '')
+		return f'.{file_format}' if file_format else ''
+
 	def cache_exists(self, cache_path: str) -> bool:
 		"""キャッシュファイルが存在するか判定
 
@@ -128,26 +174,64 @@ class CachedProxy(Cached[T_Stored]):
 		Returns:
 			True = 存在
 		"""
+		if self.content_addressed:
+			return self._backend.exists(cache_path, self.extention)
+
 		return os.path.exists(cache_path)
 
-	def save_cache(self, instance: T_Stored, cache_path: str) -> None:
+	def touch_cache(self, cache_path: str) -> None:
+		"""キャッシュファイルの最終使用日時を更新
+
+		Args:
+			cache_path: キャッシュファイルパス
+		"""
+		if self.content_addressed:
+			self._backend.touch(cache_path, self.extention)
+		else:
+			touch(cache_path)
+
+	def discard_cache(self, cache_path: str) -> None:
+		"""破損したキャッシュファイルを破棄
+
+		Args:
+			cache_path: キャッシュファイルパス
+		Note:
+			キャッシュファイル以外は保存時に上書きされるため、何もしない
+		"""
+		if self.content_addressed:
+			self._backend.discard(cache_path, self.extention)
+
+	def save_cache(self, instance: T_Stored, cache_path: str) -> int:
 		"""インスタンスをファイルに保存
 
 		Args:
 			instance: インスタンス
 			cache_path: キャッシュファイルパス
+		Returns:
+			書き込んだバイト数
 		Note:
-			保存直前に古いキャッシュファイルを自動的に削除
+			```
+			* 書き込みはアトミックに実施 @see write_atomic
+			* 保存直前に古いキャッシュファイルを自動的に削除。コンテンツアドレス形式の場合は削除しない
+			* 旧キャッシュファイルの削除から保存までは、他のプロセスと排他するためにロックを取得
+			```
 		"""
-		dirpath = os.path.dirname(cache_path)
-		if not os.path.exists(dirpath):
-			os.makedirs(dirpath)
+		stream = io.BytesIO()
+		instance.save(stream)
+		payload = stream.getvalue()
+		if self.content_addressed:
+			self._backend.write(cache_path, self.extention, payload)
+			return len(payload)
 
-		for oldest in self.find_oldest(cache_path):
-			os.unlink(oldest)
+		lock_filepath = os.path.join(os.getcwd(), self._basedir, CacheStorage.LockFilename)
+		with FileLock(lock_filepath):
+			for oldest in self.find_oldest(cache_path):
+				if oldest != cache_path and os.path.exists(oldest):
+					os.unlink(oldest)
 
-		with open(cache_path, mode='wb') as f:
-			instance.save(f)
+			write_atomic(cache_path, payload)
+
+		return len(payload)
 
 	def find_oldest(self, cache_path: str) -> list[str]:
 		"""旧キャッシュファイルを検索
@@ -159,21 +243,22 @@ class CachedProxy(Cached[T_Stored]):
 		"""
 		elems = cache_path.split('-')[:-1]
 		basepath = '-'.join(elems)
-		file_format = self._options.get('format', '')
-		extention = f'.{file_format}' if file_format else ''
-		glob_pattern = f'{basepath}-*{extention}'
+		glob_pattern = f'{basepath}-*{self.extention}'
 		return glob.glob(glob_pattern)
 
-	def load_cache(self, cache_path: str) -> T_Stored:
+	def load_cache(self, cache_path: str) -> tuple[T_Stored, int]:
 		"""インスタンスをファイルから読み込み
 
 		Args:
 			cache_path: キャッシュファイルパス
 		Returns:
-			読み込んだインスタンス
+			(読み込んだインスタンス, 読み込んだバイト数)
+		Raises:
+			Errors.InvalidSchema: キャッシュが破損
+			OSError: ファイルの読み込みに失敗
 		"""
-		with open(cache_path, mode='rb') as f:
-			return self._stored.load(f)
+		payload = self._backend.read(cache_path, self.extention) if self.content_addressed else read_verified(cache_path)
+		return self._stored.load(io.BytesIO(payload)), len(payload)
 	
 	def instantiate(self) -> T_Stored:
 		"""インスタンスを生成
@@ -206,23 +291,55 @@ class CacheSetting:
 	Attributes:
 		basedir: キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
 		enabled: True = 有効(default = True)
+		max_size: 容量の上限(バイト)。0以下は無制限(default = 0)
+		max_age: 未使用期間の上限(秒)。0以下は無制限(default = 0)
+		gc_interval: 実行終了時のエビクションの実行間隔(秒)。0以下は毎回実行(default = 0) @see rogw.tranp.cache.storage.CacheStorage.gc_due
+		backend: キャッシュバックエンドの種別。'files' = キャッシュ毎に1ファイル, 'packed' = 1つのパックファイル(default = 'files')
+		memory_max_count: メモリー上に保持するインスタンス数の上限。0以下は無制限(default = 0)
+		memory_max_size: メモリー上に保持するインスタンスの概算サイズの上限(バイト)。0以下は無制限(default = 0)
+		remote: リモートキャッシュのURL。空の場合は利用しない(default = '') @see rogw.tranp.cache.remote.RemoteCache
 	"""
 
 	basedir: str
 	enabled: bool = True
+	max_size: int = 0
+	max_age: float = 0
+	gc_interval: float = 0
+	backend: str = 'files'
+	memory_max_count: int = 0
+	memory_max_size: int = 0
+	remote: str = ''
 
 
 class CacheProvider:
-	"""キャッシュプロバイダー"""
+	"""キャッシュプロバイダー
 
-	def __init__(self, setting: CacheSetting) -> None:
+	Note:
+		```
+		* 生成したインスタンスはメモリー上にLRUで保持し、キャッシュ設定データの上限を超えた場合は古い順に追い出す
+		* 概算サイズはキャッシュファイルから読み書きしたバイト数
+		* 追い出したインスタンスは、再度取得した際にキャッシュファイルから復元
+		* 解放用の識別子の対応表は追い出しと同時に削除し、長時間稼働するプロセスでも肥大化しない
+		```
+	"""
+
+	def __init__(self, setting: CacheSetting, backend: CacheBackend) -> None:
 		"""インスタンスを生成
 
 		Args:
 			setting: キャッシュ設定データ
+			backend: キャッシュバックエンド
 		"""
 		self.__setting = setting
-		self.__instances: dict[str, Any] = {}
+		self.__backend = backend
+		self.__instances = LRUCache[str, Any](max_count=setting.memory_max_count, max_size=setting.memory_max_size, on_evict=self.__on_evict)
+		self.__identifiers: dict[str, dict[str, bool]] = {}
+		self.__cache_keys: dict[str, str] = {}
+
+	@property
+	def metrics(self) -> LRUMetrics:
+		"""Returns: メモリー上のインスタンスの統計"""
+		return self.__instances.metrics
 
 	def get(self, cache_key: str, identity: dict[str, str] = {}, **options: Any) -> Callable[[Callable[[], T_Stored]], Callable[[], T_Stored]]:
 		"""キャッシュデコレーター。ファクトリー関数をラップしてキャッシュ機能を付与
@@ -233,6 +350,13 @@ class CacheProvider:
 			**options: オプション
 		Returns:
 			デコレーター
+		Note:
+			```
+			* identityにはアプリケーションのバージョンを自動的に付与
+			### オプション
+			* format: キャッシュファイルの拡張子
+			* content_addressed: True = コンテンツアドレス形式で保存 @see CachedProxy
+			```
 		Examples:
 			```python
 			class Data:
@@ -258,11 +382,45 @@ class CacheProvider:
 				stored = wrapped.__annotations__['return']
 				ctor = CachedProxy if self.__setting.enabled else CachedDummy
 				identifier = ctor.identifier({'__cache_key__': cache_key, **identity})
-				if identifier not in self.__instances:
-					cacher = ctor(stored, wrapped, identity, self.__setting.basedir, **options)
-					self.__instances[identifier] = cacher.get(cache_key)
+				instance = self.__instances.get(identifier)
+				if instance is None:
+					cacher = ctor(stored, wrapped, {**identity, '__version__': Versions.app}, self.__setting.basedir, self.__backend, **options)
+					instance = cacher.get(cache_key)
+					self.__instances.put(identifier, instance, cacher.size)
+					if cache_key not in self.__identifiers:
+						self.__identifiers[cache_key] = {}
 
-				return self.__instances[identifier]
+					self.__identifiers[cache_key][identifier] = True
+					self.__cache_keys[identifier] = cache_key
+
+				return instance
 
 			return wrapper
 		return decorator
+
+	def release(self, cache_key: str) -> None:
+		"""キャッシュキーに対応するメモリー上のインスタンスを解放
+
+		Args:
+			cache_key: キャッシュキー
+		Note:
+			ファイルに保存されたキャッシュは削除しない
+		"""
+		for identifier in self.__identifiers.pop(cache_key, {}).keys():
+			self.__cache_keys.pop(identifier, None)
+			self.__instances.pop(identifier)
+
+	def __on_evict(self, identifier: str) -> None:
+		"""追い出したインスタンスの識別子を対応表から削除
+
+		Args:
+			identifier: 識別子
+		"""
+		cache_key = self.__cache_keys.pop(identifier, None)
+		if cache_key is None:
+			return
+
+		identifiers = self.__identifiers.get(cache_key, {})
+		identifiers.pop(identifier, None)
+		if len(identifiers) == 0:
+			self.__identifiers.pop(cache_key, None)
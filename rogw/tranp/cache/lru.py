@@ -0,0 +1,208 @@
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, TypedDict
+
+LRUMetrics = TypedDict('LRUMetrics', {
+	'hits': int,
+	'misses': int,
+	'evictions': int,
+	'count': int,
+	'size': int,
+})
+
+
+class LRUCache[K, V]:
+	"""インメモリーのLRUキャッシュ。件数・概算サイズの上限を超えた場合に最終使用日時が古い順に追い出す
+
+	Note:
+		```
+		* 上限が無い場合(default)は追い出しを行わず、参照順の更新も省略
+		* サイズはput時に呼び出し元が指定する概算値(例: シリアライズ後のバイト数)。指定しない場合は0として扱う
+		* weak=Trueの場合、追い出したエントリーを弱参照で保持し、他から参照されている間は再取得が可能
+		  弱参照に非対応の値(int/str/tuple等)は追い出しと同時に破棄
+		* on_evictは追い出したエントリーを破棄した時に呼び出す。キーに紐づく付帯情報の解放に使用(弱参照で保持した場合は対象外)
+		```
+	Examples:
+		```python
+		cache = LRUCache[str, Entry](max_count=128, max_size=64 * 1024 * 1024)
+		entry = cache.get(key)
+		if entry is None:
+			entry = load(key)
+			cache.put(key, entry, size=payload_size)
+		```
+	"""
+
+	def __init__(self, max_count: int = 0, max_size: int = 0, weak: bool = False, on_evict: Callable[[K], None] | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			max_count: 件数の上限。0以下は無制限 (default = 0)
+			max_size: 概算サイズの上限。0以下は無制限 (default = 0)
+			weak: True = 追い出したエントリーを弱参照で保持 (default = False)
+			on_evict: 追い出したエントリーの破棄時のハンドラー (default = None)
+		"""
+		self._entries: OrderedDict[K, V] = OrderedDict()
+		self._sizes: dict[K, int] = {}
+		self._weaks: weakref.WeakValueDictionary[K, Any] | None = weakref.WeakValueDictionary() if weak else None
+		self._max_count = max(0, max_count)
+		self._max_size = max(0, max_size)
+		self._bounded = self._max_count > 0 or self._max_size > 0
+		self._on_evict = on_evict
+		self._size = 0
+		self._hits = 0
+		self._misses = 0
+		self._evictions = 0
+
+	def __contains__(self, key: K) -> bool:
+		"""キーが存在するか判定
+
+		Args:
+			key: キー
+		Returns:
+			True = 存在
+		Note:
+			弱参照で保持しているエントリーも対象。参照順・統計は更新しない
+		"""
+		return key in self._entries or (self._weaks is not None and key in self._weaks)
+
+	def __len__(self) -> int:
+		"""Returns: 保持しているエントリー数(弱参照を除く)"""
+		return len(self._entries)
+
+	@property
+	def size(self) -> int:
+		"""Returns: 保持しているエントリーの概算サイズの合計(弱参照を除く)"""
+		return self._size
+
+	@property
+	def metrics(self) -> LRUMetrics:
+		"""Returns: 統計"""
+		return {'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions, 'count': len(self._entries), 'size': self._size}
+
+	def get(self, key: K, default: V | None = None) -> V | None:
+		"""エントリーを取得
+
+		Args:
+			key: キー
+			default: 存在しない場合の返却値 (default = None)
+		Returns:
+			値
+		Note:
+			弱参照で保持しているエントリーが生存している場合は、再度キャッシュに格納して返却
+		"""
+		if key in self._entries:
+			self._hits += 1
+			if self._bounded:
+				self._entries.move_to_end(key)
+
+			return self._entries[key]
+
+		if self._weaks is not None:
+			value = self._weaks.get(key)
+			if value is not None:
+				self._hits += 1
+				self.put(key, value, self._sizes.get(key, 0))
+				return value
+
+		self._misses += 1
+		return default
+
+	def put(self, key: K, value: V, size: int = 0) -> None:
+		"""エントリーを格納。上限を超えた場合は最終使用日時が古い順に追い出す
+
+		Args:
+			key: キー
+			value: 値
+			size: 概算サイズ (default = 0)
+		Note:
+			単体で上限を超えるエントリーも格納する。追い出しは格納したエントリー以外が対象
+		"""
+		if key in self._entries:
+			self._size -= self._sizes.get(key, 0)
+			if self._bounded:
+				self._entries.move_to_end(key)
+
+		self._entries[key] = value
+		if size or key in self._sizes:
+			self._sizes[key] = size
+
+		self._size += size
+		if self._bounded:
+			self.__evict()
+
+	def pop(self, key: K, default: V | None = None) -> V | None:
+		"""エントリーを削除
+
+		Args:
+			key: キー
+			default: 存在しない場合の返却値 (default = None)
+		Returns:
+			削除した値
+		Note:
+			弱参照で保持しているエントリーも削除
+		"""
+		if self._weaks is not None:
+			self._weaks.pop(key, None)
+
+		if key not in self._entries:
+			self._sizes.pop(key, None)
+			return default
+
+		self._size -= self._sizes.pop(key, 0)
+		return self._entries.pop(key)
+
+	def clear(self) -> None:
+		"""全てのエントリーを削除。統計は維持"""
+		self._entries.clear()
+		self._sizes.clear()
+		if self._weaks is not None:
+			self._weaks.clear()
+
+		self._size = 0
+
+	def __evict(self) -> None:
+		"""上限を超えたエントリーを追い出す
+
+		Note:
+			直前に格納したエントリーは末尾に位置するため、追い出しの対象外
+		"""
+		while len(self._entries) > 1 and self.__over():
+			key, value = self._entries.popitem(last=False)
+			self._size -= self._sizes.get(key, 0)
+			self._evictions += 1
+			if not self.__keep_weak(key, value):
+				self._sizes.pop(key, None)
+				if self._on_evict is not None:
+					self._on_evict(key)
+
+	def __over(self) -> bool:
+		"""上限を超えているか判定
+
+		Returns:
+			True = 超過
+		"""
+		return (self._max_count > 0 and len(self._entries) > self._max_count) or (self._max_size > 0 and self._size > self._max_size)
+
+	def __keep_weak(self, key: K, value: V) -> bool:
+		"""追い出したエントリーを弱参照で保持
+
+		Args:
+			key: キー
+			value: 値
+		Returns:
+			True = 保持
+		"""
+		if self._weaks is None:
+			return False
+
+		try:
+			self._weaks[key] = value
+		except TypeError:
+			return False
+
+		# 消滅した弱参照のサイズを破棄
+		if len(self._sizes) > 2 * (len(self._entries) + len(self._weaks)):
+			self._sizes = {key: size for key, size in self._sizes.items() if key in self._entries or key in self._weaks}
+
+		return True
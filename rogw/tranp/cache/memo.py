@@ -1,13 +1,24 @@
 from collections.abc import Callable
 from typing import Any
 
+from rogw.tranp.cache.lru import LRUCache, LRUMetrics
+
 
 class Memo:
 	"""キャッシュデコレーターファクトリー"""
 
-	def __init__(self) -> None:
-		"""インスタンスを生成"""
-		self.__cache: dict[str, Any] = {}
+	def __init__(self, max_count: int = 0) -> None:
+		"""インスタンスを生成
+
+		Args:
+			max_count: 件数の上限。0以下は無制限 (default = 0)
+		"""
+		self.__cache = LRUCache[str, Any](max_count=max_count)
+
+	@property
+	def metrics(self) -> LRUMetrics:
+		"""Returns: 統計"""
+		return self.__cache.metrics
 
 	def __call__(self, key: str) -> Callable:
 		"""キャッシュデコレーターを生成
@@ -25,11 +36,14 @@ class Memo:
 		"""
 		def decorator(wrapper_func: Callable) -> Callable:
 			def wrapper(*args, **kwargs) -> Any:
-				if key in self.__cache:
-					return self.__cache[key]
+				# 値がNoneの場合を考慮し、自身を番兵として使用
+				result = self.__cache.get(key, self)
+				if result is not self:
+					return result
 
-				self.__cache[key] = wrapper_func(*args, **kwargs)
-				return self.__cache[key]
+				result = wrapper_func(*args, **kwargs)
+				self.__cache.put(key, result)
+				return result
 
 			return wrapper
 
@@ -65,9 +79,14 @@ class Memoize:
 		```
 	"""
 
-	def __init__(self) -> None:
-		"""インスタンスを生成"""
+	def __init__(self, max_count: int = 0) -> None:
+		"""インスタンスを生成
+
+		Args:
+			max_count: キャッシュデコレーターファクトリー毎の件数の上限。0以下は無制限 (default = 0)
+		"""
 		self.__memos: dict[object, Memo] = {}
+		self.__max_count = max_count
 
 	def get(self, obj: object) -> Memo:
 		"""オブジェクトに対応したキャッシュデコレーターファクトリーを取得
@@ -80,5 +99,5 @@ class Memoize:
 		if obj in self.__memos:
 			return self.__memos[obj]
 
-		self.__memos[obj] = Memo()
+		self.__memos[obj] = Memo(self.__max_count)
 		return self.__memos[obj]
@@ -1,5 +1,7 @@
 from collections.abc import Callable
 
+from rogw.tranp.cache.lru import LRUCache, LRUMetrics
+
 
 class Memo[T]:
 	"""キャッシュ"""
@@ -26,11 +28,24 @@ class Memo[T]:
 
 
 class Memoize:
-	"""キャッシュマネージャー"""
+	"""キャッシュマネージャー
+
+	Note:
+		上限の指定がない場合(default)は無制限 @see LRUCache
+	"""
+
+	def __init__(self, max_count: int = 0) -> None:
+		"""インスタンスを生成
+
+		Args:
+			max_count: 件数の上限。0以下は無制限 (default = 0)
+		"""
+		self._memos = LRUCache[object, Memo](max_count=max_count)
 
-	def __init__(self) -> None:
-		"""インスタンスを生成"""
-		self._memos: dict[object, Memo] = {}
+	@property
+	def metrics(self) -> LRUMetrics:
+		"""Returns: 統計"""
+		return self._memos.metrics
 
 	def get[T](self, key: object, factory: Callable[[], T]) -> T:
 		"""キャッシュからインタンスを取得
@@ -41,7 +56,9 @@ class Memoize:
 		Returns:
 			インスタンス
 		"""
-		if key not in self._memos:
-			self._memos[key] = Memo(factory)
+		memo = self._memos.get(key)
+		if memo is None:
+			memo = Memo(factory)
+			self._memos.put(key, memo)
 
-		return self._memos[key].get()
+		return memo.get()
@@ -0,0 +1,412 @@
+import http.client
+import re
+import threading
+import time
+import urllib.parse
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from rogw.tranp.cache.backend import CacheBackend
+from rogw.tranp.cache.stats import CacheStats
+from rogw.tranp.cache.storage import CacheFile
+from rogw.tranp.errors import Errors
+from rogw.tranp.lang.annotation import implements
+
+ChecksumHeader = 'X-Tranp-Checksum'
+
+
+def split_key(key: str) -> tuple[str, str] | None:
+	"""キャッシュのキーを識別子と拡張子に分割
+
+	Args:
+		key: キー(識別子 + 拡張子)
+	Returns:
+		(識別子, 拡張子)。書式が不正な場合はNone
+	Note:
+		識別子はMD5の16進数表記(32文字) @see rogw.tranp.cache.cache.Cached.identifier
+	"""
+	matches = re.fullmatch(r'([0-9a-f]{32})((\.[0-9a-z]+)*)', key)
+	return (matches[1], matches[2]) if matches else None
+
+
+class RemoteCache:
+	"""リモートキャッシュのクライアント。HTTPでコンテンツのキー毎にペイロードを取得・保存
+
+	Note:
+		```
+		### プロトコル
+		* GET /objects/${key}: 200 = ペイロード, 404 = 存在しない
+		* PUT /objects/${key}: 204 = 保存(既に存在する場合も含む)
+		* ペイロードのCRC32をヘッダー(X-Tranp-Checksum)で送受信し、不一致の場合は存在しないものとして扱う
+		### 障害時の振る舞い
+		* 通信に失敗した場合は以降のリクエストを行わず、全て存在しないものとして扱う
+		* リモートキャッシュの障害によってビルドを失敗させない
+		```
+	"""
+
+	def __init__(self, url: str, timeout: float = 5.0) -> None:
+		"""インスタンスを生成
+
+		Args:
+			url: サーバーのURL 例: 'http://127.0.0.1:8765'
+			timeout: タイムアウト(秒) (default = 5.0)
+		"""
+		parsed = urllib.parse.urlsplit(url)
+		self.__scheme = parsed.scheme
+		self.__netloc = parsed.netloc
+		self.__basepath = parsed.path.rstrip('/')
+		self.__timeout = timeout
+		self.__conn: http.client.HTTPConnection | None = None
+		self.__available = True
+
+	@property
+	def available(self) -> bool:
+		"""Returns: True = 利用可能"""
+		return self.__available
+
+	def get(self, key: str) -> bytes | None:
+		"""ペイロードを取得
+
+		Args:
+			key: キー(識別子 + 拡張子)
+		Returns:
+			ペイロード。存在しない、または取得に失敗した場合はNone
+		"""
+		response = self.__request('GET', key)
+		if response is None or response[0] != 200:
+			return None
+
+		_, payload, checksum = response
+		return payload if checksum == str(zlib.crc32(payload)) else None
+
+	def put(self, key: str, payload: bytes) -> bool:
+		"""ペイロードを保存
+
+		Args:
+			key: キー(識別子 + 拡張子)
+			payload: ペイロード
+		Returns:
+			True = 成功
+		"""
+		response = self.__request('PUT', key, payload)
+		return response is not None and response[0] in [200, 201, 204]
+
+	def __request(self, method: str, key: str, body: bytes | None = None) -> tuple[int, bytes, str] | None:
+		"""リクエストを送信
+
+		Args:
+			method: HTTPメソッド
+			key: キー(識別子 + 拡張子)
+			body: リクエストボディー (default = None)
+		Returns:
+			(ステータスコード, レスポンスボディー, チェックサム)。通信に失敗した場合はNone
+		Note:
+			キープアライブの切断を考慮し、1度だけ再接続して再送
+		"""
+		if not self.__available:
+			return None
+
+		headers = {ChecksumHeader: str(zlib.crc32(body))} if body is not None else {}
+		for _ in range(2):
+			try:
+				conn = self.__connect()
+				conn.request(method, f'{self.__basepath}/objects/{key}', body=body, headers=headers)
+				response = conn.getresponse()
+				return response.status, response.read(), response.getheader(ChecksumHeader, '')
+			except (OSError, http.client.HTTPException):
+				self.__close()
+
+		self.__available = False
+		return None
+
+	def __connect(self) -> http.client.HTTPConnection:
+		"""接続を取得。未接続の場合は接続を生成
+
+		Returns:
+			接続
+		"""
+		if self.__conn is None:
+			ctor = http.client.HTTPSConnection if self.__scheme == 'https' else http.client.HTTPConnection
+			self.__conn = ctor(self.__netloc, timeout=self.__timeout)
+
+		return self.__conn
+
+	def __close(self) -> None:
+		"""接続を破棄"""
+		if self.__conn is not None:
+			self.__conn.close()
+
+		self.__conn = None
+
+
+class RemoteBackend(CacheBackend):
+	"""キャッシュバックエンド(リモート)。ローカルのバックエンドの後段にリモートキャッシュを配置
+
+	Note:
+		```
+		* ローカルに存在しない場合はリモートから取得し、ローカルに保存した上で利用
+		* 書き込みはローカルとリモートの両方に実施
+		* エビクション等の管理操作はローカルのみが対象
+		* リモートからの取得・リモートへの保存は、キャッシュキーのプレフィックス'remote'として統計に記録 @see CacheStats
+		```
+	"""
+
+	def __init__(self, local: CacheBackend, remote: RemoteCache) -> None:
+		"""インスタンスを生成
+
+		Args:
+			local: ローカルのキャッシュバックエンド
+			remote: リモートキャッシュのクライアント
+		"""
+		self.__local = local
+		self.__remote = remote
+
+	@implements
+	def exists(self, identifier: str, extention: str) -> bool:
+		"""キャッシュが存在するか判定
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			True = 存在
+		"""
+		return self.__local.exists(identifier, extention) or self.__fetch(identifier, extention)
+
+	@implements
+	def read(self, identifier: str, extention: str) -> bytes:
+		"""キャッシュを読み込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			ペイロード
+		Raises:
+			Errors.InvalidSchema: キャッシュが破損
+			OSError: キャッシュの読み込みに失敗
+		"""
+		if not self.__local.exists(identifier, extention):
+			self.__fetch(identifier, extention)
+
+		return self.__local.read(identifier, extention)
+
+	@implements
+	def write(self, identifier: str, extention: str, payload: bytes) -> None:
+		"""キャッシュを書き込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+			payload: ペイロード
+		"""
+		self.__local.write(identifier, extention, payload)
+		if self.__remote.put(f'{identifier}{extention}', payload):
+			CacheStats.instance().miss('remote', len(payload))
+
+	@implements
+	def touch(self, identifier: str, extention: str) -> None:
+		"""キャッシュの最終使用日時を更新
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		"""
+		self.__local.touch(identifier, extention)
+
+	@implements
+	def discard(self, identifier: str, extention: str) -> None:
+		"""キャッシュを破棄。存在しない場合は無視
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Note:
+			ローカルのみ破棄。リモートのデータはサーバー側で検証済み
+		"""
+		self.__local.discard(identifier, extention)
+
+	@implements
+	def files(self) -> list[CacheFile]:
+		"""全てのキャッシュを取得
+
+		Returns:
+			キャッシュファイルリスト(最終使用日時の昇順)
+		"""
+		return self.__local.files()
+
+	@implements
+	def remove(self, files: list[CacheFile]) -> list[CacheFile]:
+		"""キャッシュを削除
+
+		Args:
+			files: キャッシュファイルリスト
+		Returns:
+			削除したキャッシュファイルリスト
+		"""
+		return self.__local.remove(files)
+
+	def __fetch(self, identifier: str, extention: str) -> bool:
+		"""リモートから取得してローカルに保存
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			True = 取得
+		"""
+		start = time.perf_counter()
+		payload = self.__remote.get(f'{identifier}{extention}')
+		if payload is None:
+			return False
+
+		self.__local.write(identifier, extention, payload)
+		CacheStats.instance().hit('remote', len(payload), time.perf_counter() - start)
+		return True
+
+
+class CacheServer(ThreadingHTTPServer):
+	"""リモートキャッシュのサーバー。キャッシュバックエンドをHTTPで公開する参照実装
+
+	Note:
+		```
+		* プロトコルはRemoteCacheを参照 @see RemoteCache
+		* バックエンドへのアクセスはスレッド間で排他
+		* 認証・暗号化は提供しないため、信頼できるネットワーク内でのみ利用すること
+		```
+	Examples:
+		```python
+		server = CacheServer(FileBackend('.cache/remote'), '127.0.0.1', 8765)
+		server.serve_forever()
+		```
+	"""
+
+	MaxPayloadSize = 256 * 1024 * 1024
+
+	def __init__(self, backend: CacheBackend, host: str = '127.0.0.1', port: int = 0) -> None:
+		"""インスタンスを生成
+
+		Args:
+			backend: キャッシュバックエンド
+			host: ホスト名 (default = '127.0.0.1')
+			port: ポート番号。0の場合は空きポートを自動で割り当て (default = 0)
+		"""
+		super().__init__((host, port), CacheRequestHandler)
+		self.backend = backend
+		self.lock = threading.Lock()
+
+	@property
+	def url(self) -> str:
+		"""Returns: サーバーのURL"""
+		host, port = self.server_address[:2]
+		return f'http://{host}:{port}'
+
+
+class CacheRequestHandler(BaseHTTPRequestHandler):
+	"""リモートキャッシュのリクエストハンドラー"""
+
+	protocol_version = 'HTTP/1.1'
+	server: CacheServer
+
+	def do_GET(self) -> None:
+		"""GETリクエストを処理"""
+		parsed = self.__parse_key()
+		if parsed is None:
+			self.__respond(400)
+			return
+
+		with self.server.lock:
+			payload = self.__read(*parsed)
+
+		if payload is None:
+			self.__respond(404)
+		else:
+			self.__respond(200, payload)
+
+	def do_PUT(self) -> None:
+		"""PUTリクエストを処理
+
+		Note:
+			```
+			* チェックサムが一致しない場合は保存しない
+			* Content-Lengthが不正な場合はボディーを読まずに応答し、接続を閉じる(未読のボディーが残るため)
+			```
+		"""
+		parsed = self.__parse_key()
+		length = self.headers.get('Content-Length')
+		if length is None:
+			self.close_connection = True
+			self.__respond(411)
+			return
+
+		if not (length.isascii() and length.isdigit()):
+			self.close_connection = True
+			self.__respond(400)
+			return
+
+		size = int(length)
+		if size > CacheServer.MaxPayloadSize:
+			self.close_connection = True
+			self.__respond(413)
+			return
+
+		payload = self.rfile.read(size)
+		if parsed is None or self.headers.get(ChecksumHeader, '') != str(zlib.crc32(payload)):
+			self.__respond(400)
+			return
+
+		with self.server.lock:
+			if not self.server.backend.exists(*parsed):
+				self.server.backend.write(*parsed, payload)
+
+		self.__respond(204)
+
+	def log_message(self, format: str, *args: Any) -> None:
+		"""アクセスログを出力しない"""
+		pass
+
+	def __parse_key(self) -> tuple[str, str] | None:
+		"""リクエストパスからキーを解析
+
+		Returns:
+			(識別子, 拡張子)。パスが不正な場合はNone
+		"""
+		matches = re.fullmatch(r'/objects/([^/]+)', urllib.parse.urlsplit(self.path).path)
+		return split_key(matches[1]) if matches else None
+
+	def __read(self, identifier: str, extention: str) -> bytes | None:
+		"""バックエンドから読み込み
+
+		Args:
+			identifier: 一意な識別子
+			extention: 拡張子
+		Returns:
+			ペイロード。存在しない、または破損している場合はNone
+		"""
+		if not self.server.backend.exists(identifier, extention):
+			return None
+
+		try:
+			return self.server.backend.read(identifier, extention)
+		except (OSError, Errors.InvalidSchema):
+			self.server.backend.discard(identifier, extention)
+			return None
+
+	def __respond(self, status: int, payload: bytes = b'') -> None:
+		"""レスポンスを送信
+
+		Args:
+			status: ステータスコード
+			payload: レスポンスボディー (default = b'')
+		"""
+		self.send_response(status)
+		self.send_header('Content-Length', str(len(payload)))
+		if self.close_connection:
+			self.send_header('Connection', 'close')
+
+		if status == 200:
+			self.send_header(ChecksumHeader, str(zlib.crc32(payload)))
+
+		self.end_headers()
+		self.wfile.write(payload)
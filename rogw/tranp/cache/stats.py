@@ -0,0 +1,205 @@
+import json
+import os
+import time
+from typing import ClassVar, TypedDict
+
+CacheCounter = TypedDict('CacheCounter', {
+	'hits': int,
+	'misses': int,
+	'bytes_read': int,
+	'bytes_written': int,
+	'load_time': float,
+})
+
+
+class CacheStats:
+	"""キャッシュの統計。キャッシュキーのプレフィックス毎にヒット・ミス・読み書きのバイト数・ロード時間を集計
+
+	Note:
+		```
+		* プレフィックスはキャッシュキーの先頭の要素 例: 'path/to/module' -> 'path'
+		* 集計結果は実行毎にJSON Lines形式のファイルへ追記し、参照時に合算。ファイルは直近の実行分のみ保持 @see MaxRecords
+		* 並列モードのワーカーは集計結果を親プロセスへ転送して合算 @see drain, merge
+		```
+	Example:
+		```python
+		CacheStats.instance().hit('path/to/module', size=1024, elapsed=0.001)
+		```
+	"""
+
+	MaxRecords: ClassVar[int] = 1000
+
+	_instance: 'CacheStats | None' = None
+
+	@classmethod
+	def instance(cls) -> 'CacheStats':
+		"""シングルトンインスタンスを取得
+
+		Returns:
+			インスタンス
+		"""
+		if not cls._instance:
+			cls._instance = cls()
+
+		return cls._instance
+
+	@classmethod
+	def prefix_of(cls, cache_key: str) -> str:
+		"""キャッシュキーからプレフィックスを取得
+
+		Args:
+			cache_key: キャッシュキー
+		Returns:
+			プレフィックス
+		"""
+		return cache_key.replace(os.path.sep, '/').split('/')[0]
+
+	@classmethod
+	def load(cls, filepath: str) -> dict[str, CacheCounter]:
+		"""ファイルから集計結果を読み込み、全ての実行分を合算
+
+		Args:
+			filepath: ファイルパス
+		Returns:
+			プレフィックス毎の集計結果
+		Note:
+			破損した行は無視
+		"""
+		stats = cls()
+		if not os.path.isfile(filepath):
+			return stats.counters
+
+		with open(filepath, mode='rb') as f:
+			for line in f:
+				try:
+					stats.merge(json.loads(line)['counters'])
+				except (ValueError, KeyError, TypeError):
+					continue
+
+		return stats.counters
+
+	def __init__(self) -> None:
+		"""インスタンスを生成"""
+		self._counters: dict[str, CacheCounter] = {}
+
+	@property
+	def counters(self) -> dict[str, CacheCounter]:
+		"""Returns: プレフィックス毎の集計結果"""
+		return self._counters
+
+	def hit(self, cache_key: str, size: int, elapsed: float) -> None:
+		"""キャッシュのヒットを記録
+
+		Args:
+			cache_key: キャッシュキー
+			size: 読み込んだバイト数
+			elapsed: ロード時間(秒)
+		"""
+		counter = self.__counter_of(cache_key)
+		counter['hits'] += 1
+		counter['bytes_read'] += size
+		counter['load_time'] += elapsed
+
+	def miss(self, cache_key: str, size: int) -> None:
+		"""キャッシュのミスを記録
+
+		Args:
+			cache_key: キャッシュキー
+			size: 書き込んだバイト数
+		"""
+		counter = self.__counter_of(cache_key)
+		counter['misses'] += 1
+		counter['bytes_written'] += size
+
+	def merge(self, counters: dict[str, CacheCounter]) -> None:
+		"""集計結果を合算
+
+		Args:
+			counters: プレフィックス毎の集計結果
+		"""
+		for prefix, counter in counters.items():
+			merged = self.__counter_of(prefix)
+			merged['hits'] += counter['hits']
+			merged['misses'] += counter['misses']
+			merged['bytes_read'] += counter['bytes_read']
+			merged['bytes_written'] += counter['bytes_written']
+			merged['load_time'] += counter['load_time']
+
+	def drain(self) -> dict[str, CacheCounter]:
+		"""集計結果を取り出し、集計をリセット
+
+		Returns:
+			プレフィックス毎の集計結果
+		"""
+		counters = self._counters
+		self._counters = {}
+		return counters
+
+	def save(self, filepath: str, max_records: int = MaxRecords) -> None:
+		"""集計結果をファイルに追記し、集計をリセット
+
+		Args:
+			filepath: ファイルパス
+			max_records: 保持する実行分の上限。0以下は無制限(default = MaxRecords)
+		Note:
+			```
+			* 集計結果が空の場合は出力しない
+			* 上限を超えた場合は古い実行分から削除 @see trim
+			```
+		"""
+		counters = self.drain()
+		if not counters:
+			return
+
+		dirpath = os.path.dirname(os.path.abspath(filepath))
+		if not os.path.exists(dirpath):
+			os.makedirs(dirpath, exist_ok=True)
+
+		line = json.dumps({'time': time.time(), 'counters': counters}, separators=(',', ':'))
+		with open(filepath, mode='ab') as f:
+			f.write(f'{line}\n'.encode('utf-8'))
+
+		if max_records > 0:
+			self.trim(filepath, max_records)
+
+	@classmethod
+	def trim(cls, filepath: str, max_records: int) -> None:
+		"""ファイルの集計結果を直近の実行分に切り詰め
+
+		Args:
+			filepath: ファイルパス
+			max_records: 保持する実行分の上限
+		Note:
+			一時ファイルに出力した上で置き換えるため、切り詰め中のファイルが参照されることはない
+		"""
+		with open(filepath, mode='rb') as f:
+			lines = f.readlines()
+
+		if len(lines) <= max_records:
+			return
+
+		tmp_filepath = f'{filepath}.{os.getpid()}.tmp'
+		try:
+			with open(tmp_filepath, mode='wb') as f:
+				f.writelines(lines[-max_records:])
+
+			os.replace(tmp_filepath, filepath)
+		except BaseException:
+			if os.path.exists(tmp_filepath):
+				os.remove(tmp_filepath)
+
+			raise
+
+	def __counter_of(self, cache_key: str) -> CacheCounter:
+		"""キャッシュキーに対応するカウンターを取得
+
+		Args:
+			cache_key: キャッシュキー
+		Returns:
+			カウンター
+		"""
+		prefix = self.prefix_of(cache_key)
+		if prefix not in self._counters:
+			self._counters[prefix] = {'hits': 0, 'misses': 0, 'bytes_read': 0, 'bytes_written': 0, 'load_time': 0.0}
+
+		return self._counters[prefix]
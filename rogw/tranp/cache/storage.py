@@ -0,0 +1,208 @@
+import fnmatch
+import os
+import time
+from dataclasses import dataclass
+
+
+@dataclass
+class CacheFile:
+	"""キャッシュファイル
+
+	Attributes:
+		path: ファイルパス(絶対パス)
+		size: ファイルサイズ
+		mtime: 最終使用日時。キャッシュのヒット時に更新
+	"""
+
+	path: str
+	size: int
+	mtime: float
+
+
+class CacheStorage:
+	"""キャッシュの保存ディレクトリー。使用量の集計と容量・期間の上限に基づくエビクションを提供
+
+	Note:
+		```
+		* キャッシュのヒット時にファイルの最終更新日時を更新するため、最終更新日時を最終使用日時として扱う
+		* 統計ファイル・ロックファイル・エビクションの実行記録はエビクションの対象外
+		* ビルドマニフェストはキャッシュではないため対象外 @see rogw.tranp.bin.transpile.Runner.manifest_filepath
+		* 書き込み途中の一時ファイルは対象外
+		* パックファイルはパックのバックエンドが管理するため対象外 @see rogw.tranp.cache.backend.PackedBackend
+		```
+	"""
+
+	StatsFilename = 'stats.jsonl'
+	LockFilename = '.lock'
+	PackFilename = 'objects.pack'
+	GCStampFilename = '.gc'
+
+	def __init__(self, basedir: str) -> None:
+		"""インスタンスを生成
+
+		Args:
+			basedir: キャッシュの保存ディレクトリー(実行ディレクトリーからの相対パス)
+		"""
+		self.basedir = os.path.abspath(os.path.join(os.getcwd(), basedir))
+
+	@property
+	def stats_filepath(self) -> str:
+		"""Returns: 統計ファイルのパス(絶対パス)"""
+		return os.path.join(self.basedir, self.StatsFilename)
+
+	@property
+	def lock_filepath(self) -> str:
+		"""Returns: ロックファイルのパス(絶対パス)"""
+		return os.path.join(self.basedir, self.LockFilename)
+
+	@property
+	def pack_filepath(self) -> str:
+		"""Returns: パックファイルのパス(絶対パス)"""
+		return os.path.join(self.basedir, self.PackFilename)
+
+	@property
+	def gc_stamp_filepath(self) -> str:
+		"""Returns: エビクションの実行記録のパス(絶対パス)"""
+		return os.path.join(self.basedir, self.GCStampFilename)
+
+	def is_managed(self, filepath: str) -> bool:
+		"""キャッシュファイル以外の管理用のファイルか判定
+
+		Args:
+			filepath: ファイルパス(絶対パス)
+		Returns:
+			True = 管理用のファイル
+		"""
+		if filepath in [self.stats_filepath, self.lock_filepath, self.pack_filepath, self.gc_stamp_filepath]:
+			return True
+
+		filename = os.path.basename(filepath)
+		if os.path.dirname(filepath) == self.basedir and fnmatch.fnmatch(filename, 'manifest-*.json'):
+			return True
+
+		return filename.endswith('.tmp')
+
+	def files(self) -> list[CacheFile]:
+		"""全てのキャッシュファイルを取得
+
+		Returns:
+			キャッシュファイルリスト(最終使用日時の昇順)
+		"""
+		founds: list[CacheFile] = []
+		for dirpath, _, filenames in os.walk(self.basedir):
+			for filename in filenames:
+				filepath = os.path.join(dirpath, filename)
+				if self.is_managed(filepath):
+					continue
+
+				try:
+					stat = os.stat(filepath)
+				except FileNotFoundError:
+					continue
+
+				founds.append(CacheFile(filepath, stat.st_size, stat.st_mtime))
+
+		return sorted(founds, key=lambda found: found.mtime)
+
+	def gc(self, max_size: int, max_age: float) -> list[CacheFile]:
+		"""容量・期間の上限を超えたキャッシュファイルを削除
+
+		Args:
+			max_size: 容量の上限(バイト)。0以下は無制限
+			max_age: 未使用期間の上限(秒)。0以下は無制限
+		Returns:
+			削除したキャッシュファイルリスト
+		Note:
+			@see select
+		"""
+		return self.remove(self.select(self.files(), max_size, max_age))
+
+	def gc_due(self, interval: float) -> bool:
+		"""前回のエビクションから実行間隔が経過したか判定
+
+		Args:
+			interval: 実行間隔(秒)。0以下は常に実行
+		Returns:
+			True = 実行
+		Note:
+			エビクションは全てのキャッシュファイルを走査するため、実行間隔で間引く @see stamp_gc
+		"""
+		if interval <= 0:
+			return True
+
+		try:
+			return time.time() - os.stat(self.gc_stamp_filepath).st_mtime >= interval
+		except FileNotFoundError:
+			return True
+
+	def stamp_gc(self) -> None:
+		"""エビクションの実行日時を記録"""
+		if not os.path.exists(self.basedir):
+			os.makedirs(self.basedir, exist_ok=True)
+
+		with open(self.gc_stamp_filepath, mode='ab'):
+			pass
+
+		os.utime(self.gc_stamp_filepath)
+
+	@classmethod
+	def select(cls, files: list[CacheFile], max_size: int, max_age: float) -> list[CacheFile]:
+		"""容量・期間の上限を超えたキャッシュファイルを選出
+
+		Args:
+			files: キャッシュファイルリスト(最終使用日時の昇順)
+			max_size: 容量の上限(バイト)。0以下は無制限
+			max_age: 未使用期間の上限(秒)。0以下は無制限
+		Returns:
+			削除対象のキャッシュファイルリスト
+		Note:
+			```
+			* 未使用期間が上限を超えたファイルを選出
+			* 合計サイズが上限を超える場合、上限に収まるまで最終使用日時が古い順に選出(LRU)
+			```
+		"""
+		now = time.time()
+		expired = [found for found in files if max_age > 0 and now - found.mtime > max_age]
+		remains = files[len(expired):]
+		total = sum(found.size for found in remains)
+		evicted: list[CacheFile] = []
+		for found in remains:
+			if max_size <= 0 or total <= max_size:
+				break
+
+			evicted.append(found)
+			total -= found.size
+
+		return [*expired, *evicted]
+
+	def remove(self, files: list[CacheFile]) -> list[CacheFile]:
+		"""キャッシュファイルを削除
+
+		Args:
+			files: キャッシュファイルリスト
+		Returns:
+			削除したキャッシュファイルリスト
+		Note:
+			削除後に空になったディレクトリーも削除
+		"""
+		removed: list[CacheFile] = []
+		for found in files:
+			try:
+				os.remove(found.path)
+				removed.append(found)
+			except FileNotFoundError:
+				continue
+
+		self.__remove_empty_dirs()
+		return removed
+
+	def __remove_empty_dirs(self) -> None:
+		"""空のディレクトリーを削除。保存ディレクトリー自体は削除しない"""
+		for dirpath, _, filenames in os.walk(self.basedir, topdown=False):
+			if dirpath == self.basedir or filenames:
+				continue
+
+			try:
+				os.rmdir(dirpath)
+			except OSError:
+				continue
@@ -0,0 +1,133 @@
+import json
+import os
+from typing import TypedDict
+
+from rogw.tranp.data.meta.types import TranspilerMeta
+from rogw.tranp.data.version import Versions
+from rogw.tranp.file.writer import Writer
+from rogw.tranp.module.graph import DependencyGraph
+
+
+class ManifestOutput(TypedDict):
+	"""ビルドマニフェストの出力情報
+
+	Attributes:
+		filepath: 出力ファイルの絶対パス
+		hash: 出力内容のハッシュ値
+		transpiler: トランスパイラーのメタ情報
+	"""
+
+	filepath: str
+	hash: str
+	transpiler: TranspilerMeta
+
+
+class ManifestEntry(TypedDict):
+	"""ビルドマニフェストのエントリー
+
+	Attributes:
+		filepath: ファイルパス(実行ディレクトリー、または環境パスからの相対パス)
+		hash: ビルド時のファイルのハッシュ値
+		mtime: ビルド時のファイルの最終更新日時
+		imports: インポート先のモジュールパスリスト
+		output: 出力情報。出力対象外の場合はNone
+	"""
+
+	filepath: str
+	hash: str
+	mtime: float
+	imports: list[str]
+	output: ManifestOutput | None
+
+
+class BuildManifest:
+	"""ビルドマニフェスト。ビルド時に読み込んだモジュールのハッシュ値と依存関係を管理
+
+	Note:
+		```
+		* 出力対象に限らず、依存モジュールを含めて記録する
+		* 出力済みのファイルを読み込まずに変更の有無を判定するため、出力情報を併せて記録する
+		* アプリケーションのバージョンが異なるマニフェストは破棄する
+		```
+	"""
+
+	@classmethod
+	def load(cls, filepath: str) -> 'BuildManifest':
+		"""ファイルからインスタンスを復元。存在しない、または読み込みに失敗した場合は空のインスタンスを返却
+
+		Args:
+			filepath: ファイルパス
+		Returns:
+			インスタンス
+		"""
+		if not os.path.exists(filepath):
+			return cls()
+
+		try:
+			with open(filepath, mode='rb') as f:
+				raw = json.loads(f.read().decode('utf-8'))
+
+			if raw.get('version') != Versions.app:
+				return cls()
+
+			return cls(raw['modules'])
+		except (ValueError, KeyError, TypeError):
+			return cls()
+
+	def __init__(self, entries: dict[str, ManifestEntry] | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			entries: エントリー一覧 (default = None)
+		"""
+		self.entries: dict[str, ManifestEntry] = entries or {}
+
+	def __contains__(self, module_path: str) -> bool:
+		"""指定のモジュールのエントリーが存在するか判定
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			True = 存在
+		"""
+		return module_path in self.entries
+
+	def update(self, entries: dict[str, ManifestEntry]) -> None:
+		"""エントリーを更新
+
+		Args:
+			entries: エントリー一覧
+		Note:
+			出力情報を持たないエントリーは、ハッシュ値が一致する場合に限り既存の出力情報を引き継ぐ
+		"""
+		for module_path, entry in entries.items():
+			current = self.entries.get(module_path)
+			if entry['output'] is None and current is not None and current['hash'] == entry['hash']:
+				entry = {**entry, 'output': current['output']}
+
+			self.entries[module_path] = entry
+
+	def graph(self) -> DependencyGraph:
+		"""依存グラフを生成
+
+		Returns:
+			依存グラフ
+		"""
+		graph = DependencyGraph()
+		for module_path, entry in self.entries.items():
+			graph.add(module_path, entry['imports'])
+
+		return graph
+
+	def save(self, filepath: str) -> None:
+		"""ファイルに保存
+
+		Args:
+			filepath: ファイルパス
+		Note:
+			他のプロセスが読み込み中でも破損しない様に、アトミックに書き込み @see Writer
+		"""
+		data = {'version': Versions.app, 'modules': self.entries}
+		writer = Writer(filepath)
+		writer.put(json.dumps(data, separators=(',', ':')))
+		writer.flush()
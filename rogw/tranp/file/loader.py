@@ -54,6 +54,15 @@ class IFileLoader(metaclass=ABCMeta):
 		"""
 		...
 
+	@abstractmethod
+	def invalidate(self, filepath: str) -> None:
+		"""ファイルのキャッシュ情報(最終更新日時・ハッシュ値)を破棄
+
+		Args:
+			filepath: 実行ディレクトリーからの相対パス。または絶対パス
+		"""
+		...
+
 
 class IDataLoader(IFileLoader):
 	"""ファイルローダー(データ用) ※シンボル用の定義"""
@@ -0,0 +1,67 @@
+import os
+import sys
+from typing import Any
+
+if sys.platform == 'win32':
+	import msvcrt
+else:
+	import fcntl
+
+
+class FileLock:
+	"""ファイルによるプロセス間の排他ロック(アドバイザリーロック)
+
+	Note:
+		```
+		* POSIXはfcntl.flock、Windowsはmsvcrt.lockingでロック
+		* ロックファイルは削除せずに再利用
+		```
+	Example:
+		```python
+		with FileLock('path/to/.lock'):
+			...
+		```
+	"""
+
+	def __init__(self, filepath: str) -> None:
+		"""インスタンスを生成
+
+		Args:
+			filepath: ロックファイルのパス
+		"""
+		self.__filepath = filepath
+		self.__fd = -1
+
+	def __enter__(self) -> 'FileLock':
+		"""ロックを取得。他のプロセスがロック中の場合は解放まで待機
+
+		Returns:
+			インスタンス
+		"""
+		dirpath = os.path.dirname(os.path.abspath(self.__filepath))
+		if not os.path.exists(dirpath):
+			os.makedirs(dirpath, exist_ok=True)
+
+		self.__fd = os.open(self.__filepath, os.O_RDWR | os.O_CREAT, 0o666)
+		try:
+			if sys.platform == 'win32':
+				msvcrt.locking(self.__fd, msvcrt.LK_LOCK, 1)
+			else:
+				fcntl.flock(self.__fd, fcntl.LOCK_EX)
+		except BaseException:
+			os.close(self.__fd)
+			self.__fd = -1
+			raise
+
+		return self
+
+	def __exit__(self, *_: Any) -> None:
+		"""ロックを解放"""
+		try:
+			if sys.platform == 'win32':
+				msvcrt.locking(self.__fd, msvcrt.LK_UNLCK, 1)
+			else:
+				fcntl.flock(self.__fd, fcntl.LOCK_UN)
+		finally:
+			os.close(self.__fd)
+			self.__fd = -1
@@ -1,9 +1,21 @@
+import hashlib
 import os
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
 
 
 class Writer:
-	"""ファイルライター"""
+	"""ファイルライター
+
+	Note:
+		```
+		* 既存のファイルと内容が一致する場合は出力しない(最終更新日時を維持)
+		* 一時ファイルに出力した上でリネームするため、出力途中のファイルが参照されることはない
+		```
+	"""
 
 	def __init__(self, filepath: str) -> None:
 		"""インスタンスを生成
@@ -22,25 +34,120 @@ class Writer:
 		"""
 		self.__content += text
 
-	def flush(self) -> None:
-		"""出力バッファをファイルに反映"""
+	def flush(self) -> bool:
+		"""出力バッファをファイルに反映
+
+		Returns:
+			True = 出力, False = 内容が一致するため出力をスキップ
+		"""
 		abs_filepath = os.path.abspath(self.__filepath)
+		content = self.__content.encode('utf-8')
+		if not self.changed(abs_filepath, content):
+			return False
+
 		dirpath = os.path.dirname(abs_filepath)
 		if not os.path.exists(dirpath):
-			os.makedirs(dirpath)
+			os.makedirs(dirpath, exist_ok=True)
 
 		try:
-			self._flush(abs_filepath)
+			self._flush(abs_filepath, content)
 		except PermissionError:
 			# XXX 連続して出力すると稀にエラーが発生するため、若干間隔を空けて再出力を試行
 			time.sleep(0.1)
-			self._flush(abs_filepath)
+			self._flush(abs_filepath, content)
 
-	def _flush(self, filepath: str) -> None:
-		"""出力バッファをファイルに反映
+		return True
+
+	def changed(self, filepath: str, content: bytes) -> bool:
+		"""既存のファイルから内容が変更されたか判定
+
+		Args:
+			filepath: 出力パス
+			content: 出力内容
+		Returns:
+			True = 変更あり
+		Note:
+			ファイルサイズが一致する場合に限り、ハッシュ値を比較
+		"""
+		if not os.path.isfile(filepath) or os.path.getsize(filepath) != len(content):
+			return True
+
+		with open(filepath, mode='rb') as f:
+			return hashlib.md5(f.read()).digest() != hashlib.md5(content).digest()
+
+	def _flush(self, filepath: str, content: bytes) -> None:
+		"""出力内容を一時ファイルに出力し、出力パスへ置き換え
 
 		Args:
 			filepath: 出力パス
+			content: 出力内容
+		Note:
+			一時ファイルはumaskに従うパーミッションで生成するため、通常の出力と同じパーミッションになる
+		"""
+		tmp_filepath = os.path.join(os.path.dirname(filepath), f'.{os.path.basename(filepath)}.{os.getpid()}.{threading.get_ident()}.tmp')
+		fd = os.open(tmp_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+		try:
+			with os.fdopen(fd, mode='wb') as f:
+				f.write(content)
+
+			os.replace(tmp_filepath, filepath)
+		except BaseException:
+			if os.path.exists(tmp_filepath):
+				os.remove(tmp_filepath)
+
+			raise
+
+
+class WriterPool:
+	"""ファイル出力のスレッドプール。出力をバックグラウンドで実行
+
+	Note:
+		```
+		* 出力処理の例外は待機時に送出
+		* スレッドプールは初回の出力時に生成し、以降は再利用
+		```
+	Example:
+		```python
+		pool = WriterPool()
+		writer = Writer('path/to/file')
+		writer.put('text')
+		pool.submit(writer.flush)
+		pool.wait()
+		```
+	"""
+
+	def __init__(self, max_workers: int = 4) -> None:
+		"""インスタンスを生成
+
+		Args:
+			max_workers: 最大スレッド数 (default = 4)
+		"""
+		self.__max_workers = max_workers
+		self.__executor: ThreadPoolExecutor | None = None
+		self.__futures: list[Future[bool]] = []
+
+	def submit(self, flush: Callable[[], bool]) -> None:
+		"""出力処理を登録
+
+		Args:
+			flush: 出力処理。出力した場合はTrueを返却
+		"""
+		if self.__executor is None:
+			self.__executor = ThreadPoolExecutor(max_workers=self.__max_workers, thread_name_prefix='writer')
+
+		self.__futures.append(self.__executor.submit(flush))
+
+	def wait(self) -> int:
+		"""登録済みの出力処理の完了を待機
+
+		Returns:
+			出力したファイル数
+		Raises:
+			Exception: 出力処理で発生した例外
+		Note:
+			例外が発生した場合も、全ての出力処理の完了を待機してから送出
 		"""
-		with open(filepath, mode='wb') as f:
-			f.write(self.__content.encode('utf-8'))
+		futures = self.__futures
+		self.__futures = []
+		wait_futures(futures)
+		return len([True for future in futures if future.result()])
@@ -1,4 +1,4 @@
-import json
+import hashlib
 from typing import IO, cast
 
 import lark
@@ -10,6 +10,9 @@ from rogw.tranp.file.loader import IDataLoader, ISourceLoader
 from rogw.tranp.implements.syntax.lark.entry import EntryOfLark, Serialization
 from rogw.tranp.lang.annotation import duck_typed, injectable
 from rogw.tranp.lang.module import module_path_to_filepath
+from rogw.tranp.lang.profile import Tracer
+from rogw.tranp.module.pack import LibraryPack
+from rogw.tranp.syntax.ast.binary import EntryTable
 from rogw.tranp.syntax.ast.entry import Entry
 from rogw.tranp.syntax.ast.parser import ParserSetting, SourceProvider, SyntaxParser
 
@@ -18,7 +21,7 @@ class SyntaxParserOfLark:
 	"""シンタックスパーサー(Lark版)"""
 
 	@injectable
-	def __init__(self, datums: IDataLoader, sources: ISourceLoader, source_provider: SourceProvider, setting: ParserSetting, caches: CacheProvider) -> None:
+	def __init__(self, datums: IDataLoader, sources: ISourceLoader, source_provider: SourceProvider, setting: ParserSetting, caches: CacheProvider, pack: LibraryPack) -> None:
 		"""インスタンスを生成
 
 		Args:
@@ -27,12 +30,14 @@ class SyntaxParserOfLark:
 			source_provider: ソースコードプロバイダー @inject
 			setting: パーサー設定データ @inject
 			caches: キャッシュプロバイダー @inject
+			pack: ライブラリーパック @inject
 		"""
 		self.__datums = datums
 		self.__sources = sources
 		self.__source_provider = source_provider
 		self.__setting = setting
 		self.__caches = caches
+		self.__pack = pack
 
 	@duck_typed(SyntaxParser)
 	def __call__(self, module_path: str) -> Entry:
@@ -42,9 +47,28 @@ class SyntaxParserOfLark:
 			module_path: モジュールパス
 		Returns:
 			シンタックスツリーのルートエントリー
+		Note:
+			ライブラリーパックに格納済みのモジュールはパックから復元。シンタックスパーサーはパースが必要になった時点でロード
 		"""
-		parser = self.__load_parser()
-		return self.__load_entry(parser, module_path)
+		packed = self.__load_packed_entry(module_path)
+		if packed is not None:
+			return packed
+
+		return self.__load_entry(module_path)
+
+	def packed_identity(self, module_path: str) -> str:
+		"""ライブラリーパックに格納するシンタックスツリーの識別子を生成
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			識別子
+		Note:
+			グラマーとソースコードの内容から生成するため、環境に依存しない
+		"""
+		grammar_hash = self.__datums.hash(self.__setting.grammar)
+		source_hash = self.__sources.hash(module_path_to_filepath(module_path, '.py'))
+		return hashlib.md5(f'{grammar_hash}:{source_hash}'.encode('utf-8')).hexdigest()
 
 	def __load_parser(self) -> lark.Lark:
 		"""シンタックスパーサーをロード
@@ -62,19 +86,35 @@ class SyntaxParserOfLark:
 			))
 
 		identity = {
-			'mtime': str(self.__datums.mtime(self.__setting.grammar)),
-			'grammar': self.__setting.grammar,
+			'grammar': self.__datums.hash(self.__setting.grammar),
 			'start': self.__setting.start,
 			'algorithem': self.__setting.algorithem,
+			'lark': lark.__version__,
 		}
-		decorator = self.__caches.get('parser.cache', identity=identity, format='bin')
+		decorator = self.__caches.get('parser.cache', identity=identity, format='bin', content_addressed=True)
 		return decorator(instantiate)().lark
 
-	def __load_entry(self, parser: lark.Lark, module_path: str) -> Entry:
+	def __load_packed_entry(self, module_path: str) -> Entry | None:
+		"""ライブラリーパックからシンタックスツリーをロード
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			シンタックスツリーのルートエントリー。パックに存在しない、または識別子が一致しない場合はNone
+		"""
+		if module_path not in self.__pack or not self.__sources.exists(module_path_to_filepath(module_path, '.py')):
+			return None
+
+		data = self.__pack.get(module_path, 'entry', self.packed_identity(module_path))
+		if data is None:
+			return None
+
+		return EntryOfLark(cast(lark.Tree, Serialization.loads(data)))
+
+	def __load_entry(self, module_path: str) -> Entry:
 		"""シンタックスツリーをロード
 
 		Args:
-			parser: シンタックスパーサー
 			module_path: モジュールパス
 		Returns:
 			シンタックスツリーのルートエントリー
@@ -86,21 +126,35 @@ class SyntaxParserOfLark:
 
 		# ストレージに存在しないモジュールはメモリ上に存在すると見做して毎回パース
 		if not self.__sources.exists(source_path):
-			return EntryOfLark(parser.parse(self.__source_provider(module_path)))
+			return EntryOfLark(self.__parse(module_path))
 
 		def instantiate() -> EntryStored:
 			try:
-				return EntryStored(EntryOfLark(parser.parse(self.__source_provider(module_path))))
+				return EntryStored(EntryOfLark(self.__parse(module_path)))
 			except Exception as e:
 				raise Errors.Syntax(source_path, e) from e
 
 		identity = {
-			'grammar_mtime': str(self.__datums.mtime(self.__setting.grammar)),
-			'mtime': str(self.__sources.mtime(source_path)),
+			'grammar': self.__datums.hash(self.__setting.grammar),
+			'source': self.__sources.hash(source_path),
+			'format': str(EntryTable.Version),
 		}
-		decorator = self.__caches.get(basepath, identity=identity, format='json')
+		decorator = self.__caches.get(basepath, identity=identity, format='ast', content_addressed=True)
 		return decorator(instantiate)().entry
 
+	def __parse(self, module_path: str) -> lark.Tree:
+		"""ソースコードをパース
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			シンタックスツリー
+		"""
+		parser = self.__load_parser()
+		source = self.__source_provider(module_path)
+		with Tracer.instance().span('parse', module=module_path):
+			return parser.parse(source)
+
 	def dirty_get_origin(self) -> lark.Lark:
 		"""Larkインスタンスを取得(デバッグ用)
 
@@ -165,9 +219,7 @@ class EntryStored:
 		Returns:
 			インスタンス
 		"""
-		data = json.load(stream)
-		tree = cast(lark.Tree, Serialization.loads(data))
-		return EntryStored(EntryOfLark(tree))
+		return EntryStored(EntryTable.loads(stream.read()).root)
 
 	def save(self, stream: IO) -> None:
 		""""インスタンスを保存
@@ -175,5 +227,4 @@ class EntryStored:
 		Args:
 			stream: IO
 		"""
-		data = Serialization.dumps(cast(lark.Tree, self.entry.source))
-		stream.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+		stream.write(EntryTable.from_entry(self.entry).dumps())
@@ -69,15 +69,17 @@ class ASTToken:
 class ASTTree:
 	"""AST(ツリー)"""
 
-	def __init__(self, name: str, children: list['ASTEntry']) -> None:
+	def __init__(self, name: str, children: list['ASTEntry'], span: tuple[Token, Token] | None = None) -> None:
 		"""インスタンスを生成
 
 		Args:
 			name: エントリー名
 			children: 配下要素
+			span: 照合範囲の先頭と末尾のトークン (default = None)
 		"""
 		self._name = name
 		self._children = children
+		self._span = span
 
 	@property
 	def name(self) -> str:
@@ -89,6 +91,11 @@ class ASTTree:
 		"""Returns: 配下要素"""
 		return self._children
 
+	@property
+	def span(self) -> tuple[Token, Token] | None:
+		"""Returns: 照合範囲の先頭と末尾のトークン。配下要素に含まれないキーワード/改行を含む"""
+		return self._span
+
 	def simplify(self) -> TupleTree:
 		"""Returns: tuple形式"""
 		return self.name, [child.simplify() for child in self.children]
@@ -0,0 +1,537 @@
+import hashlib
+import re
+from collections.abc import Callable
+
+from rogw.tranp.implements.syntax.tranp.ast import ASTToken
+from rogw.tranp.implements.syntax.tranp.compiled import CompiledParser
+from rogw.tranp.implements.syntax.tranp.rule import Comps, FirstSet, JSONSerializer, Operators, Pattern, PatternEntry, Patterns, Repeators, Roles, Rules, Unwraps
+
+
+class ParserGenerator:
+	"""パーサージェネレーター。ルールリストから専用のパーサーモジュールのソースコードを生成
+
+	Note:
+		```
+		* 生成されるパーサーはSyntaxParserのマッチング手順をルール毎に展開したもの @see rogw.tranp.implements.syntax.tranp.syntax.SyntaxParser
+		* シンボル毎にメソッド(_r_${symbol})、入れ子のパターングループ毎にメソッド(_g${n})を生成
+		* 終端記号の判定、FIRST集合による選択肢の除外、ASTの展開はインライン化
+		* ANDの入れ子は平坦化し、子のASTエントリーは逆順に収集して最後に反転(=リストの再生成を省略)
+		* メモ化を有効にした場合、非終端記号のシンボル毎に照合結果を参照位置単位でキャッシュ(=パックラット解析)
+		* 生成結果はルールリストに対して決定的。シグネチャーはルールリストのシリアライズ結果のMD5
+		### 生成メソッドの規約
+		* _r_${symbol}(c): (ステップ数, ASTエントリー)。マッチしない場合はNone
+		* _g${n}(c, out): ステップ数。子のASTエントリーは逆順にoutへ追加。マッチしない場合は-1を返却し、outは変更しない
+		* _m_${symbol}(c): メモ化を有効にした場合の_r_${symbol}の本体。_r_${symbol}はキャッシュを経由して呼び出す
+		```
+	"""
+
+	def __init__(self, rules: Rules, memoize: bool = False) -> None:
+		"""インスタンスを生成
+
+		Args:
+			rules: ルールリスト
+			memoize: True = 照合結果をメモ化 (default = False)
+		"""
+		self.rules = rules
+		self.memoize = memoize
+		self._lines: list[str] = []
+		self._depth = 0
+		self._groups: dict[tuple[int, bool], str] = {}
+		self._queue: list[tuple[str, Patterns, bool]] = []
+		self._regexps: dict[str, str] = {}
+		self._sets: dict[frozenset[str], str] = {}
+		self._memos = 0
+
+	@classmethod
+	def signature(cls, rules: Rules) -> str:
+		"""ルールリストのシグネチャーを生成
+
+		Args:
+			rules: ルールリスト
+		Returns:
+			シグネチャー
+		"""
+		return hashlib.md5(JSONSerializer.dumps(rules).encode('utf-8')).hexdigest()
+
+	def generate(self, class_name: str) -> str:
+		"""パーサーモジュールのソースコードを生成
+
+		Args:
+			class_name: パーサーのクラス名
+		Returns:
+			ソースコード
+		"""
+		self._lines = []
+		self._depth = 0
+		self._groups = {}
+		self._queue = []
+		self._regexps = {}
+		self._sets = {}
+		self._memos = 0
+
+		self._line(f'class {class_name}({CompiledParser.__name__}):')
+		with self._indent():
+			self._line(f'"""シンタックスパーサー(コード生成版)"""')
+			self._line('')
+			self._line(f'Signature = {repr(self.signature(self.rules))}')
+			self._line(f'Keywords = {self._frozenset(self.rules.keyword_set)}')
+			memos_at = len(self._lines)
+			for symbol in self.rules.keys():
+				self._emit_rule(symbol)
+
+			if self._memos > 0:
+				self._lines.insert(memos_at, f'{"\t" * self._depth}Memos = {self._memos}')
+
+			while len(self._queue) > 0:
+				name, patterns, repeat = self._queue.pop(0)
+				self._emit_group(name, patterns, repeat)
+
+		body = self._lines
+		self._lines = []
+		self._line('"""このファイルは自動生成。直接編集しないこと @see rogw.tranp.bin.parser_gen"""')
+		self._line('import re')
+		self._line('')
+		self._line(f'from {ASTToken.__module__} import ASTEntry, ASTToken, ASTTree')
+		self._line(f'from {CompiledParser.__module__} import {CompiledParser.__name__}')
+		self._line('')
+		for expression, name in self._regexps.items():
+			self._line(f'{name} = re.compile({repr(expression)}).fullmatch')
+
+		for strings, name in self._sets.items():
+			self._line(f'{name} = {self._frozenset(strings)}')
+
+		self._line('')
+		self._line('')
+		return '\n'.join([*self._lines, *body, ''])
+
+	def _emit_rule(self, symbol: str) -> None:
+		"""シンボルのメソッドを出力
+
+		Args:
+			symbol: シンボル
+		"""
+		pattern = self.rules[symbol]
+		terminal = isinstance(pattern, Pattern) and pattern.role == Roles.Terminal
+
+		def emit_body() -> None:
+			if terminal:
+				self._line(f'if {self._terminal(pattern, "c")}:')
+				with self._indent():
+					self._line(f'return 1, ASTToken({repr(symbol)}, T[c])')
+
+				self._line('return None')
+			else:
+				self._line('out: list[ASTEntry] = []')
+				self._line('p = c')
+				self._emit_sequence(pattern, 'p', ['return None'], cleanup=False)
+				self._line('out.reverse()')
+				self._line(f'return p - c, ASTTree({repr(symbol)}, out, (T[p - 1], T[c]) if p > c else None)')
+
+		if not self.memoize or terminal:
+			self._emit_method(f'_r_{symbol}(self, c: int) -> tuple[int, ASTEntry] | None', emit_body)
+			return
+
+		index = self._memos
+		self._memos += 1
+
+		def emit_memo() -> None:
+			self._line(f'm = self._memos[{index}]')
+			self._line('if c in m:')
+			with self._indent():
+				self._line('return m[c]')
+
+			self._line(f'r = self._m_{symbol}(c)')
+			self._line('m[c] = r')
+			self._line('return r')
+
+		self._emit_method(f'_r_{symbol}(self, c: int) -> tuple[int, ASTEntry] | None', emit_memo)
+		self._emit_method(f'_m_{symbol}(self, c: int) -> tuple[int, ASTEntry] | None', emit_body)
+
+	def _emit_group(self, name: str, patterns: Patterns, repeat: bool) -> None:
+		"""パターングループのメソッドを出力
+
+		Args:
+			name: メソッド名
+			patterns: マッチングパターングループ
+			repeat: True = リピート
+		"""
+		def emit_body() -> None:
+			if repeat:
+				self._emit_repeat(patterns)
+			elif patterns.op == Operators.Or:
+				self._emit_or(patterns)
+			else:
+				self._line('p = c')
+				self._emit_sequence(patterns, 'p', ['return -1'], allow_repeat=False)
+				self._line('return p - c')
+
+		self._emit_method(f'{name}(self, c: int, out: list[ASTEntry]) -> int', emit_body)
+
+	def _emit_method(self, signature: str, emit_body: Callable[[], None]) -> None:
+		"""メソッドを出力
+
+		Args:
+			signature: シグネチャー(名前と引数)
+			emit_body: 本体の出力処理
+		Note:
+			本体で参照する解析中の状態のみローカル変数に展開
+		"""
+		self._line('')
+		self._line(f'def {signature}:')
+		with self._indent():
+			begin = len(self._lines)
+			emit_body()
+			body = '\n'.join(self._lines[begin:])
+			attrs = {'n': '_length', 'S': '_strings', 'K': '_keywords', 'T': '_tokens'}
+			lines = [f'{"\t" * self._depth}{name} = self.{attr}' for name, attr in attrs.items() if re.search(rf'\b{name}\b', body)]
+			self._lines[begin:begin] = lines
+
+	def _emit_repeat(self, patterns: Patterns) -> None:
+		"""パターングループ(リピート)の処理を出力 @see SyntaxParser._match_repeat
+
+		Args:
+			patterns: マッチングパターングループ
+		"""
+		counting = patterns.rep in [Repeators.OverOne, Repeators.OneOrEmpty]
+		self._line('p = c')
+		if counting:
+			self._line('found = 0')
+
+		self._line('while p < n:')
+		with self._indent():
+			self._peek('p')
+			if patterns.op == Operators.Or:
+				self._line(f's = self.{self._group(patterns, False)}(p, out)')
+				self._line('if s < 0:')
+				with self._indent():
+					self._line('break')
+
+				self._line('p += s')
+			else:
+				self._line('q = p')
+				self._emit_sequence(patterns, 'q', ['break'], allow_repeat=False)
+				self._line('p = q')
+
+			if counting:
+				self._line('found += 1')
+
+			if patterns.rep in [Repeators.OneOrZero, Repeators.OneOrEmpty]:
+				self._line('break')
+
+		if patterns.rep == Repeators.OverOne:
+			self._line('if found == 0:')
+			with self._indent():
+				self._line('return -1')
+		elif patterns.rep == Repeators.OneOrEmpty:
+			self._line('if found == 0:')
+			with self._indent():
+				self._line('out.append(ASTToken.empty())')
+
+		self._line('return p - c')
+
+	def _emit_or(self, patterns: Patterns) -> None:
+		"""パターングループ(OR)の処理を出力 @see SyntaxParser._match_or
+
+		Args:
+			patterns: マッチングパターングループ
+		"""
+		for pattern in patterns:
+			if isinstance(pattern, Pattern) and self._terminal_of(pattern) is not None:
+				self._emit_element(pattern, 'c', [], success=['return 1'])
+				continue
+
+			predict = self._predict(self.rules.first_of(pattern), 'c')
+			if predict is None:
+				self._emit_element(pattern, 'c', [], success=[f'return {self._steps_of(pattern)}'])
+				continue
+
+			self._line(f'if {predict}:')
+			with self._indent():
+				self._emit_element(pattern, 'c', [], success=[f'return {self._steps_of(pattern)}'])
+
+		self._line('return -1')
+
+	def _emit_sequence(self, entry: PatternEntry, var: str, fail: list[str], allow_repeat: bool = True, cleanup: bool = True) -> None:
+		"""パターンエントリーを順に照合する処理を出力 @see SyntaxParser._match_and
+
+		Args:
+			entry: マッチングパターンエントリー
+			var: 参照位置の変数名
+			fail: マッチしなかった場合の処理
+			allow_repeat: True = リピートへ遷移 (default = True)
+			cleanup: True = マッチしなかった場合に追加済みのASTエントリーを削除 (default = True)
+		Note:
+			ANDの入れ子は平坦化。成功時は参照位置の変数を更新
+		"""
+		elements = self._flatten(entry, allow_repeat)
+		if cleanup and len(elements) > 1:
+			self._line('mark = len(out)')
+			fail = ['del out[mark:]', *fail]
+
+		for index, element in enumerate(elements):
+			if index > 0:
+				self._peek(var)
+
+			self._emit_element(element, var, fail)
+
+	def _emit_element(self, entry: PatternEntry, var: str, fail: list[str], success: list[str] = []) -> None:
+		"""単一のパターンエントリーを照合する処理を出力 @see SyntaxParser._match_entry
+
+		Args:
+			entry: マッチングパターンエントリー
+			var: 参照位置の変数名
+			fail: マッチしなかった場合の処理
+			success: マッチした場合の処理。未指定の場合は参照位置の変数を更新 (default = [])
+		"""
+		advance = success if len(success) > 0 else None
+		if isinstance(entry, Pattern):
+			terminal = self._terminal_of(entry)
+			if terminal is not None:
+				condition = self._terminal(terminal, var)
+				self._branch(f'not ({condition})', condition, fail, advance is None)
+				if entry.role == Roles.Symbol:
+					self._line(f'out.append(ASTToken({repr(entry.expression)}, T[{var}]))')
+
+				self._lines_or(advance, [f'{var} += 1'])
+				return
+
+			self._line(f'r = self._r_{entry.expression}({var})')
+			self._branch('r is None', 'r is not None', fail, advance is None)
+			self._emit_append(entry.expression)
+			self._lines_or(advance, [f'{var} += r[0]'])
+			return
+
+		self._line(f's = self.{self._group(entry, entry.rep != Repeators.NoRepeat)}({var}, out)')
+		self._branch('s < 0', 's >= 0', fail, advance is None)
+		self._lines_or(advance, [f'{var} += s'])
+
+	def _emit_append(self, symbol: str) -> None:
+		"""シンボルのASTエントリーを展開ルールに従って追加する処理を出力 @see SyntaxParser._unwrap_children
+
+		Args:
+			symbol: シンボル
+		"""
+		unwrap = self.rules.unwrap_by(symbol)
+		if unwrap == Unwraps.OneTime:
+			self._line('e = r[1]')
+			self._line('out.append(e.children[0] if len(e.children) == 1 else e)')
+		elif unwrap == Unwraps.Always:
+			self._line('out.extend(reversed(r[1].children))')
+		else:
+			self._line('out.append(r[1])')
+
+	def _branch(self, miss: str, match: str, fail: list[str], guard: bool) -> None:
+		"""条件分岐を出力
+
+		Args:
+			miss: マッチしない条件
+			match: マッチした条件
+			fail: マッチしなかった場合の処理
+			guard: True = マッチしない場合に処理, False = マッチした場合に後続の処理
+		Note:
+			guard=Falseの場合、後続の処理はマッチした場合のブロック内に出力されるため、インデントを1段下げる
+		"""
+		if guard:
+			self._line(f'if {miss}:')
+			with self._indent():
+				for line in fail:
+					self._line(line)
+		else:
+			self._line(f'if {match}:')
+			self._depth += 1
+
+	def _lines_or(self, advance: list[str] | None, default: list[str]) -> None:
+		"""マッチした場合の処理を出力
+
+		Args:
+			advance: マッチした場合の処理。Noneの場合はデフォルトの処理
+			default: デフォルトの処理
+		"""
+		if advance is None:
+			for line in default:
+				self._line(line)
+		else:
+			for line in advance:
+				self._line(line)
+
+			self._depth -= 1
+
+	def _steps_of(self, entry: PatternEntry) -> str:
+		"""マッチした場合のステップ数の式を取得
+
+		Args:
+			entry: マッチングパターンエントリー
+		Returns:
+			式
+		"""
+		if isinstance(entry, Pattern):
+			return '1' if self._terminal_of(entry) is not None else 'r[0]'
+
+		return 's'
+
+	def _flatten(self, entry: PatternEntry, allow_repeat: bool) -> list[PatternEntry]:
+		"""ANDの入れ子を平坦化し、マッチング順のパターンエントリーリストに変換
+
+		Args:
+			entry: マッチングパターンエントリー
+			allow_repeat: True = リピートへ遷移
+		Returns:
+			パターンエントリーリスト(マッチング順)
+		"""
+		if not isinstance(entry, Patterns) or entry.op != Operators.And or (entry.rep != Repeators.NoRepeat and allow_repeat):
+			return [entry]
+
+		return [element for in_entry in reversed(entry) for element in self._flatten(in_entry, True)]
+
+	def _group(self, patterns: Patterns, repeat: bool) -> str:
+		"""パターングループのメソッド名を取得。未登録の場合は生成対象に追加
+
+		Args:
+			patterns: マッチングパターングループ
+			repeat: True = リピート
+		Returns:
+			メソッド名
+		"""
+		key = (id(patterns), repeat)
+		if key not in self._groups:
+			name = f'_g{len(self._groups)}'
+			self._groups[key] = name
+			self._queue.append((name, patterns, repeat))
+
+		return self._groups[key]
+
+	def _terminal_of(self, pattern: Pattern) -> Pattern | None:
+		"""インライン化する終端記号を取得
+
+		Args:
+			pattern: マッチングパターン
+		Returns:
+			終端記号のパターン。終端記号でない場合はNone
+		Note:
+			シンボルが終端記号のルールを参照する場合は、そのルールのパターンを返却
+		"""
+		if pattern.role == Roles.Terminal:
+			return pattern
+
+		rule = self.rules[pattern.expression]
+		return rule if isinstance(rule, Pattern) and rule.role == Roles.Terminal else None
+
+	def _terminal(self, pattern: Pattern, var: str) -> str:
+		"""終端記号の判定式を取得 @see SyntaxParser._compare_token
+
+		Args:
+			pattern: マッチングパターン
+			var: 参照位置の変数名
+		Returns:
+			式
+		"""
+		if pattern.comp == Comps.Equals:
+			return f'{var} < n and S[{var}] == {repr(pattern.expression)}'
+
+		return f'{var} < n and not K[{var}] and {self._regexp(pattern.expression)}(S[{var}])'
+
+	def _predict(self, first: FirstSet, var: str) -> str | None:
+		"""FIRST集合による判定式を取得 @see SyntaxParser._predict
+
+		Args:
+			first: FIRST集合
+			var: 参照位置の変数名
+		Returns:
+			式。空にマッチし得る場合はNone
+		"""
+		if first.nullable:
+			return None
+
+		conditions: list[str] = []
+		if len(first.equals) == 1:
+			conditions.append(f'S[{var}] == {repr(next(iter(first.equals)))}')
+		elif len(first.equals) > 1:
+			conditions.append(f'S[{var}] in {self._set(first.equals)}')
+
+		if len(first.regexps) > 0:
+			expressions = sorted(pattern.expression for pattern in first.regexps)
+			regexps = ' or '.join([f'{self._regexp(expression)}(S[{var}])' for expression in expressions])
+			conditions.append(f'(not K[{var}] and ({regexps}))')
+
+		if len(conditions) == 0:
+			return 'False'
+
+		return f'{var} < n and ({" or ".join(conditions)})'
+
+	def _regexp(self, expression: str) -> str:
+		"""正規表現の定数名を取得。未登録の場合は登録
+
+		Args:
+			expression: 正規表現
+		Returns:
+			定数名
+		"""
+		if expression not in self._regexps:
+			self._regexps[expression] = f'_R{len(self._regexps)}'
+
+		return self._regexps[expression]
+
+	def _set(self, strings: frozenset[str]) -> str:
+		"""文字列集合の定数名を取得。未登録の場合は登録
+
+		Args:
+			strings: 文字列集合
+		Returns:
+			定数名
+		"""
+		if strings not in self._sets:
+			self._sets[strings] = f'_F{len(self._sets)}'
+
+		return self._sets[strings]
+
+	def _frozenset(self, strings: frozenset[str]) -> str:
+		"""文字列集合のリテラルを取得
+
+		Args:
+			strings: 文字列集合
+		Returns:
+			リテラル(要素は昇順)
+		"""
+		return f'frozenset([{", ".join([repr(string) for string in sorted(strings)])}])'
+
+	def _peek(self, var: str) -> None:
+		"""到達位置の更新を出力 @see SyntaxParser._match_entry
+
+		Args:
+			var: 参照位置の変数名
+		"""
+		self._line(f'if {var} > self._peek:')
+		with self._indent():
+			self._line(f'self._peek = {var}')
+
+	def _line(self, line: str) -> None:
+		"""1行出力
+
+		Args:
+			line: 行
+		"""
+		self._lines.append(f'{"\t" * self._depth}{line}' if line else '')
+
+	def _indent(self) -> '_Indent':
+		"""Returns: インデントのコンテキスト"""
+		return _Indent(self)
+
+
+class _Indent:
+	"""インデントのコンテキスト"""
+
+	def __init__(self, generator: ParserGenerator) -> None:
+		"""インスタンスを生成
+
+		Args:
+			generator: パーサージェネレーター
+		"""
+		self._generator = generator
+
+	def __enter__(self) -> None:
+		"""インデントを1段下げる"""
+		self._generator._depth += 1
+
+	def __exit__(self, *_: object) -> None:
+		"""インデントを1段戻す"""
+		self._generator._depth -= 1
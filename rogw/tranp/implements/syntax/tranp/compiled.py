@@ -0,0 +1,78 @@
+from typing import ClassVar
+
+from rogw.tranp.errors import Errors
+from rogw.tranp.implements.syntax.tranp.ast import ASTEntry, ASTTree
+from rogw.tranp.implements.syntax.tranp.syntax import ErrorCollector
+from rogw.tranp.implements.syntax.tranp.tokenizer import ITokenizer, Token, Tokenizer
+from rogw.tranp.lang.convertion import as_a
+
+
+class CompiledParser:
+	"""シンタックスパーサー(コード生成版)の基底クラス
+
+	Note:
+		```
+		* 派生クラスはルールリストから自動生成 @see rogw.tranp.implements.syntax.tranp.codegen.ParserGenerator
+		* シンボル毎のメソッド(_r_${symbol})は参照位置を受け取り、(ステップ数, ASTエントリー)を返却。マッチしない場合はNone
+		* パーサーは末尾のトークンから照合するため、トークンリストは反転して保持し、参照位置をそのままインデックスとして使用
+		* 生成されるASTとエラーメッセージはSyntaxParserと同一 @see rogw.tranp.implements.syntax.tranp.syntax.SyntaxParser
+		* メモ化を有効にして生成した場合、Memosはキャッシュの数。キャッシュは解析毎に初期化
+		```
+	"""
+
+	Signature: ClassVar[str] = ''
+	Keywords: ClassVar[frozenset[str]] = frozenset()
+	Memos: ClassVar[int] = 0
+
+	def __init__(self, tokenizer: ITokenizer | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			tokenizer: トークンパーサー (default = None)
+		"""
+		self.tokenizer = tokenizer if tokenizer else Tokenizer()
+		self._tokens: list[Token] = []
+		self._strings: list[str] = []
+		self._keywords: list[bool] = []
+		self._length = 0
+		self._peek = 0
+		self._memos: list[dict[int, tuple[int, ASTEntry] | None]] = []
+
+	def parse(self, source: str, entrypoint: str) -> ASTTree:
+		"""ソースコードを解析し、ASTを生成
+
+		Args:
+			source: ソースコード
+			entrypoint: エントリーポイントのシンボル
+		Returns:
+			ASTツリー
+		Raises:
+			Errors.Syntax: パースに失敗(最初のトークンに未到達)
+			Errors.Logic: 未定義のシンボルを指定
+		"""
+		matcher = getattr(self, f'_r_{entrypoint}', None)
+		if matcher is None:
+			raise Errors.Logic(f'Symbol not defined. symbol: {entrypoint}')
+
+		tokens = self.tokenizer.parse(source)
+		length = len(tokens)
+		self._tokens = tokens[::-1]
+		self._strings = [token.string for token in self._tokens]
+		self._keywords = [string in self.Keywords for string in self._strings]
+		self._length = length
+		self._peek = 0
+		self._memos = [{} for _ in range(self.Memos)]
+		try:
+			result: tuple[int, ASTEntry] | None = matcher(0)
+		finally:
+			self._tokens = []
+			self._strings = []
+			self._keywords = []
+			self._memos = []
+
+		steps = result[0] if result is not None else 0
+		if result is None or steps != length:
+			message = ErrorCollector(source, tokens, max(0, length - 1 - self._peek)).summary()
+			raise Errors.Syntax(message)
+
+		return as_a(ASTTree, result[1])
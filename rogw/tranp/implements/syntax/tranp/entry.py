@@ -0,0 +1,148 @@
+from typing import ClassVar, override
+
+from rogw.tranp.implements.syntax.tranp.ast import ASTEntry, ASTToken, ASTTree
+from rogw.tranp.implements.syntax.tranp.token import SpecialSymbols
+from rogw.tranp.lang.annotation import implements
+from rogw.tranp.syntax.ast.entry import Entry, SourceMap
+
+
+class EntryOfTranp(Entry):
+	"""エントリーへの要素アクセスを代替するプロクシー(tranp版)
+
+	Note:
+		```
+		* Larkのグラマーの移植版で生成したASTを、Lark版と同一のエントリーとして扱うためのアダプター @see data/syntax/grammar.lark
+		* エイリアスのルール(${エイリアス}__${識別子})はエイリアスの名前に変換
+		* 単項演算子の特殊記号は元の演算子に復元 @see rogw.tranp.implements.syntax.tranp.token.Token.op_unary_minus
+		* ソースマップはLarkに合わせて1始まりに変換。ツリーは照合範囲、または配下の最初と最後のトークンから算出
+		```
+	"""
+
+	_unary_values: ClassVar[dict[str, str]] = {
+		SpecialSymbols.OpUnaryMinus.value: '-',
+		SpecialSymbols.OpUnaryPlus.value: '+',
+	}
+
+	def __init__(self, entry: ASTEntry) -> None:
+		"""インスタンスを生成
+
+		Args:
+			entry: エントリー
+		"""
+		self.__entry = entry
+
+	@property
+	@implements
+	def source(self) -> ASTEntry:
+		"""Returns: オリジナルのエントリー"""
+		return self.__entry
+
+	@property
+	@implements
+	def name(self) -> str:
+		"""Returns: エントリー名 Note: 空の場合を考慮"""
+		return self.alias_of(self.__entry.name)
+
+	@property
+	@implements
+	def has_child(self) -> bool:
+		"""Returns: True = 子を持つエントリー"""
+		return type(self.__entry) is ASTTree
+
+	@property
+	@implements
+	def children(self) -> list[Entry]:
+		"""Returns: 配下のエントリーリスト"""
+		return [EntryOfTranp(in_entry) for in_entry in self.__entry.children] if type(self.__entry) is ASTTree else []
+
+	@property
+	@implements
+	def is_terminal(self) -> bool:
+		"""Returns: True = 終端記号"""
+		return type(self.__entry) is ASTToken and not self.is_empty
+
+	@property
+	@implements
+	def value(self) -> str:
+		"""Returns: 終端記号の値"""
+		if type(self.__entry) is not ASTToken:
+			return ''
+
+		string = self.__entry.value.string
+		return self._unary_values.get(string, string)
+
+	@property
+	@implements
+	def is_empty(self) -> bool:
+		"""Returns: True = 空
+
+		Note:
+			```
+			* Grammarの定義上存在するが、構文解析の結果で空になったエントリー
+			* 例えば以下の様な関数の定義の場合[parameters]が対象となり、引数がない関数の場合、エントリーとしては存在するが内容は空になる
+			例: function_def: "def" name "(" [parameters] ")" "->" ":" block
+			```
+		"""
+		return type(self.__entry) is ASTToken and self.__entry.name == self.empty_name
+
+	@property
+	@override
+	def source_map(self) -> SourceMap:
+		"""Returns: ソースマップ
+
+		Note:
+			```
+			begin: 開始位置(行/列)
+			end: 終了位置(行/列)
+			```
+		"""
+		if type(self.__entry) is ASTTree and self.__entry.span is not None:
+			begin = self.__entry.span[0].source_map
+			end = self.__entry.span[1].source_map
+			return {'begin': (begin.begin_line + 1, begin.begin_column + 1), 'end': (end.end_line + 1, end.end_column + 1)}
+
+		first = self.__edge_token(self.__entry, 0)
+		last = self.__edge_token(self.__entry, -1)
+		if first is None or last is None:
+			return {'begin': (0, 0), 'end': (0, 0)}
+
+		begin = first.value.source_map
+		end = last.value.source_map
+		return {'begin': (begin.begin_line + 1, begin.begin_column + 1), 'end': (end.end_line + 1, end.end_column + 1)}
+
+	@classmethod
+	def alias_of(cls, name: str) -> str:
+		"""ルール名からエントリー名を取得
+
+		Args:
+			name: ルール名
+		Returns:
+			エントリー名
+		Note:
+			エイリアスのルール(${エイリアス}__${識別子})はエイリアスを返却。`__`で始まる名前は対象外 例: `__empty__`, `__ANON_0`
+		"""
+		if name.startswith('__'):
+			return name
+
+		index = name.find('__', 1)
+		return name[:index] if index > 0 else name
+
+	def __edge_token(self, entry: ASTEntry, at: int) -> ASTToken | None:
+		"""端のトークンを取得
+
+		Args:
+			entry: エントリー
+			at: 0 = 先頭, -1 = 末尾
+		Returns:
+			トークン。空のみの場合はNone
+		"""
+		if type(entry) is ASTToken:
+			return entry if entry.name != self.empty_name else None
+
+		children = entry.children if at == 0 else reversed(entry.children)
+		for child in children:
+			token = self.__edge_token(child, at)
+			if token is not None:
+				return token
+
+		return None
@@ -0,0 +1,85 @@
+import hashlib
+from collections.abc import Callable
+from typing import IO
+
+from rogw.tranp.cache.cache import CacheProvider, Stored
+from rogw.tranp.implements.syntax.tranp.rule import JSONSerializer, Rules
+from rogw.tranp.lang.annotation import duck_typed, injectable
+
+
+class RulesLoader:
+	"""ルールリストローダー。コンパイル済みのルールリストをキャッシュから復元
+
+	Note:
+		```
+		* キャッシュキーはグラマーの内容とシリアライズ形式のバージョンから生成
+		* キャッシュが存在しない場合のみグラマーを解析してルールリストを生成
+		@see rogw.tranp.implements.syntax.tranp.rule.JSONSerializer
+		```
+	Examples:
+		```python
+		gram_parser = SyntaxParser(gram_rules(), gram_tokenizer())
+		loader = RulesLoader(caches)
+		rules = loader.load(grammar, lambda: Rules.from_ast(gram_parser.parse(grammar, 'entry').simplify()))
+		```
+	"""
+
+	@injectable
+	def __init__(self, caches: CacheProvider) -> None:
+		"""インスタンスを生成
+
+		Args:
+			caches: キャッシュプロバイダー @inject
+		"""
+		self.__caches = caches
+
+	def load(self, grammar: str, factory: Callable[[], Rules]) -> Rules:
+		"""ルールリストをロード
+
+		Args:
+			grammar: グラマー
+			factory: ルールリストのファクトリー関数
+		Returns:
+			ルールリスト
+		"""
+		def instantiate() -> RulesStored:
+			return RulesStored(factory())
+
+		identity = {
+			'grammar': hashlib.md5(grammar.encode('utf-8')).hexdigest(),
+			'format': str(JSONSerializer.Version),
+		}
+		decorator = self.__caches.get('rules.cache', identity=identity, format='json', content_addressed=True)
+		return decorator(instantiate)().rules
+
+
+duck_typed(Stored)
+class RulesStored:
+	"""ストア(ルールリスト版)"""
+
+	def __init__(self, rules: Rules) -> None:
+		"""インスタンスを生成
+
+		Args:
+			rules: ルールリスト
+		"""
+		self.rules = rules
+
+	@classmethod
+	def load(cls, stream: IO) -> 'RulesStored':
+		"""インスタンスを復元
+
+		Args:
+			stream: IO
+		Returns:
+			インスタンス
+		"""
+		return RulesStored(JSONSerializer.loads(stream.read().decode('utf-8')))
+
+	def save(self, stream: IO) -> None:
+		"""インスタンスを保存
+
+		Args:
+			stream: IO
+		"""
+		stream.write(JSONSerializer.dumps(self.rules).encode('utf-8'))
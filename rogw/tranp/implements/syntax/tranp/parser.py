@@ -0,0 +1,241 @@
+from rogw.tranp.cache.cache import CacheProvider
+from rogw.tranp.errors import Errors
+from rogw.tranp.file.loader import ISourceLoader
+from rogw.tranp.implements.syntax.lark.parser import EntryStored
+from rogw.tranp.implements.syntax.tranp.ast import ASTEntry, ASTToken, ASTTree
+from rogw.tranp.implements.syntax.tranp.compiled import CompiledParser
+from rogw.tranp.implements.syntax.tranp.entry import EntryOfTranp
+from rogw.tranp.implements.syntax.tranp.token import Token
+from rogw.tranp.implements.syntax.tranp.tokenizer import PyScanTokenizer
+from rogw.tranp.lang.annotation import duck_typed, injectable
+from rogw.tranp.lang.module import module_path_to_filepath
+from rogw.tranp.lang.profile import Tracer
+from rogw.tranp.syntax.ast.binary import EntryTable
+from rogw.tranp.syntax.ast.entry import Entry
+from rogw.tranp.syntax.ast.parser import SourceProvider, SyntaxParser
+
+
+class SyntaxParserOfTranp:
+	"""シンタックスパーサー(tranp版)
+
+	Note:
+		```
+		* Larkのグラマーの移植版から生成したパーサーで解析し、Lark版と同一のシンタックスツリーを生成
+		@see data/syntax/grammar.lark
+		@see data/syntax/grammar_parser.py
+		* ライブラリーパックはLark版のシリアライズ形式のため使用しない。標準ライブラリーもモジュールと同様に解析してキャッシュ
+		* 生成したパーサーは大規模なモジュールのため、Lark版の起動時間に影響しないよう使用時にインポート
+		```
+	"""
+
+	@injectable
+	def __init__(self, sources: ISourceLoader, source_provider: SourceProvider, caches: CacheProvider) -> None:
+		"""インスタンスを生成
+
+		Args:
+			sources: ソースコードローダー @inject
+			source_provider: ソースコードプロバイダー @inject
+			caches: キャッシュプロバイダー @inject
+		"""
+		self.__sources = sources
+		self.__source_provider = source_provider
+		self.__caches = caches
+		self.__parser: CompiledParser | None = None
+
+	@duck_typed(SyntaxParser)
+	def __call__(self, module_path: str) -> Entry:
+		"""モジュールを解析してシンタックスツリーを生成
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			シンタックスツリーのルートエントリー
+		"""
+		return self.__load_entry(module_path)
+
+	def __load_parser(self) -> CompiledParser:
+		"""シンタックスパーサーをロード
+
+		Returns:
+			シンタックスパーサー
+		"""
+		if self.__parser is None:
+			from data.syntax.grammar_parser import GrammarParser
+
+			self.__parser = GrammarParser(PyScanTokenizer())
+
+		return self.__parser
+
+	def __load_entry(self, module_path: str) -> Entry:
+		"""シンタックスツリーをロード
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			シンタックスツリーのルートエントリー
+		Raises:
+			Errors.Syntax: ソースの解析に失敗
+		"""
+		basepath = module_path_to_filepath(module_path)
+		source_path = f'{basepath}.py'
+
+		# ストレージに存在しないモジュールはメモリ上に存在すると見做して毎回パース
+		if not self.__sources.exists(source_path):
+			return EntryOfTranp(self.__parse(module_path))
+
+		def instantiate() -> EntryStored:
+			try:
+				return EntryStored(EntryOfTranp(self.__parse(module_path)))
+			except Exception as e:
+				raise Errors.Syntax(source_path, e) from e
+
+		from data.syntax.grammar_parser import GrammarParser
+
+		identity = {
+			'parser': GrammarParser.Signature,
+			'source': self.__sources.hash(source_path),
+			'format': str(EntryTable.Version),
+		}
+		decorator = self.__caches.get(basepath, identity=identity, format='ast', content_addressed=True)
+		return decorator(instantiate)().entry
+
+	def __parse(self, module_path: str) -> ASTTree:
+		"""ソースコードをパース
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			シンタックスツリー
+		"""
+		parser = self.__load_parser()
+		source = self.__source_provider(module_path)
+		with Tracer.instance().span('parse', module=module_path):
+			tree = parser.parse(source, 'file_input')
+			self.__resolve(parser, tree)
+			# ルートの照合範囲はLarkと同様に先頭の空行を含むソースコードの全体。空の場合は照合範囲なし
+			if len(source) == 0 or tree.span is None:
+				return ASTTree(tree.name, tree.children)
+
+			return ASTTree(tree.name, tree.children, (Token.empty(), tree.span[1]))
+
+	def __resolve(self, parser: CompiledParser, tree: ASTTree) -> None:
+		"""グラマーの移植で表現できない構造をLarkと同一の構造に置き換え
+
+		Args:
+			parser: シンタックスパーサー
+			tree: シンタックスツリー
+		Note:
+			```
+			* 前方参照の型注釈(文字列)を型注釈として再解析
+			  字句解析で文字列として扱われるため、Larkの様に型注釈の中で直接解析できない
+			* 'typed_forward__annotated'はAnnotatedの第1引数が前方参照の場合。Larkと同様に再解析した型注釈に付与情報を追加した要素に置き換え
+			* '${name}__head'の繰り返しで表現した右再帰の入れ子を右結合のツリーに変換 @see __fold_nested
+			```
+		"""
+		children = tree.children
+		for index, child in enumerate(children):
+			if type(child) is ASTToken:
+				if child.name == 'typed_forward':
+					children[index] = self.__parse_forward(parser, child)
+
+				continue
+
+			self.__resolve(parser, child)
+			if child.name == 'typed_forward__annotated':
+				forward = children[index].children[0]
+				children[index] = ASTTree(forward.name, [*forward.children, *child.children[1:]], child.span)
+			elif self.__is_nested(child):
+				children[index] = self.__fold_nested(child)
+
+	def __is_nested(self, tree: ASTTree) -> bool:
+		"""右再帰の入れ子か判定
+
+		Args:
+			tree: ツリー
+		Returns:
+			True = 右再帰の入れ子
+		"""
+		if len(tree.children) == 0:
+			return False
+
+		head = tree.children[0]
+		return type(head) is ASTTree and head.name == f'{tree.name}__head'
+
+	def __fold_nested(self, tree: ASTTree) -> ASTTree:
+		"""右再帰の入れ子を右結合のツリーに変換
+
+		Args:
+			tree: ツリー
+		Returns:
+			変換後のツリー
+		Note:
+			```
+			* 末尾から照合するパーサーは右再帰を表現できないため、`factor := (factor__head)* primary`の様に繰り返しで表現
+			* 例: `- -a`
+			  変換前: ('factor', [('factor__head', [MINUS]), ('factor__head', [MINUS]), a])
+			  変換後: ('factor', [MINUS, ('factor', [MINUS, a])])
+			* 入れ子の照合範囲は各々の先頭要素から末尾まで
+			```
+		"""
+		node = tree.children[-1]
+		for head in reversed(tree.children[:-1]):
+			assert type(head) is ASTTree, f'Unexpected nested. head: {head}'
+			span = (head.span[0], tree.span[1]) if head.span is not None and tree.span is not None else None
+			node = ASTTree(tree.name, [*head.children, node], span)
+
+		return node
+
+	def __parse_forward(self, parser: CompiledParser, forward: ASTToken) -> ASTEntry:
+		"""前方参照の型注釈を解析
+
+		Args:
+			parser: シンタックスパーサー
+			forward: 前方参照の型注釈のトークン
+		Returns:
+			型注釈のエントリー
+		Note:
+			トークンのソースマップは元のソースコード上の位置に補正
+		"""
+		source_map = forward.value.source_map
+		entry = parser.parse(forward.value.string[1:-1], 'typed_forward_input').children[0]
+		self.__shift_source_map(entry, source_map.begin_line, source_map.begin_column + 1)
+		return entry
+
+	def __shift_source_map(self, entry: ASTEntry, line: int, column: int) -> None:
+		"""ソースマップを補正
+
+		Args:
+			entry: エントリー
+			line: 補正する行数
+			column: 補正する列数(先頭行のみ)
+		Note:
+			照合範囲のトークンは配下のトークンと重複するため、トークン毎に1度のみ補正
+		"""
+		tokens: dict[int, Token] = {}
+		self.__collect_tokens(entry, tokens)
+		for token in tokens.values():
+			source_map = token.source_map
+			token.source_map = Token.SourceMap(
+				source_map.begin_line + line,
+				source_map.begin_column + (column if source_map.begin_line == 0 else 0),
+				source_map.end_line + line,
+				source_map.end_column + (column if source_map.end_line == 0 else 0),
+			)
+
+	def __collect_tokens(self, entry: ASTEntry, tokens: dict[int, Token]) -> None:
+		"""配下のトークンと照合範囲のトークンを収集
+
+		Args:
+			entry: エントリー
+			tokens: 収集先 (トークンのID: トークン)
+		"""
+		if type(entry) is ASTToken:
+			tokens[id(entry.value)] = entry.value
+			return
+
+		if entry.span is not None:
+			tokens[id(entry.span[0])] = entry.span[0]
+			tokens[id(entry.span[1])] = entry.span[1]
+
+		for child in entry.children:
+			self.__collect_tokens(child, tokens)
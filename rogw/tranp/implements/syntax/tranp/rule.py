@@ -1,10 +1,12 @@
+import json
 import re
 from collections.abc import Mapping, Sequence
 from enum import Enum
-from typing import ClassVar, Iterator, TypeAlias, ValuesView, cast
+from typing import Any, ClassVar, Iterator, NamedTuple, TypeAlias, ValuesView, cast
 
 from rogw.tranp.cache.memo2 import Memoize
 from rogw.tranp.dsn.dsn import DSN
+from rogw.tranp.errors import Errors
 from rogw.tranp.implements.syntax.tranp.ast import TupleEntry, TupleToken, TupleTree
 from rogw.tranp.lang.annotation import deprecated
 from rogw.tranp.lang.convertion import as_a
@@ -123,10 +125,14 @@ class Pattern:
 		Args:
 			expression: マッチング式
 			role: パターンの役割
+			comp: 文字列の比較メソッド
+		Note:
+			正規表現はインスタンスの生成時にコンパイル
 		"""
 		self._expression = expression
 		self._role = role
 		self._comp = comp
+		self._regexp = re.compile(expression) if comp == Comps.Regexp else None
 
 	@property
 	def expression(self) -> str:
@@ -143,6 +149,29 @@ class Pattern:
 		"""Returns: 文字列の比較メソッド"""
 		return self._comp
 
+	@property
+	def regexp(self) -> re.Pattern[str]:
+		"""Returns: コンパイル済みの正規表現"""
+		assert self._regexp is not None, f'Not regexp pattern. expression: {self.expression}'
+		return self._regexp
+
+	def matches(self, string: str) -> bool:
+		"""文字列が終端記号と一致するか判定
+
+		Args:
+			string: 文字列
+		Returns:
+			True = 一致
+		Note:
+			キーワードの除外は行わない @see rogw.tranp.implements.syntax.tranp.syntax.SyntaxParser._compare_token
+		"""
+		assert self._comp != Comps.NoComp, f'Not terminal pattern. expression: {self.expression}'
+
+		if self._regexp is None:
+			return self._expression == string
+
+		return self._regexp.fullmatch(string) is not None
+
 	@property
 	def min_size(self) -> int:
 		"""Returns: 最小ステップ数"""
@@ -229,6 +258,49 @@ class Patterns(Sequence['Pattern | Patterns']):
 PatternEntry: TypeAlias = 'Pattern | Patterns'
 
 
+class FirstSet(NamedTuple):
+	"""FIRST集合。パターンエントリーが最初にマッチし得る終端記号の集合
+
+	Attributes:
+		equals: 通常比較の終端記号リスト
+		regexps: 正規表現の終端記号リスト
+		nullable: True = 空にマッチし得る
+	Note:
+		```
+		* 「最初」はパーサーのマッチング順を基準とする。パーサーは末尾のトークンから照合するため、ANDのグループは右端の要素が最初 @see rogw.tranp.implements.syntax.tranp.syntax.SyntaxParser
+		* 実際にマッチし得る集合を包含する(=過大評価は許容し、過小評価はしない)
+		```
+	"""
+
+	equals: frozenset[str]
+	regexps: frozenset[Pattern]
+	nullable: bool
+
+	@classmethod
+	def empty(cls) -> 'FirstSet':
+		"""Returns: 空のインスタンス"""
+		return cls(frozenset(), frozenset(), False)
+
+	def accepts(self, string: str, keyword: bool) -> bool:
+		"""トークンが最初にマッチし得るか判定
+
+		Args:
+			string: トークンの文字列
+			keyword: True = キーワード。キーワードは正規表現の終端記号とマッチしない
+		Returns:
+			True = マッチし得る
+		Note:
+			空にマッチし得る場合は常にTrue
+		"""
+		if self.nullable or string in self.equals:
+			return True
+
+		if not self.regexps or keyword:
+			return False
+
+		return any(pattern.matches(string) for pattern in self.regexps)
+
+
 class Rules(Mapping):
 	"""ルールリスト管理
 
@@ -252,15 +324,19 @@ class Rules(Mapping):
 		"""
 		return ASTSerializer.restore(tree)
 
-	def __init__(self, rules: dict[str, PatternEntry]) -> None:
+	def __init__(self, rules: dict[str, PatternEntry], keywords: list[str] | None = None) -> None:
 		"""インスタンスを生成
 
 		Args:
 			rules: ルール一覧
+			keywords: 収集済みのキーワードリスト。未指定の場合はパターンから収集 (default = None)
 		"""
 		super().__init__()
 		self._rules = rules
 		self._memo = Memoize()
+		self._firsts: dict[int, FirstSet] = {}
+		if keywords is not None:
+			self._memo.get(Rules.keywords.__name__, lambda: keywords)
 
 	def __len__(self) -> int:
 		"""Returns: 要素数"""
@@ -337,17 +413,93 @@ class Rules(Mapping):
 
 		return self._memo.get(Rules.keywords.__name__, factory)
 
+	@property
+	def keyword_set(self) -> frozenset[str]:
+		"""Returns: キーワードの集合。所属判定用"""
+		return self._memo.get(Rules.keyword_set.__name__, lambda: frozenset(self.keywords))
+
+	@property
+	def firsts(self) -> dict[str, FirstSet]:
+		"""Returns: シンボル毎のFIRST集合"""
+		def factory() -> dict[str, FirstSet]:
+			firsts = {symbol: FirstSet.empty() for symbol in self.keys()}
+			changed = True
+			while changed:
+				changed = False
+				for symbol in firsts.keys():
+					first = self._first_of(self[symbol], firsts)
+					if first != firsts[symbol]:
+						firsts[symbol] = first
+						changed = True
+
+			return firsts
+
+		return self._memo.get(Rules.firsts.__name__, factory)
+
+	def first_of(self, entry: PatternEntry) -> FirstSet:
+		"""パターンエントリーのFIRST集合を取得
+
+		Args:
+			entry: マッチングパターンエントリー
+		Returns:
+			FIRST集合
+		Note:
+			パーサーのマッチング毎に参照されるため、パターンエントリーのインスタンス毎にキャッシュ
+		"""
+		first = self._firsts.get(id(entry))
+		if first is None:
+			first = self._first_of(entry, self.firsts)
+			self._firsts[id(entry)] = first
+
+		return first
+
+	def _first_of(self, entry: PatternEntry, firsts: dict[str, FirstSet]) -> FirstSet:
+		"""パターンエントリーのFIRST集合を算出
+
+		Args:
+			entry: マッチングパターンエントリー
+			firsts: 算出途中のシンボル毎のFIRST集合
+		Returns:
+			FIRST集合
+		"""
+		if isinstance(entry, Pattern):
+			if entry.role == Roles.Symbol:
+				return firsts[entry.expression]
+			elif entry.comp == Comps.Equals:
+				return FirstSet(frozenset([entry.expression]), frozenset(), False)
+			else:
+				return FirstSet(frozenset(), frozenset([entry]), False)
+
+		ordered = list(entry) if entry.op == Operators.Or else list(reversed(entry))
+		equals: set[str] = set()
+		regexps: set[Pattern] = set()
+		nullable = entry.op == Operators.And
+		for in_entry in ordered:
+			in_first = self._first_of(in_entry, firsts)
+			equals.update(in_first.equals)
+			regexps.update(in_first.regexps)
+			if entry.op == Operators.Or:
+				nullable = nullable or in_first.nullable
+			elif not in_first.nullable:
+				nullable = False
+				break
+
+		repeat_nullable = entry.rep in [Repeators.OverZero, Repeators.OneOrZero, Repeators.OneOrEmpty]
+		return FirstSet(frozenset(equals), frozenset(regexps), nullable or repeat_nullable)
+
 	def _collect_keyword(self, root: PatternEntry) -> Iterator[str]:
 		"""マッチングパターンからキーワードを収集
 
 		Returns:
 			イテレーター(キーワード)
+		Note:
+			正規表現の終端記号はソフトキーワード等の名前としても使用できる表現のため、キーワードには含めない
 		"""
 		if isinstance(root, Patterns):
 			for pattern in root:
 				for keyword in self._collect_keyword(pattern):
 					yield keyword
-		elif root.role == Roles.Terminal:
+		elif root.role == Roles.Terminal and root.comp == Comps.Equals:
 			yield root.expression
 
 	@deprecated
@@ -629,6 +781,93 @@ class ASTSerializer:
 		return cast(TupleTree, entry)
 
 
+class JSONSerializer:
+	"""シリアライザー(JSON)。コンパイル済みのルールリストを保存・復元
+
+	Note:
+		```
+		* パターン・パターングループ・キーワードリストを格納し、復元時のグラマーの解析とキーワードの収集を省略
+		* 正規表現は復元時にコンパイル @see Pattern
+		* バージョン2: キーワードリストから正規表現の終端記号を除外 @see Rules._collect_keyword
+		### 書式
+		* ルールリスト: {"version": ${Version}, "rules": [[${org_symbol}, ${entry}], ...], "keywords": [${keyword}, ...]}
+		* パターン: ["p", ${expression}, ${role}, ${comp}]
+		* パターングループ: ["g", ${op}, ${rep}, [${entry}, ...]]
+		```
+	"""
+
+	Version = 2
+
+	@classmethod
+	def dumps(cls, rules: Rules) -> str:
+		"""ルールリストをシリアライズ
+
+		Args:
+			rules: ルールリスト
+		Returns:
+			JSON文字列
+		"""
+		data = {
+			'version': cls.Version,
+			'rules': [[org_symbol, cls._dump_entry(rules[org_symbol])] for org_symbol in rules.org_symbols()],
+			'keywords': rules.keywords,
+		}
+		return json.dumps(data, separators=(',', ':'))
+
+	@classmethod
+	def loads(cls, data: str) -> Rules:
+		"""ルールリストをデシリアライズ
+
+		Args:
+			data: JSON文字列
+		Returns:
+			ルールリスト
+		Raises:
+			Errors.InvalidSchema: 書式が不正、またはバージョンが不一致
+		"""
+		try:
+			loaded = json.loads(data)
+			if loaded['version'] != cls.Version:
+				raise Errors.InvalidSchema(f'Unsupported version. expected: {cls.Version}, actual: {loaded["version"]}')
+
+			rules = {org_symbol: cls._load_entry(entry) for org_symbol, entry in loaded['rules']}
+			return Rules(rules, keywords=[str(keyword) for keyword in loaded['keywords']])
+		except (KeyError, IndexError, TypeError, ValueError) as e:
+			raise Errors.InvalidSchema(f'Invalid rules. error: {e}') from e
+
+	@classmethod
+	def _dump_entry(cls, entry: PatternEntry) -> list[Any]:
+		"""パターンエントリーをシリアライズ
+
+		Args:
+			entry: マッチングパターンエントリー
+		Returns:
+			シリアライズ表現
+		"""
+		if isinstance(entry, Pattern):
+			return ['p', entry.expression, entry.role.value, entry.comp.value]
+		else:
+			return ['g', entry.op.value, entry.rep.value, [cls._dump_entry(in_entry) for in_entry in entry]]
+
+	@classmethod
+	def _load_entry(cls, data: list[Any]) -> PatternEntry:
+		"""パターンエントリーをデシリアライズ
+
+		Args:
+			data: シリアライズ表現
+		Returns:
+			マッチングパターンエントリー
+		Raises:
+			Errors.InvalidSchema: 書式が不正
+		"""
+		if data[0] == 'p':
+			return Pattern(data[1], Roles(data[2]), Comps(data[3]))
+		elif data[0] == 'g':
+			return Patterns([cls._load_entry(in_data) for in_data in data[3]], op=Operators(data[1]), rep=Repeators(data[2]))
+
+		raise Errors.InvalidSchema(f'Unexpected entry. tag: {data[0]}')
+
+
 class Prettier:
 	"""フォーマットユーティリティー"""
 
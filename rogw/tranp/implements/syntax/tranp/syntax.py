@@ -1,7 +1,7 @@
 import os
-import re
 from typing import Any, NamedTuple
 
+from rogw.tranp.cache.lru import LRUCache, LRUMetrics
 from rogw.tranp.dsn.dsn import DSN
 from rogw.tranp.errors import Errors
 from rogw.tranp.implements.syntax.tranp.ast import ASTEntry, ASTToken, ASTTree
@@ -85,18 +85,39 @@ class Context(NamedTuple):
 
 
 class SyntaxParser:
-	"""シンタックスパーサー"""
-
-	def __init__(self, rules: Rules, tokenizer: ITokenizer | None = None) -> None:
+	"""シンタックスパーサー
+
+	Note:
+		```
+		### パックラットモード
+		* packrat=Trueの場合、シンボル毎のマッチング結果を(シンボル, 参照位置)をキーにメモ化し、バックトラック時の再解析を省略
+		* マッチング結果は探索ルートに依存しないため、メモ化の有無に関わらず生成されるASTは同一
+		* メモの件数が上限を超えた場合は最終使用日時が古い順に追い出す(LRU)。追い出した結果は再度必要になった時点で再解析
+		* メモは解析毎に破棄
+		```
+	"""
+
+	def __init__(self, rules: Rules, tokenizer: ITokenizer | None = None, packrat: bool = False, packrat_max_count: int = 0) -> None:
 		"""インスタンスを生成
 
 		Args:
 			rules: ルールリスト
 			tokenizer: トークンパーサー (default = None)
+			packrat: True = パックラットモード (default = False)
+			packrat_max_count: メモの件数の上限。0以下は無制限 (default = 0)
 		"""
 		self.rules = rules
 		self.tokenizer = tokenizer if tokenizer else Tokenizer()
 		self.monitor = ProgreessMonitor()
+		self.packrat = packrat
+		self.packrat_max_count = packrat_max_count
+		self._memo = LRUCache[tuple[str, int], tuple[Step, ASTEntry]](max_count=packrat_max_count)
+		self._keyword_flags: list[bool] = []
+
+	@property
+	def metrics(self) -> LRUMetrics:
+		"""Returns: 直近の解析におけるメモの統計"""
+		return self._memo.metrics
 
 	def parse(self, source: str, entrypoint: str) -> ASTTree:
 		"""ソースコードを解析し、ASTを生成
@@ -112,25 +133,71 @@ class SyntaxParser:
 		tokens = self.tokenizer.parse(source)
 		length = len(tokens)
 		self.monitor.start(tokens)
-		step, entry = self._match_symbol(tokens, Context.start(), entrypoint)
+		self._memo = LRUCache[tuple[str, int], tuple[Step, ASTEntry]](max_count=self.packrat_max_count)
+		self._keyword_flags = self._classify_keywords(tokens)
+		try:
+			step, entry = self._match_symbol(tokens, Context.start(), entrypoint, entrypoint)
+		finally:
+			self._memo.clear()
+			self._keyword_flags = []
+
 		if step.steps != length:
 			message = ErrorCollector(source, tokens, max(0, length - 1 - self.monitor.peek)).summary()
 			raise Errors.Syntax(message)
 
 		return as_a(ASTTree, entry)
 
-	def _match_symbol(self, tokens: list[Token], context: Context, route: str) -> tuple[Step, ASTEntry]:
+	def _classify_keywords(self, tokens: list[Token]) -> list[bool]:
+		"""トークン毎にキーワードか否かを判定
+
+		Args:
+			tokens: トークンリスト
+		Returns:
+			トークン毎の判定結果(True = キーワード)
+		Note:
+			マッチング毎の判定を省略するため、解析の開始時に1度だけ判定
+		"""
+		keyword_set = self.rules.keyword_set
+		return [token.string in keyword_set for token in tokens]
+
+	def _match_symbol(self, tokens: list[Token], context: Context, symbol: str, route: str) -> tuple[Step, ASTEntry]:
 		"""パターン(シンボル参照)を検証し、ASTエントリーを生成
 
 		Args:
 			tokens: トークンリスト
 			context: 解析コンテキスト
 			symbol: シンボル
-			route: 探索ルート
+			route: 探索ルート(末尾はシンボル)
+		Returns:
+			(ステップ, ASTエントリー)
+		Note:
+			```
+			* パックラットモードの場合はメモ化した結果を優先
+			* 探索ルートはネストに比例して長くなるため、シンボルは探索ルートから切り出さずに受け取る
+			```
+		"""
+		if not self.packrat:
+			return self._match_symbol_impl(tokens, context, symbol, route)
+
+		key = (symbol, context.cursor)
+		result = self._memo.get(key)
+		if result is None:
+			result = self._match_symbol_impl(tokens, context, symbol, route)
+			self._memo.put(key, result)
+
+		return result
+
+	def _match_symbol_impl(self, tokens: list[Token], context: Context, symbol: str, route: str) -> tuple[Step, ASTEntry]:
+		"""パターン(シンボル参照)を検証し、ASTエントリーを生成
+
+		Args:
+			tokens: トークンリスト
+			context: 解析コンテキスト
+			symbol: シンボル
+			route: 探索ルート(末尾はシンボル)
 		Returns:
 			(ステップ, ASTエントリー)
 		"""
-		symbol = DSN.right(route, 1)
 		pattern = self.rules[symbol]
 		self.monitor.log(len(tokens) - 1 - context.cursor, symbol, pattern)
 		if isinstance(pattern, Pattern) and pattern.role == Roles.Terminal:
@@ -188,7 +255,7 @@ class SyntaxParser:
 				step, _ = self._match_terminal(tokens, context, pattern, route)
 				return step, []
 			else:
-				step, entry = self._match_symbol(tokens, context, DSN.join(route, pattern.expression))
+				step, entry = self._match_symbol(tokens, context, pattern.expression, DSN.join(route, pattern.expression))
 				return step, [entry]
 
 	def _match_or(self, tokens: list[Token], context: Context, patterns: Patterns, route: str) -> tuple[Step, list[ASTEntry]]:
@@ -203,12 +270,40 @@ class SyntaxParser:
 			(ステップ, ASTエントリーリスト)
 		"""
 		for pattern in patterns:
+			if not self._predict(tokens, context, pattern):
+				continue
+
 			in_step, in_children = self._match_entry(tokens, context, pattern, route)
 			if in_step.steping:
 				return in_step, in_children
 
 		return Step.ng(), []
 
+	def _predict(self, tokens: list[Token], context: Context, pattern: PatternEntry) -> bool:
+		"""パターンエントリーが現在のトークンからマッチし得るか判定
+
+		Args:
+			tokens: トークンリスト
+			context: 解析コンテキスト
+			pattern: パターンエントリー
+		Returns:
+			True = マッチし得る
+		Note:
+			```
+			* FIRST集合に基づいてマッチし得ない選択肢を除外 @see rogw.tranp.implements.syntax.tranp.rule.FirstSet
+			* FIRST集合は実際にマッチし得る集合を包含するため、除外の有無に関わらず生成されるASTは同一
+			```
+		"""
+		first = self.rules.first_of(pattern)
+		if first.nullable:
+			return True
+
+		if len(tokens) <= context.cursor:
+			return False
+
+		index = len(tokens) - 1 - context.cursor
+		return first.accepts(tokens[index].string, self._keyword_flags[index])
+
 	def _match_and(self, tokens: list[Token], context: Context, patterns: Patterns, route: str) -> tuple[Step, list[ASTEntry]]:
 		"""パターングループ(AND)を検証し、子のASTエントリーを生成
 
@@ -286,32 +381,28 @@ class SyntaxParser:
 
 		index = len(tokens) - 1 - context.cursor
 		token = tokens[index]
-		ok = self._compare_token(token, pattern)
+		ok = self._compare_token(token, pattern, self._keyword_flags[index])
 		self.monitor.log(index, ok, token, pattern)
 		if ok:
 			return Step.ok(1), token
 		else:
 			return Step.ng(), Token.empty()
 	
-	def _compare_token(self, token: Token, pattern: Pattern) -> bool:
+	def _compare_token(self, token: Token, pattern: Pattern, keyword: bool) -> bool:
 		"""終端/非終端記号のトークンが一致するか判定
 
 		Args:
 			token: トークン
 			pattern: マッチングパターン
+			keyword: True = トークンがキーワード
 		Returns:
 			True = 一致
 		"""
-		assert pattern.comp != Comps.NoComp
-
-		if pattern.comp == Comps.Equals:
-			return pattern.expression == token.string
-
 		# キーワード(=終端記号)はEqualsのパターンとだけマッチするため、正規表現の判定から除外する
-		if token.string in self.rules.keywords:
+		if keyword and pattern.comp == Comps.Regexp:
 			return False
 
-		return re.fullmatch(pattern.expression, token.string) is not None
+		return pattern.matches(token.string)
 
 
 class ProgreessMonitor:
@@ -323,7 +414,8 @@ class ProgreessMonitor:
 		self.verbose = 'TRANPVERBOSE' in os.environ
 
 	def start(self, tokens: list[Token]) -> None:
-		"""ログ出力(開始) Args: tokens: トークンリスト"""
+		"""解析の開始。到達位置を初期化し、ログ出力 Args: tokens: トークンリスト"""
+		self.peek = 0
 		if self.verbose:
 			for i, token in enumerate(tokens):
 				print(i, token)
@@ -101,6 +101,8 @@ class SpecialSymbols(Enum):
 	Dedent = '\\DEDENT'
 	EOF = '\\EOF'
 	OpUnaryMinus = '\\OP_UNARY_MINUS'
+	OpUnaryPlus = '\\OP_UNARY_PLUS'
+	LambdaColon = '\\LAMBDA_COLON'
 
 
 class Token:
@@ -261,6 +263,34 @@ class Token:
 		"""
 		return Token(TokenTypes.Minus, SpecialSymbols.OpUnaryMinus.value, source_map)
 
+	@classmethod
+	def op_unary_plus(cls, source_map: 'SourceMap') -> 'Token':
+		"""インスタンスを生成
+
+		Returns:
+			インスタンス(単項演算子/プラス)
+		Note:
+			```
+			* マイナス単項演算子と同様に単項/2項を区別するため特殊化
+			@see op_unary_minus
+			```
+		"""
+		return Token(TokenTypes.Plus, SpecialSymbols.OpUnaryPlus.value, source_map)
+
+	@classmethod
+	def lambda_colon(cls, source_map: 'SourceMap') -> 'Token':
+		"""インスタンスを生成
+
+		Returns:
+			インスタンス(ラムダのコロン)
+		Note:
+			```
+			* ラムダの引数の終端を表すコロン。型注釈・ブロックのコロンと区別するため特殊化
+			@see rogw.tranp.implements.syntax.tranp.tokenizer.PyScanTokenizer._rebuild
+			```
+		"""
+		return Token(TokenTypes.Colon, SpecialSymbols.LambdaColon.value, source_map)
+
 	@classmethod
 	def EOF(cls) -> 'Token':
 		"""インスタンスを生成
@@ -1,12 +1,14 @@
+import keyword
 import re
 import token as PyTokenTypes
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable
 from io import BytesIO
 from tokenize import tokenize
-from typing import override
+from typing import ClassVar, override
 
 from rogw.tranp.errors import Errors
-from rogw.tranp.implements.syntax.tranp.token import Token, TokenDefinition, TokenDomains, TokenTypes
+from rogw.tranp.implements.syntax.tranp.token import QuotePair, SpecialSymbols, Token, TokenDefinition, TokenDomains, TokenTypes
 from rogw.tranp.lang.sequence import index_of
 
 
@@ -562,3 +564,461 @@ class Tokenizer(ITokenizer):
 			context.enclosure -= 1
 
 		return begin + 1, [tokens[begin]]
+
+
+class ScanTokenizer(ITokenizer):
+	"""トークンパーサー(スキャナー版)。トークン定義から生成した単一の正規表現で1パスで解析
+
+	Note:
+		```
+		* 解析結果はTokenizerと同一 @see Tokenizer
+		* 字句解析(Lexer)・事後フィルター(Lexer.post_filter)・整形(Tokenizer._rebuild)を1度の走査で実施
+		* トークンドメインの判定は解析順序(TokenDefinition.analyze_order)に従ったパターンの選択(=正規表現の選択順)で代替
+		* コメント・引用符の終端はLexerと同じ規則で探索 @see Lexer.parse_comment, Lexer.parse_quote
+		### 事後フィルターの解釈
+		* '*': 対象の種別のトークンを全て除外
+		* TokenDefinition.MatchBeginOrEnd: 先頭と末尾の改行要素を除外
+		* その他: フィルター適用後に空になるトークンを除外
+		* 除外したトークンの前後の改行要素は合成
+		```
+	"""
+
+	_white_spaces: ClassVar[frozenset[TokenTypes]] = frozenset([TokenTypes.WhiteSpace, TokenTypes.LineBreak, TokenTypes.EOF])
+	_enclosure_begins: ClassVar[frozenset[TokenTypes]] = frozenset([TokenTypes.ParenL, TokenTypes.BraceL, TokenTypes.BracketL])
+	_enclosure_ends: ClassVar[frozenset[TokenTypes]] = frozenset([TokenTypes.ParenR, TokenTypes.BraceR, TokenTypes.BracketR])
+
+	def __init__(self, definition: TokenDefinition | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			definition: トークン定義 (default = None)
+		"""
+		self._definition = definition if definition else TokenDefinition()
+		self._scanner = self._build_scanner(self._definition)
+		self._comments = self._build_pairs(self._definition.comment)
+		self._quotes = self._build_pairs(self._definition.quote)
+		self._symbols = self._build_symbols(self._definition)
+		self._drop_types = {token_type for token_type, post_filter in self._definition.post_filters if post_filter == '*'}
+		self._drop_patterns = [(token_type, re.compile(post_filter)) for token_type, post_filter in self._definition.post_filters if post_filter not in ['*', TokenDefinition.MatchBeginOrEnd]]
+		self._trim = (TokenTypes.LineBreak, TokenDefinition.MatchBeginOrEnd) in self._definition.post_filters
+
+	@classmethod
+	def _build_scanner(cls, definition: TokenDefinition) -> re.Pattern[str]:
+		"""トークン定義からスキャナーの正規表現を生成
+
+		Args:
+			definition: トークン定義
+		Returns:
+			正規表現。グループ名はトークンドメイン名
+		"""
+		expressions = cls._build_expressions(definition)
+		groups = [f'(?P<{domain.name}>{expressions[domain]})' for domain in definition.analyze_order if domain in expressions]
+		return re.compile('|'.join(groups))
+
+	@classmethod
+	def _build_expressions(cls, definition: TokenDefinition) -> dict[TokenDomains, str]:
+		"""トークン定義からトークンドメイン毎の正規表現を生成
+
+		Args:
+			definition: トークン定義
+		Returns:
+			トークンドメインと正規表現のマップ。文字種が未定義のトークンドメインは除外
+		Note:
+			コメント・引用符は開始の文字列のみマッチ
+		"""
+		def char_class(charas: str) -> str:
+			return f'[{"".join([re.escape(chara) for chara in charas])}]'
+
+		def opens(pairs: list[QuotePair]) -> str:
+			return '|'.join([re.escape(pair['open']) for pair in pairs])
+
+		def symbols() -> str:
+			combined = [symbol for symbol in definition.combined_symbols if symbol[0] in definition.symbol]
+			ordered = [*[symbol for symbol in combined if len(symbol) == 3], *[symbol for symbol in combined if len(symbol) == 2]]
+			return '|'.join([*[re.escape(symbol) for symbol in ordered], char_class(definition.symbol)])
+
+		builders = {
+			TokenDomains.WhiteSpace: (definition.white_space, lambda: f'{char_class(definition.white_space)}+'),
+			TokenDomains.Comment: (definition.comment, lambda: opens(definition.comment)),
+			TokenDomains.Quote: (definition.quote, lambda: opens(definition.quote)),
+			TokenDomains.Number: (definition.number, lambda: f'{char_class(definition.number)}+'),
+			TokenDomains.Identifier: (definition.identifier, lambda: f'{char_class(definition.identifier)}+'),
+			TokenDomains.Symbol: (definition.symbol, symbols),
+		}
+		return {domain: build() for domain, (charas, build) in builders.items() if len(charas) > 0}
+
+	@classmethod
+	def _build_pairs(cls, pairs: list[QuotePair]) -> dict[str, QuotePair]:
+		"""開始の文字列と開始/終了のペアのマップを生成
+
+		Args:
+			pairs: 開始/終了のペアリスト
+		Returns:
+			マップ。開始の文字列が重複する場合は先勝ち
+		"""
+		mapping: dict[str, QuotePair] = {}
+		for pair in pairs:
+			mapping.setdefault(pair['open'], pair)
+
+		return mapping
+
+	@classmethod
+	def _build_symbols(cls, definition: TokenDefinition) -> dict[str, TokenTypes]:
+		"""記号とトークン種別のマップを生成
+
+		Args:
+			definition: トークン定義
+		Returns:
+			マップ
+		"""
+		mapping: dict[str, TokenTypes] = {}
+		base = TokenDomains.Symbol.value << 4
+		for offset, symbol in enumerate(definition.symbol):
+			mapping.setdefault(symbol, TokenTypes(base + offset))
+
+		for offset, symbol in enumerate(definition.combined_symbols):
+			mapping.setdefault(symbol, TokenTypes(TokenTypes.BeginCombine.value + offset))
+
+		return mapping
+
+	@override
+	def parse(self, source: str) -> list[Token]:
+		"""ソースコードを解析し、トークンに分割
+
+		Args:
+			source: ソースコード
+		Returns:
+			トークンリスト
+		Raises:
+			AssertionError: 未分類の文字種を処理
+		"""
+		context = Tokenizer.Context()
+		tokens: list[Token] = []
+		pending: Token | None = None
+		emitted = False
+		line = 0
+		line_begin = 0
+		begin = 0
+		length = len(source)
+		while begin < length:
+			matches = self._scanner.match(source, begin)
+			assert matches is not None, Errors.Never(f'Undetermine token domain. {source[begin]}')
+
+			end, token_type, string = self._scan(source, begin, matches)
+			# ソースマップは走査位置から逐次算出
+			lines = source.count('\n', begin, end)
+			end_line_begin = source.rfind('\n', begin, end) + 1 if lines > 0 else line_begin
+			source_map = Token.SourceMap(line, begin - line_begin, line + lines, end - end_line_begin)
+			line += lines
+			line_begin = end_line_begin
+			begin = end
+
+			if self._dropped(token_type, string):
+				continue
+
+			token = Token(token_type, string, source_map)
+			if token_type == TokenTypes.LineBreak:
+				pending = pending.joined(token) if pending is not None else token
+				continue
+
+			if pending is not None and (emitted or not self._trim):
+				self._rebuild(context, tokens, pending)
+
+			pending = None
+			emitted = True
+			self._rebuild(context, tokens, token)
+
+		if pending is not None and not self._trim:
+			self._rebuild(context, tokens, pending)
+
+		self._rebuild(context, tokens, Token.EOF())
+		return tokens
+
+	def _scan(self, source: str, begin: int, matches: re.Match[str]) -> tuple[int, TokenTypes, str]:
+		"""マッチしたトークンドメインに応じてトークンを解析
+
+		Args:
+			source: ソースコード
+			begin: 読み取り開始位置
+			matches: マッチ結果
+		Returns:
+			(次の読み取り位置, トークン種別, 文字列)
+		"""
+		domain = matches.lastgroup
+		value = matches.group()
+		end = matches.end()
+		if domain == TokenDomains.Identifier.name:
+			return end, TokenTypes.Name, value
+		elif domain == TokenDomains.Symbol.name:
+			token_type = self._symbols[value]
+			# XXX 単項/2項のマイナス演算子の区別はLexerに準拠 @see Lexer.parse_symbol
+			if token_type == TokenTypes.Minus and not (end < len(source) and source[end] in self._definition.white_space):
+				return end, token_type, SpecialSymbols.OpUnaryMinus.value
+
+			return end, token_type, value
+		elif domain == TokenDomains.WhiteSpace.name:
+			string = ''.join(value.split('\\\n')) if value.count('\\\n') else value
+			return end, (TokenTypes.LineBreak if string.count('\n') else TokenTypes.WhiteSpace), string
+		elif domain == TokenDomains.Number.name:
+			return end, (TokenTypes.Decimal if value.count('.') > 0 else TokenTypes.Digit), value
+		elif domain == TokenDomains.Comment.name:
+			pair = self._comments[value]
+			end = source.find(pair['close'], end)
+			if end != -1:
+				end += 0 if pair['close'] == '\n' else len(pair['close'])
+			else:
+				end = len(source)
+
+			return end, TokenTypes.Comment, source[begin:end]
+		else:
+			pair = self._quotes[value]
+			while end < len(source):
+				index = source.find(pair['close'], end)
+				if index == -1:
+					break
+
+				prev = max(end, index - 1)
+				end = index + len(pair['close'])
+				if not (source[prev] == '\\'):
+					break
+
+			string = source[begin:end]
+			return end, (TokenTypes.Regexp if string[0] == '/' else TokenTypes.String), string
+
+	def _dropped(self, token_type: TokenTypes, string: str) -> bool:
+		"""事後フィルターによって除外されるか判定
+
+		Args:
+			token_type: トークン種別
+			string: 文字列
+		Returns:
+			True = 除外
+		"""
+		if token_type in self._drop_types:
+			return True
+
+		for filter_type, pattern in self._drop_patterns:
+			if filter_type == token_type and len(''.join(pattern.split(string))) == 0:
+				return True
+
+		return False
+
+	def _rebuild(self, context: Tokenizer.Context, tokens: list[Token], token: Token) -> None:
+		"""トークンを整形して出力 @see Tokenizer.handle_white_space, Tokenizer.handle_symbol
+
+		Args:
+			context: コンテキスト
+			tokens: 出力先のトークンリスト
+			token: トークン
+		"""
+		token_type = token.type
+		if token_type in self._enclosure_begins:
+			context.enclosure += 1
+			tokens.append(token)
+		elif token_type in self._enclosure_ends:
+			context.enclosure -= 1
+			tokens.append(token)
+		elif token_type not in self._white_spaces:
+			tokens.append(token)
+		elif context.enclosure > 0 or token_type == TokenTypes.WhiteSpace:
+			pass
+		elif token_type == TokenTypes.EOF:
+			tokens.append(token.to_new_line())
+			tokens.extend([token.to_dedent()] * context.nest)
+			context.nest = 0
+		else:
+			next_nest = context.to_nest(len(token.string.split('\n')[-1]))
+			tokens.append(token.to_new_line())
+			if context.nest < next_nest:
+				tokens.append(token.to_indent())
+			elif context.nest > next_nest:
+				tokens.extend([token.to_dedent()] * (context.nest - next_nest))
+
+			context.nest = next_nest
+
+
+class PyScanTokenizer(ScanTokenizer):
+	"""トークンパーサー(Python版スキャナー)。Larkのpythonグラマーの終端記号に準拠して解析
+
+	Note:
+		```
+		* 文字列・数値・名前の書式はLarkの終端記号(STRING/LONG_STRING/NUMBER/NAME)に準拠
+		* `# type: ignore`以外のコメントは除外せず出力(=コメント文として解釈)
+		* 単項演算子(+/-)は直前のトークンが被演算子の終端でない場合に特殊化 @see SpecialSymbols
+		* ラムダの引数の終端のコロンは、ラムダと同じ括弧の深さで最初に出現するコロンを特殊化 @see SpecialSymbols
+		* 末尾の改行/ディデントはLarkに合わせてソースコードの終端を位置とする
+		* 字句解析のみ文法と独立。文法は移植版のグラマーを前提 @see data/syntax/grammar.lark
+		```
+	"""
+
+	_long_string: ClassVar[str] = r'(?:[ubfUBF]?[rR]?|[rR][ubfUBF])(?:"""[\s\S]*?(?<!\\)(?:\\\\)*?"""|\'\'\'[\s\S]*?(?<!\\)(?:\\\\)*?\'\'\')'
+	_string: ClassVar[str] = r'(?:[ubfUBF]?[rR]?|[rR][ubfUBF])(?:"(?!"")[^\n]*?(?<!\\)(?:\\\\)*?"|\'(?!\'\')[^\n]*?(?<!\\)(?:\\\\)*?\')'
+	_number: ClassVar[str] = r'0[xXoObB][\da-fA-F_]+|(?:\d[\d_]*(?:\.[\d_]*)?|\.\d[\d_]*)(?:[eE][-+]?\d[\d_]*)?[jJ]?'
+	_keywords: ClassVar[frozenset[str]] = frozenset(keyword.kwlist) - frozenset(['False', 'None', 'True'])
+	_operand_ends: ClassVar[frozenset[TokenTypes]] = frozenset([TokenTypes.Digit, TokenTypes.Decimal, TokenTypes.String, TokenTypes.ParenR, TokenTypes.BraceR, TokenTypes.BracketR, TokenTypes.Ellipsis])
+	_unary_ops: ClassVar[dict[str, Callable[[Token.SourceMap], Token]]] = {'-': Token.op_unary_minus, '+': Token.op_unary_plus}
+
+	def __init__(self, definition: TokenDefinition | None = None) -> None:
+		"""インスタンスを生成
+
+		Args:
+			definition: トークン定義 (default = None)
+		"""
+		super().__init__(definition if definition else self.make_definition())
+		self._lambdas: list[int] = []
+
+	@classmethod
+	def make_definition(cls) -> TokenDefinition:
+		"""トークン定義を生成(Python用)
+
+		Returns:
+			トークン定義
+		Note:
+			```
+			* 文字列・数値は記号より先に解析(例: '.5', "r'a'")
+			* 組み合わせの記号はTokenTypesに未定義のものを末尾に追加 @see _build_symbols
+			```
+		"""
+		definition = TokenDefinition()
+		definition.analyze_order = [
+			TokenDomains.WhiteSpace,
+			TokenDomains.Comment,
+			TokenDomains.Quote,
+			TokenDomains.Number,
+			TokenDomains.Symbol,
+			TokenDomains.Identifier,
+		]
+		definition.combined_symbols = [*definition.combined_symbols, '**=', '//=', '<<=', '>>=', '@=', '//', '<>']
+		definition.post_filters = [
+			(TokenTypes.Comment, r'#\s*type:\s*ignore[^\n]*'),
+			(TokenTypes.WhiteSpace, '*'),
+			(TokenTypes.LineBreak, TokenDefinition.MatchBeginOrEnd),
+		]
+		return definition
+
+	@classmethod
+	@override
+	def _build_expressions(cls, definition: TokenDefinition) -> dict[TokenDomains, str]:
+		"""トークン定義からトークンドメイン毎の正規表現を生成
+
+		Args:
+			definition: トークン定義
+		Returns:
+			トークンドメインと正規表現のマップ
+		Note:
+			空白(行継続を含む)・引用符・数字・識別子はLarkの終端記号に準拠した書式に置き換え
+		"""
+		expressions = super()._build_expressions(definition)
+		expressions[TokenDomains.WhiteSpace] = r'(?:[ \t\f\r\n]|\\[ \t\f]*\r?\n)+'
+		expressions[TokenDomains.Quote] = f'{cls._long_string}|{cls._string}'
+		expressions[TokenDomains.Number] = cls._number
+		expressions[TokenDomains.Identifier] = r'[^\W\d]\w*'
+		return expressions
+
+	@classmethod
+	@override
+	def _build_symbols(cls, definition: TokenDefinition) -> dict[str, TokenTypes]:
+		"""記号とトークン種別のマップを生成
+
+		Args:
+			definition: トークン定義
+		Returns:
+			マップ。既定のトークン定義にない記号は未分類
+		"""
+		mapping = super()._build_symbols(TokenDefinition())
+		for symbol in [*definition.symbol, *definition.combined_symbols]:
+			mapping.setdefault(symbol, TokenTypes.Unknown)
+
+		return mapping
+
+	@override
+	def _scan(self, source: str, begin: int, matches: re.Match[str]) -> tuple[int, TokenTypes, str]:
+		"""マッチしたトークンドメインに応じてトークンを解析
+
+		Args:
+			source: ソースコード
+			begin: 読み取り開始位置
+			matches: マッチ結果
+		Returns:
+			(次の読み取り位置, トークン種別, 文字列)
+		Note:
+			引用符・数字はマッチ結果をそのまま使用。単項演算子の特殊化は整形時に実施 @see _rebuild
+		"""
+		domain = matches.lastgroup
+		value = matches.group()
+		end = matches.end()
+		if domain == TokenDomains.Symbol.name:
+			return end, self._symbols[value], value
+		elif domain == TokenDomains.Quote.name:
+			return end, TokenTypes.String, value
+		elif domain == TokenDomains.Number.name:
+			decimal = value[:2] not in ['0x', '0X', '0o', '0O', '0b', '0B'] and re.search(r'[.eEjJ]', value) is not None
+			return end, (TokenTypes.Decimal if decimal else TokenTypes.Digit), value
+		else:
+			return super()._scan(source, begin, matches)
+
+	@override
+	def parse(self, source: str) -> list[Token]:
+		"""ソースコードを解析し、トークンに分割
+
+		Args:
+			source: ソースコード
+		Returns:
+			トークンリスト
+		"""
+		self._lambdas = []
+		tokens = super().parse(source)
+		eof = Token.SourceMap.EOF()
+		line = source.count('\n')
+		column = len(source) - (source.rfind('\n') + 1)
+		end = Token.SourceMap(line, column, line, column)
+		# ディデントは同一のインスタンスが連続するため、補正済みのトークンは読み飛ばす
+		for token in reversed(tokens):
+			if token.source_map == eof:
+				token.source_map = end
+			elif token.source_map != end:
+				break
+
+		return tokens
+
+	@override
+	def _rebuild(self, context: Tokenizer.Context, tokens: list[Token], token: Token) -> None:
+		"""トークンを整形して出力
+
+		Args:
+			context: コンテキスト
+			tokens: 出力先のトークンリスト
+			token: トークン
+		Note:
+			```
+			* 単項演算子(+/-)・ラムダのコロンを特殊化してから出力 @see ScanTokenizer._rebuild
+			* ラムダは出現時の括弧の深さをスタックに積み、同じ深さのコロンで取り出す(入れ子のラムダは内側から対応)
+			```
+		"""
+		string = token.string
+		if string in self._unary_ops and not self._operand_end(tokens):
+			token = self._unary_ops[string](token.source_map)
+		elif string == 'lambda':
+			self._lambdas.append(context.enclosure)
+		elif string == ':' and len(self._lambdas) > 0 and self._lambdas[-1] == context.enclosure:
+			self._lambdas.pop()
+			token = Token.lambda_colon(token.source_map)
+
+		super()._rebuild(context, tokens, token)
+
+	def _operand_end(self, tokens: list[Token]) -> bool:
+		"""出力済みの末尾のトークンが被演算子の終端か判定
+
+		Args:
+			tokens: 出力済みのトークンリスト
+		Returns:
+			True = 被演算子の終端
+		"""
+		if len(tokens) == 0:
+			return False
+
+		last = tokens[-1]
+		if last.type == TokenTypes.Name:
+			return last.string not in self._keywords
+
+		return last.type in self._operand_ends
@@ -1,5 +1,12 @@
+import csv
+import json
+import os
+import sys
+import threading
+import time
 from collections.abc import Callable
-from typing import ParamSpec, TypeVar
+from contextlib import AbstractContextManager, nullcontext
+from typing import Any, ParamSpec, TypedDict, TypeVar
 
 P = ParamSpec('P')
 T_Ret = TypeVar('T_Ret')
@@ -35,3 +42,227 @@ def profiler(sort: str = 'tottime', on: bool = True) -> Callable[[Callable[P, T_
 		return wrapper if on else wrapper_func
 
 	return decorator
+
+
+class TraceEvent(TypedDict):
+	"""トレースイベント(Chromeトレース形式)
+
+	Attributes:
+		name: イベント名
+		cat: カテゴリー
+		ph: イベント種別。X(完了イベント)固定
+		ts: 開始時刻(マイクロ秒)
+		dur: 所要時間(マイクロ秒)
+		pid: プロセスID
+		tid: スレッドID
+		args: 付加情報
+	"""
+
+	name: str
+	cat: str
+	ph: str
+	ts: int
+	dur: int
+	pid: int
+	tid: int
+	args: dict[str, str]
+
+
+class Tracer:
+	"""タイミングトレーサー。フェーズ・モジュール単位の処理時間をスパンとして記録
+
+	Note:
+		```
+		* 記録したスパンはChromeトレース形式(Perfetto互換)のJSONと、集計結果のCSVに出力
+		* 無効時はスパンを記録しないため、計測箇所のオーバーヘッドは最小限
+		```
+	Example:
+		```python
+		with Tracer.instance().span('parse', module='path.to.module'):
+			...
+		```
+	"""
+
+	_instance: 'Tracer | None' = None
+
+	@classmethod
+	def instance(cls) -> 'Tracer':
+		"""シングルトンインスタンスを取得
+
+		Returns:
+			インスタンス
+		"""
+		if not cls._instance:
+			cls._instance = cls()
+
+		return cls._instance
+
+	def __init__(self) -> None:
+		"""インスタンスを生成"""
+		self.enabled = False
+		self._events: list[TraceEvent] = []
+
+	def enable(self) -> None:
+		"""記録を有効化"""
+		self.enabled = True
+
+	def span(self, name: str, category: str = 'phase', **args: str) -> AbstractContextManager[None]:
+		"""スパンを生成
+
+		Args:
+			name: スパン名
+			category: カテゴリー (default = 'phase')
+			**args: 付加情報
+		Returns:
+			コンテキストマネージャー
+		"""
+		if not self.enabled:
+			return nullcontext()
+
+		return Span(self, name, category, args)
+
+	def put(self, event: TraceEvent) -> None:
+		"""イベントを追加
+
+		Args:
+			event: イベント
+		"""
+		self._events.append(event)
+
+	def merge(self, events: list[TraceEvent]) -> None:
+		"""他プロセスで記録したイベントを統合
+
+		Args:
+			events: イベントリスト
+		"""
+		self._events.extend(events)
+
+	def drain(self) -> list[TraceEvent]:
+		"""記録済みのイベントを取り出し、内部のイベントを破棄
+
+		Returns:
+			イベントリスト
+		"""
+		events = self._events
+		self._events = []
+		return events
+
+	def summary(self) -> list[dict[str, str]]:
+		"""イベントをスパン名・モジュール単位で集計
+
+		Returns:
+			集計結果の行リスト。モジュールが'*'の行はスパン名単位の合計
+		"""
+		groups: dict[tuple[str, str], list[int]] = {}
+		for event in self._events:
+			for key in [(event['name'], event['args'].get('module', '-')), (event['name'], '*')]:
+				if key not in groups:
+					groups[key] = []
+
+				groups[key].append(event['dur'])
+
+		rows: list[dict[str, str]] = []
+		for (name, module), durations in sorted(groups.items(), key=lambda entry: entry[0]):
+			total = sum(durations)
+			rows.append({
+				'name': name,
+				'module': module,
+				'count': str(len(durations)),
+				'total_ms': f'{total / 1000:.3f}',
+				'avg_ms': f'{total / len(durations) / 1000:.3f}',
+				'max_ms': f'{max(durations) / 1000:.3f}',
+			})
+
+		return rows
+
+	def save(self, filepath: str) -> None:
+		"""トレース結果をファイルに出力
+
+		Args:
+			filepath: 出力ファイルのパス
+		Note:
+			```
+			* 指定のパスにChromeトレース形式のJSONを出力
+			* 拡張子を'.csv'に置き換えたパスに集計結果のCSVを出力
+			```
+		"""
+		dirpath = os.path.dirname(os.path.abspath(filepath))
+		if not os.path.exists(dirpath):
+			os.makedirs(dirpath)
+
+		with open(filepath, mode='w', encoding='utf-8') as f:
+			json.dump({'traceEvents': self._events, 'displayTimeUnit': 'ms'}, f)
+
+		with open(f'{os.path.splitext(filepath)[0]}.csv', mode='w', encoding='utf-8', newline='') as f:
+			writer = csv.DictWriter(f, fieldnames=['name', 'module', 'count', 'total_ms', 'avg_ms', 'max_ms'])
+			writer.writeheader()
+			writer.writerows(self.summary())
+
+
+class Span:
+	"""スパン。コンテキストの開始から終了までの処理時間をトレーサーに記録"""
+
+	def __init__(self, tracer: Tracer, name: str, category: str, args: dict[str, str]) -> None:
+		"""インスタンスを生成
+
+		Args:
+			tracer: トレーサー
+			name: スパン名
+			category: カテゴリー
+			args: 付加情報
+		"""
+		self._tracer = tracer
+		self._name = name
+		self._category = category
+		self._args = args
+		self._begin = 0
+
+	def __enter__(self) -> None:
+		"""コンテキストを開始"""
+		self._begin = time.perf_counter_ns()
+
+	def __exit__(self, *_: Any) -> None:
+		"""コンテキストを終了"""
+		end = time.perf_counter_ns()
+		self._tracer.put({
+			'name': self._name,
+			'cat': self._category,
+			'ph': 'X',
+			'ts': self._begin // 1000,
+			'dur': (end - self._begin) // 1000,
+			'pid': os.getpid(),
+			'tid': threading.get_ident(),
+			'args': self._args,
+		})
+
+
+def rss_mb() -> float:
+	"""プロセスの現在のRSSを取得
+
+	Returns:
+		RSS(MB)
+	Note:
+		`/proc`を参照出来ない環境ではピーク時のRSSで代替
+	"""
+	try:
+		with open('/proc/self/statm', mode='rb') as f:
+			pages = int(f.read().split()[1])
+			return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+	except (OSError, ValueError, IndexError, AttributeError):
+		return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+	"""プロセスのピークRSSを取得
+
+	Returns:
+		ピークRSS(MB)。取得できない環境では0
+	"""
+	try:
+		import resource
+	except ImportError:
+		return 0.0
+
+	peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+	# XXX macOSはバイト単位、それ以外はキロバイト単位
+	return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
@@ -0,0 +1,135 @@
+from collections.abc import Callable
+
+from rogw.tranp.module.module import Module
+
+
+class DependencyGraph:
+	"""モジュールの依存グラフ。インポートの順方向/逆方向の関係を管理"""
+
+	@classmethod
+	def from_modules(cls, modules: list[Module]) -> 'DependencyGraph':
+		"""モジュールリストからインスタンスを生成
+
+		Args:
+			modules: モジュールリスト
+		Returns:
+			インスタンス
+		"""
+		graph = cls()
+		for module in modules:
+			graph.add(module.path, [import_node.import_path.tokens for import_node in module.entrypoint.imports])
+
+		return graph
+
+	def __init__(self) -> None:
+		"""インスタンスを生成"""
+		self.__imports: dict[str, list[str]] = {}
+		self.__dependents: dict[str, dict[str, bool]] = {}
+
+	def __contains__(self, module_path: str) -> bool:
+		"""指定のモジュールが登録済みか判定
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			True = 登録済み
+		"""
+		return module_path in self.__imports
+
+	@property
+	def module_paths(self) -> list[str]:
+		"""Returns: 登録済みのモジュールパスリスト"""
+		return list(self.__imports.keys())
+
+	def add(self, module_path: str, imports: list[str]) -> None:
+		"""モジュールとインポート先を登録。登録済みの場合は上書き
+
+		Args:
+			module_path: モジュールパス
+			imports: インポート先のモジュールパスリスト
+		"""
+		self.remove(module_path)
+		self.__imports[module_path] = list(imports)
+		for import_path in imports:
+			if import_path not in self.__dependents:
+				self.__dependents[import_path] = {}
+
+			self.__dependents[import_path][module_path] = True
+
+	def remove(self, module_path: str) -> None:
+		"""モジュールの登録を削除
+
+		Args:
+			module_path: モジュールパス
+		Note:
+			被インポート側の関係は維持する
+		"""
+		if module_path not in self.__imports:
+			return
+
+		for import_path in self.__imports[module_path]:
+			if module_path in self.__dependents.get(import_path, {}):
+				del self.__dependents[import_path][module_path]
+
+		del self.__imports[module_path]
+
+	def imports_of(self, module_path: str) -> list[str]:
+		"""インポート先のモジュールパスリストを取得(直接の依存のみ)
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			モジュールパスリスト
+		"""
+		return self.__imports.get(module_path, [])
+
+	def depends_of(self, module_path: str) -> list[str]:
+		"""依存先のモジュールパスリストを取得(推移的な依存を含む)
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			モジュールパスリスト。自身は含まない
+		"""
+		return self.__walk([module_path], lambda in_path: self.imports_of(in_path))[1:]
+
+	def closure_of(self, module_paths: list[str]) -> list[str]:
+		"""依存先のモジュールパスリストを取得(推移的な依存を含む)
+
+		Args:
+			module_paths: 基点のモジュールパスリスト
+		Returns:
+			モジュールパスリスト。基点のモジュールを含む
+		"""
+		return self.__walk(module_paths, lambda in_path: self.imports_of(in_path))
+
+	def dependents_of(self, module_paths: list[str]) -> list[str]:
+		"""依存元のモジュールパスリストを取得(推移的な依存を含む)
+
+		Args:
+			module_paths: 基点のモジュールパスリスト
+		Returns:
+			モジュールパスリスト。基点のモジュールを含む
+		"""
+		return self.__walk(module_paths, lambda in_path: list(self.__dependents.get(in_path, {}).keys()))
+
+	def __walk(self, module_paths: list[str], nexts: Callable[[str], list[str]]) -> list[str]:
+		"""基点のモジュールから辿れる全てのモジュールを収集
+
+		Args:
+			module_paths: 基点のモジュールパスリスト
+			nexts: 隣接するモジュールパスリストの取得関数
+		Returns:
+			モジュールパスリスト(探索順)
+		"""
+		founds: dict[str, bool] = {}
+		stack = list(reversed(module_paths))
+		while stack:
+			module_path = stack.pop()
+			if module_path in founds:
+				continue
+
+			founds[module_path] = True
+			stack.extend(reversed(nexts(module_path)))
+
+		return list(founds.keys())
@@ -24,6 +24,7 @@ class Module:
 		self.__entrypoint = entrypoint
 		self.__sources = sources
 		self.__identity: str = ''
+		self.__declaration_only = False
 
 	@override
 	def __repr__(self) -> str:
@@ -45,6 +46,25 @@ class Module:
 		"""Returns: エントリーポイント"""
 		return self.__entrypoint
 
+	@property
+	def declaration_only(self) -> bool:
+		"""Returns: True = 宣言のみを展開"""
+		return self.__declaration_only
+
+	def expand_as(self, declaration_only: bool) -> None:
+		"""シンボルの展開方法を設定
+
+		Args:
+			declaration_only: True = 宣言のみを展開
+		Note:
+			```
+			* 依存モジュールとしてロードした場合は、宣言(クラス・関数のシグネチャー・変数宣言・インポート)のみを展開
+			* 関数の本体は、モジュールを直接ロードした時点で展開
+			@see rogw.tranp.module.modules.Modules.load
+			```
+		"""
+		self.__declaration_only = declaration_only
+
 	@property
 	def filepath(self) -> str:
 		"""Returns: ファイルパス"""
@@ -67,13 +67,30 @@ class Modules:
 			```
 			* ロードしたモジュールはパスとマッピングしてキャッシュ
 			* 依存モジュールを再帰的にロードする
+			* 依存モジュールは宣言のみを展開し、宣言のみ展開済みのモジュールを直接ロードした場合は残りを展開
 			```
 		"""
+		return self.__load(module_path, language, declaration_only=False)
+
+	def __load(self, module_path: str, language: str, declaration_only: bool) -> Module:
+		"""モジュールをロード
+
+		Args:
+			module_path: モジュールパス
+			language: 言語タグ
+			declaration_only: True = 宣言のみを展開
+		Returns:
+			モジュール
+		"""
 		if module_path not in self.__modules:
 			self.__load_libraries(module_path)
 			self.__modules[module_path] = self.__loader.load(ModulePath(module_path, language))
+			self.__modules[module_path].expand_as(declaration_only)
 			self.__load_dependencies(self.__modules[module_path])
 			self.__loader.preprocess(self.__modules[module_path])
+		elif not declaration_only and self.__modules[module_path].declaration_only:
+			self.__modules[module_path].expand_as(False)
+			self.__loader.preprocess(self.__modules[module_path])
 
 		return self.__modules[module_path]
 
@@ -93,9 +110,11 @@ class Modules:
 
 		Args:
 			via_module: 読み込み中のモジュール
+		Note:
+			依存モジュールは宣言のみを展開
 		"""
 		for import_node in via_module.entrypoint.imports:
-			self.load(import_node.import_path.tokens)
+			self.__load(import_node.import_path.tokens, 'py', declaration_only=True)
 
 	def identity(self) -> str:
 		"""モジュール全体から一意な識別子を生成
@@ -0,0 +1,175 @@
+import json
+import mmap
+import os
+import struct
+import zlib
+from typing import Any, TypedDict
+
+from rogw.tranp.data.version import Versions
+
+
+class PackSegment(TypedDict):
+	"""パックのセグメント情報
+
+	Attributes:
+		identity: 一意性担保用の識別子
+		offset: ペイロード内の開始位置
+		size: 圧縮後のサイズ
+	"""
+
+	identity: str
+	offset: int
+	size: int
+
+
+class LibraryPack:
+	"""ライブラリーパック。標準ライブラリーのシンタックスツリー・シンボルテーブルをモジュール単位で格納したバイナリーファイル
+
+	Note:
+		```
+		### ファイルフォーマット
+		* マジックナンバー(8byte)
+		* ヘッダー長(4byte, ビッグエンディアン)
+		* ヘッダー(JSON): アプリケーションのバージョンと、モジュール・種別毎のセグメント情報
+		* ペイロード: zlibで圧縮したJSONのセグメントを連結
+		### 読み込み
+		* ファイルはメモリーマップで開き、セグメントは取得時に展開
+		* セグメントは識別子が一致する場合のみ取得可能。ソースコードが変更された場合は利用されない
+		* バージョンが異なる、または読み込みに失敗した場合は空のパックとして扱う
+		```
+	"""
+
+	Magic = b'TRANPPK1'
+
+	@classmethod
+	def load(cls, filepath: str) -> 'LibraryPack':
+		"""ファイルからインスタンスを復元。存在しない、または読み込みに失敗した場合は空のインスタンスを返却
+
+		Args:
+			filepath: ファイルパス
+		Returns:
+			インスタンス
+		"""
+		if not os.path.isfile(filepath):
+			return cls()
+
+		try:
+			with open(filepath, mode='rb') as f:
+				buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+			magic_size = len(cls.Magic)
+			if buffer[:magic_size] != cls.Magic:
+				return cls()
+
+			header_begin = magic_size + 4
+			header_size = struct.unpack('>I', buffer[magic_size:header_begin])[0]
+			header = json.loads(buffer[header_begin:header_begin + header_size].decode('utf-8'))
+			if header.get('version') != Versions.app:
+				return cls()
+
+			return cls(header['modules'], buffer, header_begin + header_size)
+		except (OSError, ValueError, KeyError, struct.error):
+			return cls()
+
+	def __init__(self, index: dict[str, dict[str, PackSegment]] | None = None, buffer: mmap.mmap | bytes = b'', base: int = 0) -> None:
+		"""インスタンスを生成
+
+		Args:
+			index: モジュール・種別毎のセグメント情報 (default = None)
+			buffer: ペイロードを含むバッファー (default = b'')
+			base: バッファー内のペイロードの開始位置 (default = 0)
+		"""
+		self.__index: dict[str, dict[str, PackSegment]] = index or {}
+		self.__buffer = buffer
+		self.__base = base
+
+	def __contains__(self, module_path: str) -> bool:
+		"""指定のモジュールが格納されているか判定
+
+		Args:
+			module_path: モジュールパス
+		Returns:
+			True = 格納済み
+		"""
+		return module_path in self.__index
+
+	@property
+	def module_paths(self) -> list[str]:
+		"""Returns: 格納済みのモジュールパスリスト"""
+		return list(self.__index.keys())
+
+	def exists(self, module_path: str, kind: str, identity: str) -> bool:
+		"""識別子が一致するセグメントが存在するか判定
+
+		Args:
+			module_path: モジュールパス
+			kind: 種別
+			identity: 一意性担保用の識別子
+		Returns:
+			True = 存在
+		"""
+		segment = self.__index.get(module_path, {}).get(kind)
+		return segment is not None and segment['identity'] == identity
+
+	def get(self, module_path: str, kind: str, identity: str) -> Any | None:
+		"""セグメントを展開して取得。識別子が一致しない場合はNoneを返却
+
+		Args:
+			module_path: モジュールパス
+			kind: 種別
+			identity: 一意性担保用の識別子
+		Returns:
+			セグメントのデータ
+		"""
+		if not self.exists(module_path, kind, identity):
+			return None
+
+		segment = self.__index[module_path][kind]
+		begin = self.__base + segment['offset']
+		return json.loads(zlib.decompress(self.__buffer[begin:begin + segment['size']]).decode('utf-8'))
+
+	def put(self, module_path: str, kind: str, identity: str, data: Any) -> None:
+		"""セグメントを追加。同じモジュール・種別のセグメントは上書き
+
+		Args:
+			module_path: モジュールパス
+			kind: 種別
+			identity: 一意性担保用の識別子
+			data: セグメントのデータ(JSONシリアライズ可能な値)
+		"""
+		payload = bytes(self.__buffer[self.__base:])
+		compressed = zlib.compress(json.dumps(data, separators=(',', ':')).encode('utf-8'), 9)
+		if module_path not in self.__index:
+			self.__index[module_path] = {}
+
+		self.__index[module_path][kind] = {'identity': identity, 'offset': len(payload), 'size': len(compressed)}
+		self.__buffer = payload + compressed
+		self.__base = 0
+
+	def save(self, filepath: str) -> None:
+		"""ファイルに保存
+
+		Args:
+			filepath: ファイルパス
+		Note:
+			上書きしたセグメントの領域は保存時に除外
+		"""
+		dirpath = os.path.dirname(os.path.abspath(filepath))
+		if not os.path.exists(dirpath):
+			os.makedirs(dirpath)
+
+		index: dict[str, dict[str, PackSegment]] = {}
+		payload = b''
+		for module_path, segments in self.__index.items():
+			index[module_path] = {}
+			for kind, segment in segments.items():
+				begin = self.__base + segment['offset']
+				index[module_path][kind] = {'identity': segment['identity'], 'offset': len(payload), 'size': segment['size']}
+				payload += bytes(self.__buffer[begin:begin + segment['size']])
+
+		header = json.dumps({'version': Versions.app, 'modules': index}, separators=(',', ':')).encode('utf-8')
+		with open(filepath, mode='wb') as f:
+			f.write(self.Magic)
+			f.write(struct.pack('>I', len(header)))
+			f.write(header)
+			f.write(payload)
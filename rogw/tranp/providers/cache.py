@@ -1,4 +1,8 @@
+from rogw.tranp.cache.backend import CacheBackend, FileBackend, PackedBackend
 from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.cache.remote import RemoteBackend, RemoteCache
+from rogw.tranp.errors import Errors
+from rogw.tranp.lang.annotation import injectable
 
 
 def cache_setting() -> CacheSetting:
@@ -6,5 +10,46 @@ def cache_setting() -> CacheSetting:
 
 	Returns:
 		キャッシュ設定データ
+	Note:
+		```
+		* 容量の上限は1GB、未使用期間の上限は30日 @see rogw.tranp.cache.storage.CacheStorage.gc
+		* エビクションの実行間隔は1日 @see rogw.tranp.cache.storage.CacheStorage.gc_due
+		* メモリー上に保持するインスタンスの概算サイズの上限は256MB @see rogw.tranp.cache.cache.CacheProvider
+		```
 	"""
-	return CacheSetting(basedir='.cache/tranp')
+	return CacheSetting(basedir='.cache/tranp', max_size=1024 * 1024 * 1024, max_age=30 * 24 * 60 * 60, gc_interval=24 * 60 * 60, memory_max_size=256 * 1024 * 1024)
+
+
+@injectable
+def cache_backend(setting: CacheSetting) -> CacheBackend:
+	"""キャッシュバックエンドを生成
+
+	Args:
+		setting: キャッシュ設定データ @inject
+	Returns:
+		キャッシュバックエンド
+	Raises:
+		Errors.InvalidSchema: 未対応のバックエンドを指定
+	Note:
+		リモートキャッシュのURLが指定された場合は、ローカルのバックエンドの後段にリモートキャッシュを配置 @see RemoteBackend
+	"""
+	backend = local_cache_backend(setting)
+	return RemoteBackend(backend, RemoteCache(setting.remote)) if setting.remote else backend
+
+
+def local_cache_backend(setting: CacheSetting) -> CacheBackend:
+	"""ローカルのキャッシュバックエンドを生成
+
+	Args:
+		setting: キャッシュ設定データ
+	Returns:
+		キャッシュバックエンド
+	Raises:
+		Errors.InvalidSchema: 未対応のバックエンドを指定
+	"""
+	if setting.backend == 'files':
+		return FileBackend(setting.basedir)
+	elif setting.backend == 'packed':
+		return PackedBackend(setting.basedir)
+
+	raise Errors.InvalidSchema(f'Unsupported cache backend. backend: {setting.backend}')
@@ -1,11 +1,16 @@
+import os
+
+from rogw.tranp.app.dir import tranp_dir
 from rogw.tranp.data.meta.types import ModuleMeta, ModuleMetaFactory
 from rogw.tranp.file.loader import ISourceLoader
 from rogw.tranp.lang.annotation import implements, injectable
 from rogw.tranp.lang.locator import Invoker
 from rogw.tranp.lang.module import module_path_to_filepath
+from rogw.tranp.lang.profile import Tracer
 from rogw.tranp.module.types import ModulePath, ModulePaths
 from rogw.tranp.module.module import Module
 from rogw.tranp.module.loader import IModuleLoader
+from rogw.tranp.module.pack import LibraryPack
 from rogw.tranp.semantics.processor import PreprocessorProvider
 from rogw.tranp.semantics.reflection.db import SymbolDB
 from rogw.tranp.syntax.ast.entrypoints import Entrypoints
@@ -34,6 +39,26 @@ def library_paths() -> ModulePaths:
 	])
 
 
+def library_pack_filepath() -> str:
+	"""ライブラリーパックのファイルパスを生成
+
+	Returns:
+		ファイルパス(絶対パス)
+	"""
+	return os.path.join(tranp_dir(), 'data/libralies.pack')
+
+
+def library_pack() -> LibraryPack:
+	"""ライブラリーパックをロード
+
+	Returns:
+		ライブラリーパック
+	Note:
+		ファイルが存在しない場合は空のパックを返却 @see bin/pack.sh
+	"""
+	return LibraryPack.load(library_pack_filepath())
+
+
 def module_paths() -> ModulePaths:
 	"""処理対象モジュールのパスリストを生成
 
@@ -88,10 +113,16 @@ class ModuleLoader(IModuleLoader):
 
 		Args:
 			module: モジュール
+		Note:
+			永続化済みのシンボルテーブルを復元した場合は、宣言のみの展開であっても展開済みとして扱う
 		"""
 		for proc in self.processors():
-			if not proc(module, self.db):
-				break
+			with Tracer.instance().span(f'preprocess.{proc.__class__.__name__}', module=module.path):
+				if not proc(module, self.db):
+					break
+
+		if module.declaration_only and self.db.completed(module.path):
+			module.expand_as(False)
 
 
 @injectable
@@ -1,6 +1,10 @@
+from rogw.tranp.errors import Errors
 from rogw.tranp.file.loader import ISourceLoader
+from rogw.tranp.implements.syntax.lark.parser import SyntaxParserOfLark
 from rogw.tranp.lang.annotation import injectable
+from rogw.tranp.lang.locator import Invoker
 from rogw.tranp.lang.module import module_path_to_filepath
+from rogw.tranp.lang.profile import Tracer
 from rogw.tranp.module.types import ModulePath
 from rogw.tranp.syntax.ast.entry import Entry
 from rogw.tranp.syntax.ast.parser import ParserSetting, SourceProvider, SyntaxParser
@@ -15,6 +19,29 @@ def parser_setting() -> ParserSetting:
 	return ParserSetting(grammar='data/grammar.lark')
 
 
+@injectable
+def syntax_parser(setting: ParserSetting, invoker: Invoker) -> SyntaxParser:
+	"""シンタックスパーサーを生成
+
+	Args:
+		setting: パーサー設定データ @inject
+		invoker: ファクトリー関数 @inject
+	Returns:
+		シンタックスパーサー
+	Raises:
+		Errors.InvalidSchema: 未対応のバックエンドを指定
+	"""
+	if setting.backend == 'lark':
+		return invoker(SyntaxParserOfLark)
+	elif setting.backend == 'tranp':
+		# 生成したパーサーのインポートはコストが高いため、選択時のみインポート
+		from rogw.tranp.implements.syntax.tranp.parser import SyntaxParserOfTranp
+
+		return invoker(SyntaxParserOfTranp)
+
+	raise Errors.InvalidSchema(f'Unsupported syntax backend. backend: {setting.backend}')
+
+
 @injectable
 def source_provider(sources: ISourceLoader) -> SourceProvider:
 	"""ソースコードプロバイダーを生成
@@ -24,7 +51,11 @@ def source_provider(sources: ISourceLoader) -> SourceProvider:
 	Returns:
 		ソースコードプロバイダー
 	"""
-	return lambda module_path: sources.load(module_path_to_filepath(module_path, '.py'))
+	def handler(module_path: str) -> str:
+		with Tracer.instance().span('load', module=module_path):
+			return sources.load(module_path_to_filepath(module_path, '.py'))
+
+	return handler
 
 
 @injectable
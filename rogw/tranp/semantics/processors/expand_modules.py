@@ -10,6 +10,8 @@ from rogw.tranp.semantics.processor import Preprocessor
 from rogw.tranp.semantics.reflection.base import IReflection
 from rogw.tranp.semantics.reflection.db import SymbolDB
 from rogw.tranp.semantics.reflection.reflection import Symbol
+from rogw.tranp.syntax.node.interface import StatementBlock
+from rogw.tranp.syntax.node.node import Node
 
 
 class Expanded:
@@ -91,8 +93,10 @@ class ExpandModules:
 			module: モジュール
 		Returns:
 			展開データ
+		Note:
+			宣言のみを展開する場合、関数は仮引数のみを展開し、本体は展開しない
 		"""
-		nodes = module.entrypoint.procedural()
+		nodes = self.declaration_nodes(module.entrypoint) if module.declaration_only else module.entrypoint.procedural()
 		nodes.append(module.entrypoint)
 
 		classes: dict[str, str] = {}
@@ -106,7 +110,8 @@ class ExpandModules:
 			if isinstance(node, defs.Entrypoint):
 				decl_vars = {**decl_vars, **{var.fullyname: var.full_path for var in node.decl_vars}}
 			elif isinstance(node, defs.Function):
-				decl_vars = {**decl_vars, **{var.fullyname: var.full_path for var in node.decl_vars}}
+				func_vars = node.parameters if module.declaration_only else node.decl_vars
+				decl_vars = {**decl_vars, **{var.fullyname: var.full_path for var in func_vars}}
 			elif isinstance(node, defs.Enum):
 				decl_vars = {**decl_vars, **{var.fullyname: var.full_path for var in node.vars}}
 			elif isinstance(node, defs.Class):
@@ -123,6 +128,41 @@ class ExpandModules:
 
 		return Expanded(classes, decl_vars, imports, import_paths)
 
+	def declaration_nodes(self, block: StatementBlock) -> list[Node]:
+		"""宣言に関わるノードを再帰的に展開し、1次元に平坦化して取得
+
+		Args:
+			block: ステートメントブロック
+		Returns:
+			ノードリスト
+		Note:
+			```
+			* 関数はステートメント以外の展開プロパティー(テンプレート・仮引数等)のみを展開し、本体は展開しない
+			* クラスはステートメントを再帰的に展開
+			* その他のステートメントは全て展開
+			@see rogw.tranp.syntax.node.node.Node.procedural
+			```
+		"""
+		nodes: list[Node] = []
+		for node in block.statements:
+			if isinstance(node, (defs.Function, defs.Class)):
+				for key in node.prop_keys():
+					if key == 'statements':
+						if isinstance(node, defs.Class):
+							nodes.extend(self.declaration_nodes(node))
+
+						continue
+
+					prop = getattr(node, key)
+					for in_node in (prop if isinstance(prop, list) else [prop]):
+						nodes.extend([*in_node.procedural(), in_node])
+			else:
+				nodes.extend(node.procedural())
+
+			nodes.append(node)
+
+		return nodes
+
 	def resolve_type_symbol(self, db: SymbolDB, var: defs.DeclVars) -> IReflection:
 		"""シンボルテーブルから変数の型のシンボルを解決
 
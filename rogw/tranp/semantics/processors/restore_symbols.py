@@ -29,12 +29,19 @@ class RestoreSymbols:
 			True = 後続処理を実行
 		Raises:
 			Errors.Never: 実施済みのモジュールに対して再度実行
+		Note:
+			```
+			* 宣言のみ展開済みのモジュールは、残りのシンボルを展開するため復元せずに後続処理を実行
+			* 永続化されたデータが破損している場合は、復元せずに後続処理を実行
+			```
 		"""
-		if db.has_module(module.path):
+		if db.completed(module.path):
 			raise Errors.Never(module, 'Already processing')
 
-		if self.persistor.stored(module):
-			self.persistor.restore(module, db)
+		if db.has_module(module.path):
+			return True
+
+		if self.persistor.stored(module) and self.persistor.restore(module, db):
 			return False
 
 		return True
@@ -26,7 +26,12 @@ class StoreSymbols:
 			db: シンボルテーブル
 		Returns:
 			True = 後続処理を実行
+		Note:
+			宣言のみを展開したシンボルテーブルは不完全なため、完了の記録と永続化を行わない
 		"""
+		if module.declaration_only:
+			return True
+
 		db.on_complete(module.path)
 		self.persistor.store(module, db)
 		return True
@@ -1,13 +1,16 @@
 from abc import ABCMeta, abstractmethod
-import glob
 import json
-import os
-
-from rogw.tranp.cache.cache import CacheSetting
-from rogw.tranp.file.loader import ISourceLoader
+import time
+from typing import Any
+
+from rogw.tranp.cache.backend import CacheBackend
+from rogw.tranp.cache.cache import Cached, CacheSetting
+from rogw.tranp.cache.stats import CacheStats
+from rogw.tranp.data.version import Versions
+from rogw.tranp.errors import Errors
 from rogw.tranp.lang.annotation import implements, injectable
-from rogw.tranp.lang.module import module_path_to_filepath
 from rogw.tranp.module.module import Module
+from rogw.tranp.module.pack import LibraryPack
 from rogw.tranp.semantics.reflection.db import SymbolDB
 from rogw.tranp.semantics.reflection.serialization import IReflectionSerializer
 
@@ -37,31 +40,46 @@ class ISymbolDBPersistor(metaclass=ABCMeta):
 		...
 
 	@abstractmethod
-	def restore(self, module: Module, db: SymbolDB) -> None:
+	def restore(self, module: Module, db: SymbolDB) -> bool:
 		"""シンボルテーブルを復元
 
 		Args:
 			module: モジュール
 			db: シンボルテーブル
+		Returns:
+			True = 復元, False = 永続化されたデータが破損しているため復元せず
 		"""
 		...
 
 
 class SymbolDBPersistor(ISymbolDBPersistor):
-	"""シンボルテーブル永続化"""
+	"""シンボルテーブル永続化
+
+	Note:
+		```
+		* ライブラリーパックに格納済みのモジュールは、キャッシュより優先してパックから復元
+		* パックはキャッシュ設定に依らず利用
+		* ファイルからの復元・ファイルへの保存は、キャッシュキーのプレフィックス'symbols'として統計に記録 @see CacheStats
+		* 保存先はキャッシュバックエンドに委譲 @see CacheBackend
+		```
+	"""
+
+	Extention = '.symbols.json'
 
 	@injectable
-	def __init__(self, setting: CacheSetting, serializer: IReflectionSerializer, sources: ISourceLoader) -> None:
+	def __init__(self, setting: CacheSetting, serializer: IReflectionSerializer, backend: CacheBackend, pack: LibraryPack) -> None:
 		"""インスタンスを生成
 
 		Args:
 			setting: キャッシュ設定 @inject
 			serializer: シンボルシリアライザー @inject
-			sources (ISourceLoader) ソースコードローダー @inject
+			backend: キャッシュバックエンド @inject
+			pack: ライブラリーパック @inject
 		"""
 		self.setting = setting
 		self.serializer = serializer
-		self.sources = sources
+		self.backend = backend
+		self.pack = pack
 
 	@implements
 	def stored(self, module: Module) -> bool:
@@ -72,7 +90,7 @@ class SymbolDBPersistor(ISymbolDBPersistor):
 		Returns:
 			True = 永続化
 		"""
-		return self._can_restore(module, self._gen_filepath(module))
+		return self._packed(module) or self._can_restore(module, self._gen_identifier(module))
 
 	@implements
 	def store(self, module: Module, db: SymbolDB) -> None:
@@ -82,102 +100,114 @@ class SymbolDBPersistor(ISymbolDBPersistor):
 			module: モジュール
 			db: シンボルテーブル
 		"""
-		filepath = self._gen_filepath(module)
-		if self._can_store(module, filepath):
-			self._store(module, db, filepath)
+		identifier = self._gen_identifier(module)
+		if self._can_store(module, identifier):
+			size = self._store(module, db, identifier)
+			CacheStats.instance().miss('symbols', size)
 
 	@implements
-	def restore(self, module: Module, db: SymbolDB) -> None:
+	def restore(self, module: Module, db: SymbolDB) -> bool:
 		"""シンボルテーブルを復元
 
 		Args:
 			module: モジュール
 			db: シンボルテーブル
+		Returns:
+			True = 復元, False = 永続化されたデータが破損しているため復元せず
+		Note:
+			破損したデータは再度保存させるために破棄
 		"""
-		filepath = self._gen_filepath(module)
-		if self._can_restore(module, filepath):
-			self._restore(db, filepath)
+		if self._packed(module):
+			db.import_json(self.serializer, self.pack.get(module.path, 'symbols', module.identity()))
+			return True
+
+		identifier = self._gen_identifier(module)
+		if not self._can_restore(module, identifier):
+			return False
+
+		try:
+			start = time.perf_counter()
+			data, size = self._load(identifier)
+		except (OSError, ValueError, Errors.InvalidSchema):
+			self.backend.discard(identifier, self.Extention)
+			return False
+
+		db.import_json(self.serializer, data)
+		CacheStats.instance().hit('symbols', size, time.perf_counter() - start)
+		self.backend.touch(identifier, self.Extention)
+		return True
 
-	def _gen_filepath(self, module: Module) -> str:
-		"""保存ファイルの絶対パスを生成
+	def _packed(self, module: Module) -> bool:
+		"""ライブラリーパックに格納済みか判定
 
 		Args:
 			module: モジュール
 		Returns:
-			絶対パス
+			True = 格納済み
 		"""
-		basepath = module_path_to_filepath(module.path)
-		identity = module.identity()
-		filename = f'{basepath}-symbols-{identity}.json'
-		return os.path.abspath(os.path.join(os.getcwd(), self.setting.basedir, filename))
+		return module.path in self.pack and module.in_storage() and self.pack.exists(module.path, 'symbols', module.identity())
 
-	def _gen_glob_pattern(self, module: Module) -> str:
-		"""旧ファイル検索用のGlobパターンを生成
+	def _gen_identifier(self, module: Module) -> str:
+		"""保存先の一意な識別子を生成
 
 		Args:
 			module: モジュール
 		Returns:
-			Globパターン
+			一意な識別子
+		Note:
+			モジュールパスとモジュールの識別子(ソースコードのハッシュ値)から生成するコンテンツアドレス形式
 		"""
-		basepath = module_path_to_filepath(module.path)
-		filename = f'{basepath}-symbols-*.json'
-		return os.path.abspath(os.path.join(os.getcwd(), self.setting.basedir, filename))
+		identity = {'module': module.path, 'identity': module.identity(), '__version__': Versions.app}
+		return Cached.identifier(identity)
 
-	def _can_store(self, module: Module, filepath: str) -> bool:
+	def _can_store(self, module: Module, identifier: str) -> bool:
 		"""保存を実施するか判定
 
 		Args:
 			module: モジュール
-			filepath: ファイルパス
+			identifier: 一意な識別子
 		Returns:
 			True = 実施
 		"""
-		return module.in_storage() and not self.sources.exists(filepath)
+		return module.in_storage() and not self.backend.exists(identifier, self.Extention)
 
-	def _can_restore(self, module: Module, filepath: str) -> bool:
+	def _can_restore(self, module: Module, identifier: str) -> bool:
 		"""復元を実施するか判定
 
 		Args:
 			module: モジュール
-			filepath: ファイルパス
+			identifier: 一意な識別子
 		Returns:
 			True = 実施
 		"""
-		return self.setting.enabled and module.in_storage() and self.sources.exists(filepath)
+		return self.setting.enabled and module.in_storage() and self.backend.exists(identifier, self.Extention)
 
-	def _store(self, module: Module, db: SymbolDB, filepath: str) -> None:
+	def _store(self, module: Module, db: SymbolDB, identifier: str) -> int:
 		"""ストレージに保存
 
 		Args:
 			module: モジュール
 			db: シンボルテーブル
-			filepath: ファイルパス
+			identifier: 一意な識別子
+		Returns:
+			書き込んだバイト数
 		"""
-		for oldest in self._find_oldest(module):
-			os.unlink(oldest)
-
 		data = db.to_json(self.serializer, for_module_path=module.path)
-		with open(filepath, mode='wb') as f:
-			json_str = json.dumps(data, separators=(',', ':'))
-			f.write(json_str.encode('utf-8'))
+		payload = json.dumps(data, separators=(',', ':')).encode('utf-8')
+		self.backend.write(identifier, self.Extention, payload)
+		return len(payload)
 
-	def _restore(self, db: SymbolDB, filepath: str) -> None:
-		"""ストレージから復元
+	def _load(self, identifier: str) -> tuple[Any, int]:
+		"""ストレージから読み込み
 
 		Args:
-			db: シンボルテーブル
-			filepath: ファイルパス
-		"""
-		content = self.sources.load(filepath)
-		data = json.loads(content)
-		db.import_json(self.serializer, data)
-
-	def _find_oldest(self, module: Module) -> list[str]:
-		"""旧ファイルを検索
-
-		Args:
-			module: モジュール
+			identifier: 一意な識別子
 		Returns:
-			旧ファイルのパスリスト
+			(シリアライズデータ, 読み込んだバイト数)
+		Raises:
+			Errors.InvalidSchema: データが破損
+			OSError: 読み込みに失敗
+			ValueError: JSONの解析に失敗
 		"""
-		return glob.glob(self._gen_glob_pattern(module))
+		payload = self.backend.read(identifier, self.Extention)
+		return json.loads(payload), len(payload)
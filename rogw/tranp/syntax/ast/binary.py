@@ -0,0 +1,266 @@
+import struct
+import sys
+from array import array
+from typing import override
+
+from rogw.tranp.lang.annotation import implements
+from rogw.tranp.syntax.ast.entry import Entry, SourceMap
+
+
+class EntryTable:
+	"""配列形式のシンタックスツリー。バイナリー形式との相互変換を提供
+
+	Note:
+		```
+		### データ構造
+		* strings: エントリー名と終端記号の値を重複なしで格納した文字列テーブル
+		* nodes: ノード毎に(エントリー名, 値, 子の開始位置, 子の数)の4要素。値が-1のノードは子を持つエントリー
+		* children: ノード毎の子のノードインデックスを連結した配列。-1は空のエントリー
+		* source_maps: ノード毎に(開始行, 開始列, 終了行, 終了列)の4要素
+		* ルートエントリーのノードインデックスは常に0
+		### バイナリー形式
+		* マジックナンバー(8byte)
+		* ヘッダー(24byte, リトルエンディアン): バージョン, 文字列数, 文字列のバイト数, ノード数, 子の数, 予約
+		* 配列(リトルエンディアンの32bit整数): 文字列長(文字数), nodes, children, source_maps
+		* 文字列(UTF-8): 文字列テーブルの全要素を連結
+		```
+	"""
+
+	Magic = b'TRANPAST'
+	Version = 1
+	Header = struct.Struct('<6I')
+
+	@classmethod
+	def from_entry(cls, root: Entry) -> 'EntryTable':
+		"""エントリーから配列形式に変換
+
+		Args:
+			root: ルートエントリー
+		Returns:
+			インスタンス
+		"""
+		table = cls([], array('i'), array('i'), array('i'))
+		table.__build(root, {})
+		return table
+
+	@classmethod
+	def loads(cls, data: bytes) -> 'EntryTable':
+		"""バイナリー形式から復元
+
+		Args:
+			data: バイナリー
+		Returns:
+			インスタンス
+		Raises:
+			ValueError: マジックナンバー・バージョンが不一致
+		"""
+		magic_size = len(cls.Magic)
+		if data[:magic_size] != cls.Magic:
+			raise ValueError(f'Invalid magic number. magic: {data[:magic_size]!r}')
+
+		version, strings_size, text_size, nodes_size, children_size, _ = cls.Header.unpack_from(data, magic_size)
+		if version != cls.Version:
+			raise ValueError(f'Unsupported version. version: {version}')
+
+		offset = magic_size + cls.Header.size
+		lengths, offset = cls.__read_array(data, offset, strings_size)
+		nodes, offset = cls.__read_array(data, offset, nodes_size * 4)
+		children, offset = cls.__read_array(data, offset, children_size)
+		source_maps, offset = cls.__read_array(data, offset, nodes_size * 4)
+		text = data[offset:offset + text_size].decode('utf-8')
+
+		strings: list[str] = []
+		begin = 0
+		for length in lengths:
+			strings.append(text[begin:begin + length])
+			begin += length
+
+		return cls(strings, nodes, children, source_maps)
+
+	@classmethod
+	def __read_array(cls, data: bytes, offset: int, size: int) -> tuple[array, int]:
+		"""32bit整数の配列を読み込み
+
+		Args:
+			data: バイナリー
+			offset: 読み込み位置
+			size: 要素数
+		Returns:
+			(配列, 次の読み込み位置)
+		"""
+		values = array('i')
+		end = offset + size * values.itemsize
+		values.frombytes(data[offset:end])
+		if sys.byteorder == 'big':
+			values.byteswap()
+
+		return values, end
+
+	def __init__(self, strings: list[str], nodes: array, children: array, source_maps: array) -> None:
+		"""インスタンスを生成
+
+		Args:
+			strings: 文字列テーブル
+			nodes: ノード配列
+			children: 子のノードインデックス配列
+			source_maps: ソースマップ配列
+		"""
+		self.strings = strings
+		self.nodes = nodes
+		self.children = children
+		self.source_maps = source_maps
+
+	@property
+	def root(self) -> Entry:
+		"""Returns: ルートエントリー"""
+		return EntryOfTable(self, 0)
+
+	def dumps(self) -> bytes:
+		"""バイナリー形式に変換
+
+		Returns:
+			バイナリー
+		"""
+		text = ''.join(self.strings).encode('utf-8')
+		header = self.Header.pack(self.Version, len(self.strings), len(text), len(self.nodes) // 4, len(self.children), 0)
+		arrays = [array('i', [len(string) for string in self.strings]), self.nodes, self.children, self.source_maps]
+		if sys.byteorder == 'big':
+			arrays = [array('i', values) for values in arrays]
+			for values in arrays:
+				values.byteswap()
+
+		return b''.join([self.Magic, header, *[values.tobytes() for values in arrays], text])
+
+	def __build(self, entry: Entry, interned: dict[str, int]) -> int:
+		"""エントリーを再帰的に配列へ追加
+
+		Args:
+			entry: エントリー
+			interned: 文字列テーブルのインデックス
+		Returns:
+			ノードインデックス。空のエントリーは-1
+		"""
+		if entry.is_empty:
+			return -1
+
+		index = len(self.nodes) // 4
+		source_map = entry.source_map
+		self.source_maps.extend((*source_map['begin'], *source_map['end']))
+		if not entry.has_child:
+			self.nodes.extend((self.__intern(entry.name, interned), self.__intern(entry.value, interned), 0, 0))
+			return index
+
+		children = entry.children
+		begin = len(self.children)
+		self.nodes.extend((self.__intern(entry.name, interned), -1, begin, len(children)))
+		self.children.extend([-1] * len(children))
+		for offset, child in enumerate(children):
+			self.children[begin + offset] = self.__build(child, interned)
+
+		return index
+
+	def __intern(self, string: str, interned: dict[str, int]) -> int:
+		"""文字列テーブルに追加
+
+		Args:
+			string: 文字列
+			interned: 文字列テーブルのインデックス
+		Returns:
+			文字列テーブルのインデックス
+		"""
+		if string not in interned:
+			interned[string] = len(self.strings)
+			self.strings.append(string)
+
+		return interned[string]
+
+
+class EntryOfTable(Entry):
+	"""配列形式のシンタックスツリーのエントリー実装。配列から直接要素を参照"""
+
+	def __init__(self, table: EntryTable, index: int) -> None:
+		"""インスタンスを生成
+
+		Args:
+			table: 配列形式のシンタックスツリー
+			index: ノードインデックス。-1は空のエントリー
+		"""
+		self.__table = table
+		self.__index = index
+
+	@property
+	@implements
+	def source(self) -> tuple[EntryTable, int]:
+		"""Returns: オリジナルのエントリー(シンタックスツリー, ノードインデックス)"""
+		return self.__table, self.__index
+
+	@property
+	@implements
+	def name(self) -> str:
+		"""Returns: エントリー名 Note: 空の場合を考慮"""
+		if self.__index < 0:
+			return self.empty_name
+
+		return self.__table.strings[self.__table.nodes[self.__index * 4]]
+
+	@property
+	@implements
+	def has_child(self) -> bool:
+		"""Returns: True = 子を持つエントリー"""
+		return self.__index >= 0 and self.__table.nodes[self.__index * 4 + 1] < 0
+
+	@property
+	@implements
+	def children(self) -> list[Entry]:
+		"""Returns: 配下のエントリーリスト"""
+		if not self.has_child:
+			return []
+
+		nodes = self.__table.nodes
+		begin = nodes[self.__index * 4 + 2]
+		end = begin + nodes[self.__index * 4 + 3]
+		return [EntryOfTable(self.__table, child) for child in self.__table.children[begin:end]]
+
+	@property
+	@implements
+	def is_terminal(self) -> bool:
+		"""Returns: True = 終端記号"""
+		return self.__index >= 0 and self.__table.nodes[self.__index * 4 + 1] >= 0
+
+	@property
+	@implements
+	def value(self) -> str:
+		"""Returns: 終端記号の値"""
+		return self.__table.strings[self.__table.nodes[self.__index * 4 + 1]] if self.is_terminal else ''
+
+	@property
+	@implements
+	def is_empty(self) -> bool:
+		"""Returns: True = 空
+
+		Note:
+			```
+			* Grammarの定義上存在するが、構文解析の結果で空になったエントリー
+			* 例えば以下の様な関数の定義の場合[parameters]が対象となり、引数がない関数の場合、エントリーとしては存在するが内容は空になる
+			例: function_def: "def" name "(" [parameters] ")" "->" ":" block
+			```
+		"""
+		return self.__index < 0
+
+	@property
+	@override
+	def source_map(self) -> SourceMap:
+		"""Returns: ソースマップ
+
+		Note:
+			```
+			begin: 開始位置(行/列)
+			end: 終了位置(行/列)
+			```
+		"""
+		if self.__index < 0:
+			return {'begin': (0, 0), 'end': (0, 0)}
+
+		begin = self.__index * 4
+		line, column, end_line, end_column = self.__table.source_maps[begin:begin + 4]
+		return {'begin': (line, column), 'end': (end_line, end_column)}
@@ -12,11 +12,13 @@ class ParserSetting:
 		grammer: Grammarファイルへのパス(実行ディレクトリーからの相対パス)
 		start: ルートエントリータグ(default = 'file_input')
 		algorithem: パーサーアルゴリズム(default = 'lalr')
+		backend: シンタックスパーサーのバックエンド。'lark' = Lark, 'tranp' = 自前のパーサー(default = 'lark')
 	"""
 
 	grammar: str
 	start: str = 'file_input'
 	algorithem: str = 'lalr'
+	backend: str = 'lark'
 
 
 class SyntaxParser(Protocol):
@@ -1,6 +1,8 @@
 from rogw.tranp.cache.memo2 import Memoize
 from rogw.tranp.errors import Errors
 from rogw.tranp.lang.annotation import implements, injectable
+from rogw.tranp.lang.profile import Tracer
+from rogw.tranp.module.types import ModulePath
 from rogw.tranp.syntax.ast.cache import EntryCache
 from rogw.tranp.syntax.ast.entry import Entry, SourceMap
 from rogw.tranp.syntax.ast.finder import ASTFinder
@@ -14,18 +16,20 @@ class Nodes(Query[Node]):
 	"""ノードクエリーインターフェイス。ASTを元にノードの探索し、リゾルバーを介してインスタンスを解決"""
 
 	@injectable
-	def __init__(self, resolver: NodeResolver, root: Entry) -> None:
+	def __init__(self, module_path: ModulePath, resolver: NodeResolver, root: Entry) -> None:
 		"""インスタンスを生成
 
 		Args:
+			module_path: モジュールパス @inject
 			resolver: ノードリゾルバー @inject
 			root: ASTのルート要素 @inject
 		"""
 		self.__memo = Memoize()
 		self.__resolver = resolver
 		self.__entries = EntryCache[Entry]()
-		for full_path, entry in ASTFinder().full_pathfy(root).items():
-			self.__entries.add(full_path, entry)
+		with Tracer.instance().span('index', module=module_path.path):
+			for full_path, entry in ASTFinder().full_pathfy(root).items():
+				self.__entries.add(full_path, entry)
 
 	def __resolve(self, entry: Entry, full_path: str) -> Node:
 		"""エントリーからノードを解決し、パスとマッピングしてキャッシュ
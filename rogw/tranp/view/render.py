@@ -3,6 +3,7 @@ from typing import Any, Callable, Literal, NamedTuple, Protocol, TypeAlias
 from jinja2 import Environment, FileSystemLoader
 
 from rogw.tranp.lang.middleware import Middleware
+from rogw.tranp.lang.profile import Tracer
 from rogw.tranp.lang.translator import Translator
 
 RendererEmitter: TypeAlias = Middleware
@@ -65,4 +66,5 @@ class Renderer:
 		Returns:
 			レンダリング結果
 		"""
-		return self.__renderer.get_template(f'{template}.j2').render(vars)
+		with Tracer.instance().span('render', category='render', template=template):
+			return self.__renderer.get_template(f'{template}.j2').render(vars)
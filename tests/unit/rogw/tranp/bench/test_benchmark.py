@@ -0,0 +1,20 @@
+from unittest import TestCase
+
+from rogw.tranp.bench.benchmark import BenchResult, PhaseResult, compare
+from rogw.tranp.test.helper import data_provider
+
+
+def _result(elapsed: float, rss: float) -> BenchResult:
+	phase: PhaseResult = {'elapsed': elapsed, 'modules_per_sec': 1.0, 'lines_per_sec': 1.0, 'peak_rss_mb': rss}
+	return {'version': '1.0.0', 'shape': {}, 'modules': 1, 'lines': 1, 'errors': 0, 'phases': {'parse': phase}, 'syntax': {}}
+
+
+class TestBenchmark(TestCase):
+	@data_provider([
+		(_result(1.0, 100.0), _result(1.1, 100.0), 1.2, [False, False]),
+		(_result(1.0, 100.0), _result(1.5, 100.0), 1.2, [True, False]),
+		(_result(1.0, 100.0), _result(1.0, 200.0), 1.2, [False, True]),
+		(_result(0.0, 0.0), _result(1.0, 1.0), 1.2, [False, False]),
+	])
+	def test_compare(self, baseline: BenchResult, current: BenchResult, threshold: float, expected: list[bool]) -> None:
+		self.assertEqual([comparison.regressed for comparison in compare(current, baseline, threshold)], expected)
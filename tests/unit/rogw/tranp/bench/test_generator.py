@@ -0,0 +1,27 @@
+import ast
+from unittest import TestCase
+
+from rogw.tranp.bench.generator import Shape, SourceGenerator
+from rogw.tranp.test.helper import data_provider
+
+
+class TestSourceGenerator(TestCase):
+	@data_provider([
+		(Shape(fanout=2), 0, []),
+		(Shape(fanout=2), 1, [0]),
+		(Shape(fanout=2), 5, [4, 3]),
+		(Shape(fanout=0), 5, []),
+	])
+	def test_imports_of(self, shape: Shape, index: int, expected: list[int]) -> None:
+		self.assertEqual(SourceGenerator(shape).imports_of(index), expected)
+
+	@data_provider([
+		(Shape(classes=2, methods=3, depth=3, fanout=2, generics=True), 3, 2, 6),
+		(Shape(classes=1, methods=1, depth=0, fanout=0, generics=False), 0, 1, 1),
+	])
+	def test_source(self, shape: Shape, index: int, expected_classes: int, expected_methods: int) -> None:
+		tree = ast.parse(SourceGenerator(shape).source(index))
+		classes = [node for node in tree.body if isinstance(node, ast.ClassDef) and node.name != 'Box']
+		methods = [node for klass in classes for node in klass.body if isinstance(node, ast.FunctionDef) and node.name.startswith('method_')]
+		self.assertEqual(len(classes), expected_classes)
+		self.assertEqual(len(methods), expected_methods)
@@ -0,0 +1,6 @@
+from tests.unit.rogw.tranp.bin.fixtures.fixture_cache_depend import Depend
+
+
+def main() -> None:
+	depend = Depend()
+	print(depend.calc(1))
@@ -0,0 +1,11 @@
+from tests.unit.rogw.tranp.bin.fixtures.fixture_transpile_depend import Depend
+
+
+class Sub(Depend):
+	def twice(self, a: int) -> int:
+		return self.calc(a) * 2
+
+
+def main() -> None:
+	sub = Sub()
+	print(sub.twice(1))
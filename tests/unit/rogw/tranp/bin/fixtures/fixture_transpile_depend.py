@@ -0,0 +1,9 @@
+class Depend:
+	value: int
+
+	def __init__(self) -> None:
+		self.value = 0
+
+	def calc(self, a: int) -> int:
+		total = a + self.value
+		return total
@@ -0,0 +1,81 @@
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from unittest import TestCase
+
+from rogw.tranp.bin.cache import Args, CacheApp
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.cache.stats import CacheStats
+from rogw.tranp.module.types import ModulePath
+from rogw.tranp.test.helper import data_provider
+
+
+class TestArgs(TestCase):
+	@data_provider([
+		([], {'command': '', 'dir': '', 'backend': '', 'config': 'example/config.yml', 'input_globs': [], 'jobs': 1, 'help': False}),
+		(['warm'], {'command': 'warm', 'dir': '', 'backend': '', 'config': 'example/config.yml', 'input_globs': [], 'jobs': 1, 'help': False}),
+		(['warm', '-j', '4', '-c', 'a.yml', '-i', 'a/*.py', '-i', 'b/*.py'], {'command': 'warm', 'dir': '', 'backend': '', 'config': 'a.yml', 'input_globs': ['a/*.py', 'b/*.py'], 'jobs': 4, 'help': False}),
+		(['stats', '--dir', '.cache/other', '-b', 'packed'], {'command': 'stats', 'dir': '.cache/other', 'backend': 'packed', 'config': 'example/config.yml', 'input_globs': [], 'jobs': 1, 'help': False}),
+		(['-h'], {'command': '', 'dir': '', 'backend': '', 'config': 'example/config.yml', 'input_globs': [], 'jobs': 1, 'help': True}),
+	])
+	def test_parse(self, argv: list[str], expected: dict[str, str | int | bool | list[str]]) -> None:
+		args = Args(argv)
+		actual = {key: getattr(args, key) for key in expected.keys()}
+		self.assertEqual(expected, actual)
+
+
+class TestCacheApp(TestCase):
+	fixture_glob = 'tests/unit/rogw/tranp/bin/fixtures/fixture_cache.py'
+
+	@data_provider([
+		(['a', 'b', 'a', 'c', 'b'], ['a', 'b', 'c']),
+		(['c', 'b', 'a'], ['c', 'b', 'a']),
+		([], []),
+	])
+	def test_unique_module_paths(self, paths: list[str], expected: list[str]) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			app = CacheApp(Args(['--dir', basedir]), CacheSetting(basedir='.cache/tranp'))
+			actual = app.unique_module_paths([ModulePath(path, language='py') for path in paths])
+			self.assertEqual(expected, [module_path.path for module_path in actual])
+
+	@data_provider([
+		(['-b', 'packed'], 'packed'),
+		([], 'files'),
+	])
+	def test_setting(self, argv: list[str], expected_backend: str) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			app = CacheApp(Args(['--dir', basedir, *argv]), CacheSetting(basedir='.cache/tranp'))
+			self.assertEqual(basedir, app.setting.basedir)
+			self.assertEqual(expected_backend, app.setting.backend)
+
+	@data_provider([
+		(['-j', '1'],),
+		(['-j', '2'],),
+	])
+	def test_run_warm(self, argv: list[str]) -> None:
+		CacheStats.instance().drain()
+		with tempfile.TemporaryDirectory() as basedir:
+			app = CacheApp(Args(['warm', '--dir', basedir, '-i', self.fixture_glob, *argv]), CacheSetting(basedir='.cache/tranp'))
+			with redirect_stdout(io.StringIO()):
+				self.assertEqual(0, app.run())
+
+			self.assertGreater(len(app.backend.files()), 0)
+			self.assertTrue(os.path.exists(app.storage.stats_filepath))
+
+			warmed = len(app.backend.files())
+			CacheStats.instance().drain()
+			with redirect_stdout(io.StringIO()):
+				app.run()
+
+			counters = CacheStats.instance().counters
+			self.assertEqual(warmed, len(app.backend.files()))
+			self.assertEqual(0, sum(counter['misses'] for counter in counters.values()))
+
+	def test_run_warm_disabled(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			app = CacheApp(Args(['warm', '--dir', basedir, '-i', self.fixture_glob]), CacheSetting(basedir='.cache/tranp', enabled=False))
+			with redirect_stdout(io.StringIO()):
+				app.run()
+
+			self.assertEqual(0, len(app.backend.files()))
@@ -0,0 +1,96 @@
+import glob
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from typing import Any
+from unittest import TestCase
+
+import yaml
+
+from rogw.tranp.app.app import App
+from rogw.tranp.bin.transpile import Args, TranspileApp, Worker
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.data.meta.manifest import BuildManifest, ManifestEntry
+from rogw.tranp.lang.annotation import injectable
+from rogw.tranp.lang.module import to_fullyname
+from rogw.tranp.module.types import ModulePath
+
+
+@injectable
+def make_cache_setting(args: Args) -> CacheSetting:
+	"""キャッシュ設定データを生成
+
+	Args:
+		args: 引数 @inject
+	Returns:
+		キャッシュ設定データ
+	Note:
+		ワーカープロセスでも同じ設定を使用するため、コンフィグのDI定義から参照。キャッシュはコンフィグと同じディレクトリーに保存
+	"""
+	return CacheSetting(basedir=os.path.join(os.path.dirname(args.config), 'cache'))
+
+
+class TestTranspileApp(TestCase):
+	fixture_glob = 'tests/unit/rogw/tranp/bin/fixtures/fixture_transpile*.py'
+	fixture_module_path = 'tests.unit.rogw.tranp.bin.fixtures.fixture_transpile'
+
+	def make_config(self, basedir: str) -> str:
+		with open('example/config.yml') as f:
+			config: dict[str, Any] = yaml.safe_load(f)
+
+		config['input_globs'] = [self.fixture_glob]
+		config['output_dirs'] = [os.path.join(basedir, 'out')]
+		config['di'] = {to_fullyname(CacheSetting): f'{__name__}.{make_cache_setting.__name__}'}
+		filepath = os.path.join(basedir, 'config.yml')
+		with open(filepath, mode='w') as f:
+			yaml.safe_dump(config, f)
+
+		return filepath
+
+	def transpile(self, basedir: str, jobs: int) -> tuple[dict[str, str], dict[str, ManifestEntry]]:
+		args = Args(['-c', self.make_config(basedir), '-j', str(jobs)])
+		with redirect_stdout(io.StringIO()):
+			App(TranspileApp.definitions(args)).run(TranspileApp.run)
+
+		output_dir = os.path.join(basedir, 'out')
+		outputs: dict[str, str] = {}
+		for filepath in glob.glob(os.path.join(output_dir, '**', '*.h'), recursive=True):
+			with open(filepath) as f:
+				outputs[os.path.relpath(filepath, output_dir)] = f.read()
+
+		manifests = glob.glob(os.path.join(basedir, 'cache', 'manifest-*.json'))
+		self.assertEqual(1, len(manifests))
+		entries = BuildManifest.load(manifests[0]).entries
+		for entry in entries.values():
+			if entry['output'] is not None:
+				entry['output']['filepath'] = os.path.relpath(entry['output']['filepath'], output_dir)
+
+		return outputs, entries
+
+	def test_run_parallel(self) -> None:
+		with tempfile.TemporaryDirectory() as serial_dir, tempfile.TemporaryDirectory() as parallel_dir:
+			serial_outputs, serial_entries = self.transpile(serial_dir, 1)
+			parallel_outputs, parallel_entries = self.transpile(parallel_dir, 2)
+
+		self.assertEqual(2, len(serial_outputs))
+		self.assertEqual(serial_outputs, parallel_outputs)
+		self.assertIn(self.fixture_module_path, serial_entries)
+		self.assertIn(f'{self.fixture_module_path}_depend', serial_entries[self.fixture_module_path]['imports'])
+		self.assertEqual(serial_entries, parallel_entries)
+
+	def test_worker_transpile(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			try:
+				Worker.setup(Args(['-c', self.make_config(basedir)]))
+				content, entries, events, counters = Worker.transpile(ModulePath(self.fixture_module_path, language='py'))
+			finally:
+				Worker.runner = None
+
+		self.assertIn('class Sub', content)
+		output = entries[self.fixture_module_path]['output']
+		self.assertIsNotNone(output)
+		self.assertEqual(os.path.join(basedir, 'out', 'tests/unit/rogw/tranp/bin/fixtures/fixture_transpile.h'), output['filepath'] if output else '')
+		self.assertIsNone(entries[f'{self.fixture_module_path}_depend']['output'])
+		self.assertEqual([], events)
+		self.assertGreater(len(counters), 0)
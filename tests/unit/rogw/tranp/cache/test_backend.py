@@ -0,0 +1,132 @@
+import os
+import tempfile
+import time
+from typing import Callable
+from unittest import TestCase
+
+from rogw.tranp.cache.backend import CacheBackend, FileBackend, PackedBackend, read_verified, write_atomic
+from rogw.tranp.errors import Errors
+from rogw.tranp.test.helper import data_provider
+
+
+class TestAtomic(TestCase):
+	@data_provider([
+		(b'',),
+		(b'payload',),
+	])
+	def test_write_atomic(self, payload: bytes) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			filepath = os.path.join(basedir, 'a', 'b.bin')
+			write_atomic(filepath, payload)
+			self.assertEqual(read_verified(filepath), payload)
+			self.assertEqual(os.listdir(os.path.dirname(filepath)), ['b.bin'])
+
+	@data_provider([
+		(lambda content: content[:3],),
+		(lambda content: content[:-1],),
+		(lambda content: b'x' + content[1:],),
+		(lambda content: content + b'x',),
+	])
+	def test_read_verified_corrupted(self, corrupt: Callable[[bytes], bytes]) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			filepath = os.path.join(basedir, 'b.bin')
+			write_atomic(filepath, b'payload')
+			with open(filepath, mode='rb') as f:
+				content = f.read()
+
+			with open(filepath, mode='wb') as f:
+				f.write(corrupt(content))
+
+			with self.assertRaises(Errors.InvalidSchema):
+				read_verified(filepath)
+
+
+class TestCacheBackend(TestCase):
+	@data_provider([
+		(FileBackend,),
+		(PackedBackend,),
+	])
+	def test_read_write(self, ctor: Callable[[str], CacheBackend]) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			backend = ctor(basedir)
+			self.assertEqual(backend.exists('aaa', '.ast'), False)
+			backend.write('aaa', '.ast', b'first')
+			backend.write('aaa', '.json', b'second')
+			self.assertEqual(backend.exists('aaa', '.ast'), True)
+			self.assertEqual(backend.read('aaa', '.ast'), b'first')
+			self.assertEqual(backend.read('aaa', '.json'), b'second')
+			self.assertEqual(len(backend.files()), 2)
+			with self.assertRaises(FileNotFoundError):
+				backend.read('bbb', '.ast')
+
+	@data_provider([
+		(FileBackend,),
+		(PackedBackend,),
+	])
+	def test_discard(self, ctor: Callable[[str], CacheBackend]) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			backend = ctor(basedir)
+			backend.write('aaa', '.ast', b'first')
+			backend.discard('aaa', '.ast')
+			self.assertEqual(backend.exists('aaa', '.ast'), False)
+			backend.write('aaa', '.ast', b'second')
+			self.assertEqual(backend.read('aaa', '.ast'), b'second')
+
+	@data_provider([
+		(FileBackend,),
+		(PackedBackend,),
+	])
+	def test_gc(self, ctor: Callable[[str], CacheBackend]) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			backend = ctor(basedir)
+			for identifier in ['aaa', 'bbb', 'ccc']:
+				backend.write(identifier, '.ast', b'0' * 100)
+				time.sleep(0.01)
+
+			removed = backend.gc(250, 0)
+			self.assertEqual(len(removed), 1)
+			self.assertEqual(backend.exists('aaa', '.ast'), False)
+			self.assertEqual(ctor(basedir).exists('aaa', '.ast'), False)
+			self.assertEqual(ctor(basedir).read('ccc', '.ast'), b'0' * 100)
+
+
+class TestPackedBackend(TestCase):
+	def test_shared(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			writer = PackedBackend(basedir)
+			reader = PackedBackend(basedir)
+			writer.write('aaa', '.ast', b'first')
+			self.assertEqual(reader.read('aaa', '.ast'), b'first')
+			writer.write('bbb', '.ast', b'second')
+			self.assertEqual(reader.exists('bbb', '.ast'), True)
+			reader.write('bbb', '.ast', b'ignored')
+			self.assertEqual(PackedBackend(basedir).read('bbb', '.ast'), b'second')
+
+	def test_corrupted(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			backend = PackedBackend(basedir)
+			backend.write('aaa', '.ast', b'first')
+			filepath = os.path.join(basedir, 'objects.pack')
+			with open(filepath, mode='r+b') as f:
+				f.seek(-1, os.SEEK_END)
+				f.write(b'x')
+
+			with self.assertRaises(Errors.InvalidSchema):
+				PackedBackend(basedir).read('aaa', '.ast')
+
+			backend = PackedBackend(basedir)
+			backend.discard('aaa', '.ast')
+			backend.write('aaa', '.ast', b'second')
+			self.assertEqual(PackedBackend(basedir).read('aaa', '.ast'), b'second')
+
+	def test_torn_tail(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			PackedBackend(basedir).write('aaa', '.ast', b'first')
+			filepath = os.path.join(basedir, 'objects.pack')
+			with open(filepath, mode='ab') as f:
+				f.write(b'\x03\x00\x00\x00')
+
+			backend = PackedBackend(basedir)
+			backend.write('bbb', '.ast', b'second')
+			self.assertEqual(PackedBackend(basedir).read('aaa', '.ast'), b'first')
+			self.assertEqual(PackedBackend(basedir).read('bbb', '.ast'), b'second')
@@ -0,0 +1,90 @@
+import glob
+import os
+import tempfile
+from typing import IO
+from unittest import TestCase
+
+from rogw.tranp.cache.backend import CacheBackend, FileBackend, PackedBackend
+from rogw.tranp.cache.cache import CacheProvider, CacheSetting
+from rogw.tranp.test.helper import data_provider
+
+
+class TextStored:
+	def __init__(self, text: str) -> None:
+		self.text = text
+
+	@classmethod
+	def load(cls, stream: IO) -> 'TextStored':
+		return cls(stream.read().decode('utf-8'))
+
+	def save(self, stream: IO) -> None:
+		stream.write(self.text.encode('utf-8'))
+
+
+class TestCacheProvider(TestCase):
+	def load(self, basedir: str, cache_key: str, identity: dict[str, str], text: str, content_addressed: bool, backend: CacheBackend | None = None) -> str:
+		caches = CacheProvider(CacheSetting(basedir=basedir), backend or FileBackend(basedir))
+
+		@caches.get(cache_key, identity=identity, format='txt', content_addressed=content_addressed)
+		def factory() -> TextStored:
+			return TextStored(text)
+
+		return factory().text
+
+	@data_provider([
+		(True, 'a/b', 'c/d', 'hash-1', 'hash-1', 'first', 1),
+		(True, 'a/b', 'a/b', 'hash-1', 'hash-2', 'second', 2),
+		(False, 'a/b', 'c/d', 'hash-1', 'hash-1', 'second', 2),
+		(False, 'a/b', 'a/b', 'hash-1', 'hash-2', 'second', 1),
+	])
+	def test_get(self, content_addressed: bool, key_a: str, key_b: str, hash_a: str, hash_b: str, expected: str, expected_files: int) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			self.assertEqual(self.load(basedir, key_a, {'source': hash_a}, 'first', content_addressed), 'first')
+			self.assertEqual(self.load(basedir, key_b, {'source': hash_b}, 'second', content_addressed), expected)
+			self.assertEqual(len(glob.glob(os.path.join(basedir, '**/*.txt'), recursive=True)), expected_files)
+
+	def test_get_content_addressed_layout(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			self.load(basedir, 'a/b', {'source': 'hash-1'}, 'first', True)
+			founds = glob.glob(os.path.join(basedir, 'objects', '*', '*.txt'))
+			self.assertEqual(len(founds), 1)
+			dirname, filename = os.path.split(founds[0])
+			self.assertEqual(filename.startswith(os.path.basename(dirname)), True)
+
+	def test_get_corrupted(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			self.load(basedir, 'a/b', {'source': 'hash-1'}, 'first', True)
+			founds = glob.glob(os.path.join(basedir, 'objects', '*', '*.txt'))
+			with open(founds[0], mode='r+b') as f:
+				f.truncate(3)
+
+			self.assertEqual(self.load(basedir, 'a/b', {'source': 'hash-1'}, 'second', True), 'second')
+			self.assertEqual(self.load(basedir, 'a/b', {'source': 'hash-1'}, 'third', True), 'second')
+
+	def test_get_packed(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			self.assertEqual(self.load(basedir, 'a/b', {'source': 'hash-1'}, 'first', True, PackedBackend(basedir)), 'first')
+			self.assertEqual(self.load(basedir, 'c/d', {'source': 'hash-1'}, 'second', True, PackedBackend(basedir)), 'first')
+			self.assertEqual(self.load(basedir, 'a/b', {'source': 'hash-2'}, 'second', True, PackedBackend(basedir)), 'second')
+			self.assertEqual(sorted(os.listdir(basedir)), ['.lock', 'objects.pack'])
+
+	def test_get_memory_bounded(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			caches = CacheProvider(CacheSetting(basedir=basedir, memory_max_count=1), FileBackend(basedir))
+
+			def load(cache_key: str, text: str) -> str:
+				@caches.get(cache_key, identity={'source': cache_key}, format='txt', content_addressed=True)
+				def factory() -> TextStored:
+					return TextStored(text)
+
+				return factory().text
+
+			self.assertEqual(load('a', 'first'), 'first')
+			self.assertEqual(load('b', 'second'), 'second')
+			self.assertEqual(load('a', 'ignored'), 'first')
+			self.assertEqual(caches.metrics['count'], 1)
+			self.assertEqual(caches.metrics['evictions'], 2)
+			caches.release('b')
+			caches.release('a')
+			self.assertEqual(caches.metrics['count'], 0)
+			self.assertEqual(load('a', 'ignored'), 'first')
@@ -0,0 +1,69 @@
+import gc
+from unittest import TestCase
+
+from rogw.tranp.cache.lru import LRUCache, LRUMetrics
+from rogw.tranp.test.helper import data_provider
+
+
+class Value:
+	def __init__(self, name: str) -> None:
+		self.name = name
+
+
+class TestLRUCache(TestCase):
+	@data_provider([
+		(0, 0, [('a', 1), ('b', 1), ('c', 1)], ['a', 'b', 'c']),
+		(2, 0, [('a', 1), ('b', 1), ('c', 1)], ['b', 'c']),
+		(0, 250, [('a', 100), ('b', 100), ('c', 100)], ['b', 'c']),
+		(0, 50, [('a', 100), ('b', 100)], ['b']),
+		(2, 0, [('a', 1), ('b', 1), ('a', 1), ('c', 1)], ['a', 'c']),
+	])
+	def test_put(self, max_count: int, max_size: int, puts: list[tuple[str, int]], expected: list[str]) -> None:
+		cache = LRUCache[str, str](max_count=max_count, max_size=max_size)
+		for key, size in puts:
+			cache.put(key, key, size)
+
+		self.assertEqual([key for key in ['a', 'b', 'c'] if key in cache], expected)
+
+	def test_get(self) -> None:
+		cache = LRUCache[str, str](max_count=2)
+		cache.put('a', 'A')
+		cache.put('b', 'B')
+		self.assertEqual(cache.get('a'), 'A')
+		cache.put('c', 'C')
+		self.assertEqual(cache.get('b'), None)
+		self.assertEqual(cache.get('b', 'default'), 'default')
+		expected: LRUMetrics = {'hits': 1, 'misses': 2, 'evictions': 1, 'count': 2, 'size': 0}
+		self.assertEqual(cache.metrics, expected)
+
+	def test_pop(self) -> None:
+		cache = LRUCache[str, str](max_size=100)
+		cache.put('a', 'A', 60)
+		cache.put('b', 'B', 40)
+		self.assertEqual(cache.pop('a'), 'A')
+		self.assertEqual(cache.pop('a'), None)
+		self.assertEqual(cache.size, 40)
+		self.assertEqual(len(cache), 1)
+
+	def test_on_evict(self) -> None:
+		evicted: list[str] = []
+		cache = LRUCache[str, str](max_count=1, on_evict=evicted.append)
+		cache.put('a', 'A')
+		cache.put('b', 'B')
+		cache.pop('b')
+		cache.put('c', 'C')
+		self.assertEqual(evicted, ['a'])
+
+	def test_weak(self) -> None:
+		cache = LRUCache[str, Value](max_count=1, weak=True)
+		alive = Value('a')
+		cache.put('a', alive, 10)
+		cache.put('b', Value('b'), 20)
+		self.assertEqual(len(cache), 1)
+		self.assertEqual(cache.get('a'), alive)
+		self.assertEqual(cache.size, 10)
+		del alive
+		cache.put('c', Value('c'))
+		gc.collect()
+		self.assertEqual(cache.get('a'), None)
+		self.assertEqual(cache.metrics['evictions'], 3)
@@ -0,0 +1,86 @@
+import http.client
+import os
+import socket
+import tempfile
+import threading
+from unittest import TestCase
+
+from rogw.tranp.cache.backend import FileBackend
+from rogw.tranp.cache.remote import CacheServer, RemoteBackend, RemoteCache, split_key
+from rogw.tranp.test.helper import data_provider
+
+
+class TestRemote(TestCase):
+	def setUp(self) -> None:
+		self.tmpdir = tempfile.TemporaryDirectory()
+		self.server = CacheServer(FileBackend(os.path.join(self.tmpdir.name, 'server')))
+		self.thread = threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.01})
+		self.thread.start()
+
+	def tearDown(self) -> None:
+		self.server.shutdown()
+		self.server.server_close()
+		self.thread.join()
+		self.tmpdir.cleanup()
+
+	def make_backend(self, name: str, url: str = '') -> RemoteBackend:
+		return RemoteBackend(FileBackend(os.path.join(self.tmpdir.name, name)), RemoteCache(url or self.server.url, timeout=1.0))
+
+	@data_provider([
+		('0123456789abcdef0123456789abcdef.ast', ('0123456789abcdef0123456789abcdef', '.ast')),
+		('0123456789abcdef0123456789abcdef.symbols.json', ('0123456789abcdef0123456789abcdef', '.symbols.json')),
+		('0123456789abcdef0123456789abcdef', ('0123456789abcdef0123456789abcdef', '')),
+		('../0123456789abcdef0123456789abcdef.ast', None),
+		('0123456789abcdef.ast', None),
+	])
+	def test_split_key(self, key: str, expected: tuple[str, str] | None) -> None:
+		self.assertEqual(split_key(key), expected)
+
+	def test_share(self) -> None:
+		identifier = '0123456789abcdef0123456789abcdef'
+		machine_a = self.make_backend('a')
+		machine_b = self.make_backend('b')
+		self.assertEqual(machine_b.exists(identifier, '.ast'), False)
+		machine_a.write(identifier, '.ast', b'payload')
+		self.assertEqual(machine_b.exists(identifier, '.ast'), True)
+		self.assertEqual(machine_b.read(identifier, '.ast'), b'payload')
+		self.assertEqual(FileBackend(os.path.join(self.tmpdir.name, 'b')).read(identifier, '.ast'), b'payload')
+
+	def test_invalid_key(self) -> None:
+		remote = RemoteCache(self.server.url)
+		self.assertEqual(remote.put('invalid', b'payload'), False)
+		self.assertEqual(remote.get('invalid'), None)
+		self.assertEqual(remote.available, True)
+
+	@data_provider([
+		({}, 411),
+		({'Content-Length': 'abc'}, 400),
+		({'Content-Length': '-1'}, 400),
+		({'Content-Length': '1e3'}, 400),
+		({'Content-Length': str(CacheServer.MaxPayloadSize + 1)}, 413),
+	])
+	def test_put_invalid_length(self, headers: dict[str, str], expected: int) -> None:
+		host, port = self.server.server_address[:2]
+		connection = http.client.HTTPConnection(str(host), int(port), timeout=1.0)
+		try:
+			connection.putrequest('PUT', '/objects/0123456789abcdef0123456789abcdef.ast')
+			for key, value in headers.items():
+				connection.putheader(key, value)
+
+			connection.endheaders()
+			response = connection.getresponse()
+			self.assertEqual(response.status, expected)
+			self.assertEqual(response.getheader('Connection'), 'close')
+		finally:
+			connection.close()
+
+	def test_unavailable(self) -> None:
+		identifier = '0123456789abcdef0123456789abcdef'
+		with socket.socket() as closed:
+			closed.bind(('127.0.0.1', 0))
+			url = f'http://127.0.0.1:{closed.getsockname()[1]}'
+
+		machine = self.make_backend('a', url)
+		machine.write(identifier, '.ast', b'payload')
+		self.assertEqual(machine.read(identifier, '.ast'), b'payload')
+		self.assertEqual(machine.exists('fedcba9876543210fedcba9876543210', '.ast'), False)
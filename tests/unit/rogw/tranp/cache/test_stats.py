@@ -0,0 +1,58 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from rogw.tranp.cache.stats import CacheStats
+from rogw.tranp.test.helper import data_provider
+
+
+class TestCacheStats(TestCase):
+	@data_provider([
+		('parser.cache', 'parser.cache'),
+		('path/to/module', 'path'),
+		('symbols', 'symbols'),
+	])
+	def test_prefix_of(self, cache_key: str, expected: str) -> None:
+		self.assertEqual(CacheStats.prefix_of(cache_key), expected)
+
+	def test_counters(self) -> None:
+		stats = CacheStats()
+		stats.hit('a/b', 10, 0.5)
+		stats.hit('a/c', 20, 0.25)
+		stats.miss('a/b', 30)
+		stats.miss('b', 40)
+		self.assertEqual(stats.counters, {
+			'a': {'hits': 2, 'misses': 1, 'bytes_read': 30, 'bytes_written': 30, 'load_time': 0.75},
+			'b': {'hits': 0, 'misses': 1, 'bytes_read': 0, 'bytes_written': 40, 'load_time': 0.0},
+		})
+
+	def test_save(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'sub', 'stats.jsonl')
+			stats = CacheStats()
+			stats.hit('a/b', 10, 0.5)
+			stats.save(filepath)
+			stats.save(filepath)
+			stats.miss('a/b', 30)
+			stats.save(filepath)
+			with open(filepath, mode='ab') as f:
+				f.write(b'{broken\n')
+
+			self.assertEqual(stats.counters, {})
+			self.assertEqual(CacheStats.load(filepath), {
+				'a': {'hits': 1, 'misses': 1, 'bytes_read': 10, 'bytes_written': 30, 'load_time': 0.5},
+			})
+
+	def test_save_max_records(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'stats.jsonl')
+			stats = CacheStats()
+			for index in range(5):
+				stats.miss('a/b', 10 ** index)
+				stats.save(filepath, max_records=3)
+
+			with open(filepath, mode='rb') as f:
+				self.assertEqual(len(f.readlines()), 3)
+
+			self.assertEqual(CacheStats.load(filepath)['a']['bytes_written'], 100 + 1000 + 10000)
+			self.assertEqual(os.listdir(dirpath), ['stats.jsonl'])
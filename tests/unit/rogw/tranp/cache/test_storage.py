@@ -0,0 +1,62 @@
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from rogw.tranp.cache.storage import CacheStorage
+from rogw.tranp.test.helper import data_provider
+
+
+class TestCacheStorage(TestCase):
+	def make_files(self, basedir: str) -> None:
+		now = time.time()
+		files = [
+			('objects/aa/a.ast', 100, now - 400),
+			('objects/bb/b.ast', 100, now - 300),
+			('objects/cc/c.ast', 100, now - 200),
+			('objects/cc/d.ast', 100, now - 100),
+			(CacheStorage.StatsFilename, 100, now - 500),
+			(CacheStorage.GCStampFilename, 0, now - 500),
+			('manifest-0123.json', 100, now - 500),
+			('objects/cc/.e.ast.1.2.tmp', 100, now - 500),
+		]
+		for filepath, size, mtime in files:
+			abs_filepath = os.path.join(basedir, filepath)
+			os.makedirs(os.path.dirname(abs_filepath), exist_ok=True)
+			with open(abs_filepath, mode='wb') as f:
+				f.write(b'0' * size)
+
+			os.utime(abs_filepath, (mtime, mtime))
+
+	@data_provider([
+		(0, 0, ['a.ast', 'b.ast', 'c.ast', 'd.ast'], ['aa', 'bb', 'cc']),
+		(250, 0, ['c.ast', 'd.ast'], ['cc']),
+		(0, 250, ['c.ast', 'd.ast'], ['cc']),
+		(150, 350, ['d.ast'], ['cc']),
+	])
+	def test_gc(self, max_size: int, max_age: float, expected_files: list[str], expected_dirs: list[str]) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			self.make_files(basedir)
+			storage = CacheStorage(basedir)
+			storage.gc(max_size, max_age)
+			self.assertEqual([os.path.basename(found.path) for found in storage.files()], expected_files)
+			self.assertEqual(sorted(os.listdir(os.path.join(basedir, 'objects'))), expected_dirs)
+			self.assertEqual(os.path.exists(storage.stats_filepath), True)
+			self.assertEqual(os.path.exists(os.path.join(basedir, 'manifest-0123.json')), True)
+
+	@data_provider([
+		(0, None, True),
+		(100, None, True),
+		(100, 200, True),
+		(100, 50, False),
+	])
+	def test_gc_due(self, interval: float, elapsed: float | None, expected: bool) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			storage = CacheStorage(basedir)
+			if elapsed is not None:
+				storage.stamp_gc()
+				mtime = time.time() - elapsed
+				os.utime(storage.gc_stamp_filepath, (mtime, mtime))
+
+			self.assertEqual(storage.gc_due(interval), expected)
+			self.assertEqual([found.path for found in storage.files()], [])
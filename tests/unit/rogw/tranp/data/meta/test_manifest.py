@@ -0,0 +1,28 @@
+from unittest import TestCase
+
+from rogw.tranp.data.meta.manifest import BuildManifest, ManifestEntry, ManifestOutput
+from rogw.tranp.test.helper import data_provider
+
+
+def _output() -> ManifestOutput:
+	return {'filepath': '/out/a.h', 'hash': 'out', 'transpiler': {'version': '1.0.0', 'module': 'Py2Cpp'}}
+
+
+def _entry(hash: str, output: ManifestOutput | None, imports: list[str] = []) -> ManifestEntry:
+	return {'filepath': 'a.py', 'hash': hash, 'mtime': 0.0, 'imports': imports, 'output': output}
+
+
+class TestBuildManifest(TestCase):
+	@data_provider([
+		(_entry('a', None), _output()),
+		(_entry('b', None), None),
+		(_entry('b', {**_output(), 'hash': 'new'}), {**_output(), 'hash': 'new'}),
+	])
+	def test_update(self, entry: ManifestEntry, expected: ManifestOutput | None) -> None:
+		manifest = BuildManifest({'a': _entry('a', _output())})
+		manifest.update({'a': entry})
+		self.assertEqual(manifest.entries['a']['output'], expected)
+
+	def test_graph(self) -> None:
+		manifest = BuildManifest({'a': _entry('a', None, ['b']), 'b': _entry('b', None)})
+		self.assertEqual(manifest.graph().dependents_of(['b']), ['b', 'a'])
@@ -0,0 +1,27 @@
+import os
+import tempfile
+import threading
+from unittest import TestCase
+
+from rogw.tranp.file.lock import FileLock
+
+
+class TestFileLock(TestCase):
+	def test_lock(self) -> None:
+		with tempfile.TemporaryDirectory() as basedir:
+			filepath = os.path.join(basedir, 'a', '.lock')
+			entered: list[str] = []
+
+			def acquire() -> None:
+				with FileLock(filepath):
+					entered.append('worker')
+
+			with FileLock(filepath):
+				worker = threading.Thread(target=acquire)
+				worker.start()
+				worker.join(timeout=0.2)
+				entered.append('main')
+
+			worker.join()
+			self.assertEqual(entered, ['main', 'worker'])
+			self.assertEqual(os.path.isfile(filepath), True)
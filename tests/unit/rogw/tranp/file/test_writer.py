@@ -0,0 +1,54 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from rogw.tranp.file.writer import Writer, WriterPool
+from rogw.tranp.test.helper import data_provider
+
+
+class TestWriter(TestCase):
+	@data_provider([
+		(None, 'abc', True),
+		('abc', 'abc', False),
+		('abc', 'abd', True),
+		('abc', 'abcd', True),
+	])
+	def test_flush(self, current: str | None, content: str, expected: bool) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'sub', 'a.h')
+			if current is not None:
+				os.makedirs(os.path.dirname(filepath))
+				with open(filepath, mode='wb') as f:
+					f.write(current.encode('utf-8'))
+
+			writer = Writer(filepath)
+			writer.put(content)
+			self.assertEqual(writer.flush(), expected)
+			with open(filepath, mode='rb') as f:
+				self.assertEqual(f.read().decode('utf-8'), content)
+
+			self.assertEqual(os.listdir(os.path.dirname(filepath)), ['a.h'])
+
+
+class TestWriterPool(TestCase):
+	def test_wait(self) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			pool = WriterPool(max_workers=2)
+			for name in ['a', 'b', 'c']:
+				writer = Writer(os.path.join(dirpath, f'{name}.h'))
+				writer.put(name)
+				pool.submit(writer.flush)
+
+			self.assertEqual(pool.wait(), 3)
+			self.assertEqual(sorted(os.listdir(dirpath)), ['a.h', 'b.h', 'c.h'])
+
+	def test_wait_raise(self) -> None:
+		def flush() -> bool:
+			raise OSError()
+
+		pool = WriterPool()
+		pool.submit(flush)
+		with self.assertRaises(OSError):
+			pool.wait()
+
+		self.assertEqual(pool.wait(), 0)
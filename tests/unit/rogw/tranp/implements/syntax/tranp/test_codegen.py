@@ -0,0 +1,91 @@
+from types import ModuleType
+from unittest import TestCase
+
+from data.syntax.gram_rules import gram_rules
+from data.syntax.gram_tokenizer import gram_tokenizer
+from data.syntax.grammar_parser import GrammarParser
+from data.syntax.py_parser import PyParser
+from data.syntax.py_rules import py_rules
+from rogw.tranp.errors import Errors
+from rogw.tranp.implements.syntax.tranp.codegen import ParserGenerator
+from rogw.tranp.implements.syntax.tranp.compiled import CompiledParser
+from rogw.tranp.implements.syntax.tranp.rule import Rules
+from rogw.tranp.implements.syntax.tranp.syntax import SyntaxParser
+from rogw.tranp.test.helper import data_provider
+
+
+class TestParserGenerator(TestCase):
+	def test_generate(self) -> None:
+		with open('data/syntax/py_parser.py', mode='rb') as f:
+			expected = f.read().decode('utf-8')
+
+		actual = ParserGenerator(py_rules()).generate('PyParser')
+		self.assertEqual(expected, actual, 'Generated parser is outdated. Run `bin/parser.sh -i data/syntax/py_rules.py -o data/syntax/py_parser.py`')
+		self.assertEqual(ParserGenerator.signature(py_rules()), PyParser.Signature)
+
+	def test_generate_grammar(self) -> None:
+		with open('data/syntax/grammar.lark', mode='rb') as f:
+			grammar = f.read().decode('utf-8')
+
+		with open('data/syntax/grammar_parser.py', mode='rb') as f:
+			expected = f.read().decode('utf-8')
+
+		rules = Rules.from_ast(SyntaxParser(gram_rules(), gram_tokenizer()).parse(grammar, 'entry').simplify())
+		actual = ParserGenerator(rules, memoize=True).generate('GrammarParser')
+		self.assertEqual(expected, actual, 'Generated parser is outdated. Run `bin/parser.sh -i data/syntax/grammar.lark -o data/syntax/grammar_parser.py -m`')
+		self.assertEqual(ParserGenerator.signature(rules), GrammarParser.Signature)
+
+	@data_provider([
+		('a.b().c + -1 == d("\\"a\\"" in b).e[0]\n',),
+		('((a + b) * c)\nif a:\n\tb(c)\nelif b:\n\t...\nelse:\n\treturn\n',),
+		('def f(a: int, *b: int) -> int:\n\tfor i in b:\n\t\ta = lambda: i\n\treturn a\n',),
+		('a = {"b": [1, 2.0], "c": None}\nwhile a:\n\tbreak\n',),
+		('a = (\n',),
+		('x = 1 +\n',),
+		('def f(\n',),
+	])
+	def test_parse(self, source: str) -> None:
+		expected = self.parse(SyntaxParser(py_rules()), source)
+		actual = self.parse(PyParser(), source)
+		self.assertEqual(expected, actual)
+
+	@data_provider([
+		('a.b().c + -1 == d("\\"a\\"" in b).e[0]\n',),
+		('((a + b) * c)\nif a:\n\tb(c)\nelif b:\n\t...\nelse:\n\treturn\n',),
+		('x = 1 +\n',),
+	])
+	def test_parse_memoize(self, source: str) -> None:
+		module = ModuleType('py_parser_memoize')
+		exec(compile(ParserGenerator(py_rules(), memoize=True).generate('PyParser'), module.__name__, 'exec'), module.__dict__)
+		parser = module.PyParser()
+		expected = self.parse(PyParser(), source)
+		self.assertEqual(expected, self.parse(parser, source))
+		self.assertEqual(expected, self.parse(parser, source))
+		self.assertEqual(0, PyParser.Memos)
+		self.assertLess(0, parser.Memos)
+
+	def test_parse_gram(self) -> None:
+		module = ModuleType('gram_parser')
+		exec(compile(ParserGenerator(gram_rules()).generate('GramParser'), module.__name__, 'exec'), module.__dict__)
+		with open('data/syntax/py_gram.lark', mode='rb') as f:
+			source = f.read().decode('utf-8')
+
+		expected = self.parse(SyntaxParser(gram_rules(), gram_tokenizer()), source)
+		actual = self.parse(module.GramParser(gram_tokenizer()), source)
+		self.assertEqual(expected, actual)
+
+	def test_parse_reuse(self) -> None:
+		parser = PyParser()
+		first = self.parse(parser, 'a = (\n')
+		self.parse(parser, 'a.b(c)\n')
+		self.assertEqual(first, self.parse(parser, 'a = (\n'))
+
+	def test_parse_undefined(self) -> None:
+		with self.assertRaises(Errors.Logic):
+			PyParser().parse('a\n', 'undefined')
+
+	def parse(self, parser: SyntaxParser | CompiledParser, source: str) -> str:
+		try:
+			return parser.parse(source, 'entry').pretty()
+		except Errors.Syntax as e:
+			return f'Syntax: {e}'
@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+from data.syntax.grammar_parser import GrammarParser
+from rogw.tranp.implements.syntax.tranp.entry import EntryOfTranp
+from rogw.tranp.implements.syntax.tranp.tokenizer import PyScanTokenizer
+from rogw.tranp.syntax.ast.entry import Entry
+from rogw.tranp.test.helper import data_provider
+
+
+class TestEntryOfTranp(TestCase):
+	@data_provider([
+		('var', 'var'),
+		('typed_var__annotated', 'typed_var'),
+		('template_assign_bound__param', 'template_assign_bound'),
+		('_inline_stmt', '_inline_stmt'),
+		('__empty__', '__empty__'),
+		('__ANON_3', '__ANON_3'),
+	])
+	def test_alias_of(self, name: str, expected: str) -> None:
+		self.assertEqual(expected, EntryOfTranp.alias_of(name))
+
+	@data_provider([
+		(
+			'a = b - 1\n',
+			('file_input', [
+				('assign', [
+					('assign_namelist', [
+						('var', [
+							('name', [
+								('NAME', 'a', ((1, 1), (1, 2))),
+							], ((1, 1), (1, 2))),
+						], ((1, 1), (1, 2))),
+					], ((1, 1), (1, 2))),
+					('sum', [
+						('var', [
+							('name', [
+								('NAME', 'b', ((1, 5), (1, 6))),
+							], ((1, 5), (1, 6))),
+						], ((1, 5), (1, 6))),
+						('MINUS', '-', ((1, 7), (1, 8))),
+						('number', [
+							('DEC_NUMBER', '1', ((1, 9), (1, 10))),
+						], ((1, 9), (1, 10))),
+					], ((1, 5), (1, 10))),
+				], ((1, 1), (1, 10))),
+			], ((1, 1), (2, 1))),
+		),
+		(
+			'def f() -> None:\n\tpass\n',
+			('file_input', [
+				('function_def', [
+					('__empty__', '', ((0, 0), (0, 0))),
+					('function_def_raw', [
+						('name', [
+							('NAME', 'f', ((1, 5), (1, 6))),
+						], ((1, 5), (1, 6))),
+						('__empty__', '', ((0, 0), (0, 0))),
+						('__empty__', '', ((0, 0), (0, 0))),
+						('typed_none', [], ((1, 12), (1, 16))),
+						('block', [
+							('pass_stmt', [], ((2, 2), (2, 6))),
+						], ((1, 17), (3, 1))),
+					], ((1, 1), (3, 1))),
+				], ((1, 1), (3, 1))),
+			], ((1, 1), (3, 1))),
+		),
+	])
+	def test_entry(self, source: str, expected: tuple) -> None:
+		root = EntryOfTranp(GrammarParser(PyScanTokenizer()).parse(source, 'file_input'))
+		self.assertEqual(expected, self.simplify(root))
+
+	def test_empty(self) -> None:
+		entry = EntryOfTranp(GrammarParser(PyScanTokenizer()).parse('def f() -> None:\n\tpass\n', 'file_input')).children[0].children[0]
+		self.assertEqual(True, entry.is_empty)
+		self.assertEqual(False, entry.is_terminal)
+		self.assertEqual(False, entry.has_child)
+		self.assertEqual('__empty__', entry.name)
+
+	def simplify(self, entry: Entry) -> tuple:
+		source_map = (entry.source_map['begin'], entry.source_map['end'])
+		if entry.has_child:
+			return entry.name, [self.simplify(child) for child in entry.children], source_map
+
+		return entry.name, entry.value, source_map
@@ -0,0 +1,26 @@
+import tempfile
+from unittest import TestCase
+
+from data.syntax.py_rules import py_rules
+from rogw.tranp.cache.backend import FileBackend
+from rogw.tranp.cache.cache import CacheProvider, CacheSetting
+from rogw.tranp.implements.syntax.tranp.loader import RulesLoader
+from rogw.tranp.implements.syntax.tranp.rule import Rules
+
+
+class TestRulesLoader(TestCase):
+	def test_load(self) -> None:
+		called: list[bool] = []
+
+		def factory() -> Rules:
+			called.append(True)
+			return py_rules()
+
+		with tempfile.TemporaryDirectory() as basedir:
+			expected = py_rules().pretty()
+			for grammar in ['grammar', 'grammar', 'other']:
+				caches = CacheProvider(CacheSetting(basedir=basedir), FileBackend(basedir))
+				actual = RulesLoader(caches).load(grammar, factory)
+				self.assertEqual(expected, actual.pretty())
+
+			self.assertEqual(2, len(called))
@@ -0,0 +1,90 @@
+from unittest import TestCase
+
+from rogw.tranp.app.app import App
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.errors import Errors
+from rogw.tranp.implements.syntax.lark.parser import SyntaxParserOfLark
+from rogw.tranp.implements.syntax.tranp.parser import SyntaxParserOfTranp
+from rogw.tranp.lang.module import to_fullyname
+from rogw.tranp.syntax.ast.entry import Entry
+from rogw.tranp.syntax.ast.parser import ParserSetting, SourceProvider, SyntaxParser
+from rogw.tranp.test.helper import data_provider
+
+_snippets: dict[str, str] = {}
+
+
+def _make_app(backend: str) -> App:
+	return App({
+		to_fullyname(CacheSetting): lambda: CacheSetting(basedir='.cache/tranp', enabled=False),
+		to_fullyname(ParserSetting): lambda: ParserSetting(grammar='data/grammar.lark', backend=backend),
+	})
+
+
+def _make_snippet_app(backend: str) -> App:
+	return App({
+		to_fullyname(CacheSetting): lambda: CacheSetting(basedir='.cache/tranp', enabled=False),
+		to_fullyname(ParserSetting): lambda: ParserSetting(grammar='data/grammar.lark', backend=backend),
+		to_fullyname(SourceProvider): lambda: lambda module_path: _snippets[module_path],
+	})
+
+
+class TestSyntaxParserOfTranp(TestCase):
+	lark_parser = _make_app('lark').run(SyntaxParserOfLark)
+	tranp_parser = _make_app('tranp').run(SyntaxParserOfTranp)
+	lark_snippet_parser = _make_snippet_app('lark').run(SyntaxParserOfLark)
+	tranp_snippet_parser = _make_snippet_app('tranp').run(SyntaxParserOfTranp)
+
+	@data_provider([
+		('rogw.tranp.compatible.cpp.function',),
+		('rogw.tranp.compatible.libralies.typing',),
+		('tests.unit.rogw.tranp.implements.cpp.transpiler.fixtures.fixture_py2cpp',),
+		('tests.unit.rogw.tranp.semantics.fixtures.fixture_reflections',),
+		('tests.unit.rogw.tranp.syntax.node.fixtures.fixture_definition',),
+	])
+	def test_call(self, module_path: str) -> None:
+		expected = self.simplify(self.lark_parser(module_path))
+		actual = self.simplify(self.tranp_parser(module_path))
+		self.assertEqual(expected, actual)
+
+	@data_provider([
+		('x = a if b else c if d else e\n',),
+		('for a in b, c:\n\tpass\n',),
+		('for a in b if c else d: ...\n',),
+		('x = - -a\n',),
+		('x = not not a\n',),
+		('x = [a for a in b if not not a]\n',),
+		('if a: b: int = 1\n',),
+		('class A: a: ClassVar[int] = 1\n',),
+		('def f(self) -> None: self.a: int = 1\n',),
+		('f(lambda: lambda: 1)\n',),
+		('lambda a: None\n',),
+		('x = y[lambda: 1:2]\n',),
+		('x = -(-a)\n',),
+		('\nif a:\n\tpass\nelif b: c: int = 1\nelse: d: int = 2\n',),
+		("def f(a: 'A', b: Annotated['B', 1]) -> 'C[int]': ...\n",),
+	])
+	def test_call_snippet(self, source: str) -> None:
+		module_path = 'tests.unit.rogw.tranp.implements.syntax.tranp.snippet'
+		_snippets[module_path] = source
+		expected = self.simplify(self.lark_snippet_parser(module_path))
+		actual = self.simplify(self.tranp_snippet_parser(module_path))
+		self.assertEqual(expected, actual)
+
+	@data_provider([
+		('lark', SyntaxParserOfLark),
+		('tranp', SyntaxParserOfTranp),
+	])
+	def test_backend(self, backend: str, expected: type) -> None:
+		self.assertEqual(expected, type(_make_app(backend).resolve(SyntaxParser)))
+
+	def test_backend_unsupported(self) -> None:
+		with self.assertRaises(Errors.InvalidSchema):
+			_make_app('unknown').resolve(SyntaxParser)
+
+	def simplify(self, entry: Entry) -> tuple | None:
+		if entry.is_empty:
+			return None
+		elif entry.has_child:
+			return entry.name, [self.simplify(child) for child in entry.children], entry.source_map['begin'], entry.source_map['end']
+		else:
+			return entry.name, entry.value, entry.source_map['begin'], entry.source_map['end']
@@ -1,7 +1,12 @@
 from unittest import TestCase
 
+from data.syntax.gram_rules import gram_rules
+from data.syntax.gram_tokenizer import gram_tokenizer
+from data.syntax.py_rules import py_rules
+from rogw.tranp.errors import Errors
 from rogw.tranp.implements.syntax.tranp.ast import TupleTree
-from rogw.tranp.implements.syntax.tranp.rule import Comps, Pattern, Roles, Rules
+from rogw.tranp.implements.syntax.tranp.rule import Comps, FirstSet, JSONSerializer, Pattern, Roles, Rules
+from rogw.tranp.implements.syntax.tranp.syntax import SyntaxParser
 from rogw.tranp.test.helper import data_provider
 
 
@@ -15,6 +20,21 @@ class TestPattern(TestCase):
 		actual = Pattern.make(expression)
 		self.assertEqual(expected, (actual.role, actual.comp))
 
+	def test_regexp(self) -> None:
+		actual = Pattern.make('/[a-z]+/')
+		self.assertIsNotNone(actual.regexp.fullmatch('abc'))
+		self.assertIsNone(actual.regexp.fullmatch('a1'))
+
+	@data_provider([
+		('"a"', 'a', True),
+		('"a"', 'ab', False),
+		('/[a-z]+/', 'ab', True),
+		('/[a-z]+/', 'a1', False),
+		('"\\n"', '\n', True),
+	])
+	def test_matches(self, expression: str, string: str, expected: bool) -> None:
+		self.assertEqual(expected, Pattern.make(expression).matches(string))
+
 
 class TestRules(TestCase):
 	@data_provider([
@@ -102,3 +122,56 @@ class TestRules(TestCase):
 		actual = rules.pretty()
 		self.assertEqual(expected[0], actual)
 		self.assertEqual(expected[1], rules.keywords)
+		self.assertEqual(frozenset(expected[1]), rules.keyword_set)
+
+	@data_provider([
+		('entry', (['!', 'b'], [], False)),
+		('exp', ([], ['[a-z]+'], False)),
+		('pair', (['!', 'b'], [], False)),
+		('opt', (['?'], [], True)),
+		('either', (['!', '?', 'b'], ['[a-z]+'], True)),
+	])
+	def test_firsts(self, symbol: str, expected: tuple[list[str], list[str], bool]) -> None:
+		grammar = '\n'.join([
+			'entry := pair',
+			'exp := /[a-z]+/',
+			'pair := exp "," ["?"] ("!" | "b")',
+			'opt := ["?"]',
+			'either := exp | pair | opt',
+		])
+		tree = SyntaxParser(gram_rules(), gram_tokenizer()).parse(grammar, 'entry')
+		rules = Rules.from_ast(tree.simplify())
+		actual = rules.firsts[symbol]
+		self.assertEqual(expected[0], sorted(actual.equals))
+		self.assertEqual(expected[1], sorted(pattern.expression for pattern in actual.regexps))
+		self.assertEqual(expected[2], actual.nullable)
+
+	@data_provider([
+		(FirstSet(frozenset(['if']), frozenset(), False), 'if', True),
+		(FirstSet(frozenset(['if']), frozenset(), False), 'a', False),
+		(FirstSet(frozenset(), frozenset([Pattern.make('/[a-z]+/')]), False), 'a', True),
+		(FirstSet(frozenset(), frozenset([Pattern.make('/[a-z]+/')]), False), 'if', False),
+		(FirstSet(frozenset(), frozenset([Pattern.make('/[a-z]+/')]), False), '1', False),
+		(FirstSet(frozenset(), frozenset(), True), '1', True),
+	])
+	def test_first_set_accepts(self, first: FirstSet, string: str, expected: bool) -> None:
+		self.assertEqual(expected, first.accepts(string, string == 'if'))
+
+
+class TestJSONSerializer(TestCase):
+	def test_dumps_loads(self) -> None:
+		rules = py_rules()
+		actual = JSONSerializer.loads(JSONSerializer.dumps(rules))
+		self.assertEqual(rules.pretty(), actual.pretty())
+		self.assertEqual(list(rules.org_symbols()), list(actual.org_symbols()))
+		self.assertEqual(rules.keywords, actual.keywords)
+
+	@data_provider([
+		('',),
+		('{"version":0,"rules":[],"keywords":[]}',),
+		('{"version":1,"rules":[["a",["x"]]],"keywords":[]}',),
+		('{"version":1,"rules":[["a",["p","a",9,0]]],"keywords":[]}',),
+	])
+	def test_loads_invalid(self, data: str) -> None:
+		with self.assertRaises(Errors.InvalidSchema):
+			JSONSerializer.loads(data)
@@ -1,8 +1,10 @@
+from collections.abc import Callable
 from unittest import TestCase
 
 from data.syntax.gram_rules import gram_rules
 from data.syntax.gram_tokenizer import gram_tokenizer
 from data.syntax.py_rules import py_rules
+from rogw.tranp.errors import Errors
 from rogw.tranp.implements.syntax.tranp.rule import Rules
 from rogw.tranp.implements.syntax.tranp.syntax import ErrorCollector, SyntaxParser
 from rogw.tranp.implements.syntax.tranp.tokenizer import Tokenizer
@@ -189,6 +191,40 @@ class TestSyntaxParser(TestCase):
 			print(f'AST unmatch. actual: {actual.pretty()}')
 			raise
 
+	@data_provider([
+		('a.b().c + -1 == d("\\"a\\"" in b).e[0]\n', 0),
+		('((a + b) * c)\nif a:\n\tb(c)\n', 0),
+		('((a + b) * c)\nif a:\n\tb(c)\n', 16),
+	])
+	def test_parse_packrat(self, source: str, max_count: int) -> None:
+		expected = SyntaxParser(py_rules()).parse(source, 'entry')
+		actual = SyntaxParser(py_rules(), packrat=True, packrat_max_count=max_count).parse(source, 'entry')
+		self.assertEqual(expected.simplify(), actual.simplify())
+
+	@data_provider([
+		(lambda n: f'{"(" * n}a{")" * n}\n',),
+		(lambda n: f'{" + ".join(["a"] * n)}\n',),
+		(lambda n: f'a{".b(c)" * n}\n',),
+	])
+	def test_parse_packrat_linear(self, make_source: Callable[[int], str]) -> None:
+		parser = SyntaxParser(py_rules(), packrat=True)
+		parser.parse(make_source(4), 'entry')
+		misses4 = parser.metrics['misses']
+		parser.parse(make_source(8), 'entry')
+		misses8 = parser.metrics['misses']
+		self.assertLess(misses8, misses4 * 2)
+
+	def test_parse_error_reuse(self) -> None:
+		parser = SyntaxParser(py_rules())
+		with self.assertRaises(Errors.Syntax) as expected:
+			parser.parse('x = 1 +\n', 'entry')
+
+		parser.parse('a.b(c)\n', 'entry')
+		with self.assertRaises(Errors.Syntax) as actual:
+			parser.parse('x = 1 +\n', 'entry')
+
+		self.assertEqual(str(expected.exception), str(actual.exception))
+
 
 class TestErrorCollector(TestCase):
 	@data_provider([
@@ -1,7 +1,8 @@
 from unittest import TestCase
 
+from data.syntax.gram_tokenizer import gram_definition
 from rogw.tranp.implements.syntax.tranp.token import SpecialSymbols
-from rogw.tranp.implements.syntax.tranp.tokenizer import Lexer, PyTokenizer, Token, TokenDefinition, TokenDomains, Tokenizer, TokenTypes
+from rogw.tranp.implements.syntax.tranp.tokenizer import Lexer, PyScanTokenizer, PyTokenizer, ScanTokenizer, Token, TokenDefinition, TokenDomains, Tokenizer, TokenTypes
 from rogw.tranp.test.helper import data_provider
 
 
@@ -223,6 +224,102 @@ class TestLexer(TestCase):
 		self.assertEqual(expected, actual)
 
 
+class TestScanTokenizer(TestCase):
+	@data_provider([
+		('a + 1', ['a', '+', '1', '\n']),
+		('a -= -1', ['a', '-=', SpecialSymbols.OpUnaryMinus.value, '1', '\n']),
+		('***a', ['**', '*', 'a', '\n']),
+		('a # bc', ['a', '\n']),
+		("r + r'abc'", ['r', '+', "r'abc'", '\n']),
+		('"\\"a\\" \\"b\\"" c', ['"\\"a\\" \\"b\\""', 'c', '\n']),
+		('if a\n\tand b: ...', ['if', 'a', '\n', SpecialSymbols.Indent.value, 'and', 'b', ':', '...', '\n', SpecialSymbols.Dedent.value]),
+		('a(\n\tb,\n)', ['a', '(', 'b', ',', ')', '\n']),
+		('# c\na\n# c\nb\n# c', ['a', '\n', 'b', '\n']),
+	])
+	def test_parse(self, source: str, expected: list[str]) -> None:
+		actual = ScanTokenizer().parse(source)
+		self.assertEqual(expected, [token.string for token in actual])
+
+	@data_provider([
+		('\n'.join([
+			'# c',
+			'def a(arr: list[int]) -> dict[str, int]:',
+			'	# c',
+			'	if arr:',
+			'		return {',
+			'			# c',
+			'			"b": arr[0],',
+			'			# c',
+			'		}',
+			'		# c',
+			'	else:',
+			'		return {}',
+			'# c',
+		]), TokenDefinition()),
+		(' \na\n\n\tb - 1.5\n\t\tc\nd\n', TokenDefinition()),
+		('a \nand b', TokenDefinition()),
+		('entry := exp // c\nexp[1] := /[a-z]+/ | "\\"" ("," exp)*\n', gram_definition()),
+	])
+	def test_parse_conformance(self, source: str, definition: TokenDefinition) -> None:
+		self.assert_conformance(source, definition)
+
+	@data_provider([
+		('rogw/tranp/implements/syntax/tranp/syntax.py', TokenDefinition()),
+		('rogw/tranp/cache/lru.py', TokenDefinition()),
+		('data/syntax/py_gram.lark', gram_definition()),
+	])
+	def test_parse_conformance_file(self, filepath: str, definition: TokenDefinition) -> None:
+		with open(filepath, mode='rb') as f:
+			source = f.read().decode('utf-8')
+
+		self.assert_conformance(source, definition)
+
+	def assert_conformance(self, source: str, definition: TokenDefinition) -> None:
+		expected = Tokenizer(definition).parse(source)
+		actual = ScanTokenizer(definition).parse(source)
+		self.assertEqual([(token.type, token.string, token.source_map) for token in expected], [(token.type, token.string, token.source_map) for token in actual])
+
+
+class TestPyScanTokenizer(TestCase):
+	@data_provider([
+		('a = -b + +1', ['a', '=', SpecialSymbols.OpUnaryMinus.value, 'b', '+', SpecialSymbols.OpUnaryPlus.value, '1', '\n']),
+		('a(-1) - -b', ['a', '(', SpecialSymbols.OpUnaryMinus.value, '1', ')', '-', SpecialSymbols.OpUnaryMinus.value, 'b', '\n']),
+		('return -a', ['return', SpecialSymbols.OpUnaryMinus.value, 'a', '\n']),
+		('a // b ** -c', ['a', '//', 'b', '**', SpecialSymbols.OpUnaryMinus.value, 'c', '\n']),
+		('a **= 2; b //= 3', ['a', '**=', '2', ';', 'b', '//=', '3', '\n']),
+		("s = '''a\nb''' + f'c'", ['s', '=', "'''a\nb'''", '+', "f'c'", '\n']),
+		('a  # c\n# type: ignore\nb', ['a', '# c', '\n', 'b', '\n']),
+		('a = \\\n\tb', ['a', '=', 'b', '\n']),
+		('f(lambda a: {b: c})', ['f', '(', 'lambda', 'a', SpecialSymbols.LambdaColon.value, '{', 'b', ':', 'c', '}', ')', '\n']),
+		('lambda: lambda: a[1:2]', ['lambda', SpecialSymbols.LambdaColon.value, 'lambda', SpecialSymbols.LambdaColon.value, 'a', '[', '1', ':', '2', ']', '\n']),
+		('a: int = 1', ['a', ':', 'int', '=', '1', '\n']),
+	])
+	def test_parse(self, source: str, expected: list[str]) -> None:
+		actual = PyScanTokenizer().parse(source)
+		self.assertEqual(expected, [token.string for token in actual])
+
+	@data_provider([
+		('a\n', [(0, 0, 0, 1), (1, 0, 1, 0)]),
+		('if a:\n\tb\n\n', [(0, 0, 0, 2), (0, 3, 0, 4), (0, 4, 0, 5), (0, 5, 1, 1), (0, 5, 1, 1), (1, 1, 1, 2), (3, 0, 3, 0), (3, 0, 3, 0)]),
+		('a', [(0, 0, 0, 1), (0, 1, 0, 1)]),
+	])
+	def test_parse_source_map(self, source: str, expected: list[tuple[int, int, int, int]]) -> None:
+		actual = PyScanTokenizer().parse(source)
+		self.assertEqual(expected, [tuple(token.source_map) for token in actual])
+
+	@data_provider([
+		('0x1F', TokenTypes.Digit),
+		('10', TokenTypes.Digit),
+		('1.5e3', TokenTypes.Decimal),
+		('2j', TokenTypes.Decimal),
+		("r'a'", TokenTypes.String),
+		('"""a"""', TokenTypes.String),
+	])
+	def test_parse_type(self, source: str, expected: TokenTypes) -> None:
+		actual = PyScanTokenizer().parse(source)
+		self.assertEqual(expected, actual[0].type)
+
+
 class TestPyTokenizer(TestCase):
 	@data_provider([
 		('abc', ['abc']),
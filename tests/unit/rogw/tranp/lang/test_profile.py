@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+from rogw.tranp.lang.profile import TraceEvent, Tracer
+from rogw.tranp.test.helper import data_provider
+
+
+def _event(name: str, dur: int, module: str = '') -> TraceEvent:
+	return {'name': name, 'cat': 'phase', 'ph': 'X', 'ts': 0, 'dur': dur, 'pid': 1, 'tid': 1, 'args': {'module': module} if module else {}}
+
+
+class TestTracer(TestCase):
+	@data_provider([
+		(False, 0),
+		(True, 1),
+	])
+	def test_span(self, enabled: bool, expected: int) -> None:
+		tracer = Tracer()
+		if enabled:
+			tracer.enable()
+
+		with tracer.span('parse', module='a'):
+			pass
+
+		events = tracer.drain()
+		self.assertEqual(len(events), expected)
+		self.assertEqual(len(tracer.drain()), 0)
+		if expected > 0:
+			self.assertEqual(events[0]['name'], 'parse')
+			self.assertEqual(events[0]['args'], {'module': 'a'})
+
+	def test_summary(self) -> None:
+		tracer = Tracer()
+		tracer.merge([_event('parse', 1000, 'a'), _event('parse', 3000, 'b'), _event('index', 500)])
+		self.assertEqual([(row['name'], row['module'], row['count'], row['total_ms'], row['max_ms']) for row in tracer.summary()], [
+			('index', '*', '1', '0.500', '0.500'),
+			('index', '-', '1', '0.500', '0.500'),
+			('parse', '*', '2', '4.000', '3.000'),
+			('parse', 'a', '1', '1.000', '1.000'),
+			('parse', 'b', '1', '3.000', '3.000'),
+		])
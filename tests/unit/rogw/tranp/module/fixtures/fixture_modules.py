@@ -0,0 +1,6 @@
+from tests.unit.rogw.tranp.module.fixtures.fixture_modules_depend import Depend
+
+
+def main() -> None:
+	depend = Depend()
+	print(depend.calc(1))
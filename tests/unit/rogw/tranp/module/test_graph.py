@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+from rogw.tranp.module.graph import DependencyGraph
+from rogw.tranp.test.helper import data_provider
+
+
+class TestDependencyGraph(TestCase):
+	def graph(self) -> DependencyGraph:
+		graph = DependencyGraph()
+		graph.add('a', ['b', 'c'])
+		graph.add('b', ['c'])
+		graph.add('c', ['d'])
+		graph.add('d', [])
+		graph.add('e', ['a'])
+		return graph
+
+	@data_provider([
+		('a', ['b', 'c', 'd']),
+		('b', ['c', 'd']),
+		('d', []),
+		('e', ['a', 'b', 'c', 'd']),
+		('x', []),
+	])
+	def test_depends_of(self, module_path: str, expected: list[str]) -> None:
+		self.assertEqual(self.graph().depends_of(module_path), expected)
+
+	@data_provider([
+		(['a'], ['a', 'b', 'c', 'd']),
+		(['b', 'e'], ['b', 'c', 'd', 'e', 'a']),
+		(['d'], ['d']),
+		([], []),
+	])
+	def test_closure_of(self, module_paths: list[str], expected: list[str]) -> None:
+		self.assertEqual(self.graph().closure_of(module_paths), expected)
+
+	@data_provider([
+		(['d'], ['d', 'c', 'a', 'e', 'b']),
+		(['b'], ['b', 'a', 'e']),
+		(['e'], ['e']),
+		(['b', 'e'], ['b', 'a', 'e']),
+		([], []),
+	])
+	def test_dependents_of(self, module_paths: list[str], expected: list[str]) -> None:
+		self.assertEqual(self.graph().dependents_of(module_paths), expected)
+
+	@data_provider([
+		('a', ['c'], 'b', ['b']),
+		('a', [], 'c', ['c', 'b']),
+		('c', ['b'], 'd', ['d']),
+		('x', ['e'], 'e', ['e', 'x']),
+	])
+	def test_add(self, module_path: str, imports: list[str], base: str, expected: list[str]) -> None:
+		graph = self.graph()
+		graph.add(module_path, imports)
+		self.assertEqual(graph.imports_of(module_path), imports)
+		self.assertEqual(graph.dependents_of([base]), expected)
+
+	def test_remove(self) -> None:
+		graph = self.graph()
+		graph.remove('a')
+		self.assertEqual('a' in graph, False)
+		self.assertEqual(graph.dependents_of(['c']), ['c', 'b'])
+		self.assertEqual(graph.module_paths, ['b', 'c', 'd', 'e'])
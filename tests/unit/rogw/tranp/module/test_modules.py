@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from rogw.tranp.cache.cache import CacheSetting
+from rogw.tranp.dsn.module import ModuleDSN
+from rogw.tranp.lang.module import to_fullyname
+from rogw.tranp.module.modules import Modules
+from rogw.tranp.semantics.reflection.db import SymbolDB
+from tests.test.fixture import Fixture
+
+
+class TestModules(TestCase):
+	fixture_module_path = Fixture.fixture_module_path(__file__)
+	depend_module_path = f'{fixture_module_path}_depend'
+
+	def test_load_declaration_only(self) -> None:
+		fixture = Fixture.make(__file__, {to_fullyname(CacheSetting): lambda: CacheSetting(basedir='.cache/tranp', enabled=False)})
+		modules = fixture.get(Modules)
+		db = fixture.get(SymbolDB)
+		fixture.shared_module
+
+		depend = [module for module in modules.loaded() if module.path == self.depend_module_path][0]
+		self.assertTrue(depend.declaration_only)
+		self.assertFalse(db.completed(depend.path))
+		self.assertIn(ModuleDSN.full_joined(depend.path, 'Depend.calc'), db)
+		self.assertIn(ModuleDSN.full_joined(depend.path, 'Depend.calc.a'), db)
+		self.assertIn(ModuleDSN.full_joined(depend.path, 'Depend.value'), db)
+		self.assertNotIn(ModuleDSN.full_joined(depend.path, 'Depend.calc.total'), db)
+
+		self.assertEqual(modules.load(depend.path), depend)
+		self.assertFalse(depend.declaration_only)
+		self.assertTrue(db.completed(depend.path))
+		self.assertIn(ModuleDSN.full_joined(depend.path, 'Depend.calc.total'), db)
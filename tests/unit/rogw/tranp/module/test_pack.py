@@ -0,0 +1,48 @@
+import os
+import tempfile
+from typing import Any
+from unittest import TestCase
+
+from rogw.tranp.module.pack import LibraryPack
+from rogw.tranp.test.helper import data_provider
+
+
+class TestLibraryPack(TestCase):
+	@data_provider([
+		('a.b', 'entry', 'id-1', {'name': 'a', 'children': [1, 2]}),
+		('a.b', 'symbols', 'id-1', {'a.b.A': {'types': 'a.b.A'}}),
+		('a.c', 'entry', 'id-1', None),
+		('a.b', 'entry', 'id-2', None),
+		('a.b', 'unknown', 'id-1', None),
+	])
+	def test_load(self, module_path: str, kind: str, identity: str, expected: Any) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'sub', 'libralies.pack')
+			pack = LibraryPack()
+			pack.put('a.b', 'entry', 'id-0', {'name': 'old'})
+			pack.put('a.b', 'entry', 'id-1', {'name': 'a', 'children': [1, 2]})
+			pack.put('a.b', 'symbols', 'id-1', {'a.b.A': {'types': 'a.b.A'}})
+			pack.save(filepath)
+
+			loaded = LibraryPack.load(filepath)
+			self.assertEqual(loaded.module_paths, ['a.b'])
+			self.assertEqual(loaded.exists(module_path, kind, identity), expected is not None)
+			self.assertEqual(loaded.get(module_path, kind, identity), expected)
+
+	@data_provider([
+		(None,),
+		(b'',),
+		(b'TRANPPK0',),
+		(b'TRANPPK1\x00\x00\x00\x02{}',),
+		(b'TRANPPK1\x00\x00\x00\x20{"version":"0.0.0","modules":{}}',),
+	])
+	def test_load_invalid(self, content: bytes | None) -> None:
+		with tempfile.TemporaryDirectory() as dirpath:
+			filepath = os.path.join(dirpath, 'libralies.pack')
+			if content is not None:
+				with open(filepath, mode='wb') as f:
+					f.write(content)
+
+			loaded = LibraryPack.load(filepath)
+			self.assertEqual(loaded.module_paths, [])
+			self.assertEqual('a.b' in loaded, False)
@@ -0,0 +1,79 @@
+from typing import Any
+from unittest import TestCase
+
+import lark
+
+from rogw.tranp.implements.syntax.lark.entry import EntryOfLark
+from rogw.tranp.syntax.ast.binary import EntryTable
+from rogw.tranp.syntax.ast.entry import Entry
+from rogw.tranp.test.helper import data_provider
+
+
+class Fixture:
+	@classmethod
+	def tree(cls) -> Entry:
+		meta = lark.tree.Meta()
+		meta.line = 1
+		meta.column = 1
+		meta.end_line = 2
+		meta.end_column = 10
+		meta.empty = False
+		token = lark.Token('name', 'ä')
+		token.line = 1
+		token.column = 5
+		token.end_line = 1
+		token.end_column = 6
+		tree = lark.Tree('root', [
+			lark.Tree('tree_a', [
+				None,
+				lark.Token('token_a', 'a.a'),
+				lark.Tree('tree_b', []),
+				lark.Token('token_a', 'a.a'),
+				lark.Token('token_b', ''),
+			]),
+			lark.Tree('tree_c', [token], meta),
+		])
+		return EntryOfLark(tree)
+
+	@classmethod
+	def walk(cls, entry: Entry) -> list[Any]:
+		founds: list[Any] = [(entry.name, entry.has_child, entry.is_terminal, entry.value, entry.is_empty, entry.source_map)]
+		for child in entry.children:
+			founds.extend(cls.walk(child))
+
+		return founds
+
+
+class TestEntryTable(TestCase):
+	def test_dumps(self) -> None:
+		entry = Fixture.tree()
+		table = EntryTable.from_entry(entry)
+		self.assertEqual(len(table.strings), len(set(table.strings)))
+		self.assertEqual(Fixture.walk(EntryTable.loads(table.dumps()).root), Fixture.walk(entry))
+
+	@data_provider([
+		(b'TRANPXXX',),
+		(EntryTable.Magic + EntryTable.Header.pack(EntryTable.Version + 1, 0, 0, 0, 0, 0),),
+	])
+	def test_loads_invalid(self, data: bytes) -> None:
+		with self.assertRaises(ValueError):
+			EntryTable.loads(data)
+
+
+class TestEntryOfTable(TestCase):
+	@data_provider([
+		((), {'name': 'root', 'has_child': True, 'is_terminal': False, 'value': '', 'is_empty': False}),
+		((0, 0), {'name': '__empty__', 'has_child': False, 'is_terminal': False, 'value': '', 'is_empty': True}),
+		((0, 1), {'name': 'token_a', 'has_child': False, 'is_terminal': True, 'value': 'a.a', 'is_empty': False}),
+		((0, 2), {'name': 'tree_b', 'has_child': True, 'is_terminal': False, 'value': '', 'is_empty': False}),
+		((0, 4), {'name': 'token_b', 'has_child': False, 'is_terminal': True, 'value': '', 'is_empty': False}),
+		((1,), {'name': 'tree_c', 'source_map': {'begin': (1, 1), 'end': (2, 10)}}),
+		((1, 0), {'name': 'name', 'value': 'ä', 'source_map': {'begin': (1, 5), 'end': (1, 6)}}),
+	])
+	def test_entry(self, indexes: tuple[int, ...], expected: dict[str, Any]) -> None:
+		entry = EntryTable.loads(EntryTable.from_entry(Fixture.tree()).dumps()).root
+		for index in indexes:
+			entry = entry.children[index]
+
+		for key, value in expected.items():
+			self.assertEqual(getattr(entry, key), value)